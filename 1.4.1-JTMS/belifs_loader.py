@@ -1,13 +1,15 @@
 import json
 import os
+from contextlib import nullcontext
 
-def load_beliefs(filename, jtms):
+def load_beliefs(filename, jtms, batch=True):
     print(os.path.abspath("."))
     with open(f"Beliefs/{filename}", 'r') as f:
         data = json.load(f)
 
-    for b in data["beliefs"]:
-        jtms.add_justification(b["in"], b["out"], b["conclusion"])
+    with jtms.batch() if batch else nullcontext():
+        for b in data["beliefs"]:
+            jtms.add_justification(b["in"], b["out"], b["conclusion"])
     
     for init in data.get("initial", []):
         jtms.add_belief(init)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark de chargement du JTMS : moteur récursif vs moteur incrémental.
+
+Un fichier au format du dossier Beliefs/ est généré (justifications en
+couches, quelques arcs OUT et quelques cycles), puis chargé via
+``load_beliefs`` avec chacun des deux moteurs, justification par
+justification puis en un seul lot (``JTMS.batch``). Le moteur récursif n'est
+mesuré que jusqu'à ``--max-recursive`` justifications : au-delà son coût
+quadratique (voire exponentiel en propagation sur ces graphes en couches)
+le rend inutilisable.
+
+Usage :
+    python benchmark.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+
+from belifs_loader import load_beliefs
+from jtms import JTMS
+
+
+def generate_beliefs_file(n_justifications, filename, seed=42, width=50, cycle_ratio=0.001):
+    """Écrit dans Beliefs/ un jeu de ``n_justifications`` justifications."""
+    rng = random.Random(seed)
+    beliefs = []
+    for i in range(n_justifications):
+        layer = i // width
+        conclusion = f"b{i}"
+        if layer == 0:
+            in_list, out_list = [f"root{i % 10}"], []
+        else:
+            previous = range((layer - 1) * width, layer * width)
+            in_list = [f"b{j}" for j in rng.sample(previous, 2)]
+            out_list = [f"b{rng.choice(previous)}"] if rng.random() < 0.1 else []
+        beliefs.append({"in": in_list, "out": out_list, "conclusion": conclusion})
+
+    # Quelques arcs arrière pour créer des cycles non monotones
+    for _ in range(int(n_justifications * cycle_ratio)):
+        target = rng.randrange(width, n_justifications)
+        source = rng.randrange(target, n_justifications)
+        beliefs.append({"in": [], "out": [f"b{source}"], "conclusion": f"b{target}"})
+
+    data = {"beliefs": beliefs, "initial": [f"root{i}" for i in range(10)]}
+    with open(os.path.join("Beliefs", filename), "w") as f:
+        json.dump(data, f)
+    return len(beliefs)
+
+
+def time_load(filename, incremental, batch=False):
+    jtms = JTMS(incremental=incremental)
+    start = time.perf_counter()
+    load_beliefs(filename, jtms, batch=batch)
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(10):
+        jtms.set_belief_validity(f"root{i}", True)
+    propagation_time = time.perf_counter() - start
+
+    non_monotonic = sum(1 for b in jtms.beliefs.values() if b.non_monotonic)
+    valid = sum(1 for b in jtms.beliefs.values() if b.valid)
+    return load_time, propagation_time, non_monotonic, valid
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des moteurs JTMS")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--max-recursive", type=int, default=5000,
+                        help="Taille maximale testée avec le moteur récursif")
+    parser.add_argument("--keep", action="store_true", help="Conserver les fichiers générés")
+    args = parser.parse_args()
+
+    print(f"{'taille':>8} | {'moteur':>11} | {'chargement':>11} | {'propagation':>11} | {'non mono.':>9} | {'valides':>8}")
+    for size in args.sizes:
+        filename = f"benchmark_{size}.json"
+        count = generate_beliefs_file(size, filename)
+        engines = [("incremental", True, False), ("batch", True, True)]
+        if size <= args.max_recursive:
+            engines.insert(0, ("recursive", False, False))
+        try:
+            for label, incremental, batch in engines:
+                try:
+                    load_time, propagation_time, non_monotonic, valid = time_load(filename, incremental, batch)
+                except RecursionError:
+                    print(f"{count:>8} | {label:>11} | {'RecursionError':>11}")
+                    continue
+                print(f"{count:>8} | {label:>11} | {load_time:>10.3f}s | {propagation_time:>10.3f}s"
+                      f" | {non_monotonic:>9} | {valid:>8}")
+        finally:
+            if not args.keep:
+                os.remove(os.path.join("Beliefs", filename))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,17 @@
+from collections import deque
+from contextlib import contextmanager
+
 from pyvis.network import Network
 import networkx as nx
 
 class Belief:
-    def __init__(self, name):
+    def __init__(self, name, engine=None):
         self.name = name
         self.valid = None # True would mean that the belief is True, False wold mean that it's undefined
         self.non_monotonic = False # The belief is only present in a loop
         self.justifications = []
         self.implications = []
+        self.engine = engine # JTMS in incremental mode, None for the recursive behaviour
 
     def __str__(self):
         return f"{self.name} -> {'UNKNOWN' if self.valid == None else 'VALID' if self.valid else 'INVALID'}"
@@ -33,22 +37,37 @@ class Belief:
         self.valid = value
         self.propagate()
 
-    def compute_truth_statement(self):
+    def evaluate(self):
+        """Recalcule la validité à partir des justifications, sans propagation."""
         if self.non_monotonic:
             self.valid = None
             return
 
         self.valid = None
         for justification in self.justifications:
-            if all([belief.valid for belief in justification.in_list]) \
-                and not any([belief.valid for belief in justification.out_list]):
+            if all(belief.valid for belief in justification.in_list) \
+                and not any(belief.valid for belief in justification.out_list):
                 self.valid = True
                 break
 
+    def compute_truth_statement(self):
+        if self.engine is not None:
+            self.engine.propagate([self], evaluate_roots=True)
+            return
+
+        if self.non_monotonic:
+            self.valid = None
+            return
+
+        self.evaluate()
         self.propagate()
             
         
     def propagate(self):
+        if self.engine is not None:
+            self.engine.propagate([self], evaluate_roots=False)
+            return
+
         for justification in self.implications:
             justification.conclusion.compute_truth_statement()
 
@@ -61,27 +80,146 @@ class Justification:
         self.conclusion: Belief = conclusion  # Belief object
 
 class JTMS:
-    def __init__(self, strict=False):
+    """
+    Justification-based Truth Maintenance System.
+
+    Deux moteurs partagent la même API publique :
+
+    - ``incremental=False`` (défaut) : propagation récursive en profondeur et
+      recalcul complet des composantes fortement connexes à chaque ajout de
+      justification.
+    - ``incremental=True`` : propagation par liste de travail en ordre
+      topologique (chaque croyance affectée est réévaluée une seule fois par
+      changement, sans récursion) et détection incrémentale des cycles, les
+      composantes fusionnées étant suivies par union-find.
+
+    Quel que soit le moteur, ``batch()`` et ``bulk_load()`` diffèrent la
+    propagation et l'analyse des cycles jusqu'à la validation du lot.
+    """
+
+    def __init__(self, strict=False, incremental=False):
         self.beliefs = {}
         self.strict = strict
+        self.incremental = incremental
+        self._components = {}  # union-find des composantes cycliques (mode incrémental)
+        self._batch_depth = 0
+        self._staged = None  # opérations en attente pendant un lot
+
+    @property
+    def in_batch(self):
+        return self._batch_depth > 0
+
+    @contextmanager
+    def batch(self):
+        """
+        Lot transactionnel de modifications.
+
+        Dans le bloc, les croyances et justifications sont seulement
+        enregistrées et les validités fixées par ``set_belief_validity`` sont
+        mémorisées. À la sortie du bloc le plus externe, une seule analyse des
+        cycles puis une seule propagation sont exécutées ; les croyances fixées
+        explicitement servent de racines et ne sont pas réévaluées. Si une
+        exception survient, le lot est annulé et l'état antérieur restauré.
+        Les lots imbriqués sont fusionnés dans le lot externe.
+        """
+        if self._batch_depth == 0:
+            self._staged = {"beliefs": [], "justifications": [], "validity": {}, "fixed": {}}
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._rollback_batch()
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._commit_batch()
+
+    def bulk_load(self, justifications, initial=()):
+        """
+        Charge en un seul lot des justifications au format du dossier Beliefs
+        (dictionnaires ``{"in": [...], "out": [...], "conclusion": ...}``) et
+        fixe à vrai les croyances de ``initial``.
+        """
+        with self.batch():
+            for justification in justifications:
+                self.add_justification(justification["in"], justification["out"], justification["conclusion"])
+            for name in initial:
+                self.add_belief(name)
+                self.set_belief_validity(name, True)
+        return self
+
+    def _commit_batch(self):
+        staged, self._staged = self._staged, None
+        if not staged["justifications"] and not staged["fixed"]:
+            return
+
+        self.update_non_monotonic_befielfs()
+        roots = [j.conclusion for j in staged["justifications"] if j.conclusion.name in self.beliefs]
+        roots += [b for name, b in staged["fixed"].items() if self.beliefs.get(name) is b]
+        self._propagate(roots, fixed=staged["fixed"].values())
+
+    def _rollback_batch(self):
+        staged, self._staged = self._staged, None
+        for justification in reversed(staged["justifications"]):
+            conclusion = justification.conclusion
+            if justification in conclusion.justifications:
+                conclusion.justifications.remove(justification)
+            for source in justification.in_list + justification.out_list:
+                if justification in source.implications:
+                    source.implications.remove(justification)
+        for name, value in staged["validity"].items():
+            if name in self.beliefs:
+                self.beliefs[name].valid = value
+        for name in staged["beliefs"]:
+            self.beliefs.pop(name, None)
+            self._components.pop(name, None)
 
     def add_belief(self, name):
         if name not in self.beliefs:
-            self.beliefs[name] = Belief(name)
+            self.beliefs[name] = Belief(name, engine=self if self.incremental else None)
+            if self.in_batch:
+                self._staged["beliefs"].append(name)
     
     def remove_belief(self, belief_name):
         if belief_name not in self.beliefs:
             raise KeyError(f"Unknown belief: {belief_name}")
+
+        if self.incremental:
+            self._remove_belief_incremental(belief_name)
+            return
         
         for justification in self.beliefs[belief_name].implications:
             self.beliefs[repr(justification.conclusion)].remove_justification(justification)
 
         self.beliefs.pop(belief_name)
+
+    def _remove_belief_incremental(self, belief_name):
+        belief = self.beliefs.pop(belief_name)
+        conclusions = []
+        for justification in belief.implications:
+            conclusion = justification.conclusion
+            if justification in conclusion.justifications:
+                conclusion.justifications.remove(justification)
+            for source in justification.in_list + justification.out_list:
+                if source is not belief and justification in source.implications:
+                    source.implications.remove(justification)
+            conclusions.append(conclusion)
+        belief.implications = []
+        self._components.pop(belief_name, None)
+        self.propagate(conclusions, evaluate_roots=True)
         
     
     def set_belief_validity(self, belief_name, validity):
         if belief_name not in self.beliefs:
             raise KeyError(f"Unknown belief: {belief_name}")
+        if self.in_batch:
+            belief = self.beliefs[belief_name]
+            self._staged["validity"].setdefault(belief_name, belief.valid)
+            self._staged["fixed"][belief_name] = belief
+            belief.valid = validity
+            return
         self.beliefs[belief_name].set_truth_value(validity)
 
     def add_justification(self, in_list, out_list, conclusion_name):
@@ -93,6 +231,17 @@ class JTMS:
                     self.add_belief(b)
 
         justification = Justification([self.beliefs[in_item] for in_item in in_list], [self.beliefs[out_item] for out_item in out_list], self.beliefs[conclusion_name])
+        if self.in_batch:
+            justification.conclusion.justifications.append(justification)
+            for source in justification.in_list + justification.out_list:
+                source.implications.append(justification)
+            self._staged["justifications"].append(justification)
+            return
+
+        if self.incremental:
+            self._add_justification_incremental(justification)
+            return
+
         self.beliefs[conclusion_name].add_justification(justification)
         for in_belief in justification.in_list:
             self.beliefs[in_belief.name].add_implication(justification)
@@ -111,8 +260,165 @@ class JTMS:
         CFCs = nx.strongly_connected_components(graph)
         for CFC in CFCs:
             if len(CFC) != 1:
+                root = next(iter(CFC))
                 for belief in CFC:
                     self.beliefs[belief].non_monotonic = True
+                    if self.incremental:
+                        self._components[self._find(belief)] = self._find(root)
+
+    # ---------- Moteur incrémental ----------
+
+    def _add_justification_incremental(self, justification):
+        conclusion = justification.conclusion
+        # Même ordre que le moteur récursif : évaluation sur l'ancien graphe,
+        # puis enregistrement des arcs et marquage des nouveaux cycles.
+        conclusion.justifications.append(justification)
+        self.propagate([conclusion], evaluate_roots=True)
+
+        for source in justification.in_list + justification.out_list:
+            source.implications.append(justification)
+        for source in justification.in_list + justification.out_list:
+            self._mark_cycle(source, conclusion)
+
+    def propagate(self, roots, evaluate_roots=True):
+        """
+        Propage les changements de validité depuis ``roots``.
+
+        La région affectée (croyances atteignables depuis les racines) est
+        parcourue en ordre topologique : chaque croyance est réévaluée une
+        seule fois. Comme dans le moteur récursif, une croyance non monotone
+        atteinte est forcée à ``None`` sans propager au-delà.
+        """
+        roots = list(roots)
+        self._propagate(roots, fixed=() if evaluate_roots else roots)
+
+    def _propagate(self, roots, fixed=()):
+        """Propagation en ordre topologique ; les croyances ``fixed`` gardent leur valeur."""
+        roots = list(dict.fromkeys(roots))
+        fixed_ids = {id(b) for b in fixed}
+
+        def expands(belief):
+            return not belief.non_monotonic or id(belief) in fixed_ids
+
+        # Collecte de la région et des degrés entrants restreints à celle-ci
+        region = {id(b): b for b in roots}
+        indegree = {id(b): 0 for b in roots}
+        stack = list(roots)
+        while stack:
+            belief = stack.pop()
+            if not expands(belief):
+                continue
+            for successor in self._successors(belief):
+                if successor is belief:
+                    continue
+                key = id(successor)
+                if key not in region:
+                    region[key] = successor
+                    indegree[key] = 0
+                    stack.append(successor)
+                indegree[key] += 1
+
+        queue = deque(b for b in roots if indegree[id(b)] == 0)
+        done = set()
+        while len(done) < len(region):
+            if not queue:
+                # Cycle résiduel non marqué : on termine la région sans ordre.
+                queue.extend(b for k, b in region.items() if k not in done)
+                for b in queue:
+                    indegree[id(b)] = 0
+            belief = queue.popleft()
+            key = id(belief)
+            if key in done:
+                continue
+            done.add(key)
+            if key not in fixed_ids:
+                belief.evaluate()
+            if not expands(belief):
+                continue
+            for successor in self._successors(belief):
+                skey = id(successor)
+                if successor is belief or skey in done:
+                    continue
+                indegree[skey] -= 1
+                if indegree[skey] == 0:
+                    queue.append(successor)
+
+    @staticmethod
+    def _successors(belief):
+        # Les doublons éventuels sont absorbés par les appelants (ensembles
+        # de visite, degrés entrants comptés par arc).
+        return [j.conclusion for j in belief.implications]
+
+    @staticmethod
+    def _predecessors(belief):
+        return [b for j in belief.justifications for b in j.in_list + j.out_list]
+
+    def _find(self, name):
+        parent = self._components.setdefault(name, name)
+        while parent != name:
+            grand_parent = self._components.setdefault(parent, parent)
+            self._components[name] = grand_parent
+            name, parent = parent, grand_parent
+        return name
+
+    def _mark_cycle(self, source, conclusion):
+        """
+        Marque les croyances d'un cycle fermé par l'arc ``source -> conclusion``.
+
+        Une recherche bidirectionnelle alternée (avant depuis la conclusion,
+        arrière depuis la source) s'arrête dès que l'un des deux côtés est
+        épuisé, ce qui borne le coût au plus petit des deux voisinages.
+        """
+        if source is conclusion or self._find(source.name) == self._find(conclusion.name):
+            return
+        if not conclusion.implications or not source.justifications:
+            return
+
+        forward, backward = {conclusion.name: conclusion}, {source.name: source}
+        forward_frontier, backward_frontier = [conclusion], [source]
+        meets = False
+        while forward_frontier and backward_frontier and not meets:
+            if len(forward_frontier) <= len(backward_frontier):
+                frontier, seen, other, step = forward_frontier, forward, backward, self._successors
+            else:
+                frontier, seen, other, step = backward_frontier, backward, forward, self._predecessors
+            next_frontier = []
+            for belief in frontier:
+                for neighbour in step(belief):
+                    if neighbour.name not in seen:
+                        seen[neighbour.name] = neighbour
+                        next_frontier.append(neighbour)
+                        meets = meets or neighbour.name in other
+            if frontier is forward_frontier:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+        if not meets:
+            return
+
+        # Le cycle est l'intersection exacte des descendants de la conclusion
+        # et des ancêtres de la source.
+        descendants = self._reachable(conclusion, self._successors)
+        ancestors = self._reachable(source, self._predecessors, within=descendants)
+        root = self._find(conclusion.name)
+        for name in ancestors:
+            belief = self.beliefs[name]
+            belief.non_monotonic = True
+            other = self._find(name)
+            if other != root:
+                self._components[other] = root
+
+    @staticmethod
+    def _reachable(start, step, within=None):
+        seen = {start.name}
+        stack = [start]
+        while stack:
+            for neighbour in step(stack.pop()):
+                if neighbour.name in seen or (within is not None and neighbour.name not in within):
+                    continue
+                seen.add(neighbour.name)
+                stack.append(neighbour)
+        return seen
 
     def show(self):
         for b in self.beliefs.values():
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 from jtms import JTMS
 from atms import ATMS
@@ -102,6 +104,138 @@ def test_graph_consistency_after_multiple_changes():
     for b in "BCDE":
         assert jtms.beliefs[b].valid is None
 
+# --------- JTMS incrémental ---------
+
+def build_random_jtms(incremental, seed, size=40):
+    rng = random.Random(seed)
+    jtms = JTMS(incremental=incremental)
+    names = [f"N{i}" for i in range(size)]
+    for name in names:
+        jtms.add_belief(name)
+    for _ in range(size):
+        conclusion = rng.randrange(1, size)
+        in_list = [names[i] for i in rng.sample(range(size), rng.randint(0, 2)) if i != conclusion]
+        out_list = [names[i] for i in rng.sample(range(size), rng.randint(0, 1)) if i != conclusion]
+        jtms.add_justification(in_list, out_list, names[conclusion])
+    for name in rng.sample(names, size // 4):
+        jtms.set_belief_validity(name, True)
+    return jtms
+
+@pytest.mark.parametrize("seed", range(10))
+def test_incremental_engine_matches_recursive(seed):
+    recursive = build_random_jtms(False, seed)
+    incremental = build_random_jtms(True, seed)
+
+    for name, belief in recursive.beliefs.items():
+        assert incremental.beliefs[name].non_monotonic == belief.non_monotonic
+        assert incremental.beliefs[name].valid == belief.valid
+
+def test_incremental_change_propagation():
+    jtms = JTMS(strict_jtms, incremental=True)
+    for name in "ABCD":
+        jtms.add_belief(name)
+    jtms.add_justification(["A"], [], "B")
+    jtms.add_justification(["A"], [], "C")
+    jtms.add_justification(["B", "C"], [], "D")
+
+    jtms.set_belief_validity("A", True)
+    assert jtms.beliefs["D"].valid is True
+
+    jtms.set_belief_validity("A", False)
+    assert jtms.beliefs["D"].valid is None
+
+def test_incremental_circular_justifications():
+    jtms = JTMS(incremental=True)
+    jtms.add_justification(["B"], [], "A")
+    jtms.add_justification(["C"], [], "B")
+    jtms.add_justification(["X"], [], "C")
+    assert not any(b.non_monotonic for b in jtms.beliefs.values())
+
+    jtms.add_justification([], ["A"], "C")
+    assert all(jtms.beliefs[name].non_monotonic for name in "ABC")
+    assert jtms.beliefs["X"].non_monotonic is False
+
+def test_incremental_remove_belief():
+    jtms = JTMS(incremental=True)
+    jtms.add_justification(["A", "B"], [], "C")
+    jtms.set_belief_validity("A", True)
+    jtms.set_belief_validity("B", True)
+    assert jtms.beliefs["C"].valid is True
+
+    jtms.remove_belief("A")
+    assert jtms.beliefs["C"].valid is None
+    assert jtms.beliefs["B"].implications == []
+
+def test_incremental_deep_chain_does_not_recurse():
+    depth = 20000
+    jtms = JTMS(incremental=True)
+    for i in range(depth):
+        jtms.add_justification([f"B{i}"], [], f"B{i + 1}")
+
+    jtms.set_belief_validity("B0", True)
+    assert jtms.beliefs[f"B{depth}"].valid is True
+
+    jtms.set_belief_validity("B0", False)
+    assert jtms.beliefs[f"B{depth}"].valid is None
+
+# ------------ JTMS batch ------------
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_batch_defers_propagation_until_commit(incremental):
+    jtms = JTMS(incremental=incremental)
+    with jtms.batch():
+        jtms.add_justification(["A"], [], "B")
+        jtms.add_justification(["B"], ["X"], "C")
+        jtms.set_belief_validity("A", True)
+        assert jtms.beliefs["B"].valid is None
+
+    assert jtms.beliefs["B"].valid is True
+    assert jtms.beliefs["C"].valid is True
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_batch_marks_cycles_once(incremental):
+    jtms = JTMS(incremental=incremental)
+    with jtms.batch():
+        jtms.add_justification(["B"], [], "A")
+        jtms.add_justification([], ["A"], "B")
+        assert jtms.beliefs["A"].non_monotonic is False
+
+    assert jtms.beliefs["A"].non_monotonic is True
+    assert jtms.beliefs["B"].non_monotonic is True
+
+def test_batch_rollback_on_error():
+    jtms = JTMS()
+    jtms.add_justification(["A"], [], "B")
+    jtms.set_belief_validity("A", True)
+
+    with pytest.raises(RuntimeError):
+        with jtms.batch():
+            jtms.add_justification(["C"], [], "B")
+            jtms.set_belief_validity("A", False)
+            raise RuntimeError("abort")
+
+    assert "C" not in jtms.beliefs
+    assert len(jtms.beliefs["B"].justifications) == 1
+    assert jtms.beliefs["A"].implications[0].conclusion is jtms.beliefs["B"]
+    assert jtms.beliefs["A"].valid is True
+    assert jtms.beliefs["B"].valid is True
+
+def test_bulk_load_matches_sequential_insertion():
+    justifications = [
+        {"in": ["A"], "out": [], "conclusion": "B"},
+        {"in": ["B"], "out": ["C"], "conclusion": "D"},
+        {"in": ["A", "D"], "out": [], "conclusion": "E"},
+    ]
+    sequential = JTMS()
+    for j in justifications:
+        sequential.add_justification(j["in"], j["out"], j["conclusion"])
+    sequential.set_belief_validity("A", True)
+
+    bulk = JTMS().bulk_load(justifications, initial=["A"])
+
+    for name, belief in sequential.beliefs.items():
+        assert bulk.beliefs[name].valid == belief.valid
+
 # -------------- ATMS ---------------
 def test_simple_justification(atms):
     atms.add_assumption("A")
@@ -1,4 +1,67 @@
 import numpy as np
+from collections.abc import MutableMapping
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8)
+def default_population(n_agents):
+    """Names of a generated population, shared by all the agents' trust maps."""
+    names = tuple(f"Agent{i+1}" for i in range(n_agents))
+    return names, frozenset(names)
+
+
+class TrustMap(MutableMapping):
+    """
+    trust[other_name] with a default score for every member of the initial population.
+    Only explicit updates are stored, so a population of n agents needs O(updates) memory
+    instead of n^2 dict entries.
+    """
+    def __init__(self, n_agents, owner, default=0.5):
+        self._names, self._members = default_population(n_agents)
+        self._owner = owner
+        self._default = default
+        self._scores = {}
+        self._removed = set()
+
+    def _is_default_key(self, key):
+        return key in self._members and key != self._owner and key not in self._removed
+
+    def __getitem__(self, key):
+        if key in self._scores:
+            return self._scores[key]
+        if self._is_default_key(key):
+            return self._default
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        self._scores[key] = value
+        self._removed.discard(key)
+
+    def __delitem__(self, key):
+        if key not in self._scores and not self._is_default_key(key):
+            raise KeyError(key)
+        self._scores.pop(key, None)
+        if key in self._members and key != self._owner:
+            self._removed.add(key)
+
+    def __iter__(self):
+        for name in self._names:
+            if name != self._owner and name not in self._removed:
+                yield name
+        for key in self._scores:
+            if key not in self._members or key == self._owner:
+                yield key
+
+    def __len__(self):
+        implicit = len(self._names) - (self._owner in self._members) - len(self._removed)
+        return implicit + sum(1 for key in self._scores if key not in self._members or key == self._owner)
+
+    def above(self, threshold):
+        """Names trusted strictly more than threshold, without scanning the whole population."""
+        if self._default > threshold:
+            return [name for name in self if self[name] > threshold]
+        return [key for key, score in self._scores.items() if score > threshold]
+
 
 class Agent:
     """
@@ -20,7 +83,7 @@ class Agent:
         self.alpha = 0.5    # Learning rate
         self.gamma = 0.9    # Discount factor
         if n_agents:
-            self.trust = {f"Agent{i+1}": 0.5 for i in range(n_agents) if f"Agent{i+1}" != self.name}
+            self.trust = TrustMap(n_agents, self.name)
 
     def get_state(self, options, context):
         # State can be tuple of (top preference, coalition, round, etc.)
@@ -81,6 +144,7 @@ class Agent:
             sat = 0
         self.satisfaction_history.append(sat)
         # Q-learning update: reward is satisfaction
+        options = context['options'] if context and 'options' in context else self.preferences
         if len(self.memory) > 1:
             prev = self.memory[-2]
             prev_options = prev['context']['options'] if prev['context'] and 'options' in prev['context'] else options
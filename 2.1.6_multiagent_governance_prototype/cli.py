@@ -4,17 +4,37 @@ from rich.table import Table
 from agents.agent_factory import AgentFactory
 from governance.methods import GOVERNANCE_METHODS
 from scenarios.loader import load_scenario, list_scenarios
-from runner import run_simulation
+from runner import run_simulation, sweep, MANIPULATIONS
 from metrics.metrics import summarize_results, per_agent_satisfaction, validate_scenario
 from reporting.visualize import plot_results, plot_method_comparison, plot_manipulability_impact
 from governance.simulation import manipulability_analysis
+from governance.shapley import SHAPLEY_METHODS
 import json
 import os
+import time
 import numpy as np
 import pandas as pd
 
 console = Console()
 
+def apply_shapley_options(scenario_data, shapley_method, shapley_samples):
+    """Override the scenario's Shapley settings (context['shapley']) with CLI options."""
+    if shapley_method is None and shapley_samples is None:
+        return scenario_data
+    shapley_config = dict(scenario_data.get('context', {}).get('shapley', {}))
+    if shapley_method is not None:
+        shapley_config['method'] = shapley_method
+    if shapley_samples is not None:
+        shapley_config['samples'] = shapley_samples
+    scenario_data.setdefault('context', {})['shapley'] = shapley_config
+    return scenario_data
+
+def shapley_options(f):
+    f = click.option('--shapley-samples', default=None, type=int, help='Permutation samples for Monte-Carlo Shapley')(f)
+    f = click.option('--shapley-method', default=None, type=click.Choice(SHAPLEY_METHODS),
+                     help="Shapley engine (default: scenario context 'shapley.method', else auto)")(f)
+    return f
+
 @click.group()
 def cli():
     """Multiagent Governance Prototype CLI"""
@@ -38,7 +58,8 @@ def list_scenarios_cmd():
 @cli.command('run')
 @click.option('--scenario', default=None, help='Path to scenario JSON file')
 @click.option('--method', default=None, help='Governance method to use')
-def run(scenario, method):
+@shapley_options
+def run(scenario, method, shapley_method, shapley_samples):
     """Run a simulation with selected scenario and governance method."""
     try:
         if not scenario:
@@ -48,7 +69,7 @@ def run(scenario, method):
                 console.print(f"{i+1}. [yellow]{s}[/yellow]")
             idx = int(console.input("Enter scenario number: ")) - 1
             scenario = f"scenarios/{scenarios[idx]}"
-        scenario_data = load_scenario(scenario)
+        scenario_data = apply_shapley_options(load_scenario(scenario), shapley_method, shapley_samples)
         if not method:
             console.print("[bold cyan]Select a governance method:[/bold cyan]")
             for i, m in enumerate(GOVERNANCE_METHODS):
@@ -113,21 +134,24 @@ def generate_scenario(n_agents, n_options, personalities, seed, output):
         console.print(f"[red]Error generating scenario: {e}[/red]")
 
 @cli.command('compare-all')
-def compare_all():
+@shapley_options
+def compare_all(shapley_method, shapley_samples):
     """Run all governance methods on all scenarios, output summary table and plots."""
     try:
         scenarios = list_scenarios()
         results = []
         for scenario_file in scenarios:
             scenario_path = f"scenarios/{scenario_file}" if not scenario_file.startswith('scenarios/') else scenario_file
-            scenario_data = load_scenario(scenario_path)
+            scenario_data = apply_shapley_options(load_scenario(scenario_path), shapley_method, shapley_samples)
             agents_config = scenario_data['agents']
             for method in GOVERNANCE_METHODS:
+                start = time.perf_counter()
                 agents = AgentFactory.create_agents(agents_config)
                 res = run_simulation(agents, scenario_data, method)
                 summary = summarize_results(res)
                 summary['scenario'] = scenario_file
                 summary['method'] = method
+                summary['total_time'] = time.perf_counter() - start
                 results.append(summary)
         df = pd.DataFrame(results)
         df.to_csv('comparison_results.csv', index=False)
@@ -146,26 +170,62 @@ def compare_all():
 @cli.command('manipulability-analysis')
 @click.option('--scenario', required=True, help='Path to scenario JSON file')
 @click.option('--method', required=True, help='Governance method to use')
-def manipulability_analysis_cmd(scenario, method):
+@click.option('--details', is_flag=True, help='Also detect and resolve every pairwise conflict (quadratic in the number of agents)')
+def manipulability_analysis_cmd(scenario, method, details):
     """Run manipulability analysis for a scenario and method, and visualize the impact."""
     try:
         scenario_data = load_scenario(scenario)
         agents = AgentFactory.create_agents(scenario_data['agents'])
-        results_list = manipulability_analysis(agents, scenario_data, method)
+        results_list = manipulability_analysis(agents, scenario_data, method, detailed=details)
         if not results_list:
             console.print("[red]No results from manipulability analysis.[/red]")
             return
         table = Table(title="Manipulability Analysis Results", show_lines=True)
         metrics = ['manipulation_type', 'consensus_rate', 'fairness', 'satisfaction']
-        for m in metrics:
+        for m in metrics + (['resolved_conflicts'] if details else []):
             table.add_column(m, style="cyan")
         for r in results_list:
-            table.add_row(*(str(r.get(m, '')) for m in metrics))
+            row = [str(r.get(m, '')) for m in metrics]
+            if details:
+                row.append(str(len(r['resolved_conflicts'])))
+            table.add_row(*row)
         console.print(table)
         plot_manipulability_impact(results_list)
     except Exception as e:
         console.print(f"[red]Error in manipulability analysis: {e}[/red]")
 
+@cli.command('sweep')
+@click.option('--scenario', required=True, help='Path to scenario JSON file')
+@click.option('--methods', multiple=True, type=click.Choice(list(GOVERNANCE_METHODS)), help='Methods to evaluate (default: all)')
+@click.option('--manipulations', multiple=True, type=click.Choice(MANIPULATIONS), help='Manipulation types (default: all)')
+@click.option('--noise-levels', default='0.1,0.3', help='Comma-separated noise levels')
+@click.option('--bribery-budgets', default='1,2', help='Comma-separated bribery budgets')
+@click.option('--seeds', default=10, type=int, help='Number of seeds per cell')
+@click.option('--workers', default=None, type=int, help='Worker processes (default: CPU count)')
+@click.option('--output', default='sweep_results.csv', help='CSV output file')
+@shapley_options
+def sweep_cmd(scenario, methods, manipulations, noise_levels, bribery_budgets, seeds, workers, output,
+              shapley_method, shapley_samples):
+    """Run methods x manipulations x levels x seeds in parallel and save one row per run."""
+    try:
+        scenario_data = apply_shapley_options(load_scenario(scenario), shapley_method, shapley_samples)
+        start = time.perf_counter()
+        df = sweep(scenario_data, list(methods) or None, list(manipulations) or None,
+                   [float(x) for x in noise_levels.split(',') if x.strip()],
+                   [int(x) for x in bribery_budgets.split(',') if x.strip()],
+                   range(seeds), workers, output)
+        means = df.groupby(['method', 'manipulation_type', 'level']).mean(numeric_only=True).reset_index()
+        table = Table(title=f"Sweep Results ({len(df)} runs, {time.perf_counter() - start:.1f}s)", show_lines=True)
+        columns = ['method', 'manipulation_type', 'level', 'consensus_rate', 'fairness', 'satisfaction', 'time']
+        for col in columns:
+            table.add_column(col, style="cyan")
+        for _, row in means.iterrows():
+            table.add_row(*(f"{row[c]:.3f}" if isinstance(row[c], float) else str(row[c]) for c in columns))
+        console.print(table)
+        console.print(f"[green]Results saved to {output}[/green]")
+    except Exception as e:
+        console.print(f"[red]Error in sweep: {e}[/red]")
+
 @cli.command('validate-scenarios')
 def validate_scenarios_cmd():
     """Validate all scenario files in the scenarios/ directory."""
@@ -1,34 +1,70 @@
 from collections import Counter, defaultdict
 import numpy as np
 
+# --- Preference profile ---
+class PreferenceProfile:
+    """
+    Agents x options rank matrix: ranks[i, j] is the position of options[j] in agent i's
+    preference list (first occurrence), or MISSING if the agent does not rank it.
+    Every voting method below works on this matrix instead of calling list.index per agent.
+    """
+    MISSING = np.iinfo(np.int64).max // 2
+
+    def __init__(self, agents, options):
+        self.options = list(options)
+        self.index = {o: j for j, o in enumerate(self.options)}
+        self.ranks = np.full((len(agents), len(self.options)), self.MISSING, dtype=np.int64)
+        lengths = np.fromiter((len(a.preferences) for a in agents), dtype=np.int64, count=len(agents))
+        cols = np.fromiter((self.index.get(o, -1) for a in agents for o in a.preferences),
+                           dtype=np.int64, count=int(lengths.sum()))
+        rows = np.repeat(np.arange(len(agents)), lengths)
+        positions = np.arange(cols.size) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        ranked = cols >= 0
+        # First occurrence wins, as with list.index
+        np.minimum.at(self.ranks, (rows[ranked], cols[ranked]), positions[ranked])
+
+    def pairwise_wins(self, chunk=4096):
+        """wins[j, k] = number of agents ranking options[j] strictly before options[k]."""
+        n = len(self.options)
+        wins = np.zeros((n, n), dtype=np.int64)
+        for start in range(0, self.ranks.shape[0], chunk):
+            block = self.ranks[start:start + chunk]
+            wins += (block[:, :, None] < block[:, None, :]).sum(axis=0)
+        return wins
+
+
+def tally_winner(votes):
+    """
+    Most common vote, ties going to the vote seen first (same rule as Counter.most_common).
+    """
+    codes = {}
+    encoded = np.fromiter((codes.setdefault(v, len(codes)) for v in votes), dtype=np.int64, count=len(votes))
+    labels = list(codes)
+    return labels[int(np.argmax(np.bincount(encoded)))]
+
 # --- Majority Voting ---
 def majority_voting(agents, options, context):
     """
     Each agent votes for their top choice. Option with most votes wins.
     """
     votes = [a.decide(options, context) for a in agents]
-    tally = Counter(votes)
-    winner, _ = tally.most_common(1)[0]
-    return winner
+    return tally_winner(votes)
 
 # --- Plurality Voting (same as majority for single-winner) ---
 def plurality_voting(agents, options, context):
     return majority_voting(agents, options, context)
 
 # --- Borda Count ---
-def borda_count(agents, options, context):
+def borda_count(agents, options, context, profile=None):
     """
     Each agent ranks options. Points assigned: n-1 for top, n-2 for second, ...
     Option with highest total points wins.
     """
-    scores = {o: 0 for o in options}
+    profile = profile or PreferenceProfile(agents, options)
     n = len(options)
-    for a in agents:
-        for i, o in enumerate(a.preferences):
-            if o in scores:
-                scores[o] += n - i - 1
-    winner = max(scores, key=scores.get)
-    return winner
+    ranks = profile.ranks
+    scores = np.where(ranks != PreferenceProfile.MISSING, n - 1 - ranks, 0).sum(axis=0)
+    return options[int(np.argmax(scores))]
 
 # --- Condorcet Method ---
 def condorcet_method(agents, options, context):
@@ -37,21 +73,15 @@ def condorcet_method(agents, options, context):
     If no Condorcet winner, fallback to Borda.
     """
     n = len(options)
-    pairwise_wins = {o: 0 for o in options}
-    for i, o1 in enumerate(options):
-        for o2 in options:
-            if o1 == o2:
-                continue
-            o1_wins = sum(a.preferences.index(o1) < a.preferences.index(o2) for a in agents)
-            o2_wins = len(agents) - o1_wins
-            if o1_wins > o2_wins:
-                pairwise_wins[o1] += 1
-    # Condorcet winner must win against all others
-    for o in options:
-        if pairwise_wins[o] == n - 1:
-            return o
+    profile = PreferenceProfile(agents, options)
+    wins = profile.pairwise_wins()
+    # o1 beats o2 if it is preferred by more agents than the rest (ties count against o1)
+    beats = wins > (len(agents) - wins)
+    condorcet = np.flatnonzero(beats.sum(axis=1) == n - 1)
+    if condorcet.size:
+        return options[int(condorcet[0])]
     # No Condorcet winner, fallback to Borda
-    return borda_count(agents, options, context)
+    return borda_count(agents, options, context, profile)
 
 # --- Quadratic Voting ---
 def quadratic_voting(agents, options, context):
@@ -61,20 +91,17 @@ def quadratic_voting(agents, options, context):
     Agents allocate votes to maximize their satisfaction (simulate rational allocation).
     """
     budget = context.get('quadratic_budget', 9) if context else 9
-    votes = {o: 0 for o in options}
-    for a in agents:
-        # Rational: allocate all to top preference, or split if two top
-        allocation = [0] * len(options)
-        if a.personality == 'flexible' and len(options) > 1:
-            # Split between top 2
-            allocation[a.preferences.index(options[0])] = budget // 2
-            allocation[a.preferences.index(options[1])] = budget - (budget // 2)
-        else:
-            allocation[a.preferences.index(a.preferences[0])] = budget
-        for i, o in enumerate(options):
-            votes[o] += allocation[i]
-    winner = max(votes, key=votes.get)
-    return winner
+    n = len(options)
+    votes = np.zeros(n, dtype=np.int64)
+    flexible = np.array([a.personality == 'flexible' for a in agents], dtype=bool) & (n > 1)
+    if flexible.any():
+        # Split between top 2: the allocation slots are the ranks of options[0] and options[1]
+        ranks = PreferenceProfile(agents, options[:2]).ranks[flexible]
+        np.add.at(votes, ranks[:, 0], budget // 2)
+        np.add.at(votes, ranks[:, 1], budget - (budget // 2))
+    # Rational: allocate all to top preference (allocation slot 0)
+    votes[0] += budget * int((~flexible).sum())
+    return options[int(np.argmax(votes))]
 
 # --- Byzantine Consensus ---
 def byzantine_consensus(agents, options, context):
@@ -84,12 +111,10 @@ def byzantine_consensus(agents, options, context):
     byzantine_ratio = context.get('byzantine_ratio', 0.2) if context else 0.2
     n_byzantine = int(len(agents) * byzantine_ratio)
     honest_agents = agents[n_byzantine:]
-    byzantine_agents = agents[:n_byzantine]
     votes = [a.decide(options, context) for a in honest_agents]
-    votes += [np.random.choice(options) for _ in byzantine_agents]
-    tally = Counter(votes)
-    winner, _ = tally.most_common(1)[0]
-    return winner
+    if n_byzantine:
+        votes += list(np.random.choice(options, n_byzantine))
+    return tally_winner(votes)
 
 # --- Raft Consensus ---
 def raft_consensus(agents, options, context):
@@ -98,13 +123,14 @@ def raft_consensus(agents, options, context):
     """
     leader = np.random.choice(agents)
     proposal = leader.decide(options, context)
-    acceptances = 1  # leader always accepts own proposal
-    for a in agents:
-        if a is leader:
-            continue
+    if proposal in options:
         # Accept if proposal is in top 2 preferences
-        if proposal in a.preferences[:2]:
-            acceptances += 1
+        profile = PreferenceProfile(agents, [proposal])
+        accepting = profile.ranks[:, 0] < 2
+        leader_idx = next(i for i, a in enumerate(agents) if a is leader)
+        acceptances = 1 + int(accepting.sum()) - int(accepting[leader_idx])  # leader always accepts own proposal
+    else:
+        acceptances = 1 + sum(1 for a in agents if a is not leader and proposal in a.preferences[:2])
     if acceptances > len(agents) // 2:
         return proposal
     else:
@@ -0,0 +1,202 @@
+"""
+Shapley value engine.
+
+Payoffs are callables taking a set of agent names and returning a coalition value.
+Structured games (AdditiveGame, WeightedVotingGame) are also callable and expose
+an exact closed-form/DP solution; arbitrary payoffs are solved exactly by subset
+enumeration for small coalitions or estimated by permutation sampling.
+"""
+import math
+import time
+from dataclasses import dataclass, field
+from statistics import NormalDist
+
+import numpy as np
+
+SHAPLEY_METHODS = ('auto', 'exact', 'monte_carlo')
+MAX_SUBSET_PLAYERS = 16
+DEFAULT_SAMPLES = 2000
+
+
+@dataclass
+class ShapleyResult:
+    values: dict
+    method: str
+    time: float = 0.0
+    samples: int = 0
+    # Half-width of the confidence interval per player (Monte-Carlo only)
+    ci: dict = field(default_factory=dict)
+
+    @property
+    def max_ci(self):
+        return max(self.ci.values()) if self.ci else 0.0
+
+
+class AdditiveGame:
+    """
+    v(S) = sum of the weights of the members of S.
+    The Shapley value of each player is its own weight.
+    """
+
+    def __init__(self, weights):
+        self.weights = dict(weights)
+
+    def __call__(self, agent_names):
+        return sum(self.weights.get(name, 0.0) for name in agent_names)
+
+    def shapley(self, players):
+        return {p: float(self.weights.get(p, 0.0)) for p in players}
+
+
+class WeightedVotingGame:
+    """
+    v(S) = 1 if the total weight of S reaches the quota, else 0.
+    Integer weights are required by the dynamic program over coalition sizes and weights.
+    """
+
+    def __init__(self, weights, quota):
+        self.weights = {}
+        for name, w in weights.items():
+            if w < 0 or w != int(w):
+                raise ValueError(f"Weighted voting requires non-negative integer weights, got {name}={w}")
+            self.weights[name] = int(w)
+        self.quota = quota
+
+    def __call__(self, agent_names):
+        return 1.0 if sum(self.weights.get(name, 0) for name in agent_names) >= self.quota else 0.0
+
+    def shapley(self, players):
+        players = list(players)
+        n = len(players)
+        if n == 0:
+            return {}
+        w = [self.weights.get(p, 0) for p in players]
+        total = sum(w)
+        quota = math.ceil(self.quota)
+        if quota <= 0 or quota > total:
+            # Constant game: no player is ever pivotal
+            return {p: 0.0 for p in players}
+        # Exact counts; int64 overflows past C(66, 33), Python ints beyond
+        dtype = np.int64 if n <= 60 else object
+        # counts[k, s] = number of subsets of size k and weight s (weights capped at the quota)
+        counts = np.zeros((n + 1, quota + 1), dtype=dtype)
+        counts[0, 0] = 1
+        for wi in w:
+            counts = _add_player(counts, wi)
+        # k!(n-k-1)!/n! for k = 0..n-1
+        coeff = [1.0 / (n * math.comb(n - 1, k)) for k in range(n)]
+        values = {}
+        for p, wi in zip(players, w):
+            if wi == 0:
+                values[p] = 0.0
+                continue
+            without = _remove_player(counts, wi)
+            # Swing coalitions: weight in [quota - wi, quota - 1]
+            swings = without[:n, max(0, quota - wi):quota].sum(axis=1)
+            values[p] = float(sum(c * s for c, s in zip(coeff, swings)))
+        return values
+
+
+def _add_player(counts, wi):
+    """Knapsack step: include a player of weight wi (weights above the quota are folded into it)."""
+    quota = counts.shape[1] - 1
+    new = counts.copy()
+    if wi >= quota:
+        new[1:, quota] += counts[:-1].sum(axis=1)
+    else:
+        new[1:, wi:] += counts[:-1, :quota + 1 - wi]
+        new[1:, quota] += counts[:-1, quota + 1 - wi:].sum(axis=1)
+    return new
+
+
+def _remove_player(counts, wi):
+    """Inverse of _add_player, row by row (sizes increase): counts of the other players only."""
+    quota = counts.shape[1] - 1
+    without = np.zeros_like(counts)
+    without[0] = counts[0]
+    for k in range(1, counts.shape[0]):
+        prev = without[k - 1]
+        row = counts[k].copy()
+        if wi >= quota:
+            row[quota] -= prev.sum()
+        else:
+            row[wi:] -= prev[:quota + 1 - wi]
+            row[quota] -= prev[quota + 1 - wi:].sum()
+        without[k] = row
+    return without
+
+
+def shapley_subsets(players, payoff_func):
+    """Exact Shapley value of an arbitrary payoff: one payoff call per subset (2^n)."""
+    players = list(players)
+    n = len(players)
+    masks = np.arange(1 << n)
+    v = np.array([payoff_func({players[i] for i in range(n) if m >> i & 1}) for m in range(1 << n)], dtype=float)
+    sizes = np.array([bin(m).count('1') for m in range(1 << n)])
+    weight_by_size = np.array([1.0 / (n * math.comb(n - 1, k)) for k in range(n)] + [0.0])
+    values = {}
+    for i, p in enumerate(players):
+        without = masks[(masks >> i & 1) == 0]
+        marginals = v[without | (1 << i)] - v[without]
+        values[p] = float(np.dot(marginals, weight_by_size[sizes[without]]))
+    return values
+
+
+def shapley_monte_carlo(players, payoff_func, samples=DEFAULT_SAMPLES, seed=None, confidence=0.95):
+    """
+    Permutation-sampling estimate of the Shapley value.
+    Returns (values, ci) where ci is the half-width of the normal confidence interval.
+    """
+    players = list(players)
+    n = len(players)
+    rng = np.random.default_rng(seed)
+    sums = np.zeros(n)
+    squares = np.zeros(n)
+    empty = payoff_func(set())
+    for _ in range(samples):
+        prefix = set()
+        previous = empty
+        for i in rng.permutation(n):
+            prefix.add(players[i])
+            current = payoff_func(prefix)
+            marginal = current - previous
+            sums[i] += marginal
+            squares[i] += marginal * marginal
+            previous = current
+    means = sums / samples
+    if samples > 1:
+        variances = np.maximum(squares / samples - means ** 2, 0.0) * samples / (samples - 1)
+    else:
+        variances = np.zeros(n)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    half_widths = z * np.sqrt(variances / samples)
+    return ({p: float(m) for p, m in zip(players, means)},
+            {p: float(h) for p, h in zip(players, half_widths)})
+
+
+def compute_shapley(players, payoff_func, method='auto', samples=DEFAULT_SAMPLES, seed=None, confidence=0.95):
+    """
+    Shapley values of `players` under `payoff_func`.
+    method: 'exact' (structured game solution, or subset enumeration), 'monte_carlo', or 'auto'
+    (exact when the game is structured or small enough, sampling otherwise).
+    """
+    if method not in SHAPLEY_METHODS:
+        raise ValueError(f"Unknown Shapley method '{method}', expected one of {SHAPLEY_METHODS}")
+    players = list(players)
+    structured = hasattr(payoff_func, 'shapley')
+    if method == 'auto':
+        method = 'exact' if structured or len(players) <= MAX_SUBSET_PLAYERS else 'monte_carlo'
+    start = time.perf_counter()
+    if not players:
+        return ShapleyResult({}, method)
+    if method == 'exact':
+        if structured:
+            values = payoff_func.shapley(players)
+        elif len(players) <= MAX_SUBSET_PLAYERS:
+            values = shapley_subsets(players, payoff_func)
+        else:
+            raise ValueError(f"Exact Shapley for an arbitrary payoff is limited to {MAX_SUBSET_PLAYERS} players "
+                             f"({len(players)} given); use 'monte_carlo'")
+        return ShapleyResult(values, method, time.perf_counter() - start)
+    values, ci = shapley_monte_carlo(players, payoff_func, samples, seed, confidence)
+    return ShapleyResult(values, method, time.perf_counter() - start, samples, ci)
@@ -1,30 +1,34 @@
-from .methods import GOVERNANCE_METHODS
+from .methods import GOVERNANCE_METHODS, tally_winner
 import numpy as np
-from collections import defaultdict
+from collections import Counter, defaultdict
 import math
 from governance import conflict_resolution
+from governance.shapley import AdditiveGame, WeightedVotingGame, compute_shapley, DEFAULT_SAMPLES
 
-def shapley_value(coalition, all_agents, payoff_func):
+def shapley_value(coalition, all_agents, payoff_func, method='auto', samples=DEFAULT_SAMPLES, seed=None):
     """
     Compute Shapley value for each agent in a coalition.
     payoff_func: function that takes a set of agent names and returns the coalition's value.
+    See governance.shapley.compute_shapley for the available methods.
     """
-    from itertools import permutations
-    n = len(coalition)
-    if n == 0:
-        return {}
-    values = {a.name: 0.0 for a in coalition}
-    agents_list = list(coalition)
-    for perm in permutations(agents_list):
-        prev = set()
-        for i, agent in enumerate(perm):
-            prev_set = set(a.name for a in prev)
-            with_agent = prev_set | {agent.name}
-            without_agent = prev_set
-            marginal = payoff_func(with_agent) - payoff_func(without_agent)
-            values[agent.name] += marginal / math.factorial(n)
-            prev.add(agent)
-    return values
+    return compute_shapley([a.name for a in coalition], payoff_func, method, samples, seed).values
+
+def build_payoff(agents, winner, shapley_config):
+    """
+    Coalition payoff for the current winner.
+    'additive' (default): each supporter of the winner contributes its weight.
+    'weighted_voting': a coalition wins (value 1) if its supporters' weight reaches quota * total weight.
+    Weights come from shapley_config['weights'] (default 1 per agent).
+    """
+    weights = shapley_config.get('weights', {})
+    support = {a.name: weights.get(a.name, 1) if winner == a.preferences[0] else 0 for a in agents}
+    payoff = shapley_config.get('payoff', 'additive')
+    if payoff == 'additive':
+        return AdditiveGame(support)
+    if payoff == 'weighted_voting':
+        total = sum(weights.get(a.name, 1) for a in agents)
+        return WeightedVotingGame(support, shapley_config.get('quota', 0.5) * total)
+    raise ValueError(f"Unknown Shapley payoff '{payoff}'")
 
 def get_neighbors(agent, agents, adjacency):
     idx = [a.name for a in agents].index(agent.name)
@@ -33,30 +37,54 @@ def get_neighbors(agent, agents, adjacency):
 def distributed_gossip_consensus(agents, options, adjacency, rounds=5):
     """
     Distributed consensus using gossip: each agent shares its vote with neighbors, updates to local majority.
+    Votes are encoded as integers and each round is a matrix product over the adjacency matrix;
+    ties go to the vote seen first among the neighbors (in index order), then the agent's own vote.
     """
-    votes = {a.name: a.decide(options) for a in agents}
+    initial = [a.decide(options) for a in agents]
+    codes = {}
+    current = np.array([codes.setdefault(v, len(codes)) for v in initial], dtype=np.int64)
+    labels = list(codes)
+    m, k = len(agents), len(labels)
+    links = np.array(adjacency, dtype=bool)[:m, :m]
+    np.fill_diagonal(links, False)
+    weights = links.astype(np.int64)
+    rows = np.arange(m)
     for _ in range(rounds):
-        new_votes = votes.copy()
-        for a in agents:
-            neighbors = get_neighbors(a, agents, adjacency)
-            neighbor_votes = [votes[n.name] for n in neighbors]
-            all_votes = neighbor_votes + [votes[a.name]]
-            counts = defaultdict(int)
-            for v in all_votes:
-                counts[v] += 1
-            new_votes[a.name] = max(counts, key=counts.get)
-        votes = new_votes
-    final_counts = defaultdict(int)
-    for v in votes.values():
-        final_counts[v] += 1
-    winner = max(final_counts, key=final_counts.get)
+        onehot = np.zeros((m, k), dtype=np.int64)
+        onehot[rows, current] = 1
+        counts = weights @ onehot + onehot
+        # Position of each vote's first occurrence in [neighbors..., self]
+        first = np.full((m, k), 2 * m, dtype=np.int64)
+        first[rows, current] = m
+        for c in range(k):
+            voters = links & (current == c)[None, :]
+            seen = voters.any(axis=1)
+            first[seen, c] = voters[seen].argmax(axis=1)
+        ranked = np.where(counts == counts.max(axis=1, keepdims=True), first, 3 * m)
+        current = ranked.argmin(axis=1)
+    votes = {a.name: labels[c] for a, c in zip(agents, current)}
+    winner = tally_winner(list(votes.values()))
     return winner, votes
 
-def simulate_governance(agents, scenario_data, method):
+def trusted_partners(agent, threshold):
+    """Names the agent trusts strictly more than threshold."""
+    if hasattr(agent.trust, 'above'):
+        return agent.trust.above(threshold)
+    return [name for name, score in agent.trust.items() if score > threshold]
+
+def conflict_count(positions):
+    """Number of agent pairs with different positions (what detect_conflicts would list)."""
+    n = len(positions)
+    same = sum(c * (c - 1) // 2 for c in Counter(positions.values()).values())
+    return n * (n - 1) // 2 - same
+
+def simulate_governance(agents, scenario_data, method, detailed=True):
     """
     Run the governance method with support for networked/distributed simulation.
     If scenario context includes 'adjacency', use distributed consensus (gossip protocol).
     Otherwise, use coalition logic as before.
+    detailed=False skips the pairwise conflict list (quadratic in the number of agents)
+    and only reports 'conflict_count'.
     """
     options = scenario_data['options']
     context = scenario_data.get('context', {})
@@ -88,9 +116,12 @@ def simulate_governance(agents, scenario_data, method):
     results_per_round = []
     coalitions = []
     unassigned = set(agents)
+    by_name = defaultdict(list)
+    for a in agents:
+        by_name[a.name].append(a)
     while unassigned:
         agent = unassigned.pop()
-        partners = [a for a in unassigned if agent.trust.get(a.name, 0) > 0.8]
+        partners = [a for name in set(trusted_partners(agent, 0.8)) for a in by_name.get(name, ()) if a in unassigned]
         if partners:
             coalition = [agent] + partners
             for p in partners:
@@ -111,13 +142,20 @@ def simulate_governance(agents, scenario_data, method):
     for v in bloc_votes:
         tally[v] += 1
     winner = max(tally, key=tally.get)
-    def payoff_func(agent_names):
-        return sum(1.0 for a in agents if a.name in agent_names and winner == a.preferences[0])
+    shapley_config = context.get('shapley', {})
+    payoff_func = build_payoff(agents, winner, shapley_config)
     coalition_payoffs = {}
+    shapley_method = shapley_config.get('method', 'auto')
+    shapley_info = {'method': shapley_method, 'time': 0.0, 'max_ci': 0.0}
     for coalition in coalitions:
-        sv = shapley_value(coalition, agents, payoff_func)
+        sv = compute_shapley([a.name for a in coalition], payoff_func, shapley_method,
+                             shapley_config.get('samples', DEFAULT_SAMPLES), shapley_config.get('seed'))
+        # Method actually used ('auto' resolves per coalition)
+        shapley_info['method'] = sv.method
+        shapley_info['time'] += sv.time
+        shapley_info['max_ci'] = max(shapley_info['max_ci'], sv.max_ci)
         for a in coalition:
-            coalition_payoffs[a.name] = sv[a.name]
+            coalition_payoffs[a.name] = sv.values[a.name]
     votes = [a.decide(options, context) for a in agents]
     satisfaction = [1.0 - a.preferences.index(winner)/max(1, len(a.preferences)-1) if winner in a.preferences else 0 for a in agents]
     for a, v, s in zip(agents, votes, satisfaction):
@@ -125,7 +163,7 @@ def simulate_governance(agents, scenario_data, method):
     # 1. Collect agent positions
     positions = {a.name: a.decide(options, context) for a in agents}
     # 2. Detect conflicts
-    conflicts = conflict_resolution.detect_conflicts(positions)
+    conflicts = conflict_resolution.detect_conflicts(positions) if detailed else []
     resolved_conflicts = []
     if conflicts:
         for conflict in conflicts:
@@ -139,14 +177,16 @@ def simulate_governance(agents, scenario_data, method):
         'agent_names': [a.name for a in agents],
         'coalitions': [[a.name for a in c] for c in coalitions],
         'coalition_payoffs': coalition_payoffs,
+        'shapley': shapley_info,
         'rounds': 1,
         'history': [],
         'conflicts': conflicts,
+        'conflict_count': conflict_count(positions),
         'resolved_conflicts': resolved_conflicts
     }
     return result
 
-def simulate_manipulation(agents, scenario_data, method, manipulation_type='strategic', noise_level=0.0, bribery_budget=0):
+def simulate_manipulation(agents, scenario_data, method, manipulation_type='strategic', noise_level=0.0, bribery_budget=0, detailed=True):
     """
     Simulate governance with manipulation/noise:
     - manipulation_type: 'strategic', 'false_coalition', 'bribery', 'noise'
@@ -181,7 +221,7 @@ def simulate_manipulation(agents, scenario_data, method, manipulation_type='stra
             orig_decide = a.decide
             a.decide = lambda opts, ctx=None, orig_decide=orig_decide: orig_decide(opts, ctx) if np.random.rand() > noise_level else np.random.choice(opts)
     # Run normal simulation
-    result = simulate_governance(agents_copy, scenario_data, method)
+    result = simulate_governance(agents_copy, scenario_data, method, detailed)
     result['manipulation_type'] = manipulation_type
     result['noise_level'] = noise_level
     result['bribery_budget'] = bribery_budget
@@ -189,24 +229,24 @@ def simulate_manipulation(agents, scenario_data, method, manipulation_type='stra
 
 # CLI-accessible entry point for manipulability analysis
 
-def manipulability_analysis(agents, scenario_data, method):
+def manipulability_analysis(agents, scenario_data, method, detailed=True):
     """
     Run a suite of manipulation/noise scenarios and report impact on metrics.
     Returns: list of result dicts for each manipulation type/level.
     """
     results = []
     # Baseline
-    baseline = simulate_governance(agents, scenario_data, method)
+    baseline = simulate_governance(agents, scenario_data, method, detailed)
     baseline['manipulation_type'] = 'none'
     results.append(baseline)
     # Strategic manipulation
-    results.append(simulate_manipulation(agents, scenario_data, method, 'strategic'))
+    results.append(simulate_manipulation(agents, scenario_data, method, 'strategic', detailed=detailed))
     # False coalition
-    results.append(simulate_manipulation(agents, scenario_data, method, 'false_coalition'))
+    results.append(simulate_manipulation(agents, scenario_data, method, 'false_coalition', detailed=detailed))
     # Bribery (bribe 1 and 2 agents)
-    results.append(simulate_manipulation(agents, scenario_data, method, 'bribery', bribery_budget=1))
-    results.append(simulate_manipulation(agents, scenario_data, method, 'bribery', bribery_budget=2))
+    results.append(simulate_manipulation(agents, scenario_data, method, 'bribery', bribery_budget=1, detailed=detailed))
+    results.append(simulate_manipulation(agents, scenario_data, method, 'bribery', bribery_budget=2, detailed=detailed))
     # Noise (10% and 30%)
-    results.append(simulate_manipulation(agents, scenario_data, method, 'noise', noise_level=0.1))
-    results.append(simulate_manipulation(agents, scenario_data, method, 'noise', noise_level=0.3))
+    results.append(simulate_manipulation(agents, scenario_data, method, 'noise', noise_level=0.1, detailed=detailed))
+    results.append(simulate_manipulation(agents, scenario_data, method, 'noise', noise_level=0.3, detailed=detailed))
     return results 
\ No newline at end of file
@@ -77,20 +77,29 @@ def summarize_results(results):
     Summarize results for a single run or a batch (list of runs).
     """
     if isinstance(results, list):
-        return {
+        summary = {
             'consensus_rate': np.mean([consensus_rate(r) for r in results]),
             'fairness': np.mean([fairness_index(r) for r in results]),
             'efficiency': np.mean([efficiency(r) for r in results]),
             'satisfaction': np.mean([satisfaction(r) for r in results]),
             'stability': stability(results),
         }
+        shapley_runs = [r['shapley'] for r in results if 'shapley' in r]
+        if shapley_runs:
+            summary['shapley_method'] = shapley_runs[0]['method']
+            summary['shapley_time'] = np.mean([s['time'] for s in shapley_runs])
+        return summary
     else:
-        return {
+        summary = {
             'consensus_rate': consensus_rate(results),
             'fairness': fairness_index(results),
             'efficiency': efficiency(results),
             'satisfaction': satisfaction(results),
         }
+        if 'shapley' in results:
+            summary['shapley_method'] = results['shapley']['method']
+            summary['shapley_time'] = results['shapley']['time']
+        return summary
 
 def validate_scenario(scenario):
     """
@@ -5,6 +5,9 @@ from scenarios.loader import load_scenario
 from metrics.metrics import summarize_results
 import numpy as np
 import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 
 def run_simulation(agents, scenario_data, method):
@@ -30,6 +33,78 @@ def batch_run(config_path, n_runs=100, method=None, output_csv='results.csv'):
     print(f"Batch results saved to {output_csv}")
     print(df.groupby('method').mean(numeric_only=True))
 
+MANIPULATIONS = ['none', 'strategic', 'false_coalition', 'bribery', 'noise']
+
+# Scenario shared by the sweep workers (set once per process by the pool initializer)
+_SWEEP_SCENARIO = None
+
+
+def _init_sweep_worker(scenario_data):
+    global _SWEEP_SCENARIO
+    _SWEEP_SCENARIO = scenario_data
+
+
+def sweep_task(task):
+    """
+    One sweep cell: fresh agents for (method, manipulation, level, seed), summary-only simulation.
+    Module-level so that it can be sent to the process pool.
+    """
+    from governance.simulation import simulate_governance, simulate_manipulation
+    method, manipulation, level, seed = task
+    scenario_data = _SWEEP_SCENARIO
+    start = time.perf_counter()
+    agents = AgentFactory.create_agents(scenario_data['agents'], seed=seed)
+    if manipulation == 'none':
+        result = simulate_governance(agents, scenario_data, method, detailed=False)
+    else:
+        result = simulate_manipulation(agents, scenario_data, method, manipulation,
+                                       noise_level=level if manipulation == 'noise' else 0.0,
+                                       bribery_budget=int(level) if manipulation == 'bribery' else 0,
+                                       detailed=False)
+    # Outcome of the voting kernel itself on the same population
+    method_winner = GOVERNANCE_METHODS[method](agents, scenario_data['options'], scenario_data.get('context', {}))
+    summary = summarize_results(result)
+    summary.update({
+        'method': method,
+        'manipulation_type': manipulation,
+        'level': level,
+        'seed': seed,
+        'winner': result['winner'],
+        'method_winner': method_winner,
+        'n_agents': len(agents),
+        'time': time.perf_counter() - start,
+    })
+    return summary
+
+
+def sweep(scenario_data, methods=None, manipulations=None, noise_levels=(0.1, 0.3), bribery_budgets=(1, 2),
+          seeds=range(10), workers=None, output_csv=None):
+    """
+    Evaluate methods x manipulation types x levels x seeds in a process pool.
+    Levels are noise_levels for 'noise', bribery_budgets for 'bribery', and 0 otherwise.
+    Returns a DataFrame with one summary row per cell (optionally saved to output_csv).
+    """
+    methods = methods or list(GOVERNANCE_METHODS)
+    manipulations = manipulations or MANIPULATIONS
+    levels = {'noise': list(noise_levels), 'bribery': list(bribery_budgets)}
+    tasks = [(method, manipulation, level, seed)
+             for method in methods
+             for manipulation in manipulations
+             for level in levels.get(manipulation, [0])
+             for seed in seeds]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_sweep_worker(scenario_data)
+        rows = [sweep_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_sweep_worker,
+                                 initargs=(scenario_data,)) as pool:
+            rows = list(pool.map(sweep_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    df = pd.DataFrame(rows)
+    if output_csv:
+        df.to_csv(output_csv, index=False)
+    return df
+
 if __name__ == '__main__':
     import argparse
     parser = argparse.ArgumentParser(description='Batch experiment runner')
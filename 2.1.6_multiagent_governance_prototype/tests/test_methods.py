@@ -0,0 +1,274 @@
+"""
+Equivalence tests for the vectorised governance kernels.
+
+The reference implementations below are the per-agent loops the kernels replaced;
+every kernel must pick the same winner on random profiles.
+"""
+import os
+import random
+import sys
+import unittest
+from collections import Counter, defaultdict
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.base_agent import Agent, TrustMap
+from governance import methods
+from governance.methods import PreferenceProfile, tally_winner
+from governance.simulation import distributed_gossip_consensus, trusted_partners
+from runner import sweep
+
+SCENARIO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scenarios'))
+
+
+# --- Reference (scalar) implementations ---
+
+def reference_majority(agents, options, context):
+    return Counter(a.decide(options, context) for a in agents).most_common(1)[0][0]
+
+
+def reference_borda(agents, options, context):
+    scores = {o: 0 for o in options}
+    n = len(options)
+    for a in agents:
+        for i, o in enumerate(a.preferences):
+            if o in scores:
+                scores[o] += n - i - 1
+    return max(scores, key=scores.get)
+
+
+def reference_condorcet(agents, options, context):
+    n = len(options)
+    pairwise_wins = {o: 0 for o in options}
+    for o1 in options:
+        for o2 in options:
+            if o1 == o2:
+                continue
+            o1_wins = sum(a.preferences.index(o1) < a.preferences.index(o2) for a in agents)
+            if o1_wins > len(agents) - o1_wins:
+                pairwise_wins[o1] += 1
+    for o in options:
+        if pairwise_wins[o] == n - 1:
+            return o
+    return reference_borda(agents, options, context)
+
+
+def reference_quadratic(agents, options, context):
+    budget = context.get('quadratic_budget', 9) if context else 9
+    votes = {o: 0 for o in options}
+    for a in agents:
+        allocation = [0] * len(options)
+        if a.personality == 'flexible' and len(options) > 1:
+            allocation[a.preferences.index(options[0])] = budget // 2
+            allocation[a.preferences.index(options[1])] = budget - (budget // 2)
+        else:
+            allocation[a.preferences.index(a.preferences[0])] = budget
+        for i, o in enumerate(options):
+            votes[o] += allocation[i]
+    return max(votes, key=votes.get)
+
+
+def reference_byzantine(agents, options, context):
+    n_byzantine = int(len(agents) * context.get('byzantine_ratio', 0.2))
+    votes = [a.decide(options, context) for a in agents[n_byzantine:]]
+    votes += [np.random.choice(options) for _ in agents[:n_byzantine]]
+    return Counter(votes).most_common(1)[0][0]
+
+
+def reference_raft(agents, options, context):
+    leader = np.random.choice(agents)
+    proposal = leader.decide(options, context)
+    acceptances = 1 + sum(1 for a in agents if a is not leader and proposal in a.preferences[:2])
+    if acceptances > len(agents) // 2:
+        return proposal
+    return reference_majority(agents, options, context)
+
+
+def reference_gossip(agents, options, adjacency, rounds=5):
+    votes = {a.name: a.decide(options) for a in agents}
+    for _ in range(rounds):
+        new_votes = votes.copy()
+        for i, a in enumerate(agents):
+            neighbors = [agents[j] for j, connected in enumerate(adjacency[i]) if connected and j != i]
+            counts = defaultdict(int)
+            for v in [votes[n.name] for n in neighbors] + [votes[a.name]]:
+                counts[v] += 1
+            new_votes[a.name] = max(counts, key=counts.get)
+        votes = new_votes
+    final_counts = defaultdict(int)
+    for v in votes.values():
+        final_counts[v] += 1
+    return max(final_counts, key=final_counts.get), votes
+
+
+def random_population(rng, n_agents, options, partial=False):
+    agents = []
+    for i in range(n_agents):
+        preferences = rng.sample(options, len(options))
+        if partial:
+            preferences = preferences[:rng.randint(1, len(options))]
+        personality = rng.choice(['stubborn', 'flexible', 'strategic'])
+        agents.append(Agent(f"Agent{i+1}", personality, preferences, n_agents=n_agents))
+    return agents
+
+
+class TestVotingKernels(unittest.TestCase):
+
+    def compare(self, kernel, reference, partial=False, seeded=False, trials=200, context=None):
+        rng = random.Random(0)
+        for trial in range(trials):
+            options = [f"O{j}" for j in range(rng.randint(2, 6))]
+            agents = random_population(rng, rng.randint(1, 25), options, partial)
+            ctx = dict(context or {})
+            if seeded:
+                np.random.seed(trial)
+            expected = reference(agents, options, ctx)
+            if seeded:
+                np.random.seed(trial)
+            self.assertEqual(kernel(agents, options, ctx), expected,
+                             [(a.personality, a.preferences) for a in agents])
+
+    def test_majority(self):
+        self.compare(methods.majority_voting, reference_majority)
+
+    def test_borda(self):
+        self.compare(methods.borda_count, reference_borda)
+        self.compare(methods.borda_count, reference_borda, partial=True)
+
+    def test_condorcet(self):
+        self.compare(methods.condorcet_method, reference_condorcet)
+
+    def test_quadratic(self):
+        self.compare(methods.quadratic_voting, reference_quadratic)
+        self.compare(methods.quadratic_voting, reference_quadratic, context={'quadratic_budget': 7})
+
+    def test_byzantine(self):
+        self.compare(methods.byzantine_consensus, reference_byzantine, seeded=True,
+                     context={'byzantine_ratio': 0.3})
+
+    def test_raft(self):
+        self.compare(methods.raft_consensus, reference_raft, seeded=True)
+
+    def test_tally_winner_matches_most_common(self):
+        rng = random.Random(1)
+        for _ in range(500):
+            votes = [rng.choice("abcd") for _ in range(rng.randint(1, 12))]
+            self.assertEqual(tally_winner(votes), Counter(votes).most_common(1)[0][0], votes)
+
+    def test_profile_ranks_first_occurrence(self):
+        agents = [Agent("x", 'stubborn', ['B', 'A', 'B']), Agent("y", 'stubborn', ['C'])]
+        ranks = PreferenceProfile(agents, ['A', 'B', 'C']).ranks
+        self.assertEqual(ranks[0].tolist(), [1, 0, PreferenceProfile.MISSING])
+        self.assertEqual(ranks[1].tolist(), [PreferenceProfile.MISSING, PreferenceProfile.MISSING, 0])
+
+
+class TestGossip(unittest.TestCase):
+
+    def test_matches_reference_loop(self):
+        rng = random.Random(2)
+        for _ in range(200):
+            options = [f"O{j}" for j in range(rng.randint(2, 5))]
+            agents = random_population(rng, rng.randint(1, 15), options)
+            n = len(agents)
+            density = rng.random()
+            adjacency = [[int(rng.random() < density) for _ in range(n)] for _ in range(n)]
+            rounds = rng.randint(0, 6)
+            self.assertEqual(distributed_gossip_consensus(agents, options, adjacency, rounds),
+                             reference_gossip(agents, options, adjacency, rounds), adjacency)
+
+
+class TestTrustMap(unittest.TestCase):
+
+    def test_behaves_like_dict(self):
+        rng = random.Random(3)
+        for owner in ("Agent3", "Outsider"):
+            trust = TrustMap(6, owner)
+            expected = {f"Agent{i+1}": 0.5 for i in range(6) if f"Agent{i+1}" != owner}
+            keys = [f"Agent{i+1}" for i in range(8)] + [owner, "Other"]
+            for _ in range(500):
+                key = rng.choice(keys)
+                op = rng.random()
+                if op < 0.4:
+                    value = round(rng.random(), 2)
+                    trust[key] = value
+                    expected[key] = value
+                elif op < 0.6:
+                    if key in expected:
+                        del trust[key]
+                        del expected[key]
+                    else:
+                        with self.assertRaises(KeyError):
+                            del trust[key]
+                else:
+                    self.assertEqual(trust.get(key, 0.5), expected.get(key, 0.5))
+                self.assertEqual(dict(trust), expected)
+                self.assertEqual(len(trust), len(expected))
+                self.assertEqual(sorted(trust.values()), sorted(expected.values()))
+                threshold = rng.choice([0.3, 0.5, 0.8])
+                self.assertEqual(sorted(trust.above(threshold)),
+                                 sorted(name for name, score in expected.items() if score > threshold))
+
+    def test_trusted_partners_with_plain_dict(self):
+        agent = Agent("a", 'stubborn', ['A'])
+        agent.trust = {'b': 0.9, 'c': 0.8}
+        self.assertEqual(trusted_partners(agent, 0.8), ['b'])
+
+
+class TestSweep(unittest.TestCase):
+
+    def test_sweep_smoke(self):
+        import json
+        with open(os.path.join(SCENARIO_DIR, 'strategic_bloc.json')) as f:
+            scenario = json.load(f)
+        kwargs = dict(methods=['majority', 'borda'], manipulations=['none', 'noise'],
+                      noise_levels=(0.1, 0.3), seeds=range(2))
+        df = sweep(scenario, workers=1, **kwargs)
+        self.assertEqual(len(df), 2 * (1 + 2) * 2)
+        for column in ('method', 'manipulation_type', 'level', 'seed', 'winner', 'method_winner',
+                       'n_agents', 'time'):
+            self.assertIn(column, df.columns)
+        self.assertTrue(set(df['winner']) <= set(scenario['options']))
+        self.assertTrue((df['n_agents'] == len(scenario['agents'])).all())
+        # Each cell reseeds its agents, so the process pool gives the same kernel outcomes
+        # (the simulated 'winner' may differ on ties, coalitions are drawn from a set)
+        pooled = sweep(scenario, workers=2, **kwargs)
+        cells = ['method', 'manipulation_type', 'level', 'seed']
+        self.assertEqual(df[cells].values.tolist(), pooled[cells].values.tolist())
+        self.assertEqual(df['method_winner'].tolist(), pooled['method_winner'].tolist())
+
+
+
+class TestManipulabilityAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        from agents.agent_factory import AgentFactory
+        from scenarios.loader import load_scenario
+        self.scenario = load_scenario(os.path.join(SCENARIO_DIR, 'strategic_bloc.json'))
+        self.agents = AgentFactory.create_agents(self.scenario['agents'])
+
+    def test_summary_mode_skips_conflict_records(self):
+        from governance.simulation import manipulability_analysis
+        results = manipulability_analysis(self.agents, self.scenario, 'majority', detailed=False)
+        self.assertEqual(len(results), 7)
+        self.assertTrue(all(r['conflicts'] == [] and r['resolved_conflicts'] == [] for r in results))
+        self.assertTrue(all('conflict_count' in r for r in results))
+
+    def test_cli_requests_details_only_on_demand(self):
+        try:
+            from click.testing import CliRunner
+            import cli
+        except ImportError as e:
+            self.skipTest(f"CLI dependencies missing: {e}")
+        from unittest.mock import patch
+        path = os.path.join(SCENARIO_DIR, 'strategic_bloc.json')
+        for extra, detailed in (([], False), (['--details'], True)):
+            with patch.object(cli, 'manipulability_analysis', return_value=[]) as analysis:
+                CliRunner().invoke(cli.cli, ['manipulability-analysis', '--scenario', path,
+                                             '--method', 'majority'] + extra)
+            self.assertEqual(analysis.call_args.kwargs, {'detailed': detailed})
+
+
+if __name__ == '__main__':
+    unittest.main()
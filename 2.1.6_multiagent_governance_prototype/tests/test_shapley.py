@@ -0,0 +1,123 @@
+"""
+Tests of the Shapley engine: the weighted voting dynamic program and the
+additive closed form are checked against exact subset enumeration.
+"""
+import math
+import os
+import random
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from governance.shapley import (AdditiveGame, WeightedVotingGame, compute_shapley,
+                                shapley_monte_carlo, shapley_subsets)
+
+
+def random_game(rng, n):
+    players = [f"A{i}" for i in range(n)]
+    weights = {p: rng.randint(0, 6) for p in players}
+    total = sum(weights.values())
+    quota = rng.choice([rng.uniform(0, total + 1), rng.randint(0, total + 1), total / 2, 0, total + 1])
+    return players, WeightedVotingGame(weights, quota)
+
+
+class TestWeightedVotingGame(unittest.TestCase):
+
+    def assertValuesAlmostEqual(self, actual, expected, places=9, msg=None):
+        self.assertEqual(list(actual), list(expected), msg)
+        for p in expected:
+            self.assertAlmostEqual(actual[p], expected[p], places=places, msg=msg)
+
+    def test_matches_subset_enumeration_on_random_games(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            players, game = random_game(rng, rng.randint(1, 8))
+            self.assertValuesAlmostEqual(game.shapley(players), shapley_subsets(players, game),
+                                         msg=(game.weights, game.quota))
+
+    def test_heavy_players_and_unknown_players(self):
+        game = WeightedVotingGame({'a': 10, 'b': 1, 'c': 1}, 3)
+        players = ['a', 'b', 'c', 'ghost']
+        self.assertValuesAlmostEqual(game.shapley(players), shapley_subsets(players, game))
+        # Dictator: quota reachable by 'a' alone and only with 'a'
+        dictator = WeightedVotingGame({'a': 5, 'b': 1, 'c': 1}, 5)
+        self.assertValuesAlmostEqual(dictator.shapley(['a', 'b', 'c']), {'a': 1.0, 'b': 0.0, 'c': 0.0})
+
+    def test_constant_games(self):
+        game = WeightedVotingGame({'a': 1, 'b': 2}, 0)
+        self.assertEqual(game.shapley(['a', 'b']), {'a': 0.0, 'b': 0.0})
+        game = WeightedVotingGame({'a': 1, 'b': 2}, 4)
+        self.assertEqual(game.shapley(['a', 'b']), {'a': 0.0, 'b': 0.0})
+        self.assertEqual(game.shapley([]), {})
+
+    def test_rejects_non_integer_weights(self):
+        with self.assertRaises(ValueError):
+            WeightedVotingGame({'a': 1.5}, 1)
+        with self.assertRaises(ValueError):
+            WeightedVotingGame({'a': -1}, 1)
+
+    def test_large_games_are_efficient(self):
+        # Efficiency axiom: in a non-constant simple game the values sum to v(N) = 1
+        rng = random.Random(1)
+        for n in (50, 61, 200):
+            players = [f"A{i}" for i in range(n)]
+            weights = {p: rng.randint(1, 10) for p in players}
+            game = WeightedVotingGame(weights, sum(weights.values()) / 2)
+            start = time.perf_counter()
+            values = game.shapley(players)
+            elapsed = time.perf_counter() - start
+            self.assertAlmostEqual(sum(values.values()), 1.0, places=9, msg=n)
+            self.assertTrue(all(v >= 0 for v in values.values()))
+            # Symmetry: equal weights, equal values
+            by_weight = {}
+            for p in players:
+                by_weight.setdefault(weights[p], set()).add(round(values[p], 12))
+            self.assertTrue(all(len(v) == 1 for v in by_weight.values()), n)
+            self.assertLess(elapsed, 60, n)
+
+    def test_symmetric_game_splits_evenly(self):
+        n = 80
+        players = [f"A{i}" for i in range(n)]
+        values = WeightedVotingGame({p: 1 for p in players}, n // 2 + 1).shapley(players)
+        for p in players:
+            self.assertTrue(math.isclose(values[p], 1 / n, rel_tol=1e-9))
+
+
+class TestComputeShapley(unittest.TestCase):
+
+    def test_additive_game(self):
+        game = AdditiveGame({'a': 1.0, 'b': 2.5, 'c': 0.0})
+        players = ['a', 'b', 'c', 'd']
+        expected = shapley_subsets(players, game)
+        for p, v in game.shapley(players).items():
+            self.assertAlmostEqual(v, expected[p])
+
+    def test_method_selection(self):
+        game = WeightedVotingGame({'a': 3, 'b': 2, 'c': 1}, 4)
+        result = compute_shapley(['a', 'b', 'c'], game)
+        self.assertEqual(result.method, 'exact')
+        plain = compute_shapley(['a', 'b', 'c'], lambda s: game(s), method='exact')
+        for p in 'abc':
+            self.assertAlmostEqual(result.values[p], plain.values[p])
+        with self.assertRaises(ValueError):
+            compute_shapley(['a'], game, method='lottery')
+        with self.assertRaises(ValueError):
+            compute_shapley([f"A{i}" for i in range(20)], lambda s: len(s), method='exact')
+
+    def test_monte_carlo_within_confidence_interval(self):
+        rng = random.Random(2)
+        players, game = random_game(rng, 7)
+        game.quota = sum(game.weights.values()) / 2
+        exact = shapley_subsets(players, game)
+        values, ci = shapley_monte_carlo(players, game, samples=4000, seed=3)
+        for p in players:
+            self.assertLessEqual(abs(values[p] - exact[p]), 2 * ci[p] + 1e-9, p)
+        result = compute_shapley(players, lambda s: game(s), method='monte_carlo', samples=200, seed=1)
+        self.assertEqual(result.samples, 200)
+        self.assertGreaterEqual(result.max_ci, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,7 @@
 import json
 
 import spacy
-from typing import Dict, List
+from typing import Dict, Iterable, List
 from textstat import flesch_reading_ease
 import re
 
@@ -29,6 +29,50 @@ VERTUES = [
 with open("ressources_argumentatives.json", encoding="utf-8") as f:
     RESSOURCES_ARGUMENTATIVES = json.load(f)
 
+# Composants spaCy inutiles aux détecteurs (seuls les tokens et les phrases servent)
+COMPOSANTS_INUTILES = [nom for nom in ("ner", "lemmatizer") if nom in nlp.pipe_names]
+
+
+class MarkerMatcher:
+    """
+    Recherche en une passe de marqueurs textuels (sous-chaînes, insensible à la casse).
+
+    Une seule expression régulière en lookahead trouve, à chaque position du texte,
+    le marqueur le plus long qui y commence ; les marqueurs contenus dans un marqueur
+    trouvé sont ajoutés ensuite. Le résultat est identique au test `m in text.lower()`
+    appliqué à chaque marqueur, dans l'ordre de la liste d'origine.
+    """
+
+    def __init__(self, marqueurs: List[str]):
+        self.marqueurs = list(marqueurs)
+        self.cles = [m.lower() for m in self.marqueurs]
+        distinctes = sorted(set(c for c in self.cles if c), key=len, reverse=True)
+        self.regex = re.compile("(?=(" + "|".join(map(re.escape, distinctes)) + "))") if distinctes else None
+        self.contenus = {c: {autre for autre in distinctes if autre in c} for c in distinctes}
+
+    def trouver(self, text_lower: str) -> List[str]:
+        presents = set()
+        if self.regex is not None:
+            for match in self.regex.finditer(text_lower):
+                cle = match.group(1)
+                if cle not in presents:
+                    presents |= self.contenus[cle]
+        # Un marqueur vide est contenu dans tout texte
+        return [m for m, c in zip(self.marqueurs, self.cles) if c in presents or not c]
+
+
+CONNECTEURS_PERTINENCE = frozenset(RESSOURCES_ARGUMENTATIVES["connecteurs_pertinence"])
+CITATION_REGEXES = [re.compile(p, re.IGNORECASE) for p in RESSOURCES_ARGUMENTATIVES["citation_patterns"]]
+MARQUEURS_REFUTATION = MarkerMatcher(RESSOURCES_ARGUMENTATIVES["marqueurs_refutation"])
+CONNECTEURS_STRUCTURE = MarkerMatcher(RESSOURCES_ARGUMENTATIVES["connecteurs_structure_logique"])
+PATTERNS_ANALOGIES = MarkerMatcher(RESSOURCES_ARGUMENTATIVES["patterns_analogies"])
+SOURCES_CREDIBLES = MarkerMatcher(RESSOURCES_ARGUMENTATIVES["credible_sources"])
+
+
+def analyser(text: str):
+    """Analyse spaCy d'un texte, partagée par les détecteurs qui en ont besoin."""
+    return nlp(text, disable=COMPOSANTS_INUTILES)
+
 
 class ArgumentEvaluationReport:
     def __init__(self, text: str):
@@ -63,10 +107,9 @@ def detect_clarte(text: str) -> (float, str):
 
 # Détecteur de pertinence : heuristique simple
 
-def detect_pertinence(text: str) -> (float, str):
-    doc = nlp(text)
-    connecteurs = RESSOURCES_ARGUMENTATIVES["connecteurs_pertinence"]
-    count = sum(1 for token in doc if token.text.lower() in connecteurs)
+def detect_pertinence(text: str, doc=None) -> (float, str):
+    doc = doc if doc is not None else analyser(text)
+    count = sum(1 for token in doc if token.text.lower() in CONNECTEURS_PERTINENCE)
     if count >= 3:
         return 1.0, f"Connecteurs logiques détectés ({count}). Argument bien structuré."
     elif count >= 1:
@@ -77,10 +120,7 @@ def detect_pertinence(text: str) -> (float, str):
 # Détecteur de sources
 
 def detect_presence_sources(text: str) -> (float, str):
-    citation_patterns = RESSOURCES_ARGUMENTATIVES["citation_patterns"]
-    count = 0
-    for pattern in citation_patterns:
-        count += len(re.findall(pattern, text, re.IGNORECASE))
+    count = sum(len(regex.findall(text)) for regex in CITATION_REGEXES)
     if count >= 2:
         return 1.0, f"{count} sources détectées."
     elif count == 1:
@@ -91,8 +131,7 @@ def detect_presence_sources(text: str) -> (float, str):
 # Réfutation constructive
 
 def detect_refutation_constructive(text: str) -> (float, str):
-    marqueurs = RESSOURCES_ARGUMENTATIVES["marqueurs_refutation"]
-    found = [m for m in marqueurs if m in text.lower()]
+    found = MARQUEURS_REFUTATION.trouver(text.lower())
     if len(found) >= 1:
         return 1.0, f"Réfutation détectée avec les marqueurs : {found}."
     return 0.0, "Aucune réfutation constructive détectée."
@@ -100,8 +139,7 @@ def detect_refutation_constructive(text: str) -> (float, str):
 # Bonne structure logique (simplifié)
 
 def detect_structure_logique(text: str) -> (float, str):
-    connecteurs = RESSOURCES_ARGUMENTATIVES["connecteurs_structure_logique"]
-    found = [c for c in connecteurs if c in text.lower()]
+    found = CONNECTEURS_STRUCTURE.trouver(text.lower())
     if len(found) >= 2:
         return 1.0, f"Structure logique détectée avec {len(found)} connecteurs."
     elif len(found) == 1:
@@ -111,8 +149,7 @@ def detect_structure_logique(text: str) -> (float, str):
 # Analogies pertinentes
 
 def detect_analogie_pertinente(text: str) -> (float, str):
-    patterns = RESSOURCES_ARGUMENTATIVES["patterns_analogies"]
-    found = [p for p in patterns if p in text.lower()]
+    found = PATTERNS_ANALOGIES.trouver(text.lower())
     if len(found) >= 1:
         return 1.0, f"Analogie détectée : {found}."
     return 0.0, "Aucune analogie détectée."
@@ -120,16 +157,16 @@ def detect_analogie_pertinente(text: str) -> (float, str):
 # Fiabilité des sources (très simplifié)
 
 def detect_fiabilite_sources(text: str) -> (float, str):
-    credible_sources = RESSOURCES_ARGUMENTATIVES["credible_sources"]
-    found = [src for src in credible_sources if src.lower() in text.lower()]
+    found = SOURCES_CREDIBLES.trouver(text.lower())
     if found:
         return 1.0, f"Sources crédibles détectées : {found}."
     return 0.0, "Pas de source crédible identifiable."
 
 # Exhaustivité raisonnable (heuristique basée sur la longueur)
 
-def detect_exhaustivite(text: str) -> (float, str):
-    sentences = list(nlp(text).sents)
+def detect_exhaustivite(text: str, doc=None) -> (float, str):
+    doc = doc if doc is not None else analyser(text)
+    sentences = list(doc.sents)
     if len(sentences) >= 5:
         return 1.0, f"{len(sentences)} phrases détectées. Couverture raisonnable."
     elif len(sentences) >= 3:
@@ -138,8 +175,9 @@ def detect_exhaustivite(text: str) -> (float, str):
 
 # Redondance faible (heuristique simple sur répétitions de mots)
 
-def detect_redondance_faible(text: str) -> (float, str):
-    words = [t.text.lower() for t in nlp(text) if t.is_alpha]
+def detect_redondance_faible(text: str, doc=None) -> (float, str):
+    doc = doc if doc is not None else analyser(text)
+    words = [t.text.lower() for t in doc if t.is_alpha]
     unique = set(words)
     ratio = len(unique) / len(words) if words else 0
     if ratio > 0.7:
@@ -150,28 +188,50 @@ def detect_redondance_faible(text: str) -> (float, str):
 
 # Fonction principale
 
-def evaluer_argument(text: str) -> Dict:
+DETECTEURS = {
+    "clarte": detect_clarte,
+    "pertinence": detect_pertinence,
+    "presence_sources": detect_presence_sources,
+    "refutation_constructive": detect_refutation_constructive,
+    "structure_logique": detect_structure_logique,
+    "analogie_pertinente": detect_analogie_pertinente,
+    "fiabilite_sources": detect_fiabilite_sources,
+    "exhaustivite": detect_exhaustivite,
+    "redondance_faible": detect_redondance_faible
+}
+
+# Détecteurs qui reçoivent l'analyse spaCy partagée
+DETECTEURS_SPACY = {"pertinence", "exhaustivite", "redondance_faible"}
+
+
+def evaluer_argument(text: str, doc=None) -> Dict:
+    """Évalue un argument ; `doc` est son analyse spaCy si elle est déjà disponible."""
     report = ArgumentEvaluationReport(text)
+    doc = doc if doc is not None else analyser(text)
 
-    detecteurs = {
-        "clarte": detect_clarte,
-        "pertinence": detect_pertinence,
-        "presence_sources": detect_presence_sources,
-        "refutation_constructive": detect_refutation_constructive,
-        "structure_logique": detect_structure_logique,
-        "analogie_pertinente": detect_analogie_pertinente,
-        "fiabilite_sources": detect_fiabilite_sources,
-        "exhaustivite": detect_exhaustivite,
-        "redondance_faible": detect_redondance_faible
-    }
-
-    for vertu, fonction in detecteurs.items():
-        note, commentaire = fonction(text)
+    for vertu, fonction in DETECTEURS.items():
+        if vertu in DETECTEURS_SPACY:
+            note, commentaire = fonction(text, doc)
+        else:
+            note, commentaire = fonction(text)
         report.scores[vertu] = note
         report.details[vertu] = commentaire
 
     return report.to_dict()
 
+
+def evaluer_arguments_batch(texts: Iterable[str], batch_size: int = 256,
+                            n_process: int = 1) -> List[Dict]:
+    """
+    Évalue un corpus d'arguments en analysant les textes par lots avec `nlp.pipe`.
+
+    `n_process` > 1 répartit l'analyse spaCy sur plusieurs processus ;
+    les textes peuvent être fournis par un générateur.
+    """
+    return [evaluer_argument(d.text, d)
+            for d in nlp.pipe(texts, batch_size=batch_size, n_process=n_process,
+                              disable=COMPOSANTS_INUTILES)]
+
 ARGUMENTS_EXAMPLE = [
 # 0
 "Selon Smith (2020), les énergies renouvelables sont essentielles car elles réduisent les émissions. Cependant, leur mise en œuvre demande des investissements.",
@@ -0,0 +1,80 @@
+"""
+Tests de l'agent d'évaluation de la qualité argumentative.
+
+Vérifie que la recherche de marqueurs en une passe (`MarkerMatcher`) donne le
+même résultat que le test `marqueur in texte.lower()`, et que l'évaluation par
+lots (`evaluer_arguments_batch`) donne les mêmes rapports que l'évaluation
+texte par texte.
+"""
+
+import os
+import random
+import sys
+import unittest
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    import spacy
+    import textstat  # noqa: F401
+    MODELE_DISPONIBLE = spacy.util.is_package("fr_core_news_sm")
+except ImportError:
+    MODELE_DISPONIBLE = False
+
+if not MODELE_DISPONIBLE:
+    raise unittest.SkipTest("spaCy, textstat ou le modèle fr_core_news_sm ne sont pas installés")
+
+# agent.py lit ses ressources dans le répertoire courant
+sys.path.insert(0, SRC_DIR)
+_cwd = os.getcwd()
+os.chdir(SRC_DIR)
+try:
+    import agent
+finally:
+    os.chdir(_cwd)
+
+
+def recherche_naive(marqueurs, texte):
+    texte = texte.lower()
+    return [m for m in marqueurs if m.lower() in texte]
+
+
+class TestMarkerMatcher(unittest.TestCase):
+
+    def test_ressources_du_projet(self):
+        for nom in ("marqueurs_refutation", "connecteurs_structure_logique", "patterns_analogies",
+                    "credible_sources"):
+            marqueurs = agent.RESSOURCES_ARGUMENTATIVES[nom]
+            matcher = agent.MarkerMatcher(marqueurs)
+            for texte in agent.ARGUMENTS_EXAMPLE:
+                self.assertEqual(matcher.trouver(texte.lower()), recherche_naive(marqueurs, texte), nom)
+
+    def test_marqueurs_imbriques_et_chevauchants(self):
+        rng = random.Random(0)
+        alphabet = "ab c"
+        for _ in range(300):
+            marqueurs = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 4)))
+                         for _ in range(rng.randint(1, 8))]
+            marqueurs += [m.upper() for m in rng.sample(marqueurs, 1)]
+            texte = "".join(rng.choice(alphabet + "AB") for _ in range(rng.randint(0, 30)))
+            self.assertEqual(agent.MarkerMatcher(marqueurs).trouver(texte.lower()),
+                             recherche_naive(marqueurs, texte), (marqueurs, texte))
+
+    def test_liste_vide(self):
+        self.assertEqual(agent.MarkerMatcher([]).trouver("cependant"), [])
+
+
+class TestEvaluationParLots(unittest.TestCase):
+
+    def test_lots_identiques_a_l_evaluation_unitaire(self):
+        attendus = [agent.evaluer_argument(texte) for texte in agent.ARGUMENTS_EXAMPLE]
+        self.assertEqual(agent.evaluer_arguments_batch(agent.ARGUMENTS_EXAMPLE, batch_size=4), attendus)
+
+    def test_generateur_et_textes_vides(self):
+        textes = ["", "Cependant, selon l'OMS (2021), c'est comme un bouclier."] + agent.ARGUMENTS_EXAMPLE[:3]
+        attendus = [agent.evaluer_argument(texte) for texte in textes]
+        self.assertEqual(agent.evaluer_arguments_batch(iter(textes), batch_size=2), attendus)
+
+
+if __name__ == '__main__':
+    unittest.main()
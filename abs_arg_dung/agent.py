@@ -1,44 +1,81 @@
 import os
+import re
 import glob
 import random
+from pathlib import Path
 
 # --- CONFIGURATION AVEC JPYPE ---
 # Ce fichier ne doit PAS démarrer la JVM. Il suppose qu'elle est déjà démarrée
 # par le point d'entrée de l'application (ex: api/main.py ou une fixture de test).
-import jpype
-import jpype.imports
-# Assurez-vous que le pont est démarré en amont (par ex. dans l'API)
-import matplotlib.pyplot as plt
+# JPype n'est requis que pour le backend "tweety" ; les backends "native" et
+# "remote" (reasoners Tweety exécutés dans des processus workers) fonctionnent
+# sans JVM dans le processus courant.
+try:
+    import jpype
+    import jpype.imports
+    from jpype import JClass
+except ImportError:
+    jpype = None
+    JClass = None
 import networkx as nx
-from jpype import JClass
 
-# Classes pour la structure du graphe
-DungTheory = JClass('org.tweetyproject.arg.dung.syntax.DungTheory')
-Argument = JClass('org.tweetyproject.arg.dung.syntax.Argument')
-Attack = JClass('org.tweetyproject.arg.dung.syntax.Attack')
+try:
+    from abs_arg_dung.native_solver import NativeArgument, NativeAttack, NativeDungTheory, NativeDungSolver
+    from abs_arg_dung.cycle_analysis import analyze_cycles, DEFAULT_CYCLE_LIMIT, DEFAULT_CYCLE_TIMEOUT
+except ImportError:
+    from native_solver import NativeArgument, NativeAttack, NativeDungTheory, NativeDungSolver
+    from cycle_analysis import analyze_cycles, DEFAULT_CYCLE_LIMIT, DEFAULT_CYCLE_TIMEOUT
 
-# Classes pour le raisonnement (calcul des extensions)
-SimpleGroundedReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleGroundedReasoner')
-SimplePreferredReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimplePreferredReasoner')
-SimpleStableReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleStableReasoner')
-SimpleCompleteReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleCompleteReasoner')
-SimpleAdmissibleReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleAdmissibleReasoner')
-SimpleIdealReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleIdealReasoner')
-SimpleSemiStableReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleSemiStableReasoner')
+BACKENDS = ('tweety', 'native', 'remote')
+
+# Identifiants acceptés dans le format ICCMA apx : arg(a). att(a,b).
+APX_NAME = re.compile(r'[A-Za-z0-9_]+')
+APX_ATTACK = re.compile(r'att\(\s*([^,()\s]+)\s*,\s*([^,()\s]+)\s*\)')
 
 
 # --- Définition de l'Agent d'Argumentation ---
 
 class DungAgent:
-    def __init__(self):
+    def __init__(self, backend: str = 'tweety', worker_pool=None):
         """
-        Initialise l'agent. Les classes Java sont importées ici pour s'assurer
-        que la JVM est prête au moment de l'instanciation.
+        Initialise l'agent.
+
+        Args:
+            backend: 'tweety' (reasoners Java de TweetyProject, JVM requise),
+                'native' (solveur Python en mémoire, sans JVM) ou 'remote'
+                (reasoners Tweety exécutés par un pool de workers, sans JVM
+                locale).
+            worker_pool: Pool de workers Tweety du backend 'remote' (par
+                défaut, le pool partagé du processus).
         """
-        if not jpype.isJVMStarted():
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend inconnu '{backend}'. Backends disponibles: {BACKENDS}")
+        self.backend = backend
+        self._worker_pool = worker_pool
+
+        if backend in ('native', 'remote'):
+            self.DungTheory = NativeDungTheory
+            self.Argument = NativeArgument
+            self.Attack = NativeAttack
+        else:
+            self._init_tweety_classes()
+
+        self.af = self.DungTheory()
+        self._arguments = {}
+        self._native_solver = None
+
+        # Cache des extensions : chaque sémantique est calculée à la demande
+        self._cached_extensions = {}
+        self._cache_valid = False
+        self._cache_stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+    def _init_tweety_classes(self):
+        """Importe les classes Java ; la JVM doit être prête à ce moment-là."""
+        if jpype is None or not jpype.isJVMStarted():
             raise RuntimeError(
                 "La JVM doit être démarrée avant d'instancier un DungAgent. "
-                "Vérifiez le point d'entrée de l'application."
+                "Vérifiez le point d'entrée de l'application "
+                "ou utilisez DungAgent(backend='native')."
             )
 
         # Classes pour la structure du graphe
@@ -54,10 +91,7 @@ class DungAgent:
         self.SimpleAdmissibleReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleAdmissibleReasoner')
         self.SimpleIdealReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleIdealReasoner')
         self.SimpleSemiStableReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleSemiStableReasoner')
-        
-        self.af = self.DungTheory()
-        self._arguments = {}
-        
+
         # Initialiser les reasoners une seule fois
         self.grounded_reasoner = self.SimpleGroundedReasoner()
         self.preferred_reasoner = self.SimplePreferredReasoner()
@@ -67,44 +101,209 @@ class DungAgent:
         self.ideal_reasoner = self.SimpleIdealReasoner()
         self.semi_stable_reasoner = self.SimpleSemiStableReasoner()
 
-        # Attributs pour le cache des extensions
-        self._cached_extensions = {}
-        self._cache_valid = False
-
     def add_argument(self, name: str):
         if name not in self._arguments:
             arg = self.Argument(name)
             self.af.add(arg)
             self._arguments[name] = arg
-            self._invalidate_cache()
+            self._invalidate_cache(changed=[name])
         else:
             print(f"Avertissement : L'argument '{name}' existe déjà.")
 
     def add_attack(self, source_name: str, target_name: str):
         if source_name in self._arguments and target_name in self._arguments:
             self.af.add(self.Attack(self._arguments[source_name], self._arguments[target_name]))
-            self._invalidate_cache()
+            self._invalidate_cache(changed=[target_name])
         else:
             print(f"Erreur : Un ou plusieurs arguments ('{source_name}', '{target_name}') n'existent pas.")
 
-    def _invalidate_cache(self):
-        """Invalide le cache quand le framework est modifié."""
+    def add_arguments(self, names):
+        """Ajoute plusieurs arguments en une fois (sans avertissement pour les doublons)."""
+        names = [name for name in dict.fromkeys(names) if name not in self._arguments]
+        if not names:
+            return
+        if self.backend != 'tweety':
+            self.af.add_arguments(names)
+            for name in names:
+                self._arguments[name] = self.af.arguments[self.af.index[name]]
+            self._invalidate_cache(changed=names)
+        else:
+            self._tweety_bulk_add(names, [])
+
+    def add_attacks(self, pairs):
+        """
+        Ajoute plusieurs attaques (paires de noms) en une fois. Contrairement à
+        ``add_attack``, un argument inconnu lève une ``ValueError``.
+        """
+        if self.backend != 'tweety':
+            targets = self.af.add_attacks(pairs)
+            if targets:
+                self._invalidate_cache(changed=[self.af.arguments[t].name for t in dict.fromkeys(targets)])
+            return
+        pairs = list(pairs)
+        for source, target in pairs:
+            if source not in self._arguments or target not in self._arguments:
+                raise ValueError(f"Attaque ({source}, {target}) : argument inconnu")
+        self._tweety_bulk_add([], pairs)
+
+    def _tweety_bulk_add(self, names, pairs):
+        """
+        Construit le framework Tweety en un appel JVM : le texte ICCMA apx est
+        analysé par ``ApxParser`` puis fusionné dans ``self.af``. Si les noms ne
+        sont pas des identifiants apx valides, on revient à l'ajout unitaire.
+        """
+        all_names = list(self._arguments) + list(names)
+        if all(APX_NAME.fullmatch(name) for name in all_names):
+            ApxParser = JClass('org.tweetyproject.arg.dung.parser.ApxParser')
+            StringReader = JClass('java.io.StringReader')
+            text = "".join(f"arg({name}).\n" for name in names) + \
+                "".join(f"att({source},{target}).\n" for source, target in pairs)
+            # Les arguments existants doivent être redéclarés pour que l'apx soit valide
+            text = "".join(f"arg({name}).\n" for name in self._arguments) + text
+            theory = ApxParser().parseBeliefBase(StringReader(text))
+            self.af.add(theory)
+            if names:
+                new_names = set(names)
+                for arg in self.af.getNodes():
+                    name = str(arg.getName())
+                    if name in new_names:
+                        self._arguments[name] = arg
+        else:
+            for name in names:
+                arg = self.Argument(name)
+                self.af.add(arg)
+                self._arguments[name] = arg
+            for source, target in pairs:
+                self.af.add(self.Attack(self._arguments[source], self._arguments[target]))
+        self._invalidate_cache()
+
+    def get_argument_names(self) -> list:
+        """Noms des arguments dans l'ordre d'ajout."""
+        return list(self._arguments)
+
+    def get_attack_pairs(self) -> list:
+        """
+        Attaques sous forme de paires de noms. Avec Tweety, le framework est
+        écrit en apx par ``ApxWriter`` (un appel JVM) au lieu d'être parcouru
+        attaque par attaque.
+        """
+        if self.backend != 'tweety':
+            arguments = self.af.arguments
+            return [(arguments[s].name, arguments[t].name) for s, t in self.af.attack_pairs()]
+        try:
+            ApxWriter = JClass('org.tweetyproject.arg.dung.writer.ApxWriter')
+            File = JClass('java.io.File')
+        except Exception:
+            return [(str(a.getAttacker().getName()), str(a.getAttacked().getName()))
+                    for a in self.af.getAttacks()]
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'framework.apx')
+            ApxWriter().write(self.af, File(path))
+            with open(path) as f:
+                return [match.groups() for match in APX_ATTACK.finditer(f.read())]
+
+    def iter_attack_pairs(self):
+        """
+        Attaques sous forme de paires de noms, produites au fil de l'eau avec le
+        backend natif (utilisé par l'export en flux).
+        """
+        if self.backend == 'tweety':
+            yield from self.get_attack_pairs()
+            return
+        arguments = self.af.arguments
+        for s, t in self.af.attack_pairs():
+            yield arguments[s].name, arguments[t].name
+
+    def _invalidate_cache(self, changed: list = None):
+        """
+        Invalide le cache quand le framework est modifié.
+
+        Avec le backend natif et ``changed`` (arguments ajoutés ou nouvellement
+        attaqués), le solveur est conservé : seules la SCC touchée et les SCC
+        en aval sont recalculées à la prochaine demande. Sans ``changed``, tout
+        est oublié.
+        """
+        if self._cached_extensions:
+            self._cache_stats['invalidations'] += 1
         self._cached_extensions = {}
         self._cache_valid = False
+        if changed is None or self._native_solver is None:
+            self._native_solver = None
+        else:
+            self._native_solver.notify_change([self.af.index[name] for name in changed])
+
+    def get_cache_statistics(self) -> dict:
+        """Compteurs du cache d'extensions (et du cache par SCC du backend natif)."""
+        stats = {
+            'extension_hits': self._cache_stats['hits'],
+            'extension_misses': self._cache_stats['misses'],
+            'invalidations': self._cache_stats['invalidations'],
+            'cached_semantics': sorted(self._cached_extensions),
+        }
+        if self._native_solver is not None:
+            stats.update(self._native_solver.stats)
+        return stats
+
+    def _get_extensions(self, semantics: str):
+        """Retourne les extensions d'une sémantique, calculées seulement à la première demande."""
+        if semantics in self._cached_extensions:
+            self._cache_stats['hits'] += 1
+        else:
+            self._cache_stats['misses'] += 1
+            if self.backend == 'native':
+                self._cached_extensions[semantics] = self._compute_native(semantics)
+            elif self.backend == 'remote':
+                self._cached_extensions[semantics] = self._compute_remote(semantics)
+            else:
+                self._cached_extensions[semantics] = self._compute_tweety(semantics)
+        return self._cached_extensions[semantics]
+
+    def _compute_tweety(self, semantics: str):
+        single_model = {
+            'grounded': self.grounded_reasoner,
+            'ideal': self.ideal_reasoner,
+        }
+        multiple_models = {
+            'preferred': self.preferred_reasoner,
+            'stable': self.stable_reasoner,
+            'complete': self.complete_reasoner,
+            'admissible': self.admissible_reasoner,
+            'semi_stable': self.semi_stable_reasoner,
+        }
+        if semantics in single_model:
+            return sorted([str(arg.getName()) for arg in single_model[semantics].getModel(self.af)])
+        return self._format_extensions(multiple_models[semantics].getModels(self.af))
+
+    def _compute_remote(self, semantics: str):
+        """Calcule une sémantique avec les reasoners Tweety d'un processus worker."""
+        if self._worker_pool is None:
+            from argumentation_analysis.agents.core.logic.tweety_worker_pool import get_tweety_worker_pool
+            self._worker_pool = get_tweety_worker_pool()
+        result = self._worker_pool.call(
+            "dung_extensions",
+            arguments=self.get_argument_names(),
+            attacks=[list(pair) for pair in self.get_attack_pairs()],
+            semantics=[semantics],
+        )
+        return result[semantics]
+
+    def _compute_native(self, semantics: str):
+        if self._native_solver is None:
+            self._native_solver = NativeDungSolver(self.af)
+        solver = self._native_solver
+        names = [arg.getName() for arg in self.af.arguments]
+        if semantics in ('grounded', 'ideal'):
+            return sorted(names[i] for i in getattr(solver, semantics)())
+        extensions = [sorted(names[i] for i in extension) for extension in getattr(solver, semantics)()]
+        return sorted(extensions, key=lambda extension: (len(extension), extension))
 
     def _compute_extensions_if_needed(self):
-        """Calcule les extensions seulement si elles n'ont pas déjà été calculées."""
+        """Calcule toutes les extensions (conservé pour compatibilité ; préférer les getters)."""
         if not self._cache_valid:
             print("(Calcul des extensions en cours...)")
-            self._cached_extensions = {
-                'grounded': sorted([str(arg.getName()) for arg in self.grounded_reasoner.getModel(self.af)]),
-                'preferred': self._format_extensions(self.preferred_reasoner.getModels(self.af)),
-                'stable': self._format_extensions(self.stable_reasoner.getModels(self.af)),
-                'complete': self._format_extensions(self.complete_reasoner.getModels(self.af)),
-                'admissible': self._format_extensions(self.admissible_reasoner.getModels(self.af)),
-                'ideal': sorted([str(arg.getName()) for arg in self.ideal_reasoner.getModel(self.af)]),
-                'semi_stable': self._format_extensions(self.semi_stable_reasoner.getModels(self.af))
-            }
+            for semantics in ('grounded', 'preferred', 'stable', 'complete', 'admissible', 'ideal', 'semi_stable'):
+                self._get_extensions(semantics)
             self._cache_valid = True
 
     def reset_cache(self):
@@ -115,32 +314,25 @@ class DungAgent:
         return [sorted([str(arg.getName()) for arg in extension]) for extension in java_collection]
 
     def get_grounded_extension(self) -> list:
-        self._compute_extensions_if_needed()
-        return self._cached_extensions['grounded']
+        return self._get_extensions('grounded')
 
     def get_preferred_extensions(self) -> list:
-        self._compute_extensions_if_needed()
-        return self._cached_extensions['preferred']
+        return self._get_extensions('preferred')
 
     def get_stable_extensions(self) -> list:
-        self._compute_extensions_if_needed()
-        return self._cached_extensions['stable']
+        return self._get_extensions('stable')
     
     def get_complete_extensions(self) -> list:
-        self._compute_extensions_if_needed()
-        return self._cached_extensions['complete']
+        return self._get_extensions('complete')
 
     def get_admissible_sets(self) -> list:
-        self._compute_extensions_if_needed()
-        return self._cached_extensions['admissible']
+        return self._get_extensions('admissible')
 
     def get_ideal_extension(self) -> list:
-        self._compute_extensions_if_needed()
-        return self._cached_extensions['ideal']
+        return self._get_extensions('ideal')
 
     def get_semi_stable_extensions(self) -> list:
-        self._compute_extensions_if_needed()
-        return self._cached_extensions['semi_stable']
+        return self._get_extensions('semi_stable')
     
     # LA MÉTHODE SUIVANTE A ÉTÉ SUPPRIMÉE
     # def get_cf2_extensions(self) -> list:
@@ -172,14 +364,12 @@ class DungAgent:
 
     def get_semantics_relationships(self) -> dict:
         """Retourne l'analyse des relations sémantiques sous forme de dictionnaire."""
-        self._compute_extensions_if_needed()
-        
-        grounded = self._cached_extensions['grounded']
-        preferred = self._cached_extensions['preferred']
-        complete = self._cached_extensions['complete']
-        stable = self._cached_extensions['stable']
-        admissible = self._cached_extensions['admissible']
-        ideal = self._cached_extensions['ideal']
+        grounded = self.get_grounded_extension()
+        preferred = self.get_preferred_extensions()
+        complete = self.get_complete_extensions()
+        stable = self.get_stable_extensions()
+        admissible = self.get_admissible_sets()
+        ideal = self.get_ideal_extension()
         
         # Vérifications théoriques
         relationships = {
@@ -227,11 +417,9 @@ class DungAgent:
         if arg_name not in self._arguments:
             return {'error': f"Argument '{arg_name}' n'existe pas"}
         
-        self._compute_extensions_if_needed()
-        
-        grounded = self._cached_extensions['grounded']
-        preferred = self._cached_extensions['preferred']
-        stable = self._cached_extensions['stable']
+        grounded = self.get_grounded_extension()
+        preferred = self.get_preferred_extensions()
+        stable = self.get_stable_extensions()
         
         status = {
             'credulously_accepted': any(arg_name in ext for ext in preferred),
@@ -263,30 +451,28 @@ class DungAgent:
                 print(f"  - Accepté dans l'extension fondée: {status['grounded_accepted']}")
                 print(f"  - Accepté dans une extension stable: {status['stable_accepted']}")
 
-    def get_framework_properties(self) -> dict:
-        """Retourne les propriétés structurelles du framework."""
-        nodes = list(self.af.getNodes())
-        attacks = list(self.af.getAttacks())
-        
-        # Vérifier s'il y a des cycles
-        import networkx as nx
-        G = nx.DiGraph()
-        G.add_nodes_from([arg.getName() for arg in nodes])
-        G.add_edges_from([(a.getAttacker().getName(), a.getAttacked().getName()) for a in attacks])
-        
-        cycles = list(nx.simple_cycles(G))
-        
-        # Arguments self-attacking
-        self_attacking = [a.getAttacker().getName() for a in attacks 
-                         if a.getAttacker().getName() == a.getAttacked().getName()]
-        
-        return {
+    def get_framework_properties(self, enumerate_cycles: bool = False,
+                                 cycle_limit: int = DEFAULT_CYCLE_LIMIT,
+                                 cycle_timeout: float = DEFAULT_CYCLE_TIMEOUT) -> dict:
+        """
+        Retourne les propriétés structurelles du framework.
+
+        Les propriétés des cycles (SCC, parité, maille, échantillon) sont
+        calculées en temps polynomial par ``analyze_cycles`` ; l'énumération de
+        tous les cycles n'a lieu que sur demande (``enumerate_cycles``), bornée
+        par ``cycle_limit`` cycles et ``cycle_timeout`` secondes.
+        """
+        nodes = [arg.getName() for arg in self.af.getNodes()]
+        attacks = [(a.getAttacker().getName(), a.getAttacked().getName()) for a in self.af.getAttacks()]
+
+        properties = {
             'num_arguments': len(nodes),
             'num_attacks': len(attacks),
-            'has_cycles': len(cycles) > 0,
-            'cycles': cycles,
-            'self_attacking': self_attacking
         }
+        properties.update(analyze_cycles(nodes, attacks, enumerate_cycles=enumerate_cycles,
+                                         cycle_limit=cycle_limit, timeout=cycle_timeout))
+        properties['cache'] = self.get_cache_statistics()
+        return properties
 
     def analyze_framework_properties(self):
         """Affiche les propriétés structurelles du framework (méthode de convenance)."""
@@ -295,10 +481,13 @@ class DungAgent:
         print("=== PROPRIÉTÉS STRUCTURELLES ===")
         print(f"Nombre d'arguments: {properties['num_arguments']}")
         print(f"Nombre d'attaques: {properties['num_attacks']}")
-        print(f"Cycles détectés: {len(properties['cycles'])}")
+        print(f"Composantes fortement connexes: {properties['num_sccs']} "
+              f"(dont {len(properties['cyclic_sccs'])} cycliques)")
         
-        if properties['cycles']:
-            print(f"Cycles: {properties['cycles']}")
+        if properties['has_cycles']:
+            print(f"Maille: {properties['girth']}, cycle impair: {properties['has_odd_cycle']}, "
+                  f"cycle pair: {properties['has_even_cycle']}")
+            print(f"Exemples de cycles: {properties['cycles']}")
         
         if properties['self_attacking']:
             print(f"Arguments auto-attaquants: {properties['self_attacking']}")
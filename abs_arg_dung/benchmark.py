@@ -1,5 +1,6 @@
 import time
 import statistics
+import agent as agent_module
 from agent import DungAgent
 from enhanced_agent import EnhancedDungAgent
 from framework_generator import FrameworkGenerator
@@ -23,7 +24,7 @@ class ArgumentationBenchmark:
                     seed=trial
                 )
                 
-                start_time = time.time()
+                start_time = time.perf_counter()
                 # Forcer le calcul de toutes les extensions
                 agent.get_grounded_extension()
                 agent.get_preferred_extensions()
@@ -31,7 +32,7 @@ class ArgumentationBenchmark:
                 agent.get_complete_extensions()
                 agent.get_admissible_sets()
                 agent.get_ideal_extension()
-                end_time = time.time()
+                end_time = time.perf_counter()
                 
                 times.append(end_time - start_time)
             
@@ -167,11 +168,11 @@ class ArgumentationBenchmark:
         for size in sizes:
             agent = FrameworkGenerator.generate_random_framework(size, 0.3, seed=42)
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 grounded = agent.get_grounded_extension()
                 preferred = agent.get_preferred_extensions()
-                computation_time = time.time() - start_time
+                computation_time = time.perf_counter() - start_time
                 
                 data_point = {
                     'size': size,
@@ -202,6 +203,53 @@ class ArgumentationBenchmark:
         
         self.results['scalability'] = scalability_data
     
+    def benchmark_backends(self, sizes=[1000, 10000, 100000], semantics=('grounded', 'preferred', 'stable'),
+                           attacks_per_argument=1.0, jvm_max_size=10000, seed=42):
+        """Compare le backend Tweety (JVM) et le backend natif sur de grands frameworks"""
+        print("\n=== BENCHMARK JVM vs NATIF ===")
+        
+        jvm_available = agent_module.jpype is not None and agent_module.jpype.isJVMStarted()
+        if not jvm_available:
+            print("JVM non démarrée : seul le backend natif est mesuré.")
+        
+        comparison = []
+        for size in sizes:
+            backends = ['native']
+            if jvm_available and size <= jvm_max_size:
+                backends.insert(0, 'tweety')
+            
+            extensions = {}
+            for backend in backends:
+                start_time = time.perf_counter()
+                agent = FrameworkGenerator.generate_sparse_framework(
+                    size, attacks_per_argument, seed=seed, backend=backend)
+                build_time = time.perf_counter() - start_time
+                
+                timings = {}
+                extensions[backend] = {}
+                for semantic in semantics:
+                    start_time = time.perf_counter()
+                    extensions[backend][semantic] = agent._get_extensions(semantic)
+                    timings[semantic] = time.perf_counter() - start_time
+                
+                comparison.append({
+                    'size': size,
+                    'backend': backend,
+                    'build_time': build_time,
+                    'timings': timings
+                })
+                timing_str = ", ".join(f"{sem}={t:.3f}s" for sem, t in timings.items())
+                print(f"Taille {size:6d} [{backend:6s}]: construction={build_time:.3f}s, {timing_str}")
+            
+            if len(extensions) == 2:
+                agree = all(
+                    sorted(extensions['tweety'][sem]) == sorted(extensions['native'][sem])
+                    for sem in semantics
+                )
+                print(f"Taille {size:6d}: résultats {'identiques' if agree else 'DIFFÉRENTS'}")
+        
+        self.results['backends'] = comparison
+    
     def benchmark_framework_properties(self, num_samples=50):
         """Analyse statistique des propriétés des frameworks"""
         print("\n=== BENCHMARK PROPRIÉTÉS FRAMEWORKS ===")
@@ -295,6 +343,12 @@ class ArgumentationBenchmark:
                 density = stats['attack_densities']['mean']
                 print(f"   Densité d'attaques moyenne: {density:.2f}")
         
+        print("\n6. BACKENDS (JVM vs NATIF):")
+        if 'backends' in self.results:
+            for entry in self.results['backends']:
+                total = sum(entry['timings'].values())
+                print(f"   Taille {entry['size']} [{entry['backend']}]: {total:.3f}s")
+        
         return self.results
 
 # Script principal de benchmark
@@ -311,6 +365,7 @@ if __name__ == "__main__":
         benchmark.compare_standard_vs_enhanced(num_tests=5)
         benchmark.benchmark_scalability(max_size=20, step=4)
         benchmark.benchmark_framework_properties(num_samples=30)
+        benchmark.benchmark_backends(sizes=[1000, 10000, 100000])
         
         # Générer le rapport final
         results = benchmark.generate_report()
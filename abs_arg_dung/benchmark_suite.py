@@ -0,0 +1,213 @@
+"""
+Suite de benchmark parallèle avec lignes de base de non-régression.
+
+Chaque cas (famille de frameworks, taille, graine, sémantique) est exécuté
+dans un processus du pool : le framework est généré, puis le calcul d'une
+seule sémantique est chronométré avec ``perf_counter``. Les résultats sont
+enregistrés en JSON ; le mode ``compare`` les confronte à une ligne de base
+et signale les cas ralentis au-delà d'un seuil relatif.
+
+Usage :
+    python benchmark_suite.py run --sizes 1000 10000 --save baseline.json
+    python benchmark_suite.py compare baseline.json --threshold 0.25
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from framework_generator import FrameworkGenerator
+from config import BENCHMARK_CONFIG
+
+FAMILIES = {
+    'random': FrameworkGenerator.generate_sparse_framework,
+    'grid': FrameworkGenerator.generate_grid_framework,
+    'cycles': FrameworkGenerator.generate_cycle_framework,
+    'iccma': FrameworkGenerator.generate_iccma_framework,
+}
+
+
+# Sémantiques dont le calcul retourne une seule extension (liste de noms)
+SINGLE_EXTENSION_SEMANTICS = ('grounded', 'ideal')
+
+
+def case_key(case: dict) -> str:
+    """Identifiant stable d'un cas, utilisé pour apparier résultats et ligne de base."""
+    return f"{case['family']}/{case['size']}/{case['semantics']}/{case['backend']}"
+
+
+def run_case(case: dict) -> dict:
+    """Exécute un cas ; fonction de module pour pouvoir être envoyée au pool."""
+    timings, build_times = [], []
+    for repeat in range(case['repeats']):
+        start = time.perf_counter()
+        agent = FAMILIES[case['family']](case['size'], seed=case['seed'] + repeat, backend=case['backend'])
+        build_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        extensions = agent._get_extensions(case['semantics'])
+        timings.append(time.perf_counter() - start)
+
+    if case['semantics'] in SINGLE_EXTENSION_SEMANTICS:
+        extensions = [extensions]
+    return dict(case,
+                key=case_key(case),
+                num_arguments=len(agent.get_argument_names()),
+                num_attacks=len(agent.get_attack_pairs()),
+                num_extensions=len(extensions),
+                build_time=statistics.median(build_times),
+                time=statistics.median(timings),
+                times=timings)
+
+
+def build_cases(families, sizes, semantics, backend='native', repeats=3, seed=42) -> list:
+    return [{'family': family, 'size': size, 'semantics': semantic, 'backend': backend,
+             'repeats': repeats, 'seed': seed}
+            for family in families for size in sizes for semantic in semantics]
+
+
+def run_suite(families=None, sizes=None, semantics=None, backend='native', repeats=3,
+              seed=42, workers=None) -> dict:
+    """
+    Exécute tous les cas et retourne un dictionnaire prêt à être sérialisé.
+
+    Le backend Tweety n'est utilisable qu'avec ``workers=1`` : la JVM est
+    démarrée par l'appelant dans le processus courant.
+    """
+    families = families or list(FAMILIES)
+    sizes = sizes or BENCHMARK_CONFIG['sizes']
+    semantics = semantics or BENCHMARK_CONFIG['semantics']
+    workers = workers or os.cpu_count() or 1
+    if backend != 'native' and workers > 1:
+        raise ValueError("Le backend Tweety impose workers=1 (une JVM par processus)")
+
+    cases = build_cases(families, sizes, semantics, backend, repeats, seed)
+    start = time.perf_counter()
+    if workers == 1:
+        results = [run_case(case) for case in cases]
+    else:
+        # Les plus gros cas d'abord pour équilibrer la charge entre processus
+        ordered = sorted(cases, key=lambda case: -case['size'])
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            by_key = {result['key']: result for result in pool.map(run_case, ordered)}
+        results = [by_key[case_key(case)] for case in cases]
+
+    return {
+        'metadata': {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'workers': workers,
+            'repeats': repeats,
+            'wall_time': time.perf_counter() - start,
+        },
+        'results': results,
+    }
+
+
+def save_results(data: dict, filename: str):
+    with open(filename, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def load_results(filename: str) -> dict:
+    with open(filename, 'r') as f:
+        return json.load(f)
+
+
+def compare_results(current: dict, baseline: dict, threshold: float = None,
+                    min_time: float = None) -> list:
+    """
+    Compare deux exécutions et retourne la liste des écarts par cas.
+
+    Un cas est une régression si son temps médian dépasse celui de la ligne
+    de base de plus de ``threshold`` (relatif). Les cas plus rapides que
+    ``min_time`` secondes dans les deux exécutions sont ignorés : leur
+    mesure est dominée par le bruit.
+    """
+    threshold = BENCHMARK_CONFIG['regression_threshold'] if threshold is None else threshold
+    min_time = BENCHMARK_CONFIG['min_time'] if min_time is None else min_time
+    reference = {result['key']: result for result in baseline['results']}
+
+    comparison = []
+    for result in current['results']:
+        base = reference.get(result['key'])
+        if base is None:
+            continue
+        ratio = result['time'] / base['time'] if base['time'] > 0 else float('inf')
+        significant = max(result['time'], base['time']) >= min_time
+        comparison.append({
+            'key': result['key'],
+            'baseline': base['time'],
+            'current': result['time'],
+            'ratio': ratio,
+            'regression': significant and ratio > 1 + threshold,
+            'improvement': significant and ratio < 1 / (1 + threshold),
+            'extensions_changed': result['num_extensions'] != base['num_extensions'],
+        })
+    return comparison
+
+
+def print_results(data: dict):
+    print(f"{'cas':<40} | {'args':>7} | {'attaques':>8} | {'ext.':>5} | {'constr.':>8} | {'calcul':>8}")
+    for result in data['results']:
+        print(f"{result['key']:<40} | {result['num_arguments']:>7} | {result['num_attacks']:>8} | "
+              f"{result['num_extensions']:>5} | {result['build_time']:>7.3f}s | {result['time']:>7.3f}s")
+    print(f"Durée totale : {data['metadata']['wall_time']:.2f}s ({data['metadata']['workers']} processus)")
+
+
+def print_comparison(comparison: list, threshold: float):
+    for entry in comparison:
+        flag = "RÉGRESSION" if entry['regression'] else "amélioration" if entry['improvement'] else ""
+        if entry['extensions_changed']:
+            flag += " (nombre d'extensions différent)"
+        print(f"{entry['key']:<40} | {entry['baseline']:>7.3f}s -> {entry['current']:>7.3f}s | "
+              f"x{entry['ratio']:.2f} {flag}")
+    regressions = [entry for entry in comparison if entry['regression']]
+    print(f"{len(regressions)} régression(s) au-delà de {threshold:.0%} sur {len(comparison)} cas")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Suite de benchmark des sémantiques de Dung")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    for name in ('run', 'compare'):
+        sub = subparsers.add_parser(name)
+        if name == 'compare':
+            sub.add_argument('baseline', help="Fichier JSON de la ligne de base")
+            sub.add_argument('--threshold', type=float, default=BENCHMARK_CONFIG['regression_threshold'])
+            sub.add_argument('--current', help="Résultats déjà calculés (sinon la suite est exécutée)")
+        sub.add_argument('--families', nargs='+', choices=list(FAMILIES))
+        sub.add_argument('--sizes', type=int, nargs='+')
+        sub.add_argument('--semantics', nargs='+')
+        sub.add_argument('--repeats', type=int, default=BENCHMARK_CONFIG['repeats'])
+        sub.add_argument('--workers', type=int)
+        sub.add_argument('--save', help="Enregistrer les résultats en JSON")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'compare' and args.current:
+        data = load_results(args.current)
+    else:
+        data = run_suite(args.families, args.sizes, args.semantics,
+                         repeats=args.repeats, workers=args.workers)
+        print_results(data)
+    if args.save:
+        save_results(data, args.save)
+        print(f"Résultats enregistrés dans {args.save}")
+
+    if args.command == 'compare':
+        comparison = compare_results(data, load_results(args.baseline), args.threshold)
+        print_comparison(comparison, args.threshold)
+        # Code de sortie non nul pour l'intégration continue
+        return 1 if any(entry['regression'] for entry in comparison) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
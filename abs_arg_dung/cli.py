@@ -36,7 +36,8 @@ def main():
     convert_parser = subparsers.add_parser('convert', help='Convertir entre formats')
     convert_parser.add_argument('input', help='Fichier d\'entrée')
     convert_parser.add_argument('output', help='Fichier de sortie')
-    convert_parser.add_argument('--format', choices=['json', 'tgf', 'dot'], default='json', help='Format de sortie')
+    convert_parser.add_argument('--format', choices=['json', 'tgf', 'dot', 'jsonl', 'apx', 'i23'], default='json', help='Format de sortie')
+    convert_parser.add_argument('--backend', choices=['tweety', 'native'], default='tweety', help='Backend de construction')
     
     # Commande d'information
     info_parser = subparsers.add_parser('info', help='Informations sur le projet')
@@ -180,14 +181,13 @@ def handle_examples(args):
 def convert_framework(args):
     """Convertit un framework entre formats"""
     try:
-        agent = FrameworkIO.import_from_json(args.input)
+        # Format d'entrée déduit de l'extension (json, tgf, jsonl, apx, i23)
+        agent = FrameworkIO.stream_import(args.input, backend=args.backend)
         
-        if args.format == 'json':
-            FrameworkIO.export_to_json(agent, args.output)
-        elif args.format == 'tgf':
-            FrameworkIO.export_to_tgf(agent, args.output)
-        elif args.format == 'dot':
+        if args.format == 'dot':
             FrameworkIO.export_to_dot(agent, args.output)
+        else:
+            FrameworkIO.stream_export(agent, args.output, fmt=args.format)
         
         print(f"✓ Conversion terminée: {args.input} → {args.output}")
         
@@ -55,6 +55,15 @@ TEST_CONFIG = {
     'benchmark_trials': 5
 }
 
+# Configuration de la suite de benchmark (benchmark_suite.py)
+BENCHMARK_CONFIG = {
+    'sizes': [1000, 10000, 50000],
+    'semantics': ['grounded', 'preferred', 'stable', 'semi_stable', 'ideal'],
+    'repeats': 3,
+    'regression_threshold': 0.25,  # ralentissement relatif toléré
+    'min_time': 0.05  # en secondes, en dessous la mesure est du bruit
+}
+
 # Sémantiques supportées
 SUPPORTED_SEMANTICS = [
     'grounded',
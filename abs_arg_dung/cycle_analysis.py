@@ -0,0 +1,248 @@
+"""
+Analyse des cycles d'attaque d'un framework en temps polynomial.
+
+L'énumération de tous les cycles élémentaires (``nx.simple_cycles``) est
+exponentielle sur les graphes denses : une clique de 40 arguments en compte
+des milliards. On calcule donc uniquement des propriétés polynomiales :
+
+- composantes fortement connexes (SCC) et SCC cycliques (taille > 1 ou
+  argument auto-attaquant) ; le graphe est acyclique s'il n'y en a aucune ;
+- cycle impair : une SCC en contient un si et seulement si son graphe non
+  orienté sous-jacent n'est pas biparti (ou si elle contient une boucle) ;
+- cycle pair : présent si une SCC est bipartie, contient une attaque
+  mutuelle ou un cycle pair de l'échantillon ; absent si toutes les SCC
+  cycliques sont des cycles simples impairs. Sinon la réponse exacte
+  demanderait un algorithme dédié et vaut ``None`` (indéterminé), sauf si
+  l'énumération complète a été demandée et s'est terminée ;
+- maille (girth) : parcours en largeur depuis les arguments des SCC
+  cycliques, interrompu dès qu'il ne peut plus trouver de cycle plus court.
+  Le nombre de sources est borné par SCC (``girth_sources``, réparties sur
+  la SCC) et la recherche par ``timeout`` ; si une borne est atteinte, la
+  maille est la plus petite trouvée et ``girth_exact`` vaut False ;
+- échantillon de cycles : plus courts cycles passant par des arguments
+  des SCC cycliques, au plus ``sample_size``.
+
+L'énumération complète reste disponible sur demande (``enumerate_cycles``),
+bornée par ``cycle_limit`` cycles et ``timeout`` secondes.
+"""
+
+import time
+from collections import deque
+
+try:
+    from abs_arg_dung.native_solver import strongly_connected_components
+except ImportError:
+    from native_solver import strongly_connected_components
+
+DEFAULT_SAMPLE_SIZE = 10
+DEFAULT_CYCLE_LIMIT = 1000
+DEFAULT_CYCLE_TIMEOUT = 5.0
+DEFAULT_GIRTH_SOURCES = 200
+
+
+def _is_bipartite(members: list, successors: list, component: list) -> bool:
+    """Test de bipartition du graphe non orienté sous-jacent à une SCC."""
+    scc_id = component[members[0]]
+    neighbours = {node: [] for node in members}
+    for node in members:
+        for target in successors[node]:
+            if component[target] == scc_id:
+                neighbours[node].append(target)
+                neighbours[target].append(node)
+    colour = {members[0]: 0}
+    queue = deque([members[0]])
+    while queue:
+        node = queue.popleft()
+        for other in neighbours[node]:
+            if other not in colour:
+                colour[other] = 1 - colour[node]
+                queue.append(other)
+            elif colour[other] == colour[node]:
+                return False
+    return True
+
+
+def _shortest_cycle_through(source: int, successors: list, component: list, bound=None):
+    """
+    Plus court cycle passant par ``source`` (liste d'index), restreint à sa
+    SCC. Avec ``bound``, seuls les cycles strictement plus courts sont cherchés.
+    """
+    scc_id = component[source]
+    parent = {source: None}
+    depth = {source: 0}
+    queue = deque([source])
+    while queue:
+        node = queue.popleft()
+        if bound is not None and depth[node] + 1 >= bound:
+            return None
+        for target in successors[node]:
+            if target == source:
+                cycle = [node]
+                while parent[cycle[-1]] is not None:
+                    cycle.append(parent[cycle[-1]])
+                cycle.reverse()
+                return cycle
+            if component[target] == scc_id and target not in parent:
+                parent[target] = node
+                depth[target] = depth[node] + 1
+                queue.append(target)
+    return None
+
+
+def _spread(members: list, count: int) -> list:
+    """Au plus ``count`` arguments répartis régulièrement sur ``members``."""
+    if len(members) <= count:
+        return members
+    step = len(members) / count
+    return [members[int(i * step)] for i in range(count)]
+
+
+def _canonical_cycle(cycle: list) -> tuple:
+    """Rotation du cycle commençant par son plus petit index (déduplication)."""
+    start = cycle.index(min(cycle))
+    return tuple(cycle[start:] + cycle[:start])
+
+
+def analyze_cycles(arguments, attacks, sample_size: int = DEFAULT_SAMPLE_SIZE,
+                   enumerate_cycles: bool = False, cycle_limit: int = DEFAULT_CYCLE_LIMIT,
+                   timeout: float = DEFAULT_CYCLE_TIMEOUT,
+                   girth_sources: int = DEFAULT_GIRTH_SOURCES) -> dict:
+    """
+    Propriétés des cycles d'un framework donné par ses noms d'arguments et
+    ses attaques (paires de noms ; les attaques vers des arguments inconnus
+    sont ignorées).
+
+    Args:
+        sample_size: Nombre maximal de cycles de l'échantillon.
+        enumerate_cycles: Énumère tous les cycles élémentaires au lieu de
+            l'échantillon, au plus ``cycle_limit`` et pendant au plus
+            ``timeout`` secondes.
+        timeout: Durée maximale (secondes) de la recherche de la maille et
+            de l'énumération ; None pour aucune limite.
+        girth_sources: Nombre maximal d'arguments d'une SCC depuis lesquels
+            la maille est cherchée ; None pour tous.
+
+    Returns:
+        Un dictionnaire avec ``has_cycles``, ``is_acyclic``, ``num_sccs``,
+        ``cyclic_sccs``, ``largest_scc_size``, ``has_odd_cycle``,
+        ``has_even_cycle``, ``girth``, ``girth_exact`` (False si la maille
+        n'est qu'un majorant, une borne ayant été atteinte), ``cycles``,
+        ``cycles_exhaustive`` (True si ``cycles`` contient tous les cycles)
+        et ``self_attacking``.
+    """
+    names = list(dict.fromkeys(arguments))
+    index = {name: i for i, name in enumerate(names)}
+    successors = [[] for _ in names]
+    edges = set()
+    for source, target in attacks:
+        if source in index and target in index:
+            edge = (index[source], index[target])
+            if edge not in edges:
+                edges.add(edge)
+                successors[edge[0]].append(edge[1])
+    self_loops = {source for source, target in edges if source == target}
+
+    components = strongly_connected_components(range(len(names)), successors)
+    component = [0] * len(names)
+    for scc_id, members in enumerate(components):
+        for node in members:
+            component[node] = scc_id
+    cyclic = [members for members in components if len(members) > 1 or members[0] in self_loops]
+
+    # Parité des cycles et maille, SCC par SCC
+    has_odd = bool(self_loops)
+    has_even = any((target, source) in edges for source, target in edges if source != target)
+    undetermined = False
+    girth_exact = True
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    girth = 1 if self_loops else None
+    if has_even and girth is None:
+        girth = 2
+    for members in cyclic:
+        if len(members) == 1:
+            continue
+        internal = sum(1 for node in members for target in successors[node]
+                       if component[target] == component[node])
+        if internal == len(members):
+            # Cycle simple : longueur et parité connues directement
+            length = len(members)
+            if length % 2:
+                has_odd = True
+            else:
+                has_even = True
+            girth = length if girth is None else min(girth, length)
+            continue
+        if _is_bipartite(members, successors, component):
+            has_even = True
+        else:
+            has_odd = True
+            undetermined = True
+        if girth is None or girth > 3:
+            sources = members if girth_sources is None else _spread(members, girth_sources)
+            complete = len(sources) == len(members)
+            for node in sources:
+                # La première source donne toujours un cycle : la maille est connue
+                if girth is not None and deadline is not None and time.monotonic() > deadline:
+                    complete = False
+                    break
+                cycle = _shortest_cycle_through(node, successors, component, girth)
+                if cycle is not None:
+                    girth = len(cycle)
+                    if girth <= 3:
+                        break
+            girth_exact = girth_exact and complete
+    # Sans boucle ni attaque mutuelle, aucune maille n'est inférieure à 3
+    girth_exact = girth_exact or (girth is not None and girth <= 3)
+
+    exhaustive = not cyclic
+    if enumerate_cycles and cyclic:
+        cycles, exhaustive = _enumerate_cycles(names, edges, cycle_limit, timeout)
+        if exhaustive:
+            has_even = any(len(cycle) % 2 == 0 for cycle in cycles)
+            undetermined = False
+    else:
+        seen = set()
+        cycles = []
+        for members in cyclic:
+            # Les plus courts cycles de plusieurs arguments coïncident souvent :
+            # nombre de parcours borné par SCC
+            for node in members[:4 * sample_size]:
+                if len(cycles) >= sample_size:
+                    break
+                cycle = _shortest_cycle_through(node, successors, component)
+                key = _canonical_cycle(cycle)
+                if key not in seen:
+                    seen.add(key)
+                    cycles.append([names[i] for i in cycle])
+    has_even = has_even or any(len(cycle) % 2 == 0 for cycle in cycles)
+
+    return {
+        'has_cycles': bool(cyclic),
+        'is_acyclic': not cyclic,
+        'num_sccs': len(components),
+        'cyclic_sccs': [sorted(names[i] for i in members) for members in cyclic],
+        'largest_scc_size': max((len(members) for members in components), default=0),
+        'has_odd_cycle': has_odd,
+        'has_even_cycle': None if undetermined and not has_even else has_even,
+        'girth': girth,
+        'girth_exact': girth_exact,
+        'cycles': cycles,
+        'cycles_exhaustive': exhaustive,
+        'self_attacking': [names[i] for i in sorted(self_loops)],
+    }
+
+
+def _enumerate_cycles(names: list, edges: set, limit: int, timeout: float):
+    """Énumération bornée des cycles élémentaires ; retourne (cycles, complète)."""
+    import networkx as nx
+
+    G = nx.DiGraph()
+    G.add_nodes_from(range(len(names)))
+    G.add_edges_from(edges)
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    cycles = []
+    for cycle in nx.simple_cycles(G):
+        if len(cycles) >= limit or (deadline is not None and time.monotonic() > deadline):
+            return cycles, False
+        cycles.append([names[i] for i in cycle])
+    return cycles, True
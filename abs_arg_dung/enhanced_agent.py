@@ -4,8 +4,8 @@ import networkx as nx
 class EnhancedDungAgent(DungAgent):
     """Agent avec corrections pour certains cas spécifiques"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, backend: str = 'tweety', worker_pool=None):
+        super().__init__(backend=backend, worker_pool=worker_pool)
         self.correction_mode = True
     
     def get_preferred_extensions(self) -> list:
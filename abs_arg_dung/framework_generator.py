@@ -4,12 +4,13 @@ from agent import DungAgent
 class FrameworkGenerator:
     
     @staticmethod
-    def generate_random_framework(num_args: int, attack_probability: float = 0.3, seed: int = None) -> DungAgent:
+    def generate_random_framework(num_args: int, attack_probability: float = 0.3, seed: int = None,
+                                  backend: str = 'tweety') -> DungAgent:
         """Génère un framework d'argumentation aléatoire"""
         if seed:
             random.seed(seed)
         
-        agent = DungAgent()
+        agent = DungAgent(backend=backend)
         
         # Ajouter les arguments
         for i in range(num_args):
@@ -24,6 +25,105 @@ class FrameworkGenerator:
         
         return agent
     
+    @staticmethod
+    def generate_sparse_framework(num_args: int, attacks_per_argument: float = 1.0, seed: int = None,
+                                  backend: str = 'tweety') -> DungAgent:
+        """
+        Génère un grand framework aléatoire peu dense (environ
+        ``attacks_per_argument * num_args`` attaques), en O(attaques) au lieu
+        du parcours de toutes les paires de ``generate_random_framework``.
+        """
+        rng = random.Random(seed)
+        agent = DungAgent(backend=backend)
+        for i in range(num_args):
+            agent.add_argument(f"arg_{i}")
+        
+        attacks = set()
+        while len(attacks) < int(num_args * attacks_per_argument):
+            attacks.add((rng.randrange(num_args), rng.randrange(num_args)))
+        for source, target in attacks:
+            agent.add_attack(f"arg_{source}", f"arg_{target}")
+        
+        return agent
+    
+    @staticmethod
+    def generate_grid_framework(num_args: int, seed: int = None, backend: str = 'tweety') -> DungAgent:
+        """
+        Génère une grille d'environ ``num_args`` arguments : chaque case attaque
+        ses voisines de droite et du bas, et une case sur vingt s'attaque
+        elle-même (l'indécision se propage alors le long de la grille).
+        """
+        rng = random.Random(seed)
+        side = max(1, int(num_args ** 0.5))
+        names = [f"arg_{i}" for i in range(side * side)]
+        attacks = []
+        for row in range(side):
+            for col in range(side):
+                i = row * side + col
+                if rng.random() < 0.05:
+                    attacks.append((names[i], names[i]))
+                if col + 1 < side:
+                    attacks.append((names[i], names[i + 1]))
+                if row + 1 < side:
+                    attacks.append((names[i], names[i + side]))
+        
+        agent = DungAgent(backend=backend)
+        agent.add_arguments(names)
+        agent.add_attacks(attacks)
+        return agent
+    
+    @staticmethod
+    def generate_cycle_framework(num_args: int, seed: int = None, backend: str = 'tweety') -> DungAgent:
+        """
+        Génère une chaîne de cycles impairs (longueurs 1, 3, 5 ou 7) reliés par
+        des attaques entre cycles consécutifs : beaucoup d'arguments indécis et
+        de SCC non triviales.
+        """
+        rng = random.Random(seed)
+        names = [f"arg_{i}" for i in range(num_args)]
+        attacks = []
+        cycles = []
+        start = 0
+        while start < num_args:
+            length = min(rng.choice((1, 3, 5, 7)), num_args - start)
+            cycle = list(range(start, start + length))
+            attacks.extend((names[cycle[k]], names[cycle[(k + 1) % length]]) for k in range(length))
+            if cycles:
+                attacks.append((names[rng.choice(cycles[-1])], names[rng.choice(cycle)]))
+            cycles.append(cycle)
+            start += length
+        
+        agent = DungAgent(backend=backend)
+        agent.add_arguments(names)
+        agent.add_attacks(attacks)
+        return agent
+    
+    @staticmethod
+    def generate_iccma_framework(num_args: int, attacks_per_argument: float = 2.0, seed: int = None,
+                                 backend: str = 'tweety') -> DungAgent:
+        """
+        Génère un framework proche des instances ICCMA « scale-free » :
+        attachement préférentiel vers les arguments déjà très attaqués, plus
+        quelques attaques retour locales qui forment de petites SCC.
+        """
+        rng = random.Random(seed)
+        names = [f"arg_{i}" for i in range(num_args)]
+        attacks = set()
+        targets = [0]  # un argument apparaît autant de fois qu'il est attaqué (+1)
+        for i in range(1, num_args):
+            for _ in range(max(1, int(rng.expovariate(1 / attacks_per_argument)))):
+                target = rng.choice(targets)
+                attacks.add((i, target))
+                targets.append(target)
+            if rng.random() < 0.05:
+                attacks.add((rng.randrange(max(0, i - 5), i), i))
+            targets.append(i)
+        
+        agent = DungAgent(backend=backend)
+        agent.add_arguments(names)
+        agent.add_attacks((names[s], names[t]) for s, t in attacks)
+        return agent
+    
     @staticmethod
     def generate_classic_examples() -> dict:
         """Génère des exemples classiques d'argumentation"""
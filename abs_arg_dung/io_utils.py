@@ -1,14 +1,203 @@
 import json
-from agent import DungAgent
+import os
+import re
+from itertools import islice
+from agent import APX_NAME, DungAgent
+
+# Taille des lots transmis à add_arguments / add_attacks lors d'un import en flux
+CHUNK_SIZE = 100000
+
+STREAM_FORMATS = {
+    '.tgf': 'tgf',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.apx': 'apx',
+    '.i23': 'i23',
+    '.af': 'i23',
+    '.json': 'json',
+}
+
+APX_LINE = re.compile(r'\s*(arg|att)\(\s*([^,()\s]+)\s*(?:,\s*([^,()\s]+)\s*)?\)\s*\.')
+
+
+def detect_format(filename: str) -> str:
+    """Déduit le format d'un fichier de son extension."""
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in STREAM_FORMATS:
+        raise ValueError(f"Format inconnu pour {filename} (extensions : {', '.join(STREAM_FORMATS)})")
+    return STREAM_FORMATS[ext]
+
+
+# Lecteurs en flux : chaque lecteur produit des tuples ('arg', nom) ou
+# ('att', source, cible) ligne par ligne, sans charger le fichier en mémoire.
+
+def read_tgf(f):
+    """TGF : « id libellé » par nœud, puis « # », puis « id_source id_cible »."""
+    labels = {}
+    edges = False
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        if line == '#':
+            edges = True
+            continue
+        if edges:
+            source, target = line.split()[:2]
+            yield ('att', labels.get(source, source), labels.get(target, target))
+        else:
+            node_id, _, label = line.partition(' ')
+            labels[node_id] = label.strip() or node_id
+            yield ('arg', labels[node_id])
+
+
+def read_jsonl(f):
+    """JSON lines : {"argument": nom} ou {"attack": [source, cible]} par ligne."""
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        if 'argument' in record:
+            yield ('arg', record['argument'])
+        elif 'attack' in record:
+            source, target = record['attack']
+            yield ('att', source, target)
+
+
+def read_apx(f):
+    """ICCMA apx : arg(a). et att(a,b)."""
+    for line in f:
+        match = APX_LINE.match(line)
+        if match is None:
+            continue
+        kind, first, second = match.groups()
+        if kind == 'arg':
+            yield ('arg', first)
+        elif second is not None:
+            yield ('att', first, second)
+
+
+def read_i23(f):
+    """ICCMA 2023 : en-tête « p af n », arguments numérotés de 1 à n, « i j » par attaque."""
+    for line in f:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        fields = line.split()
+        if fields[0] == 'p':
+            for i in range(1, int(fields[2]) + 1):
+                yield ('arg', str(i))
+        else:
+            yield ('att', fields[0], fields[1])
+
+
+def read_json(f):
+    """Format JSON historique du projet (fichier chargé en entier)."""
+    data = json.load(f)
+    for arg in data["arguments"]:
+        yield ('arg', arg)
+    for source, target in data["attacks"]:
+        yield ('att', source, target)
+
+
+READERS = {'tgf': read_tgf, 'jsonl': read_jsonl, 'apx': read_apx, 'i23': read_i23, 'json': read_json}
+
+
+# Écrivains en flux : ils reçoivent la liste des noms et un itérable de paires
+# d'attaques, parcouru une seule fois.
+
+def write_tgf(f, names, pairs):
+    ids = {}
+    for i, name in enumerate(names, 1):
+        ids[name] = i
+        f.write(f"{i} {name}\n")
+    f.write("#\n")
+    f.writelines(f"{ids[s]} {ids[t]}\n" for s, t in pairs)
+
+
+def write_jsonl(f, names, pairs):
+    f.writelines(json.dumps({"argument": name}) + "\n" for name in names)
+    f.writelines(json.dumps({"attack": [s, t]}) + "\n" for s, t in pairs)
+
+
+def write_apx(f, names, pairs):
+    """Les noms doivent être des identifiants apx, sans quoi le fichier ne serait pas relisible."""
+    invalid = [name for name in names if not APX_NAME.fullmatch(name)]
+    if invalid:
+        raise ValueError(f"Noms d'arguments invalides en apx : {', '.join(map(repr, invalid[:5]))}")
+    f.writelines(f"arg({name}).\n" for name in names)
+    f.writelines(f"att({s},{t}).\n" for s, t in pairs)
+
+
+def write_i23(f, names, pairs):
+    """Les arguments sont renumérotés de 1 à n dans l'ordre d'ajout."""
+    ids = {name: i for i, name in enumerate(names, 1)}
+    f.write(f"p af {len(ids)}\n")
+    f.writelines(f"{ids[s]} {ids[t]}\n" for s, t in pairs)
+
+
+def write_json(f, names, pairs):
+    pairs = [list(pair) for pair in pairs]
+    json.dump({
+        "arguments": names,
+        "attacks": pairs,
+        "metadata": {"num_arguments": len(names), "num_attacks": len(pairs), "creation_time": None},
+    }, f, indent=2)
+
+
+WRITERS = {'tgf': write_tgf, 'jsonl': write_jsonl, 'apx': write_apx, 'i23': write_i23, 'json': write_json}
+
 
 class FrameworkIO:
     
+    @staticmethod
+    def stream_import(filename: str, fmt: str = None, backend: str = 'tweety',
+                      chunk_size: int = CHUNK_SIZE) -> DungAgent:
+        """
+        Importe un framework en flux (TGF, JSON lines, apx, i23 ou JSON).
+
+        Les éléments sont lus ligne par ligne et transmis par lots à
+        ``add_arguments`` / ``add_attacks`` : peu d'appels JVM avec Tweety,
+        remplissage direct des tableaux d'indices avec le backend natif.
+        Les arguments cités dans une attaque sans déclaration sont créés.
+        """
+        fmt = fmt or detect_format(filename)
+        agent = DungAgent(backend=backend)
+        known = set()
+        with open(filename, 'r') as f:
+            items = READERS[fmt](f)
+            while True:
+                chunk = list(islice(items, chunk_size))
+                if not chunk:
+                    break
+                names, pairs = [], []
+                for item in chunk:
+                    if item[0] == 'arg':
+                        names.append(item[1])
+                        known.add(item[1])
+                    else:
+                        for name in item[1:]:
+                            if name not in known:
+                                known.add(name)
+                                names.append(name)
+                        pairs.append((item[1], item[2]))
+                agent.add_arguments(names)
+                agent.add_attacks(pairs)
+        return agent
+
+    @staticmethod
+    def stream_export(agent: DungAgent, filename: str, fmt: str = None):
+        """Exporte un framework en flux, sans construire d'objets Tweety par attaque."""
+        fmt = fmt or detect_format(filename)
+        with open(filename, 'w') as f:
+            WRITERS[fmt](f, agent.get_argument_names(), agent.iter_attack_pairs())
+
     @staticmethod
     def export_to_json(agent: DungAgent, filename: str):
         """Exporte un framework vers un fichier JSON"""
-        nodes = [str(arg.getName()) for arg in agent.af.getNodes()]
-        edges = [(str(a.getAttacker().getName()), str(a.getAttacked().getName()))
-                 for a in agent.af.getAttacks()]
+        nodes = agent.get_argument_names()
+        edges = agent.get_attack_pairs()
         
         data = {
             "arguments": nodes,
@@ -26,20 +215,9 @@ class FrameworkIO:
         print(f"Framework exporté vers {filename}")
     
     @staticmethod
-    def import_from_json(filename: str) -> DungAgent:
+    def import_from_json(filename: str, backend: str = 'tweety') -> DungAgent:
         """Importe un framework depuis un fichier JSON"""
-        with open(filename, 'r') as f:
-            data = json.load(f)
-        
-        agent = DungAgent()
-        
-        # Ajouter les arguments
-        for arg in data["arguments"]:
-            agent.add_argument(arg)
-        
-        # Ajouter les attaques
-        for source, target in data["attacks"]:
-            agent.add_attack(source, target)
+        agent = FrameworkIO.stream_import(filename, fmt='json', backend=backend)
         
         print(f"Framework importé depuis {filename}")
         return agent
@@ -56,10 +234,8 @@ class FrameworkIO:
             
             # Edges
             arg_to_id = {str(arg): i+1 for i, arg in enumerate(agent._arguments.keys())}
-            for attack in agent.af.getAttacks():
-                source_id = arg_to_id[str(attack.getAttacker().getName())]
-                target_id = arg_to_id[str(attack.getAttacked().getName())]
-                f.write(f"{source_id} {target_id}\n")
+            for source, target in agent.get_attack_pairs():
+                f.write(f"{arg_to_id[source]} {arg_to_id[target]}\n")
         
         print(f"Framework exporté vers {filename} (format TGF)")
     
@@ -76,9 +252,7 @@ class FrameworkIO:
                 f.write(f"  \"{str(arg)}\";\n")
             
             # Edges
-            for attack in agent.af.getAttacks():
-                source = str(attack.getAttacker().getName())
-                target = str(attack.getAttacked().getName())
+            for source, target in agent.get_attack_pairs():
                 f.write(f"  \"{source}\" -> \"{target}\";\n")
             
             f.write("}\n")
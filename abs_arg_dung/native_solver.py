@@ -0,0 +1,627 @@
+"""
+Backend natif (sans JVM) pour le calcul des extensions de Dung.
+
+Le framework est stocké sous forme de tableaux indexés (listes d'attaquants et
+d'attaqués par argument) et les ensembles d'arguments sous forme d'entiers
+utilisés comme bitsets. Les sémantiques sont calculées à la demande :
+
+- grounded : point fixe en temps linéaire (compteurs d'attaquants non vaincus) ;
+- complete / stable / preferred : étiquetage IN/OUT/UNDEC par backtracking
+  avec propagation, décomposé selon les composantes fortement connexes (SCC)
+  des arguments laissés indécis par l'extension fondée, traitées dans l'ordre
+  topologique ;
+- semi-stable : extensions préférées dont l'ensemble UNDEC est minimal ;
+- ideal : plus grand sous-ensemble admissible de l'intersection des préférées ;
+- admissible : énumération avec élagage (conflict-free, arguments hors de
+  l'extension fondée exclus).
+
+``NativeDungTheory`` reproduit la petite partie de l'API ``DungTheory`` de
+Tweety utilisée par le projet (``add``, ``getNodes``, ``getAttacks``), ce qui
+permet à ``DungAgent`` d'utiliser l'un ou l'autre backend sans autre changement.
+"""
+
+import itertools
+import time
+
+IN, OUT, UNDEC = 1, 2, 3
+
+SEMANTICS = ('grounded', 'complete', 'preferred', 'stable', 'semi-stable', 'ideal')
+
+
+class SolverTimeout(TimeoutError):
+    """Le calcul des extensions a dépassé le délai imparti."""
+
+
+class NativeArgument:
+    """Argument nommé, compatible avec ``org.tweetyproject...Argument``."""
+
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def getName(self) -> str:
+        return self.name
+
+    def __eq__(self, other):
+        return isinstance(other, NativeArgument) and other.name == self.name
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return self.name
+
+
+class NativeAttack:
+    """Attaque entre deux arguments, compatible avec ``...syntax.Attack``."""
+
+    __slots__ = ('attacker', 'attacked')
+
+    def __init__(self, attacker: NativeArgument, attacked: NativeArgument):
+        self.attacker = attacker
+        self.attacked = attacked
+
+    def getAttacker(self) -> NativeArgument:
+        return self.attacker
+
+    def getAttacked(self) -> NativeArgument:
+        return self.attacked
+
+    def __eq__(self, other):
+        return (isinstance(other, NativeAttack)
+                and other.attacker == self.attacker and other.attacked == self.attacked)
+
+    def __hash__(self):
+        return hash((self.attacker, self.attacked))
+
+    def __repr__(self):
+        return f"({self.attacker},{self.attacked})"
+
+
+class NativeDungTheory:
+    """Framework d'argumentation stocké dans des tableaux indexés."""
+
+    def __init__(self):
+        self.arguments = []      # index -> NativeArgument
+        self.index = {}          # nom -> index
+        self.attackers = []      # index -> liste des index attaquants
+        self.successors = []     # index -> liste des index attaqués
+        self._attacks = {}       # (source, cible) -> None, dans l'ordre d'insertion
+
+    def add(self, item):
+        """Ajoute un argument ou une attaque ; retourne False si déjà présent."""
+        if isinstance(item, NativeAttack):
+            return self.add_attack_indices(self.index[item.attacker.name],
+                                           self.index[item.attacked.name])
+        if item.name in self.index:
+            return False
+        self.index[item.name] = len(self.arguments)
+        self.arguments.append(item)
+        self.attackers.append([])
+        self.successors.append([])
+        return True
+
+    def add_attack_indices(self, source: int, target: int) -> bool:
+        key = (source, target)
+        if key in self._attacks:
+            return False
+        self._attacks[key] = None
+        self.successors[source].append(target)
+        self.attackers[target].append(source)
+        return True
+
+    def add_arguments(self, names) -> list:
+        """Ajout en bloc ; retourne les noms effectivement ajoutés."""
+        added = []
+        for name in names:
+            if name not in self.index:
+                self.add(NativeArgument(name))
+                added.append(name)
+        return added
+
+    def add_attacks(self, pairs) -> list:
+        """Ajout en bloc de paires de noms ; retourne les index des arguments nouvellement attaqués."""
+        index, attacks = self.index, self._attacks
+        successors, attackers = self.successors, self.attackers
+        targets = []
+        for source, target in pairs:
+            try:
+                key = (index[source], index[target])
+            except KeyError as e:
+                raise ValueError(f"Attaque ({source}, {target}) : argument inconnu {e}") from None
+            if key not in attacks:
+                attacks[key] = None
+                successors[key[0]].append(key[1])
+                attackers[key[1]].append(key[0])
+                targets.append(key[1])
+        return targets
+
+    def getNodes(self):
+        return list(self.arguments)
+
+    def getAttacks(self):
+        arguments = self.arguments
+        return [NativeAttack(arguments[s], arguments[t]) for s, t in self._attacks]
+
+    def attack_pairs(self):
+        """Itère sur les paires d'index (source, cible), dans l'ordre d'insertion."""
+        return iter(self._attacks)
+
+    def __len__(self):
+        return len(self.arguments)
+
+
+class NativeDungSolver:
+    """
+    Solveur d'extensions sur un ``NativeDungTheory``.
+
+    Les résultats sont des listes d'index d'arguments ; chaque sémantique est
+    calculée à la première demande puis mémorisée. Le solveur partage les
+    tableaux du framework : après une modification, ``notify_change`` ne
+    recalcule que la région en aval des arguments touchés (étiquetage fondé,
+    SCC) et ne purge que les étiquetages locaux des SCC de cette région ; les
+    étiquetages des SCC non affectées sont réutilisés tels quels.
+    """
+
+    def __init__(self, theory: NativeDungTheory):
+        self.attackers = theory.attackers
+        self.successors = theory.successors
+        self._cache = {}
+        self._grounded = None
+        self._sccs = None
+        self._scc_cache = {}        # (mode, SCC, étiquettes des attaquants externes) -> étiquetages locaux
+        self._scc_keys = {}         # argument -> clés de _scc_cache qui le concernent
+        self._deadline = None       # time.monotonic() limite pendant extensions(..., timeout=...)
+        self.stats = {'scc_hits': 0, 'scc_misses': 0, 'scc_invalidated': 0, 'incremental_updates': 0}
+
+    @property
+    def n(self) -> int:
+        return len(self.attackers)
+
+    # ---------- Invalidation incrémentale ----------
+
+    def downstream(self, changed) -> list:
+        """Arguments atteignables depuis ``changed`` (inclus), dans l'ordre de découverte."""
+        seen = set(changed)
+        order = list(seen)
+        head = 0
+        while head < len(order):
+            for target in self.successors[order[head]]:
+                if target not in seen:
+                    seen.add(target)
+                    order.append(target)
+            head += 1
+        return order
+
+    def notify_change(self, changed):
+        """
+        Signale que les arguments ``changed`` ont été ajoutés ou ont reçu de
+        nouveaux attaquants. Seuls ces arguments et leurs descendants sont
+        recalculés.
+        """
+        self._cache.clear()
+        if self._grounded is None:
+            return
+        self.stats['incremental_updates'] += 1
+        region = self.downstream(changed)
+        self._grounded.extend([UNDEC] * (self.n - len(self._grounded)))
+        self._ground_region(region)
+
+        in_region = set(region)
+        if self._sccs is not None:
+            kept = [scc for scc in self._sccs if not any(arg in in_region for arg in scc)]
+            labels = self._grounded
+            rebuilt = strongly_connected_components(
+                [arg for arg in region if labels[arg] == UNDEC], self.successors,
+                lambda i: labels[i] == UNDEC)
+            # Aucune SCC conservée ne dépend de la région : elles restent en tête.
+            self._sccs = kept + rebuilt
+
+        stale = set()
+        for arg in region:
+            stale.update(self._scc_keys.pop(arg, ()))
+        for key in stale:
+            if self._scc_cache.pop(key, None) is not None:
+                self.stats['scc_invalidated'] += 1
+
+    # ---------- Grounded ----------
+
+    def _ground_region(self, region):
+        """
+        Recalcule l'étiquetage fondé des arguments de ``region`` (fermée vers
+        l'aval), les autres étiquettes étant fixées.
+        """
+        labels = self._grounded
+        in_region = set(region)
+        for arg in region:
+            labels[arg] = UNDEC
+        remaining = {}
+        beaten = []
+        for arg in region:
+            count = 0
+            for attacker in self.attackers[arg]:
+                if attacker in in_region:
+                    count += 1
+                elif labels[attacker] == IN:
+                    beaten.append(arg)
+                    count += 1
+                elif labels[attacker] == UNDEC:
+                    count += 1
+            remaining[arg] = count
+
+        queue = []
+        for arg in beaten:
+            if labels[arg] == UNDEC:
+                labels[arg] = OUT
+                for victim in self.successors[arg]:
+                    remaining[victim] -= 1
+        for arg in region:
+            if remaining[arg] == 0 and labels[arg] == UNDEC:
+                labels[arg] = IN
+                queue.append(arg)
+        head = 0
+        while head < len(queue):
+            arg = queue[head]
+            head += 1
+            for target in self.successors[arg]:
+                if labels[target] != UNDEC:
+                    continue
+                labels[target] = OUT
+                for victim in self.successors[target]:
+                    remaining[victim] -= 1
+                    if remaining[victim] == 0 and labels[victim] == UNDEC:
+                        labels[victim] = IN
+                        queue.append(victim)
+
+    def grounded_labels(self) -> list:
+        """Étiquetage fondé (IN/OUT/UNDEC) en O(arguments + attaques)."""
+        if self._grounded is None:
+            self._grounded = [UNDEC] * self.n
+            self._ground_region(list(range(self.n)))
+        return self._grounded
+
+    def grounded(self) -> list:
+        labels = self.grounded_labels()
+        return [i for i in range(self.n) if labels[i] == IN]
+
+    # ---------- Décomposition en SCC ----------
+
+    def undecided_sccs(self) -> list:
+        """SCC du sous-graphe des arguments UNDEC de l'étiquetage fondé, ordre topologique."""
+        if self._sccs is None:
+            labels = self.grounded_labels()
+            nodes = [i for i in range(self.n) if labels[i] == UNDEC]
+            self._sccs = strongly_connected_components(
+                nodes, self.successors, lambda i: labels[i] == UNDEC)
+        return self._sccs
+
+    # ---------- Étiquetages par SCC ----------
+
+    def _consistent(self, arg, labels, allow_undec):
+        has_in = has_undec = has_free = False
+        for attacker in self.attackers[arg]:
+            label = labels[attacker]
+            if label == IN:
+                has_in = True
+            elif label == UNDEC:
+                has_undec = True
+            elif label == 0:
+                has_free = True
+        label = labels[arg]
+        if label == IN:
+            return not has_in and not has_undec
+        if label == OUT:
+            return has_in or has_free
+        if label == UNDEC:
+            return allow_undec and not has_in and (has_undec or has_free)
+        return True
+
+    def _propagate(self, queue, members, labels, trail, allow_undec):
+        """Propagation des contraintes d'étiquetage complet à l'intérieur d'une SCC."""
+        while queue:
+            arg = queue.pop()
+            label = labels[arg]
+            if label == 0:
+                attackers = self.attackers[arg]
+                if any(labels[a] == IN for a in attackers):
+                    forced = OUT
+                elif all(labels[a] == OUT for a in attackers):
+                    forced = IN
+                elif not allow_undec and any(labels[a] == UNDEC for a in attackers):
+                    return False
+                else:
+                    continue
+                labels[arg] = forced
+                trail.append(arg)
+                label = forced
+                queue.append(arg)
+                queue.extend(t for t in self.successors[arg] if t in members)
+                queue.extend(a for a in self.attackers[arg] if a in members)
+                continue
+            if not self._consistent(arg, labels, allow_undec):
+                return False
+            if label == IN:
+                for attacker in self.attackers[arg]:
+                    if labels[attacker] == 0:
+                        labels[attacker] = OUT
+                        trail.append(attacker)
+                        queue.append(attacker)
+                        queue.extend(t for t in self.successors[attacker] if t in members)
+                        queue.extend(a for a in self.attackers[attacker] if a in members)
+        return True
+
+    def _check_deadline(self):
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            raise SolverTimeout("Délai de calcul des extensions dépassé")
+
+    def _undo(self, labels, trail, mark):
+        while len(trail) > mark:
+            labels[trail.pop()] = 0
+
+    def scc_labellings(self, scc, labels, allow_undec=True):
+        """
+        Énumère les étiquetages complets d'une SCC, les arguments des SCC
+        antérieures étant déjà étiquetés dans ``labels``. Chaque étiquetage
+        reste appliqué dans ``labels`` jusqu'à l'itération suivante et est
+        fourni sous forme de tuple aligné sur ``scc``.
+        """
+        members = set(scc)
+        choices = (IN, OUT, UNDEC) if allow_undec else (IN, OUT)
+        trail = []
+        if not self._propagate(list(scc), members, labels, trail, allow_undec):
+            self._undo(labels, trail, 0)
+            return
+
+        def first_free(start):
+            for position in range(start, len(scc)):
+                if labels[scc[position]] == 0:
+                    return position
+            return None
+
+        position = first_free(0)
+        if position is None:
+            yield tuple(labels[a] for a in scc)
+            self._undo(labels, trail, 0)
+            return
+
+        frames = [[position, iter(choices), len(trail)]]
+        while frames:
+            self._check_deadline()
+            position, options, mark = frames[-1]
+            self._undo(labels, trail, mark)
+            arg = scc[position]
+            for label in options:
+                labels[arg] = label
+                trail.append(arg)
+                queue = [arg]
+                queue.extend(t for t in self.successors[arg] if t in members)
+                queue.extend(a for a in self.attackers[arg] if a in members)
+                if self._propagate(queue, members, labels, trail, allow_undec):
+                    break
+                self._undo(labels, trail, mark)
+            else:
+                frames.pop()
+                continue
+            following = first_free(position + 1)
+            if following is not None:
+                frames.append([following, iter(choices), len(trail)])
+            elif all(self._consistent(a, labels, allow_undec) for a in scc):
+                yield tuple(labels[a] for a in scc)
+        self._undo(labels, trail, 0)
+
+    def _maximal_scc_labellings(self, scc, labels):
+        """Étiquetages complets de la SCC dont l'ensemble IN est maximal."""
+        candidates = []
+        for snapshot in self.scc_labellings(scc, labels):
+            mask = 0
+            for position, label in enumerate(snapshot):
+                if label == IN:
+                    mask |= 1 << position
+            candidates.append((mask, snapshot))
+        maximal = [
+            snapshot for mask, snapshot in candidates
+            if not any(other != mask and other & mask == mask for other, _ in candidates)
+        ]
+        return list(dict.fromkeys(maximal))
+
+    def _apply_snapshots(self, scc, labels, snapshots):
+        for snapshot in snapshots:
+            for arg, label in zip(scc, snapshot):
+                labels[arg] = label
+            yield snapshot
+        for arg in scc:
+            labels[arg] = 0
+
+    def _local_labellings(self, mode, scc, labels):
+        """Étiquetages locaux d'une SCC, mis en cache selon l'étiquetage de ses attaquants externes."""
+        members = set(scc)
+        condition = tuple(labels[a] for arg in scc for a in self.attackers[arg] if a not in members)
+        key = (mode, tuple(scc), condition)
+        snapshots = self._scc_cache.get(key)
+        if snapshots is not None:
+            self.stats['scc_hits'] += 1
+            return snapshots
+        self.stats['scc_misses'] += 1
+        if mode == 'preferred':
+            snapshots = self._maximal_scc_labellings(scc, labels)
+        else:
+            snapshots = list(self.scc_labellings(scc, labels, allow_undec=(mode != 'stable')))
+        self._scc_cache[key] = snapshots
+        for arg in scc:
+            self._scc_keys.setdefault(arg, set()).add(key)
+        return snapshots
+
+    def _enumerate(self, mode):
+        """Parcours en profondeur (itératif) du produit des étiquetages par SCC."""
+        grounded = self.grounded_labels()
+        sccs = self.undecided_sccs()
+        labels = [label if label != UNDEC else 0 for label in grounded]
+
+        def options(scc):
+            return self._apply_snapshots(scc, labels, self._local_labellings(mode, scc, labels))
+
+        if not sccs:
+            yield list(labels)
+            return
+        stack = [options(sccs[0])]
+        while stack:
+            self._check_deadline()
+            try:
+                next(stack[-1])
+            except StopIteration:
+                stack.pop()
+                continue
+            if len(stack) == len(sccs):
+                yield list(labels)
+            else:
+                stack.append(options(sccs[len(stack)]))
+
+    def labellings(self, mode: str) -> list:
+        """Étiquetages complets (``complete``), préférés (``preferred``) ou stables (``stable``)."""
+        key = f'labellings_{mode}'
+        if key not in self._cache:
+            self._cache[key] = list(self._enumerate(mode))
+        return self._cache[key]
+
+    def extensions(self, semantics: str, limit=None, timeout=None) -> list:
+        """
+        Extensions d'une sémantique de ``SEMANTICS``, au plus ``limit``.
+        Lève ``SolverTimeout`` si le calcul dépasse ``timeout`` secondes ; une
+        énumération tronquée par ``limit`` n'est pas mémorisée.
+        """
+        if semantics not in SEMANTICS:
+            raise ValueError(f"Sémantique inconnue: {semantics}")
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            if semantics == 'grounded':
+                return [self.grounded()]
+            if semantics == 'ideal':
+                return [self.ideal()]
+            if semantics == 'semi-stable':
+                # La minimalité se vérifie sur toutes les préférées
+                return self.semi_stable()[:limit]
+            key = f'labellings_{semantics}'
+            if limit is None or key in self._cache:
+                return [self._in_set(l) for l in self.labellings(semantics)[:limit]]
+            labellings = list(itertools.islice(self._enumerate(semantics), limit + 1))
+            if len(labellings) <= limit:
+                self._cache[key] = labellings
+            return [self._in_set(l) for l in labellings[:limit]]
+        finally:
+            self._deadline = None
+
+    @staticmethod
+    def _in_set(labels) -> list:
+        return [i for i, label in enumerate(labels) if label == IN]
+
+    def complete(self) -> list:
+        return [self._in_set(l) for l in self.labellings('complete')]
+
+    def preferred(self) -> list:
+        return [self._in_set(l) for l in self.labellings('preferred')]
+
+    def stable(self) -> list:
+        return [self._in_set(l) for l in self.labellings('stable')]
+
+    def semi_stable(self) -> list:
+        preferred = self.labellings('preferred')
+        undec = [sum(1 << i for i, label in enumerate(l) if label == UNDEC) for l in preferred]
+        return [
+            self._in_set(l) for l, mask in zip(preferred, undec)
+            if not any(other != mask and other & mask == other for other in undec)
+        ]
+
+    def ideal(self) -> list:
+        preferred = self.preferred()
+        if not preferred:
+            return []
+        candidate = set(preferred[0]).intersection(*preferred[1:])
+        changed = True
+        while changed:
+            changed = False
+            attacked = {t for a in candidate for t in self.successors[a]}
+            for arg in list(candidate):
+                if any(attacker not in attacked for attacker in self.attackers[arg]):
+                    candidate.discard(arg)
+                    changed = True
+        return sorted(candidate)
+
+    def admissible(self) -> list:
+        """Tous les ensembles admissibles (énumération exponentielle, à la demande)."""
+        grounded = self.grounded_labels()
+        candidates = [i for i in range(self.n)
+                      if grounded[i] != OUT and i not in self.attackers[i]]
+        attack_mask = [sum(1 << a for a in self.attackers[i]) for i in range(self.n)]
+        target_mask = [sum(1 << t for t in self.successors[i]) for i in range(self.n)]
+
+        results = []
+        # (position, ensemble, attaquants de l'ensemble, arguments attaqués par l'ensemble)
+        stack = [(0, 0, 0, 0)]
+        while stack:
+            position, members, attacking, attacked = stack.pop()
+            if position == len(candidates):
+                if attacking & ~attacked == 0:
+                    results.append([i for i in candidates if members >> i & 1])
+                continue
+            arg = candidates[position]
+            stack.append((position + 1, members, attacking, attacked))
+            if not (attack_mask[arg] | target_mask[arg]) & members:
+                stack.append((position + 1, members | 1 << arg,
+                              attacking | attack_mask[arg], attacked | target_mask[arg]))
+        return results
+
+
+def strongly_connected_components(nodes, successors, keep=lambda i: True) -> list:
+    """
+    SCC par l'algorithme de Tarjan (version itérative), restreint aux nœuds
+    acceptés par ``keep``. Les composantes sont renvoyées dans l'ordre
+    topologique (sources d'abord).
+    """
+    index = {}
+    lowlink = {}
+    on_stack = set()
+    stack = []
+    components = []
+    counter = 0
+    for root in nodes:
+        if root in index:
+            continue
+        work = [(root, iter(successors[root]))]
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, neighbours = work[-1]
+            advanced = False
+            for neighbour in neighbours:
+                if not keep(neighbour):
+                    continue
+                if neighbour not in index:
+                    index[neighbour] = lowlink[neighbour] = counter
+                    counter += 1
+                    stack.append(neighbour)
+                    on_stack.add(neighbour)
+                    work.append((neighbour, iter(successors[neighbour])))
+                    advanced = True
+                    break
+                if neighbour in on_stack:
+                    lowlink[node] = min(lowlink[node], index[neighbour])
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    components.reverse()
+    return components
@@ -0,0 +1,49 @@
+import copy
+import unittest
+
+from benchmark_suite import FAMILIES, compare_results, run_suite
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_parallel_run_matches_serial_run(self):
+        kwargs = dict(sizes=[200], semantics=['grounded', 'preferred'], repeats=1)
+        serial = run_suite(workers=1, **kwargs)
+        parallel = run_suite(workers=2, **kwargs)
+
+        self.assertEqual(len(serial['results']), len(FAMILIES) * 2)
+        self.assertEqual([r['key'] for r in serial['results']], [r['key'] for r in parallel['results']])
+        self.assertEqual([r['num_extensions'] for r in serial['results']],
+                         [r['num_extensions'] for r in parallel['results']])
+
+    def test_single_extension_semantics_count_one_extension(self):
+        data = run_suite(families=['random'], sizes=[100], semantics=['grounded', 'ideal', 'complete'],
+                         repeats=1, workers=1)
+        counts = [result['num_extensions'] for result in data['results']]
+        self.assertEqual(counts[:2], [1, 1])
+        self.assertGreaterEqual(counts[2], 1)
+
+    def test_compare_flags_regressions_beyond_threshold(self):
+        baseline = run_suite(families=['random'], sizes=[100], semantics=['grounded', 'stable'],
+                             repeats=1, workers=1)
+        for result in baseline['results']:
+            result['time'] = 1.0
+        current = copy.deepcopy(baseline)
+        current['results'][0]['time'] = 1.5
+        current['results'][1]['time'] = 1.1
+
+        comparison = compare_results(current, baseline, threshold=0.25)
+        self.assertEqual([entry['regression'] for entry in comparison], [True, False])
+
+        # En dessous de min_time, les écarts sont considérés comme du bruit
+        for result in baseline['results'] + current['results']:
+            result['time'] /= 1000
+        self.assertFalse(any(entry['regression'] for entry in compare_results(current, baseline, 0.25)))
+
+    def test_tweety_backend_requires_single_worker(self):
+        with self.assertRaises(ValueError):
+            run_suite(backend='tweety', workers=2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
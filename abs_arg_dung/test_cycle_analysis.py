@@ -0,0 +1,106 @@
+import random
+import time
+import unittest
+
+import networkx as nx
+
+from cycle_analysis import analyze_cycles
+from test_native_solver import build_agent
+
+
+class TestCycleAnalysis(unittest.TestCase):
+
+    def test_acyclic_framework(self):
+        props = analyze_cycles(["a", "b", "c"], [("a", "b"), ("b", "c")])
+        self.assertTrue(props['is_acyclic'])
+        self.assertEqual(props['num_sccs'], 3)
+        self.assertEqual((props['cycles'], props['girth'], props['has_odd_cycle']), ([], None, False))
+        self.assertTrue(props['cycles_exhaustive'])
+
+    def test_cycle_parity_and_girth(self):
+        """Cycle pair a <-> b, cycle impair c -> d -> e -> c, boucle sur f"""
+        attacks = [("a", "b"), ("b", "a"), ("c", "d"), ("d", "e"), ("e", "c"), ("b", "c"), ("f", "f")]
+        props = analyze_cycles(list("abcdef"), attacks)
+        self.assertEqual(sorted(props['cyclic_sccs']), [["a", "b"], ["c", "d", "e"], ["f"]])
+        self.assertTrue(props['has_odd_cycle'])
+        self.assertTrue(props['has_even_cycle'])
+        self.assertEqual(props['girth'], 1)
+        self.assertEqual(props['self_attacking'], ["f"])
+        self.assertEqual(len(props['cycles']), 3)
+
+        odd_only = analyze_cycles(list("cde"), attacks)
+        self.assertEqual((odd_only['has_odd_cycle'], odd_only['has_even_cycle'], odd_only['girth']), (True, False, 3))
+
+    def test_clique_is_polynomial(self):
+        """Une clique de 40 arguments a des milliards de cycles élémentaires"""
+        names = [f"a{i}" for i in range(40)]
+        start = time.monotonic()
+        props = analyze_cycles(names, [(a, b) for a in names for b in names if a != b], sample_size=5)
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(props['largest_scc_size'], 40)
+        self.assertEqual(props['girth'], 2)
+        self.assertEqual(len(props['cycles']), 5)
+        self.assertFalse(props['cycles_exhaustive'])
+
+        bounded = analyze_cycles(names, [(a, b) for a in names for b in names if a != b],
+                                 enumerate_cycles=True, cycle_limit=100, timeout=1.0)
+        self.assertEqual(len(bounded['cycles']), 100)
+        self.assertFalse(bounded['cycles_exhaustive'])
+
+    def test_matches_networkx_on_random_frameworks(self):
+        for seed in range(200):
+            rng = random.Random(seed)
+            names = [str(i) for i in range(rng.randint(1, 7))]
+            density = rng.random() * 0.5
+            attacks = [(a, b) for a in names for b in names if rng.random() < density]
+            G = nx.DiGraph()
+            G.add_nodes_from(names)
+            G.add_edges_from(attacks)
+            cycles = list(nx.simple_cycles(G))
+
+            props = analyze_cycles(names, attacks)
+            self.assertEqual(props['has_cycles'], bool(cycles))
+            self.assertEqual(props['has_odd_cycle'], any(len(c) % 2 for c in cycles))
+            self.assertIn(props['has_even_cycle'], (any(len(c) % 2 == 0 for c in cycles), None))
+            self.assertEqual(props['girth'], min(map(len, cycles)) if cycles else None)
+            self.assertTrue(props['girth_exact'])
+
+            full = analyze_cycles(names, attacks, enumerate_cycles=True)
+            self.assertTrue(full['cycles_exhaustive'])
+            self.assertEqual(len(full['cycles']), len(cycles))
+            self.assertEqual(full['has_even_cycle'], any(len(c) % 2 == 0 for c in cycles))
+
+    def test_girth_search_is_bounded(self):
+        """Anneau avec cordes : la maille exacte demande un parcours par argument"""
+        def ring(n):
+            rng = random.Random(n)
+            names = [f"a{i}" for i in range(n)]
+            attacks = [(names[i], names[(i + 1) % n]) for i in range(n)]
+            attacks += [(names[i], names[(i + rng.randint(5, 50)) % n]) for i in range(0, n, 3)]
+            return names, attacks
+
+        names, attacks = ring(600)
+        exact = analyze_cycles(names, attacks, girth_sources=None, timeout=None)
+        self.assertTrue(exact['girth_exact'])
+        capped = analyze_cycles(names, attacks, girth_sources=10)
+        self.assertFalse(capped['girth_exact'])
+        self.assertGreaterEqual(capped['girth'], exact['girth'])
+
+        names, attacks = ring(5000)
+        start = time.monotonic()
+        timed_out = analyze_cycles(names, attacks, timeout=0)
+        self.assertLess(time.monotonic() - start, 2.0)
+        self.assertFalse(timed_out['girth_exact'])
+        self.assertIsNotNone(timed_out['girth'])
+
+    def test_agent_properties(self):
+        agent = build_agent(["a", "b", "c"], [("a", "b"), ("b", "a"), ("c", "c")])
+        props = agent.get_framework_properties()
+        self.assertEqual((props['num_arguments'], props['num_attacks']), (3, 3))
+        self.assertTrue(props['has_cycles'])
+        self.assertEqual(props['self_attacking'], ["c"])
+        self.assertIn('cache', props)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import random
+import tempfile
+import unittest
+
+from agent import DungAgent
+from io_utils import FrameworkIO, detect_format
+
+
+class TestStreamingIO(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.agent = DungAgent(backend='native')
+        self.agent.add_arguments(["a", "b", "c", "d"])
+        self.agent.add_attacks([("a", "b"), ("b", "c"), ("c", "d"), ("d", "c")])
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp_dir.name, name)
+
+    def test_round_trip_all_formats(self):
+        for ext in ('json', 'tgf', 'jsonl', 'apx'):
+            filename = self.path(f"framework.{ext}")
+            FrameworkIO.stream_export(self.agent, filename)
+            imported = FrameworkIO.stream_import(filename, backend='native')
+            self.assertEqual(imported.get_argument_names(), ["a", "b", "c", "d"], ext)
+            self.assertEqual(imported.get_attack_pairs(), self.agent.get_attack_pairs(), ext)
+            self.assertEqual(imported.get_preferred_extensions(), self.agent.get_preferred_extensions(), ext)
+
+    def test_i23_renumbers_arguments(self):
+        filename = self.path("framework.i23")
+        FrameworkIO.stream_export(self.agent, filename)
+        with open(filename) as f:
+            self.assertEqual(f.readline(), "p af 4\n")
+        imported = FrameworkIO.stream_import(filename, backend='native')
+        self.assertEqual(imported.get_attack_pairs(), [("1", "2"), ("2", "3"), ("3", "4"), ("4", "3")])
+
+    def test_apx_reader_ignores_comments_and_declares_missing_arguments(self):
+        filename = self.path("framework.apx")
+        with open(filename, 'w') as f:
+            f.write("% commentaire\narg(a).\n\natt( a , b ).\n")
+        imported = FrameworkIO.stream_import(filename, backend='native')
+        self.assertEqual(imported.get_argument_names(), ["a", "b"])
+        self.assertEqual(imported.get_grounded_extension(), ["a"])
+
+    def test_export_iterates_attacks_lazily(self):
+        self.agent.get_attack_pairs = None  # l'export ne doit pas construire la liste complète
+        filename = self.path("framework.tgf")
+        FrameworkIO.stream_export(self.agent, filename)
+        with open(filename) as f:
+            self.assertEqual(f.read().split("#\n")[1], "1 2\n2 3\n3 4\n4 3\n")
+
+    def test_apx_export_rejects_invalid_names(self):
+        self.agent.add_arguments(["not apx"])
+        with self.assertRaises(ValueError):
+            FrameworkIO.stream_export(self.agent, self.path("framework.apx"))
+        FrameworkIO.stream_export(self.agent, self.path("framework.jsonl"))
+
+    def test_bulk_add_rejects_unknown_arguments(self):
+        with self.assertRaises(ValueError):
+            self.agent.add_attacks([("a", "z")])
+        with self.assertRaises(ValueError):
+            detect_format("framework.xml")
+
+    def test_large_framework_is_streamed_in_chunks(self):
+        rng = random.Random(0)
+        size = 20000
+        filename = self.path("large.apx")
+        with open(filename, 'w') as f:
+            f.writelines(f"arg(a{i}).\n" for i in range(size))
+            f.writelines(f"att(a{rng.randrange(size)},a{rng.randrange(size)}).\n" for _ in range(2 * size))
+        imported = FrameworkIO.stream_import(filename, backend='native', chunk_size=5000)
+        self.assertEqual(len(imported.get_argument_names()), size)
+        self.assertLessEqual(len(imported.get_attack_pairs()), 2 * size)
+        self.assertTrue(imported.get_grounded_extension())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
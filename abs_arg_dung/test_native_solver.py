@@ -0,0 +1,163 @@
+import itertools
+import random
+import unittest
+
+from agent import DungAgent
+from native_solver import NativeDungSolver, NativeDungTheory, SolverTimeout
+
+
+def build_agent(arguments, attacks):
+    agent = DungAgent(backend='native')
+    for arg in arguments:
+        agent.add_argument(arg)
+    for source, target in attacks:
+        agent.add_attack(source, target)
+    return agent
+
+
+def brute_force_extensions(arguments, attacks):
+    """Extensions calculées par définition, sur tous les sous-ensembles (petits frameworks)."""
+    attackers = {a: {s for s, t in attacks if t == a} for a in arguments}
+
+    def conflict_free(S):
+        return not any((a, b) in attacks for a in S for b in S)
+
+    def defends(S, a):
+        return all(any((s, b) in attacks for s in S) for b in attackers[a])
+
+    def rng(S):
+        return S | {t for s, t in attacks if s in S}
+
+    subsets = [frozenset(c) for r in range(len(arguments) + 1) for c in itertools.combinations(arguments, r)]
+    admissible = [S for S in subsets if conflict_free(S) and all(defends(S, a) for a in S)]
+    complete = [S for S in admissible if all((a in S) == defends(S, a) for a in arguments)]
+    preferred = [S for S in complete if not any(S < T for T in complete)]
+    stable = [S for S in complete if rng(S) == set(arguments)]
+    semi_stable = [S for S in complete if not any(rng(S) < rng(T) for T in complete)]
+    return {
+        'grounded': min(complete, key=len),
+        'complete': complete,
+        'preferred': preferred,
+        'stable': stable,
+        'semi_stable': semi_stable,
+        'admissible': admissible,
+    }
+
+
+class TestNativeSolver(unittest.TestCase):
+
+    def test_basic_framework_without_jvm(self):
+        """a -> b -> c : extension fondée {a, c}"""
+        agent = build_agent(["a", "b", "c"], [("a", "b"), ("b", "c")])
+
+        self.assertEqual(agent.get_grounded_extension(), ["a", "c"])
+        self.assertEqual(agent.get_preferred_extensions(), [["a", "c"]])
+        self.assertEqual(agent.get_stable_extensions(), [["a", "c"]])
+
+    def test_odd_and_even_cycles(self):
+        """Cycle pair : deux préférées ; cycle impair : préférée vide, pas de stable"""
+        even = build_agent(["a", "b"], [("a", "b"), ("b", "a")])
+        self.assertEqual(even.get_preferred_extensions(), [["a"], ["b"]])
+        self.assertEqual(even.get_complete_extensions(), [[], ["a"], ["b"]])
+
+        odd = build_agent(["a", "b", "c"], [("a", "b"), ("b", "c"), ("c", "a")])
+        self.assertEqual(odd.get_preferred_extensions(), [[]])
+        self.assertEqual(odd.get_stable_extensions(), [])
+        self.assertEqual(odd.get_semi_stable_extensions(), [[]])
+
+    def test_semantics_are_computed_lazily(self):
+        agent = build_agent(["a", "b"], [("a", "b")])
+        agent.get_grounded_extension()
+        self.assertEqual(set(agent._cached_extensions), {'grounded'})
+
+        agent.add_attack("b", "a")
+        self.assertEqual(agent._cached_extensions, {})
+        self.assertEqual(agent.get_grounded_extension(), [])
+
+    def test_matches_definitions_on_random_frameworks(self):
+        for seed in range(100):
+            rng = random.Random(seed)
+            arguments = [f"a{i}" for i in range(rng.randint(1, 7))]
+            attacks = {(s, t) for s in arguments for t in arguments if rng.random() < 0.3}
+            agent = build_agent(arguments, attacks)
+            expected = brute_force_extensions(arguments, attacks)
+
+            self.assertEqual(agent.get_grounded_extension(), sorted(expected['grounded']))
+            for semantics, getter in [('complete', agent.get_complete_extensions),
+                                      ('preferred', agent.get_preferred_extensions),
+                                      ('stable', agent.get_stable_extensions),
+                                      ('semi_stable', agent.get_semi_stable_extensions),
+                                      ('admissible', agent.get_admissible_sets)]:
+                self.assertEqual(sorted(getter()), sorted(sorted(S) for S in expected[semantics]),
+                                 f"{semantics} (seed {seed})")
+
+    def test_incremental_edits_match_fresh_computation(self):
+        """Après chaque édition, le cache par SCC donne les mêmes extensions qu'un calcul complet"""
+        for seed in range(30):
+            rng = random.Random(seed)
+            arguments = [f"a{i}" for i in range(8)]
+            agent = build_agent(arguments, [])
+            attacks = set()
+            for _ in range(12):
+                attack = (rng.choice(arguments), rng.choice(arguments))
+                attacks.add(attack)
+                agent.add_attack(*attack)
+                fresh = build_agent(arguments, attacks)
+                for getter in ('get_grounded_extension', 'get_complete_extensions',
+                               'get_preferred_extensions', 'get_stable_extensions',
+                               'get_semi_stable_extensions'):
+                    self.assertEqual(getattr(agent, getter)(), getattr(fresh, getter)(),
+                                     f"{getter} (seed {seed}, attaques {sorted(attacks)})")
+
+    def test_edit_only_invalidates_downstream_sccs(self):
+        """Deux cycles pairs indépendants : éditer le second réutilise le premier"""
+        agent = build_agent(["a", "b", "c", "d"], [("a", "b"), ("b", "a"), ("c", "d"), ("d", "c")])
+        self.assertEqual(len(agent.get_preferred_extensions()), 4)
+        before = agent.get_cache_statistics()
+
+        agent.add_argument("e")
+        agent.add_attack("e", "d")
+        self.assertEqual(agent.get_preferred_extensions(), [["a", "c", "e"], ["b", "c", "e"]])
+
+        after = agent.get_framework_properties()['cache']
+        self.assertEqual(after['scc_misses'], before['scc_misses'])
+        self.assertGreater(after['scc_hits'], before['scc_hits'])
+        self.assertEqual(after['invalidations'], before['invalidations'] + 1)
+
+        agent.get_preferred_extensions()
+        self.assertEqual(agent.get_cache_statistics()['extension_hits'], after['extension_hits'] + 1)
+
+    def test_large_sparse_framework(self):
+        rng = random.Random(0)
+        size = 20000
+        agent = DungAgent(backend='native')
+        for i in range(size):
+            agent.add_argument(f"a{i}")
+        for _ in range(size):
+            agent.add_attack(f"a{rng.randrange(size)}", f"a{rng.randrange(size)}")
+
+        grounded = set(agent.get_grounded_extension())
+        preferred = agent.get_preferred_extensions()
+        self.assertTrue(preferred)
+        self.assertTrue(all(grounded <= set(extension) for extension in preferred))
+
+    def test_extensions_limit_and_timeout(self):
+        """n cycles pairs indépendants : 2^n extensions préférées"""
+        theory = NativeDungTheory()
+        theory.add_arguments([f"{side}{i}" for i in range(12) for side in "ab"])
+        theory.add_attacks([pair for i in range(12) for pair in ((f"a{i}", f"b{i}"), (f"b{i}", f"a{i}"))])
+        solver = NativeDungSolver(theory)
+
+        self.assertEqual(len(solver.extensions('preferred', limit=10)), 10)
+        self.assertNotIn('labellings_preferred', solver._cache)
+        with self.assertRaises(SolverTimeout):
+            solver.extensions('complete', timeout=0.0)
+        self.assertEqual(solver.extensions('grounded', timeout=0.0), [[]])
+        self.assertEqual(len(solver.extensions('stable')), 2 ** 12)
+        self.assertEqual(solver.extensions('stable', limit=3), solver.stable()[:3])
+        with self.assertRaises(ValueError):
+            solver.extensions('naive')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -131,24 +131,32 @@ def get_dung_analysis_service() -> DungAnalysisService:
     """
     Injection de dépendance pour le service d'analyse de Dung.
     Utilise un singleton global pour instancier le service (et la JVM) une seule fois.
+    Si `settings.jvm.tweety_workers` est positif, le service utilise le pool de
+    workers Tweety et la JVM n'est pas démarrée dans le processus de l'API.
     """
     global _global_dung_service
     if _global_dung_service is None:
         logging.info("[API] Initialisation du DungAnalysisService...")
-        import jpype
-        import jpype.imports
-        from argumentation_analysis.orchestration.jpype_manager import JPypeManager
-        
-        if not jpype.isJVMStarted():
-            # Instance du manager pour la configuration centralisée
-            jpype_manager = JPypeManager()
-            
-            # Définir le chemin vers les fichiers JAR
-            jpype_manager.set_jars_path('libs/tweety')
-            
-            # Lancer la JVM avec la configuration du manager
-            jpype_manager.start_jvm()
+        from argumentation_analysis.config.settings import settings
+
+        if settings.jvm.tweety_workers > 0:
+            # Les reasoners Tweety tournent dans le pool de workers : pas de JVM dans l'API
+            _global_dung_service = DungAnalysisService(backend='remote')
+        else:
+            import jpype
+            import jpype.imports
+            from argumentation_analysis.orchestration.jpype_manager import JPypeManager
+
+            if not jpype.isJVMStarted():
+                # Instance du manager pour la configuration centralisée
+                jpype_manager = JPypeManager()
+
+                # Définir le chemin vers les fichiers JAR
+                jpype_manager.set_jars_path('libs/tweety')
+
+                # Lancer la JVM avec la configuration du manager
+                jpype_manager.start_jvm()
 
-        _global_dung_service = DungAnalysisService()
+            _global_dung_service = DungAnalysisService()
         logging.info("[API] DungAnalysisService initialisé avec succès.")
     return _global_dung_service
\ No newline at end of file
@@ -33,6 +33,10 @@ class FrameworkAnalysisOptions(BaseModel):
     semantics: str = "preferred"
     compute_extensions: bool = True
     include_visualization: bool = False
+    # Énumération complète des cycles (coût exponentiel) : désactivée par défaut
+    enumerate_cycles: bool = False
+    cycle_limit: int = 1000
+    cycle_timeout: float = 5.0
 
 class FrameworkAnalysisRequest(BaseModel):
     """
@@ -56,6 +60,14 @@ class GraphProperties(BaseModel):
     has_cycles: bool
     cycles: List[List[str]]
     self_attacking_nodes: List[str]
+    is_acyclic: bool = True
+    num_sccs: int = 0
+    cyclic_sccs: List[List[str]] = []
+    largest_scc_size: int = 0
+    has_odd_cycle: bool = False
+    has_even_cycle: Optional[bool] = False
+    girth: Optional[int] = None
+    cycles_exhaustive: bool = True
 
 class Extensions(BaseModel):
     """Conteneur pour toutes les extensions sémantiques."""
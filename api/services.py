@@ -6,6 +6,7 @@ from .models import AnalysisResponse, Fallacy
 import jpype
 import jpype.imports
 from jpype import JClass
+import functools
 import time
 from typing import Dict
 
@@ -90,9 +91,10 @@ class AnalysisService:
 # --- Service d'analyse d'argumentation de Dung ---
 import os
 import glob
-import networkx as nx
 from typing import TYPE_CHECKING
 
+from abs_arg_dung.cycle_analysis import analyze_cycles, DEFAULT_CYCLE_LIMIT, DEFAULT_CYCLE_TIMEOUT
+
 if TYPE_CHECKING:
     from enhanced_agent import EnhancedDungAgent
 
@@ -106,22 +108,30 @@ class DungAnalysisService:
     Utilise l'implémentation de l'étudiant (`EnhancedDungAgent`) comme moteur principal.
     """
 
-    def __init__(self):
-        import jpype
-        import jpype.imports
-        if not jpype.isJVMStarted():
-            raise RuntimeError(
-                "La JVM n'est pas démarrée. "
-                "Veuillez l'initialiser au point d'entrée de l'application."
-            )
+    def __init__(self, backend: str = 'tweety'):
+        """
+        Args:
+            backend: Backend de l'agent ('tweety', 'native' ou 'remote'). Seul
+                'tweety' exige une JVM démarrée dans le processus de l'API.
+        """
+        self.backend = backend
+        if backend == 'tweety':
+            import jpype
+            import jpype.imports
+            if not jpype.isJVMStarted():
+                raise RuntimeError(
+                    "La JVM n'est pas démarrée. "
+                    "Veuillez l'initialiser au point d'entrée de l'application."
+                )
         # Importer l'agent ici pour s'assurer que la JVM est prête
         from abs_arg_dung.enhanced_agent import EnhancedDungAgent
-        self.agent_class = EnhancedDungAgent
-        
-        # Exposer les classes Java nécessaires pour que le test worker puisse passer
-        self.DungTheory = JClass('org.tweetyproject.arg.dung.syntax.DungTheory')
-        self.Argument = JClass('org.tweetyproject.arg.dung.syntax.Argument')
-        self.Attack = JClass('org.tweetyproject.arg.dung.syntax.Attack')
+        self.agent_class = functools.partial(EnhancedDungAgent, backend=backend)
+
+        if backend == 'tweety':
+            # Exposer les classes Java nécessaires pour que le test worker puisse passer
+            self.DungTheory = JClass('org.tweetyproject.arg.dung.syntax.DungTheory')
+            self.Argument = JClass('org.tweetyproject.arg.dung.syntax.Argument')
+            self.Attack = JClass('org.tweetyproject.arg.dung.syntax.Attack')
         
         print("Service d'analyse Dung initialisé, utilisant EnhancedDungAgent.")
 
@@ -143,7 +153,7 @@ class DungAnalysisService:
         # 3. Formater les résultats dans la structure attendue
         results = {
             'argument_status': {}, # Sera rempli plus bas
-            'graph_properties': self._get_framework_properties(agent)
+            'graph_properties': self._get_framework_properties(agent, options)
         }
 
         # 2. Calculer les extensions et le statut des arguments si demandé
@@ -182,24 +192,29 @@ class DungAnalysisService:
             }
         return all_status
     
-    def _get_framework_properties(self, agent: "EnhancedDungAgent") -> dict:
-        """Extrait les propriétés du graphe directement depuis l'agent ou son framework Java."""
-        # L'agent de l'étudiant ne stocke pas directement le graphe networkx
-        # Nous le reconstruisons ici pour l'analyse des propriétés
+    def _get_framework_properties(self, agent: "EnhancedDungAgent", options: dict = None) -> dict:
+        """
+        Extrait les propriétés du graphe depuis le framework Java de l'agent.
+
+        Les cycles sont analysés en temps polynomial (SCC, parité, maille,
+        échantillon) ; l'énumération complète n'a lieu que si l'option
+        `enumerate_cycles` est activée, bornée par `cycle_limit` et `cycle_timeout`.
+        """
+        options = options or {}
         nodes = [str(arg.getName()) for arg in agent.af.getNodes()]
         attacks = [(str(a.getAttacker().getName()), str(a.getAttacked().getName())) for a in agent.af.getAttacks()]
-        
-        G = nx.DiGraph()
-        G.add_nodes_from(nodes)
-        G.add_edges_from(attacks)
-        
-        cycles = [list(map(str, c)) for c in nx.simple_cycles(G)]
-        self_attacking = [str(a.getAttacker().getName()) for a in agent.af.getAttacks() if a.getAttacker() == a.getAttacked()]
+
+        analysis = analyze_cycles(
+            nodes, attacks,
+            enumerate_cycles=options.get('enumerate_cycles', False),
+            cycle_limit=options.get('cycle_limit', DEFAULT_CYCLE_LIMIT),
+            timeout=options.get('cycle_timeout', DEFAULT_CYCLE_TIMEOUT)
+        )
+        self_attacking = analysis.pop('self_attacking')
 
         return {
             'num_arguments': len(nodes),
             'num_attacks': len(attacks),
-            'has_cycles': len(cycles) > 0,
-            'cycles': cycles,
-            'self_attacking_nodes': list(set(self_attacking))
+            **analysis,
+            'self_attacking_nodes': self_attacking
         }
@@ -46,7 +46,9 @@ from semantic_kernel.functions.kernel_parameter_metadata import KernelParameterM
 # Importer load_csv_file depuis project_core
 from argumentation_analysis.core.utils.file_loaders import load_csv_file
 from argumentation_analysis.utils.taxonomy_loader import get_taxonomy_path
+from argumentation_analysis.utils.taxonomy_snapshot import load_taxonomy_snapshot
 from argumentation_analysis.paths import DATA_DIR # Assurer que DATA_DIR est importé si nécessaire ailleurs
+from .taxonomy_index import TaxonomyIndex, get_shared_index
 
 # Configuration du logging
 logging.basicConfig(
@@ -95,6 +97,9 @@ class InformalAnalysisPlugin:
         _current_taxonomy_path (Path): Chemin effectif utilisé pour charger la taxonomie.
         _taxonomy_df_cache (Optional[pd.DataFrame]): Cache pour le DataFrame afin
             d'optimiser les accès répétés.
+        _taxonomy_index (Optional[TaxonomyIndex]): Index compilé (adjacence,
+            PK -> ligne, trigrammes des noms), partagé par toutes les instances
+            du processus qui utilisent le même fichier.
     """
 
     def __init__(self, kernel: Kernel, taxonomy_file_path: Optional[str] = None):
@@ -118,18 +123,21 @@ class InformalAnalysisPlugin:
         self._logger.info(f"Chemin de taxonomie utilisé : {self._current_taxonomy_path}")
         
         self._taxonomy_df_cache = None
+        self._taxonomy_index = None
     
     def _internal_load_and_prepare_dataframe(self) -> pd.DataFrame:
         """
         Charge et prépare le DataFrame de la taxonomie.
-        - Charge le CSV.
+        - Charge l'instantané binaire de la taxonomie s'il est à jour, sinon le CSV.
         - Standardise les types des colonnes de clés (PK, FK_Parent, parent_pk) en entiers nullables (Int64).
         - Définit 'PK' comme index.
         """
         self._logger.info(f"Chargement et préparation du DataFrame de taxonomie depuis: {self._current_taxonomy_path}...")
         
         try:
-            df = load_csv_file(self._current_taxonomy_path)
+            df = load_taxonomy_snapshot(self._current_taxonomy_path)
+            if df is None:
+                df = load_csv_file(self._current_taxonomy_path)
             if df is None:
                 raise Exception(f"Impossible de charger la taxonomie depuis {self._current_taxonomy_path}")
             
@@ -196,8 +204,31 @@ class InformalAnalysisPlugin:
             les modifications involontaires du cache.
         """
         if self._taxonomy_df_cache is None:
-            self._taxonomy_df_cache = self._internal_load_and_prepare_dataframe()
+            self._taxonomy_df_cache = self._get_taxonomy_index().df
         return self._taxonomy_df_cache.copy() # Retourner une copie pour éviter les modifications accidentelles du cache
+
+    def _get_taxonomy_index(self) -> TaxonomyIndex:
+        """
+        Accède à l'index compilé de la taxonomie.
+
+        L'index est construit une seule fois par fichier et par processus
+        (voir `get_shared_index`) : les fonctions du kernel appelées en boucle
+        par le LLM n'ont plus à filtrer le DataFrame.
+
+        Returns:
+            TaxonomyIndex: L'index de la taxonomie courante.
+        """
+        if self._taxonomy_index is None:
+            self._taxonomy_index = get_shared_index(
+                self._current_taxonomy_path, self._internal_load_and_prepare_dataframe
+            )
+        return self._taxonomy_index
+
+    def _index_for_dataframe(self, df: pd.DataFrame) -> TaxonomyIndex:
+        """Index du plugin si `df` est son DataFrame, sinon index construit pour `df`."""
+        if self._taxonomy_index is not None and df is self._taxonomy_index.df:
+            return self._taxonomy_index
+        return TaxonomyIndex(df)
     
     def _internal_explore_hierarchy(self, current_pk: int, df: pd.DataFrame, max_children: int = 15) -> Dict[str, Any]:
         """
@@ -217,109 +248,11 @@ class InformalAnalysisPlugin:
             liste de ses enfants. Contient une clé 'error' en cas de problème.
         """
         self._logger.debug(f"DEBUG: Entering _internal_explore_hierarchy with pk={current_pk}")
-        result = {
-            "current_node": None,
-            "children": [],
-            "error": None
-        }
-        
         if df is None:
-            result["error"] = "Taxonomie sophismes non disponible."
             self._logger.debug("DEBUG: Exiting _internal_explore_hierarchy (df is None)")
-            return result
-        
-        # Convertir les colonnes numériques
-        if 'depth' in df.columns and not pd.api.types.is_numeric_dtype(df['depth']):
-            df['depth'] = pd.to_numeric(df['depth'], errors='coerce')
-        
-        # Trouver le nœud courant
-        current_node_df = df.loc[df.index == current_pk] if current_pk in df.index else pd.DataFrame()
-        if len(current_node_df) == 0:
-            result["error"] = f"PK {current_pk} non trouvée dans la taxonomie."
-            return result
-        
-        # Extraire les informations du nœud courant
-        current_row = current_node_df.iloc[0]
-        # Utiliser une valeur par défaut pour path si elle n'existe pas
-        current_path = current_row.get('path', '') # .get est disponible sur les Series pandas
-        
-        result["current_node"] = {
-            "pk": int(current_row.name), # PK est l'index
-            "path": current_path,
-            "depth": int(current_row['depth']) if pd.notna(current_row.get('depth')) else 0,
-            "Name": current_row.get('Name', ''), # Utiliser la colonne 'Name' du CSV
-            "nom_vulgarise": current_row.get('nom_vulgarise', ''), # nom_vulgarise (peut être redondant ou un alias)
-            "famille": current_row.get('Famille', ''),             # Famille
-            "description_courte": current_row.get('text_fr', '')   # text_fr comme description courte
-        }
-        
-        # Trouver les enfants
-        children_df = pd.DataFrame() # Initialiser à un DataFrame vide
-        if 'FK_Parent' in df.columns:
-            # Si FK_Parent existe, l'utiliser pour trouver les enfants
-            children_df = df[df['FK_Parent'] == current_pk]
-        elif 'parent_pk' in df.columns:
-            # Si parent_pk existe, l'utiliser pour trouver les enfants
-            children_df = df[df['parent_pk'] == current_pk]
-        elif 'path' in df.columns and current_path:
-            # Si path existe, l'utiliser pour trouver les enfants
-            # S'assurer que current_path se termine par un point pour éviter les correspondances partielles incorrectes
-            # Exemple: si current_path est "1", on ne veut pas matcher "10.x"
-            # On cherche les enfants directs, donc le path de l'enfant doit être current_path + ".quelquechose"
-            # et ne pas contenir d'autres points après "quelquechose".
-            # Exemple: si current_path = "1", on cherche "1.X" mais pas "1.X.Y"
-            # Si current_path = "1.2", on cherche "1.2.X" mais pas "1.2.X.Y"
-            
-            # Construire le préfixe attendu pour les enfants directs
-            child_path_prefix = str(current_path) + "."
-            
-            # Filtrer les enfants qui commencent par ce préfixe
-            potential_children = df[df['path'].astype(str).str.startswith(child_path_prefix, na=False)]
-            
-            # Filtrer pour ne garder que les enfants directs (pas les petits-enfants, etc.)
-            # Un enfant direct aura un path qui, une fois le préfixe retiré, ne contient plus de "."
-            children_df = potential_children[~potential_children['path'].astype(str).str.slice(start=len(child_path_prefix)).str.contains('.', na=False, regex=False)]
-
-        elif 'depth' in df.columns and pd.notna(current_row.get('depth')):
-             # Si depth existe et que le nœud courant a une profondeur,
-             # les enfants directs auront une profondeur de current_depth + 1
-             # et leur path commencera par le path du parent.
-            current_depth = int(current_row['depth'])
-            # S'assurer que current_path est une chaîne pour la comparaison str.startswith
-            current_path_str = str(current_path) if pd.notna(current_path) else ""
-
-            # Filtrer par profondeur et par le début du path
-            # (pour éviter de prendre des nœuds d'une autre branche ayant la même profondeur)
-            children_df = df[
-                (df['depth'] == current_depth + 1) &
-                (df['path'].astype(str).str.startswith(current_path_str + ('.' if current_path_str else ''), na=False))
-            ]
-        
-        children_count = len(children_df)
-        
-        if children_count > 0:
-            # Limiter le nombre d'enfants si nécessaire
-            if max_children > 0 and children_count > max_children:
-                children_df = children_df.head(max_children)
-                result["children_truncated"] = True
-                result["total_children"] = children_count
-            
-            # Extraire les informations des enfants
-            for _, child_row in children_df.iterrows():
-                # Vérifier si l'enfant a lui-même des enfants
-                # (simplifié, une vérification plus robuste serait nécessaire pour une UI complexe)
-                # Pour cette fonction, on peut se baser sur la présence d'enfants dans le dataframe
-                # en utilisant une logique similaire à celle ci-dessus.
-                # Pour l'instant, on met False, car le but est de lister les enfants directs.
-                child_info = {
-                    "pk": int(child_row.name), # .name est l'index (PK)
-                    "nom_vulgarise": child_row.get('nom_vulgarise', ''), # nom_vulgarise
-                    "description_courte": child_row.get('text_fr', ''),   # text_fr
-                    "famille": child_row.get('Famille', ''),             # Famille
-                    "has_children": False # Simplifié. Pourrait être calculé si besoin.
-                }
-                result["children"].append(child_info)
+            return {"current_node": None, "children": [], "error": "Taxonomie sophismes non disponible."}
         
+        result = self._index_for_dataframe(df).explore(current_pk, max_children)
         self._logger.debug(f"DEBUG: Exiting _internal_explore_hierarchy with pk={current_pk}")
         return result
     
@@ -342,105 +275,11 @@ class InformalAnalysisPlugin:
             incluant des informations contextuelles (parent, enfants).
         """
         self._logger.debug(f"DEBUG: Entering _internal_get_node_details with pk={pk}")
-        result = {
-            "pk": pk,
-            "error": None
-        }
-        
         if df is None:
-            result["error"] = "Taxonomie sophismes non disponible."
             self._logger.debug(f"DEBUG: Exiting _internal_get_node_details (df is None) for pk={pk}")
-            return result
-        
-        # Convertir les colonnes numériques si elles existent et ne sont pas déjà numériques
-        if 'PK' in df.columns and not pd.api.types.is_numeric_dtype(df['PK']):
-            df['PK'] = pd.to_numeric(df['PK'], errors='coerce')
-        if 'depth' in df.columns and not pd.api.types.is_numeric_dtype(df['depth']):
-            df['depth'] = pd.to_numeric(df['depth'], errors='coerce')
-        
-        # Trouver le nœud
-        # Correction pour la compatibilité pandas 2.x
-        # Remplacer df.loc[[pk]] par un filtrage sur l'index, plus robuste
-        node_df = df.loc[df.index == pk]
-        if len(node_df) == 0:
-            result["error"] = f"PK {pk} non trouvée dans la taxonomie."
-            return result
-        # Extraire les informations du nœud
-        row = node_df.iloc[0]
-        # Suppression des logs de débogage
-        for col in row.index: # Utiliser row.index qui contient les noms des colonnes
-            if pd.notna(row[col]):
-                # Gérer la conversion pour numpy types si nécessaire pour la sérialisation JSON
-                if hasattr(row[col], 'item'): # Typique pour les types numpy (int64, float64, etc.)
-                    result[col] = row[col].item()
-                else:
-                    result[col] = row[col]
-        
-        # Trouver le parent
-        parent_df = pd.DataFrame() # Initialiser
-        parent_pk_val = None
-        if 'FK_Parent' in df.columns and pd.notna(row.get('FK_Parent')):
-            parent_pk_val = row.get('FK_Parent')
-        elif 'parent_pk' in df.columns and pd.notna(row.get('parent_pk')): # Fallback
-            parent_pk_val = row.get('parent_pk')
-        
-        if parent_pk_val is not None:
-            try:
-                parent_pk_int = int(parent_pk_val)
-                parent_df = df.loc[df.index == parent_pk_int]
-            except ValueError:
-                self._logger.warning(f"Valeur FK_Parent/parent_pk non entière pour le nœud {pk}: {parent_pk_val}")
-
-        elif 'path' in df.columns:
-            # Sinon, essayer d'utiliser path
-            path_val = row.get('path', '')
-            if path_val and '.' in str(path_val): # S'assurer que path_val est une chaîne
-                parent_path = str(path_val).rsplit('.', 1)[0]
-                parent_df = df[df['path'] == parent_path]
-        
-        if len(parent_df) > 0:
-            parent_row = parent_df.iloc[0]
-            result["parent"] = {
-                "pk": int(parent_row.name), # .name est l'index (PK)
-                "nom_vulgarise": parent_row.get('nom_vulgarise', ''), # nom_vulgarise
-                "description_courte": parent_row.get('text_fr', ''),   # text_fr
-                "famille": parent_row.get('Famille', '')              # Famille
-            }
-        
-        # Trouver les enfants (logique similaire à _internal_explore_hierarchy)
-        # children_list = [] # Renommé pour éviter conflit
-        # Pour être plus précis, on reprend la logique de _internal_explore_hierarchy pour les enfants directs
-        
-        child_nodes_for_details = pd.DataFrame()
-        current_path_for_children = row.get('path', '')
-        current_depth_for_children = row.get('depth', None)
-        
-        if 'FK_Parent' in df.columns:
-            child_nodes_for_details = df[df['FK_Parent'] == pk]
-        elif 'parent_pk' in df.columns:
-            child_nodes_for_details = df[df['parent_pk'] == pk]
-        elif 'path' in df.columns and current_path_for_children:
-            child_path_prefix = str(current_path_for_children) + "."
-            potential_children = df[df['path'].astype(str).str.startswith(child_path_prefix, na=False)]
-            child_nodes_for_details = potential_children[~potential_children['path'].astype(str).str.slice(start=len(child_path_prefix)).str.contains('.', na=False, regex=False)]
-        elif 'depth' in df.columns and pd.notna(current_depth_for_children):
-            current_path_str_for_children = str(current_path_for_children) if pd.notna(current_path_for_children) else ""
-            child_nodes_for_details = df[
-                (df['depth'] == int(current_depth_for_children) + 1) &
-                (df['path'].astype(str).str.startswith(current_path_str_for_children + ('.' if current_path_str_for_children else ''), na=False))
-            ]
-
-        if len(child_nodes_for_details) > 0:
-            result["children"] = []
-            for _, child_row_detail in child_nodes_for_details.iterrows():
-                child_info_detail = {
-                    "pk": int(child_row_detail.name),
-                    "nom_vulgarise": child_row_detail.get('nom_vulgarise', ''), # nom_vulgarise
-                    "description_courte": child_row_detail.get('text_fr', ''),   # text_fr
-                    "famille": child_row_detail.get('Famille', '')              # Famille
-                }
-                result["children"].append(child_info_detail)
+            return {"pk": pk, "error": "Taxonomie sophismes non disponible."}
         
+        result = self._index_for_dataframe(df).node_details(pk)
         self._logger.debug(f"DEBUG: Exiting _internal_get_node_details for pk={pk}")
         return result
     
@@ -537,7 +376,7 @@ class InformalAnalysisPlugin:
             self._logger.error(f"PK invalide: {current_pk_str}")
             return json.dumps({"error": f"PK invalide: {current_pk_str}"})
         
-        df = self._get_taxonomy_dataframe()
+        df = self._get_taxonomy_index().df  # Sans copie : l'index partagé est réutilisé
         if df is None: # Vérifier si df est None après l'appel
             self._logger.error("Taxonomie sophismes non disponible (DataFrame est None).")
             return json.dumps({"error": "Taxonomie sophismes non disponible."})
@@ -585,7 +424,7 @@ class InformalAnalysisPlugin:
             result_error["error"] = f"PK invalide: {fallacy_pk_str}"
             return json.dumps(result_error)
         
-        df = self._get_taxonomy_dataframe()
+        df = self._get_taxonomy_index().df  # Sans copie : l'index partagé est réutilisé
         if df is None: # Vérifier si df est None
             self._logger.error("Taxonomie sophismes non disponible (DataFrame est None).")
             return json.dumps({"pk_requested": fallacy_pk, "error": "Taxonomie sophismes non disponible."})
@@ -622,37 +461,18 @@ class InformalAnalysisPlugin:
                  correspondant, ou un objet JSON d'erreur.
         """
         self._logger.info(f"Recherche de la définition pour le sophisme: '{fallacy_name}'")
-        df = self._get_taxonomy_dataframe()
-        if df is None:
-            return json.dumps({"error": "Taxonomie non disponible."})
-
-        # Recherche cas insensible dans 'nom_vulgarisé' et 'text_fr' (pour la taxonomie réelle)
-        # 'fallacy_type' n'est pas une colonne standard de la taxonomie réelle pour le nom principal.
-        
-        condition_nom_vulgarise = pd.Series(False, index=df.index)
-        if 'nom_vulgarise' in df.columns:
-            condition_nom_vulgarise = df['nom_vulgarise'].fillna('').astype(str).str.contains(fallacy_name, case=False, na=False)
-        
-        condition_text_fr = pd.Series(False, index=df.index)
-        if 'text_fr' in df.columns: # text_fr peut aussi contenir des noms/labels
-            condition_text_fr = df['text_fr'].fillna('').astype(str).str.contains(fallacy_name, case=False, na=False)
-            
-        # On peut aussi chercher dans 'Latin' si pertinent
-        condition_latin = pd.Series(False, index=df.index)
-        if 'Latin' in df.columns:
-            condition_latin = df['Latin'].fillna('').astype(str).str.contains(fallacy_name, case=False, na=False)
+        index = self._get_taxonomy_index()
 
-        found_fallacy = df[condition_nom_vulgarise | condition_text_fr | condition_latin]
+        # Recherche insensible à la casse dans 'nom_vulgarise', 'text_fr' et 'Latin'
+        # via l'index de trigrammes (première occurrence dans l'ordre de la taxonomie)
+        pk_found = index.find(fallacy_name)
 
-        if not found_fallacy.empty:
-            # Prendre la première occurrence si plusieurs
+        if pk_found is not None:
+            row = index.rows[pk_found]
             # Utiliser 'desc_fr' pour la définition
-            definition = found_fallacy.iloc[0].get('desc_fr', "Définition non disponible.")
-            
-            # Gérer l'absence de 'PK' comme index
-            pk_found = found_fallacy.iloc[0].name if df.index.name == 'PK' else found_fallacy.index[0]
+            definition = row.get('desc_fr', "Définition non disponible.")
             # Le nom trouvé est prioritairement 'nom_vulgarisé', sinon 'text_fr', sinon le nom cherché
-            name_found = found_fallacy.iloc[0].get('nom_vulgarise', found_fallacy.iloc[0].get('text_fr', fallacy_name))
+            name_found = row.get('nom_vulgarise', row.get('text_fr', fallacy_name))
 
             self._logger.info(f"Définition trouvée pour '{name_found}' (PK: {pk_found}).")
             return json.dumps({"fallacy_name": name_found, "pk": int(pk_found), "definition": definition}, default=str)
@@ -676,17 +496,13 @@ class InformalAnalysisPlugin:
         """
         self._logger.info("Listage des catégories de sophismes...")
         try:
-            df = self._get_taxonomy_dataframe()
+            index = self._get_taxonomy_index()
         except ValueError as e:
             self._logger.error(f"Erreur de chargement de la taxonomie lors du listage des catégories: {e}")
             return json.dumps({"error": f"Erreur de chargement de la taxonomie: {e}"})
 
-        if df is None:
-            # Cette condition est maintenant probablement redondante mais gardée par sécurité
-            return json.dumps({"error": "Taxonomie non disponible (DataFrame est None)."})
-
-        if 'Famille' in df.columns:
-            categories = df['Famille'].dropna().unique().tolist()
+        if 'Famille' in index.columns:
+            categories = list(index.categories)
             if categories:
                 self._logger.info(f"{len(categories)} catégories trouvées.")
                 return json.dumps({"categories": categories}, default=str)
@@ -715,21 +531,19 @@ class InformalAnalysisPlugin:
                  appartenant à cette catégorie.
         """
         self._logger.info(f"Listage des sophismes dans la catégorie: '{category_name}'")
-        df = self._get_taxonomy_dataframe()
-        if df is None:
-            return json.dumps({"error": "Taxonomie non disponible."})
+        index = self._get_taxonomy_index()
 
-        if 'Famille' not in df.columns:
+        if 'Famille' not in index.columns:
             self._logger.warning("Colonne 'Famille' non trouvée pour lister les sophismes par catégorie.")
             return json.dumps({"category": category_name, "fallacies": [], "error": "Colonne 'Famille' pour les catégories non trouvée."})
 
         # Filtrer par catégorie (cas sensible pour correspondre aux valeurs exactes de 'Famille')
-        fallacies_in_cat_df = df[df['Famille'] == category_name]
+        pks_in_category = index.categories.get(category_name, [])
 
-        if not fallacies_in_cat_df.empty:
+        if pks_in_category:
             result_list = []
-            for index, row in fallacies_in_cat_df.iterrows():
-                pk_val = index # PK est l'index
+            for pk_val in pks_in_category:
+                row = index.rows[pk_val]
                 # Utiliser nom_vulgarisé, sinon text_fr
                 name_val = row.get('nom_vulgarisé', row.get('text_fr', 'Nom non disponible'))
                 result_list.append({
@@ -759,30 +573,16 @@ class InformalAnalysisPlugin:
                  d'erreur si le sophisme n'est pas trouvé.
         """
         self._logger.info(f"Recherche d'un exemple pour le sophisme: '{fallacy_name}'")
-        df = self._get_taxonomy_dataframe()
-        if df is None:
-            return json.dumps({"error": "Taxonomie non disponible."})
-
-        # Recherche cas insensible dans 'nom_vulgarisé' et 'text_fr' (pour la taxonomie réelle)
-        condition_nom_vulgarise = pd.Series(False, index=df.index)
-        if 'nom_vulgarise' in df.columns:
-            condition_nom_vulgarise = df['nom_vulgarise'].fillna('').astype(str).str.contains(fallacy_name, case=False, na=False)
-        
-        condition_text_fr = pd.Series(False, index=df.index)
-        if 'text_fr' in df.columns:
-            condition_text_fr = df['text_fr'].fillna('').astype(str).str.contains(fallacy_name, case=False, na=False)
-
-        condition_latin = pd.Series(False, index=df.index)
-        if 'Latin' in df.columns:
-            condition_latin = df['Latin'].fillna('').astype(str).str.contains(fallacy_name, case=False, na=False)
+        index = self._get_taxonomy_index()
 
-        found_fallacy = df[condition_nom_vulgarise | condition_text_fr | condition_latin]
+        # Même recherche que find_fallacy_definition ('nom_vulgarise', 'text_fr', 'Latin')
+        pk_found = index.find(fallacy_name)
 
-        if not found_fallacy.empty:
+        if pk_found is not None:
+            row = index.rows[pk_found]
             # Utiliser 'example_fr' pour l'exemple
-            example = found_fallacy.iloc[0].get('example_fr', "Exemple non disponible.")
-            pk_found = found_fallacy.iloc[0].name if df.index.name == 'PK' else found_fallacy.index[0]
-            name_found = found_fallacy.iloc[0].get('nom_vulgarise', found_fallacy.iloc[0].get('text_fr', fallacy_name))
+            example = row.get('example_fr', "Exemple non disponible.")
+            name_found = row.get('nom_vulgarise', row.get('text_fr', fallacy_name))
 
             self._logger.info(f"Exemple trouvé pour '{name_found}' (PK: {pk_found}).")
             return json.dumps({"fallacy_name": name_found, "pk": int(pk_found), "example": example}, default=str)
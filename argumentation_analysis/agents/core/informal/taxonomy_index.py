@@ -0,0 +1,449 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Index compilé de la taxonomie des sophismes.
+
+Le DataFrame de la taxonomie est parcouru une seule fois pour construire :
+- un dictionnaire PK -> ligne et des listes d'adjacence parent/enfants, qui
+  rendent l'exploration hiérarchique et les détails d'un nœud en O(1) ;
+- un index de trigrammes sur les noms, pour la recherche de définitions ;
+- un automate d'Aho–Corasick sur les noms, noms vulgarisés et mots-clés des
+  descriptions, qui permet de scorer tous les sophismes en un seul passage
+  sur le texte analysé (construit au premier usage).
+
+`get_shared_index` partage un même index entre toutes les instances du
+processus pour un fichier de taxonomie donné.
+
+Ce module ne dépend que de pandas afin de pouvoir être utilisé et testé sans
+Semantic Kernel.
+"""
+
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+# Pondérations de l'analyse lexicale (identiques à l'ancienne boucle `iterrows`)
+WEIGHT_NOM_VULGARISE = 0.7
+WEIGHT_NAME = 0.5
+WEIGHT_KEYWORD = 0.1
+MAX_KEYWORDS = 5
+MIN_KEYWORD_LENGTH = 5
+
+# Pondérations de la recherche par motif
+SEARCH_WEIGHTS = (('nom_vulgarisé', 0.8), ('Name', 0.6), ('text_fr', 0.4), ('Famille', 0.3))
+
+MAX_SIBLINGS = 5
+
+# Colonnes interrogées par la recherche de définition (find_fallacy_definition)
+NAME_COLUMNS = ('nom_vulgarise', 'text_fr', 'Latin')
+FIELD_SEPARATOR = '\x00'
+
+
+class AhoCorasickAutomaton:
+    """
+    Automate d'Aho–Corasick minimal pour la recherche simultanée de motifs.
+
+    Les motifs sont ajoutés avec `add`, l'automate est finalisé par `build`,
+    puis `find` retourne en un seul passage l'ensemble des motifs présents
+    (en tant que sous-chaînes) dans un texte.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[Tuple[int, ...]] = [()]
+        self.patterns: List[str] = []
+        self._pattern_ids: Dict[str, int] = {}
+
+    def add(self, pattern: str) -> int:
+        """Ajoute un motif (s'il est nouveau) et retourne son identifiant."""
+        if pattern in self._pattern_ids:
+            return self._pattern_ids[pattern]
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append(())
+            node = next_node
+        pattern_id = len(self.patterns)
+        self.patterns.append(pattern)
+        self._pattern_ids[pattern] = pattern_id
+        self._outputs[node] += (pattern_id,)
+        return pattern_id
+
+    def build(self) -> 'AhoCorasickAutomaton':
+        """Calcule les liens d'échec (parcours en largeur)."""
+        # Les fils de la racine gardent un lien d'échec vers la racine
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._outputs[child] += self._outputs[self._fail[child]]
+        return self
+
+    def find(self, text: str) -> set:
+        """Identifiants des motifs apparaissant dans `text`."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        found = set()
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if outputs[node]:
+                found.update(outputs[node])
+        return found
+
+
+def _text(value: Any) -> str:
+    """Valeur textuelle d'une cellule, chaîne vide pour les valeurs manquantes."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ''
+    return str(value)
+
+
+class TaxonomyIndex:
+    """
+    Représentation compilée et immuable d'un DataFrame de taxonomie.
+
+    Attributes:
+        keys (List[int]): Les PK dans l'ordre du DataFrame.
+        rows (Dict[int, Dict[str, Any]]): PK -> valeurs brutes de la ligne.
+        parent (Dict[int, int]): PK -> PK du parent.
+        children (Dict[int, List[int]]): PK -> PK des enfants directs.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.columns: List[str] = list(df.columns)
+        self.keys: List[int] = [int(pk) for pk in df.index]
+        self.rows: Dict[int, Dict[str, Any]] = {
+            pk: row for pk, row in zip(self.keys, df.to_dict('records'))
+        }
+        self._lower = {
+            column: [_text(self.rows[pk].get(column)).lower() for pk in self.keys]
+            for column, _ in SEARCH_WEIGHTS
+        }
+        self._automaton: Optional[AhoCorasickAutomaton] = None
+        self._build_hierarchy(df)
+        self._build_name_index()
+        self._build_categories()
+
+    # --- Hiérarchie ---
+
+    def _build_hierarchy(self, df: pd.DataFrame):
+        """Tables parent/enfants, avec le même ordre de priorité que le plugin."""
+        self.parent: Dict[int, int] = {}
+        self.children: Dict[int, List[int]] = {pk: [] for pk in self.keys}
+        self.paths: Dict[int, str] = {pk: _text(self.rows[pk].get('path')) for pk in self.keys}
+
+        parent_column = next((c for c in ('FK_Parent', 'parent_pk') if c in df.columns), None)
+        if parent_column is not None:
+            for pk in self.keys:
+                value = self.rows[pk].get(parent_column)
+                if value is not None and pd.notna(value):
+                    try:
+                        parent_pk = int(value)
+                    except (TypeError, ValueError):
+                        continue
+                    self.parent[pk] = parent_pk
+                    if parent_pk in self.children:
+                        self.children[parent_pk].append(pk)
+
+        # Parent déduit du chemin : repli des détails d'un nœud sans FK_Parent
+        self._path_parent: Dict[int, int] = {}
+        if 'path' in df.columns:
+            by_path = {path: pk for pk, path in self.paths.items() if path}
+            for pk, path in self.paths.items():
+                if '.' in path:
+                    parent_pk = by_path.get(path.rsplit('.', 1)[0])
+                    if parent_pk is not None:
+                        self._path_parent[pk] = parent_pk
+            if parent_column is None:
+                for pk, parent_pk in self._path_parent.items():
+                    self.parent[pk] = parent_pk
+                    self.children[parent_pk].append(pk)
+
+        # Premiers descendants de chaque préfixe de chemin, pour le contexte "frères"
+        self._descendants: Dict[str, List[int]] = {}
+        for pk in self.keys:
+            parts = self.paths[pk].split('.') if self.paths[pk] else []
+            for length in range(1, len(parts)):
+                bucket = self._descendants.setdefault('.'.join(parts[:length]), [])
+                if len(bucket) <= MAX_SIBLINGS:
+                    bucket.append(pk)
+
+    def parent_context(self, pk: int) -> Dict[str, Any]:
+        """Chemin du parent et premiers nœuds de la même branche (hors `pk`)."""
+        path = self.paths.get(pk)
+        if not path or '.' not in path:
+            return {'siblings': []}
+        parent_path = path.rsplit('.', 1)[0]
+        siblings = [key for key in self._descendants.get(parent_path, []) if key != pk][:MAX_SIBLINGS]
+        return {
+            'parent_path': parent_path,
+            'siblings': [{
+                'taxonomy_key': key,
+                'name': self.rows[key].get('Name', ''),
+                'nom_vulgarise': self.rows[key].get('nom_vulgarisé', ''),
+                'description_courte': self.rows[key].get('text_fr', ''),
+            } for key in siblings]
+        }
+
+    def _summary(self, pk: int) -> Dict[str, Any]:
+        row = self.rows[pk]
+        return {
+            "pk": pk,
+            "nom_vulgarise": row.get('nom_vulgarise', ''),
+            "description_courte": row.get('text_fr', ''),
+            "famille": row.get('Famille', ''),
+        }
+
+    def explore(self, pk: int, max_children: int = 15) -> Dict[str, Any]:
+        """Nœud courant et enfants directs (format de `_internal_explore_hierarchy`)."""
+        result = {"current_node": None, "children": [], "error": None}
+        row = self.rows.get(pk)
+        if row is None:
+            result["error"] = f"PK {pk} non trouvée dans la taxonomie."
+            return result
+
+        result["current_node"] = {
+            "pk": pk,
+            "path": row.get('path', ''),
+            "depth": _int(row.get('depth')),
+            "Name": row.get('Name', ''),
+            "nom_vulgarise": row.get('nom_vulgarise', ''),
+            "famille": row.get('Famille', ''),
+            "description_courte": row.get('text_fr', '')
+        }
+
+        children = self.children.get(pk, [])
+        if max_children > 0 and len(children) > max_children:
+            result["children_truncated"] = True
+            result["total_children"] = len(children)
+            children = children[:max_children]
+        for child in children:
+            child_info = self._summary(child)
+            child_info["has_children"] = bool(self.children.get(child))
+            result["children"].append(child_info)
+        return result
+
+    def node_details(self, pk: int) -> Dict[str, Any]:
+        """Colonnes non vides du nœud, son parent et ses enfants (format de `_internal_get_node_details`)."""
+        result = {"pk": pk, "error": None}
+        row = self.rows.get(pk)
+        if row is None:
+            result["error"] = f"PK {pk} non trouvée dans la taxonomie."
+            return result
+
+        for column, value in row.items():
+            if not _is_na(value):
+                result[column] = value.item() if hasattr(value, 'item') else value
+
+        parent_pk = self.parent.get(pk, self._path_parent.get(pk))
+        if parent_pk in self.rows:
+            result["parent"] = self._summary(parent_pk)
+
+        if self.children.get(pk):
+            result["children"] = [self._summary(child) for child in self.children[pk]]
+        return result
+
+    # --- Recherche par nom ---
+
+    def _build_name_index(self):
+        """Trigrammes -> positions des lignes, sur les colonnes de NAME_COLUMNS."""
+        columns = [c for c in NAME_COLUMNS if c in self.columns]
+        self._name_fields: List[str] = [
+            FIELD_SEPARATOR.join(_text(self.rows[pk].get(c)).lower() for c in columns)
+            for pk in self.keys
+        ]
+        self._trigrams: Dict[str, List[int]] = {}
+        for position, field in enumerate(self._name_fields):
+            for trigram in {field[i:i + 3] for i in range(len(field) - 2)}:
+                self._trigrams.setdefault(trigram, []).append(position)
+
+    def find(self, fragment: str) -> Optional[int]:
+        """
+        PK de la première ligne (ordre de la taxonomie) dont un des champs de
+        NAME_COLUMNS contient `fragment`, sans tenir compte de la casse.
+        """
+        fragment = fragment.lower()
+        if len(fragment) < 3:
+            candidates = range(len(self._name_fields))
+        else:
+            postings = []
+            for trigram in {fragment[i:i + 3] for i in range(len(fragment) - 2)}:
+                if trigram not in self._trigrams:
+                    return None
+                postings.append(self._trigrams[trigram])
+            postings.sort(key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+            candidates = sorted(candidates)
+        for position in candidates:
+            if fragment in self._name_fields[position]:
+                return self.keys[position]
+        return None
+
+    # --- Catégories ---
+
+    def _build_categories(self):
+        self.categories: Dict[Any, List[int]] = {}
+        if 'Famille' in self.columns:
+            for pk in self.keys:
+                famille = self.rows[pk].get('Famille')
+                if not _is_na(famille):
+                    self.categories.setdefault(famille, []).append(pk)
+
+    # --- Analyse lexicale ---
+
+    @property
+    def automaton(self) -> AhoCorasickAutomaton:
+        if self._automaton is None:
+            self._build_automaton()
+        return self._automaton
+
+    def _build_automaton(self):
+        """Un motif par nom, nom vulgarisé et mot-clé ; chaque ligne garde ses motifs dans l'ordre."""
+        automaton = AhoCorasickAutomaton()
+        self._row_patterns: List[List[Tuple[int, float, str]]] = []
+        self._rows_by_pattern: Dict[int, List[int]] = {}
+        for position, pk in enumerate(self.keys):
+            row = self.rows[pk]
+            patterns = []
+            nom_vulgarise = _text(row.get('nom_vulgarisé')).lower()
+            if nom_vulgarise:
+                patterns.append((nom_vulgarise, WEIGHT_NOM_VULGARISE, f"Nom vulgarisé: '{nom_vulgarise}'"))
+            name = _text(row.get('Name')).lower()
+            if name:
+                patterns.append((name, WEIGHT_NAME, f"Nom officiel: '{name}'"))
+            description = _text(row.get('text_fr')).lower()
+            keywords = [w for w in description.split() if len(w) >= MIN_KEYWORD_LENGTH]
+            for word in keywords[:MAX_KEYWORDS]:
+                patterns.append((word, WEIGHT_KEYWORD, f"Mot-clé: '{word}'"))
+
+            compiled = []
+            for pattern, weight, label in patterns:
+                pattern_id = automaton.add(pattern)
+                compiled.append((pattern_id, weight, label))
+                rows = self._rows_by_pattern.setdefault(pattern_id, [])
+                if not rows or rows[-1] != position:
+                    rows.append(position)
+            self._row_patterns.append(compiled)
+        self._automaton = automaton.build()
+
+    def score(self, text: str, min_confidence: float = 0.3) -> List[Dict[str, Any]]:
+        """
+        Score tous les sophismes en un seul passage sur `text`.
+
+        Returns:
+            Les sophismes dont la confiance atteint `min_confidence`, triés par
+            confiance décroissante puis dans l'ordre de la taxonomie.
+        """
+        found = self.automaton.find(text.lower())
+        candidates = sorted({position for pattern_id in found for position in self._rows_by_pattern[pattern_id]})
+
+        detections = []
+        for position in candidates:
+            confidence = 0.0
+            matches = []
+            for pattern_id, weight, label in self._row_patterns[position]:
+                if pattern_id in found:
+                    confidence += weight
+                    matches.append(label)
+            if confidence >= min_confidence:
+                pk = self.keys[position]
+                row = self.rows[pk]
+                detections.append({
+                    'taxonomy_key': pk,
+                    'name': row.get('Name', ''),
+                    'nom_vulgarise': row.get('nom_vulgarisé', ''),
+                    'famille': row.get('Famille', ''),
+                    'description': row.get('text_fr', ''),
+                    'confidence': min(confidence, 1.0),
+                    'matches': matches,
+                    'depth': _int(row.get('depth')),
+                    'path': row.get('path', ''),
+                    'detection_method': 'taxonomy_lexical'
+                })
+        detections.sort(key=lambda d: d['confidence'], reverse=True)
+        return detections
+
+    def search(self, pattern: str) -> List[Dict[str, Any]]:
+        """Recherche d'un motif dans les champs textuels, triée par score décroissant."""
+        pattern_lower = pattern.lower()
+        scores = [0.0] * len(self.keys)
+        for column, weight in SEARCH_WEIGHTS:
+            for position, value in enumerate(self._lower[column]):
+                if pattern_lower in value:
+                    scores[position] += weight
+
+        results = []
+        for position, score in enumerate(scores):
+            if score > 0:
+                pk = self.keys[position]
+                row = self.rows[pk]
+                results.append({
+                    'taxonomy_key': pk,
+                    'name': row.get('Name', ''),
+                    'nom_vulgarise': row.get('nom_vulgarisé', ''),
+                    'famille': row.get('Famille', ''),
+                    'description': row.get('text_fr', ''),
+                    'match_score': score,
+                    'depth': _int(row.get('depth')),
+                    'path': row.get('path', '')
+                })
+        results.sort(key=lambda r: r['match_score'], reverse=True)
+        return results
+
+
+def _is_na(value: Any) -> bool:
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def _int(value: Any, default: int = 0) -> int:
+    try:
+        return int(float(value)) if pd.notna(value) else default
+    except (TypeError, ValueError):
+        return default
+
+
+_shared_indexes: Dict[Tuple[str, int, int], TaxonomyIndex] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_index(path: Any, load_dataframe: Callable[[], pd.DataFrame]) -> TaxonomyIndex:
+    """
+    Index partagé par tout le processus pour le fichier `path`.
+
+    L'index est reconstruit si le fichier change (date ou taille). Si le
+    fichier n'existe pas (taxonomie injectée, tests), un index propre à
+    l'appelant est construit à partir de `load_dataframe`.
+    """
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return TaxonomyIndex(load_dataframe())
+    resolved = os.path.realpath(path)
+    signature = (resolved, stat.st_mtime_ns, stat.st_size)
+    with _shared_lock:
+        index = _shared_indexes.get(signature)
+        if index is None:
+            index = TaxonomyIndex(load_dataframe())
+            for stale in [key for key in _shared_indexes if key[0] == resolved]:
+                del _shared_indexes[stale]
+            _shared_indexes[signature] = index
+        return index
@@ -18,6 +18,7 @@ from pathlib import Path
 
 # Import de l'InformalAnalysisPlugin pour accéder à la taxonomie
 from .informal_definitions import InformalAnalysisPlugin
+from .taxonomy_index import TaxonomyIndex
 
 logger = logging.getLogger("TaxonomySophismDetector")
 
@@ -37,6 +38,8 @@ class TaxonomySophismDetector:
             aux données de la taxonomie.
         _taxonomy_cache (Optional[pd.DataFrame]): Cache pour le DataFrame de
             la taxonomie afin d'éviter les lectures répétées.
+        _taxonomy_index (Optional[TaxonomyIndex]): Index compilé (automate
+            lexical et tables hiérarchiques), partagé avec le plugin.
         logger: Instance du logger pour ce module.
     """
 
@@ -50,8 +53,10 @@ class TaxonomySophismDetector:
                 utilisera son chemin par défaut.
         """
         self.logger = logging.getLogger("TaxonomySophismDetector")
-        self.plugin = InformalAnalysisPlugin(taxonomy_file_path=taxonomy_file_path)
+        # Le détecteur n'utilise que l'accès à la taxonomie : pas de kernel interne
+        self.plugin = InformalAnalysisPlugin(kernel=None, taxonomy_file_path=taxonomy_file_path)
         self._taxonomy_cache = None
+        self._taxonomy_index = None
 
     def _get_taxonomy_df(self) -> pd.DataFrame:
         """
@@ -64,6 +69,19 @@ class TaxonomySophismDetector:
             self._taxonomy_cache = self.plugin._get_taxonomy_dataframe()
         return self._taxonomy_cache
 
+    def _get_taxonomy_index(self) -> TaxonomyIndex:
+        """
+        Récupère l'index compilé de la taxonomie, partagé avec le plugin.
+
+        Returns:
+            TaxonomyIndex: L'automate lexical et les tables hiérarchiques.
+        """
+        if self._taxonomy_index is None:
+            self._taxonomy_index = self.plugin._get_taxonomy_index()
+            self.logger.info(f"Index de taxonomie compilé: {len(self._taxonomy_index.keys)} entrées, "
+                             f"{len(self._taxonomy_index.automaton.patterns)} motifs")
+        return self._taxonomy_index
+
     def get_main_branches(self) -> List[Dict[str, Any]]:
         """
         Récupère les branches principales (racines) de la taxonomie.
@@ -114,12 +132,8 @@ class TaxonomySophismDetector:
             de la branche, incluant le nœud courant et ses enfants.
         """
         try:
-            # Utiliser la méthode du plugin pour explorer la hiérarchie
-            result = self.plugin._internal_explore_hierarchy(
-                current_pk=taxonomy_key,
-                df=self._get_taxonomy_df(),
-                max_children=20
-            )
+            # Utiliser l'index compilé pour explorer la hiérarchie
+            result = self._get_taxonomy_index().explore(taxonomy_key, max_children=20)
             
             if result.get('error'):
                 self.logger.warning(f"Erreur d'exploration pour la clé {taxonomy_key}: {result['error']}")
@@ -152,8 +166,8 @@ class TaxonomySophismDetector:
         la taxonomie et le contenu du texte fourni.
 
         Le processus se déroule en trois étapes :
-        1.  **Analyse lexicale** : Parcourt la taxonomie et assigne un score de
-            confiance basé sur les correspondances trouvées.
+        1.  **Analyse lexicale** : Un seul passage de l'automate de l'index
+            compilé sur le texte score tous les sophismes à la fois.
         2.  **Tri et filtrage** : Trie les détections par confiance et ne conserve
             que les plus pertinentes.
         3.  **Enrichissement** : Ajoute du contexte aux sophismes détectés, comme
@@ -167,78 +181,53 @@ class TaxonomySophismDetector:
             List[Dict[str, Any]]: Une liste de dictionnaires, où chaque dictionnaire
             représente un sophisme détecté avec ses détails et son contexte.
         """
-        detected_sophisms = []
-        
+        results = self.detect_sophisms_batch([text], max_sophisms=max_sophisms)
+        return results[0] if results else []
+
+    def detect_sophisms_batch(self, texts: List[str], max_sophisms: int = 10) -> List[List[Dict[str, Any]]]:
+        """
+        Détecte les sophismes dans plusieurs textes.
+
+        Le contexte taxonomique (branche et sophismes apparentés) d'une clé
+        n'est calculé qu'une fois pour tout le lot.
+
+        Args:
+            texts (List[str]): Les textes à analyser.
+            max_sophisms (int): Le nombre maximum de sophismes par texte.
+
+        Returns:
+            List[List[Dict[str, Any]]]: Les détections de chaque texte, dans
+            l'ordre des textes fournis.
+        """
         try:
-            df = self._get_taxonomy_df()
-            text_lower = text.lower()
+            index = self._get_taxonomy_index()
+            contexts: Dict[int, Tuple[Dict[str, Any], List[Dict[str, Any]]]] = {}
+            results = []
             
-            # 1. Analyse lexicale basée sur les noms et descriptions
-            for pk, row in df.iterrows():
-                confidence = 0.0
-                matches = []
-                
-                # Vérifier les correspondances avec les noms
-                name = str(row.get('Name', '')).lower()
-                nom_vulgarise = str(row.get('nom_vulgarisé', '')).lower()
-                description = str(row.get('text_fr', '')).lower()
-                
-                # Correspondance avec le nom vulgarisé (plus probable)
-                if nom_vulgarise and nom_vulgarise in text_lower:
-                    confidence += 0.7
-                    matches.append(f"Nom vulgarisé: '{nom_vulgarise}'")
-                
-                # Correspondance avec le nom officiel
-                if name and name in text_lower:
-                    confidence += 0.5
-                    matches.append(f"Nom officiel: '{name}'")
+            for text in texts:
+                detected_sophisms = index.score(text)[:max_sophisms]
                 
-                # Correspondance avec des mots-clés de la description
-                if description:
-                    desc_words = [w for w in description.split() if len(w) > 4]
-                    for word in desc_words[:5]:  # Limiter aux 5 premiers mots significatifs
-                        if word in text_lower:
-                            confidence += 0.1
-                            matches.append(f"Mot-clé: '{word}'")
+                for sophism in detected_sophisms:
+                    taxonomy_key = sophism['taxonomy_key']
+                    if taxonomy_key not in contexts:
+                        contexts[taxonomy_key] = (
+                            self.explore_branch(taxonomy_key, max_depth=2),
+                            index.parent_context(taxonomy_key).get('siblings', [])
+                        )
+                    # Copies : les contextes sont partagés entre les textes du lot
+                    branch_details, siblings = contexts[taxonomy_key]
+                    sophism['branch_context'] = dict(branch_details)
+                    sophism['related_sophisms'] = list(siblings)
                 
-                # Si on a des correspondances significatives
-                if confidence >= 0.3:
-                    sophism = {
-                        'taxonomy_key': int(pk),
-                        'name': row.get('Name', ''),
-                        'nom_vulgarise': row.get('nom_vulgarisé', ''),
-                        'famille': row.get('Famille', ''),
-                        'description': row.get('text_fr', ''),
-                        'confidence': min(confidence, 1.0),
-                        'matches': matches,
-                        'depth': int(row.get('depth', 0)),
-                        'path': row.get('path', ''),
-                        'detection_method': 'taxonomy_lexical'
-                    }
-                    detected_sophisms.append(sophism)
+                results.append(detected_sophisms)
             
-            # 2. Trier par confiance et limiter
-            detected_sophisms.sort(key=lambda x: x['confidence'], reverse=True)
-            detected_sophisms = detected_sophisms[:max_sophisms]
-            
-            # 3. Enrichir avec le contexte taxonomique
-            for sophism in detected_sophisms:
-                taxonomy_key = sophism['taxonomy_key']
-                
-                # Ajouter les détails de la branche
-                branch_details = self.explore_branch(taxonomy_key, max_depth=2)
-                sophism['branch_context'] = branch_details
-                
-                # Ajouter les sophismes apparentés (frères/sœurs)
-                parent_context = self._get_parent_context(taxonomy_key)
-                sophism['related_sophisms'] = parent_context.get('siblings', [])
-            
-            self.logger.info(f"Détection terminée: {len(detected_sophisms)} sophismes trouvés")
-            return detected_sophisms
+            self.logger.info(f"Détection terminée sur {len(texts)} texte(s): "
+                             f"{sum(len(r) for r in results)} sophismes trouvés")
+            return results
             
         except Exception as e:
             self.logger.error(f"Erreur lors de la détection de sophismes: {e}")
-            return []
+            return [[] for _ in texts]
     
     def _get_parent_context(self, taxonomy_key: int) -> Dict[str, Any]:
         """
@@ -252,43 +241,7 @@ class TaxonomySophismDetector:
             une liste des nœuds frères.
         """
         try:
-            df = self._get_taxonomy_df()
-            
-            if taxonomy_key not in df.index:
-                return {'siblings': []}
-            
-            current_row = df.loc[taxonomy_key]
-            current_path = current_row.get('path', '')
-            
-            if not current_path:
-                return {'siblings': []}
-            
-            # Trouver le path parent
-            path_parts = str(current_path).split('.')
-            if len(path_parts) <= 1:
-                return {'siblings': []}
-            
-            parent_path = '.'.join(path_parts[:-1])
-            
-            # Trouver les frères/sœurs (même parent)
-            siblings = df[df['path'].astype(str).str.startswith(parent_path + '.', na=False)]
-            siblings = siblings[siblings.index != taxonomy_key]  # Exclure soi-même
-            
-            siblings_list = []
-            for _, sibling in siblings.iterrows():
-                sibling_info = {
-                    'taxonomy_key': int(sibling.name),
-                    'name': sibling.get('Name', ''),
-                    'nom_vulgarise': sibling.get('nom_vulgarisé', ''),
-                    'description_courte': sibling.get('text_fr', '')
-                }
-                siblings_list.append(sibling_info)
-            
-            return {
-                'parent_path': parent_path,
-                'siblings': siblings_list[:5]  # Limiter à 5 frères/sœurs
-            }
-            
+            return self._get_taxonomy_index().parent_context(taxonomy_key)
         except Exception as e:
             self.logger.error(f"Erreur lors de la récupération du contexte parent: {e}")
             return {'siblings': []}
@@ -297,8 +250,8 @@ class TaxonomySophismDetector:
         """
         Récupère les détails complets d'un sophisme via sa clé taxonomique.
 
-        Délègue l'appel au plugin sous-jacent pour extraire toutes les
-        informations associées à une clé primaire (PK) de la taxonomie.
+        Interroge l'index compilé partagé avec le plugin pour extraire toutes
+        les informations associées à une clé primaire (PK) de la taxonomie.
 
         Args:
             taxonomy_key (int): La clé taxonomique du sophisme.
@@ -308,11 +261,7 @@ class TaxonomySophismDetector:
             du sophisme, ou un message d'erreur si la clé est introuvable.
         """
         try:
-            result = self.plugin._internal_get_node_details(
-                pk=taxonomy_key,
-                df=self._get_taxonomy_df()
-            )
-            return result
+            return self._get_taxonomy_index().node_details(taxonomy_key)
             
         except Exception as e:
             self.logger.error(f"Erreur lors de la récupération des détails pour la clé {taxonomy_key}: {e}")
@@ -334,45 +283,7 @@ class TaxonomySophismDetector:
             motif, triés par pertinence.
         """
         try:
-            df = self._get_taxonomy_df()
-            pattern_lower = pattern.lower()
-            
-            matching_sophisms = []
-            
-            for pk, row in df.iterrows():
-                score = 0.0
-                
-                # Recherche dans les différents champs
-                name = str(row.get('Name', '')).lower()
-                nom_vulgarise = str(row.get('nom_vulgarisé', '')).lower()
-                description = str(row.get('text_fr', '')).lower()
-                famille = str(row.get('Famille', '')).lower()
-                
-                if pattern_lower in nom_vulgarise:
-                    score += 0.8
-                if pattern_lower in name:
-                    score += 0.6
-                if pattern_lower in description:
-                    score += 0.4
-                if pattern_lower in famille:
-                    score += 0.3
-                
-                if score > 0:
-                    sophism = {
-                        'taxonomy_key': int(pk),
-                        'name': row.get('Name', ''),
-                        'nom_vulgarise': row.get('nom_vulgarisé', ''),
-                        'famille': row.get('Famille', ''),
-                        'description': row.get('text_fr', ''),
-                        'match_score': score,
-                        'depth': int(row.get('depth', 0)),
-                        'path': row.get('path', '')
-                    }
-                    matching_sophisms.append(sophism)
-            
-            # Trier par score et limiter
-            matching_sophisms.sort(key=lambda x: x['match_score'], reverse=True)
-            return matching_sophisms[:max_results]
+            return self._get_taxonomy_index().search(pattern)[:max_results]
             
         except Exception as e:
             self.logger.error(f"Erreur lors de la recherche par motif: {e}")
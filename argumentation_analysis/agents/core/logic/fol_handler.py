@@ -4,7 +4,7 @@ import asyncio
 # La configuration du logging (appel à setup_logging()) est supposée être faite globalement.
 from argumentation_analysis.core.utils.logging_utils import setup_logging
 from .tweety_initializer import TweetyInitializer
-from argumentation_analysis.core.prover9_runner import run_prover9
+from argumentation_analysis.core.prover9_runner import get_prover9_service
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -210,13 +210,20 @@ class FOLHandler:
 
             logger.debug(f"Prover9 input for consistency check:\n{prover9_input}")
 
-            # Run Prover9 externally
-            prover9_output = await asyncio.to_thread(run_prover9, prover9_input)
+            # Run Prover9 through the shared worker pool (verdicts are cached)
+            result = await asyncio.to_thread(get_prover9_service().prove, prover9_input)
             
-            # Check output for proof of contradiction
-            is_consistent = "END OF PROOF" not in prover9_output
+            # A proof of $F means the assumptions are contradictory; an exhausted
+            # search space means they are consistent. Any other status (limit hit,
+            # timeout) leaves the question open.
+            if result.proved:
+                is_consistent = False
+            elif result.status == "sos_empty":
+                is_consistent = True
+            else:
+                raise RuntimeError(f"Prover9 stopped before reaching a verdict (status: {result.status})")
             
-            msg = f"Consistency check result: {is_consistent}"
+            msg = f"Consistency check result: {is_consistent} (prover9: {result.status}{', cached' if result.cached else ''})"
             logger.info(msg)
             return is_consistent, msg
         except Exception as e:
@@ -239,11 +246,11 @@ class FOLHandler:
             
             logger.debug(f"Prover9 input for query:\n{prover9_input}")
 
-            # Run Prover9 externally
-            prover9_output = run_prover9(prover9_input)
+            # Run Prover9 through the shared worker pool (verdicts are cached)
+            result = get_prover9_service().prove(prover9_input)
 
-            # Check for "END OF PROOF" which means the goal was proven
-            entails = "END OF PROOF" in prover9_output
+            # A proof means the goal is entailed
+            entails = result.proved
             
             logger.info(f"FOL Query: KB entails '{query_formula_str}'? {entails}")
             return entails
@@ -1,7 +1,10 @@
 import jpype
 import re
+import hashlib
 import logging
-from typing import Optional, List
+import threading
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple
 # La configuration du logging (appel à setup_logging()) est supposée être faite globalement,
 # par exemple au point d'entrée de l'application ou dans conftest.py pour les tests.
 from argumentation_analysis.core.utils.logging_utils import setup_logging
@@ -11,14 +14,70 @@ from .tweety_initializer import TweetyInitializer
 setup_logging() # Appel de la configuration globale du logging
 logger = logging.getLogger(__name__) # Obtient le logger pour ce module
 
+# Nombre de bases de connaissances compilées (PlBeliefSet) et de formules parsées gardées en cache
+DEFAULT_KB_CACHE_SIZE = 64
+DEFAULT_FORMULA_CACHE_SIZE = 1024
+
+def normalize_pl_formula(formula_str: str) -> str:
+    """
+    Ensures consistent spacing around logical operators and parentheses for Tweety's parser.
+    This version uses regex for safer and more robust replacements.
+    """
+    if not isinstance(formula_str, str):
+        return ""
+
+    logger.debug(f"Original formula for normalization: '{formula_str}'")
+
+    # Replacements for common alternative operators. Ensure spacing for safety.
+    formula_str = formula_str.replace("&&", " & ").replace("||", " | ")
+    formula_str = formula_str.replace("->", " => ").replace("<->", " <=> ")
+    formula_str = formula_str.replace(" NOT ", " ! ").replace(" Not ", " ! ")
+
+
+    # Regex to add spaces around all operators and parentheses that might be stuck together (e.g. "A&B")
+    # This is a safety net for cases the replaces above miss.
+    # Note the correction of '<=>' from the previous '<=<' typo.
+    formula_str = re.sub(r'\s*(=>|<=>|&|\||!|\(|\))\s*', r' \1 ', formula_str)
+
+    # Sanitize proposition names: replace invalid characters with underscore
+    # This is done after operator spacing to avoid corrupting them.
+    tokens = formula_str.split(' ')
+    sanitized_tokens = []
+    operators_and_parentheses = {'=>', '<=>', '&', '|', '!', '(', ')'}
+    for token in tokens:
+        if token in operators_and_parentheses or token == '':
+            sanitized_tokens.append(token)
+        else:
+            # It's a proposition name, sanitize it
+            # Allow letters, numbers, and underscores. Replace everything else.
+            sanitized_token = re.sub(r'[^a-zA-Z0-9_]', '_', token)
+            sanitized_tokens.append(sanitized_token)
+    formula_str = ' '.join(sanitized_tokens)
+
+    # Clean up any resulting multiple spaces
+    formula_str = " ".join(formula_str.split())
+
+    logger.debug(f"Normalized formula to: '{formula_str}'")
+    return formula_str
+
+
 class PLHandler:
     """
     Handles Propositional Logic (PL) operations using TweetyProject.
     Relies on TweetyInitializer for JVM and PL component setup.
+
+    Knowledge bases are compiled once into a `PlBeliefSet` and kept in an LRU
+    cache keyed by a hash of their text, so repeated queries against the same
+    KB skip the split/normalise/parse round-trips through JPype. Parsed
+    formulas are cached the same way. Cached belief sets are shared: callers
+    that need to modify one must copy it (see `create_belief_base_from_string`).
     """
 
-    def __init__(self, initializer_instance: TweetyInitializer):
+    def __init__(self, initializer_instance: TweetyInitializer,
+                 kb_cache_size: int = DEFAULT_KB_CACHE_SIZE,
+                 formula_cache_size: int = DEFAULT_FORMULA_CACHE_SIZE):
         self._initializer_instance = initializer_instance
+        self._init_caches(kb_cache_size, formula_cache_size)
         self._pl_parser = self._initializer_instance.get_pl_parser()
         # Dans la nouvelle architecture, le handler est responsable de créer son propre reasoner.
         # Le nom correct, trouvé dans les sources, est SimplePlReasoner.
@@ -29,47 +88,17 @@ class PLHandler:
             logger.error("PL components not initialized. Ensure TweetyBridge calls TweetyInitializer first.")
             raise RuntimeError("PLHandler initialized before TweetyInitializer completed PL setup.")
 
+    def _init_caches(self, kb_cache_size: int, formula_cache_size: int) -> None:
+        self._kb_cache_size = kb_cache_size
+        self._formula_cache_size = formula_cache_size
+        self._kb_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._formula_cache: "OrderedDict[Tuple[str, Tuple[str, ...]], Any]" = OrderedDict()
+        self._cache_lock = threading.RLock()
+        self.cache_stats = {"kb_hits": 0, "kb_misses": 0, "formula_hits": 0, "formula_misses": 0}
+
     def _normalize_formula(self, formula_str: str) -> str:
-        """
-        Ensures consistent spacing around logical operators and parentheses for Tweety's parser.
-        This version uses regex for safer and more robust replacements.
-        """
-        if not isinstance(formula_str, str):
-            return ""
-
-        logger.debug(f"Original formula for normalization: '{formula_str}'")
-
-        # Replacements for common alternative operators. Ensure spacing for safety.
-        formula_str = formula_str.replace("&&", " & ").replace("||", " | ")
-        formula_str = formula_str.replace("->", " => ").replace("<->", " <=> ")
-        formula_str = formula_str.replace(" NOT ", " ! ").replace(" Not ", " ! ")
-
-
-        # Regex to add spaces around all operators and parentheses that might be stuck together (e.g. "A&B")
-        # This is a safety net for cases the replaces above miss.
-        # Note the correction of '<=>' from the previous '<=<' typo.
-        formula_str = re.sub(r'\s*(=>|<=>|&|\||!|\(|\))\s*', r' \1 ', formula_str)
-
-        # Sanitize proposition names: replace invalid characters with underscore
-        # This is done after operator spacing to avoid corrupting them.
-        tokens = formula_str.split(' ')
-        sanitized_tokens = []
-        operators_and_parentheses = {'=>', '<=>', '&', '|', '!', '(', ')'}
-        for token in tokens:
-            if token in operators_and_parentheses or token == '':
-                sanitized_tokens.append(token)
-            else:
-                # It's a proposition name, sanitize it
-                # Allow letters, numbers, and underscores. Replace everything else.
-                sanitized_token = re.sub(r'[^a-zA-Z0-9_]', '_', token)
-                sanitized_tokens.append(sanitized_token)
-        formula_str = ' '.join(sanitized_tokens)
-
-        # Clean up any resulting multiple spaces
-        formula_str = " ".join(formula_str.split())
-
-        logger.debug(f"Normalized formula to: '{formula_str}'")
-        return formula_str
+        """See `normalize_pl_formula`."""
+        return normalize_pl_formula(formula_str)
 
     def parse_pl_formula(self, formula_str: str, constants: Optional[List[str]] = None):
         """Parses a PL formula string into a TweetyProject PlFormula object."""
@@ -99,70 +128,162 @@ class PLHandler:
         logger.debug(f"Attempting to parse normalized PL formula: {normalized_formula}")
 
         try:
-            if constants:
-                PlSignature = jpype.JClass("org.tweetyproject.logics.pl.syntax.PlSignature")
-                signature = PlSignature()
-                Proposition = jpype.JClass("org.tweetyproject.logics.pl.syntax.Proposition")
-                for const_name in constants:
-                    proposition = Proposition(jpype.JClass("java.lang.String")(const_name))
-                    if not signature.contains(proposition):
-                        signature.add(proposition)
-                pl_formula = self._pl_parser.parseFormula(JString(normalized_formula), signature)
-            else:
-                # Using JString is a good practice to avoid ambiguity.
-                pl_formula = self._pl_parser.parseFormula(jpype.JString(normalized_formula))
-
+            pl_formula = self._parse_normalized(normalized_formula, constants)
             logger.info(f"Successfully parsed PL formula: '{formula_str}' as '{normalized_formula}' -> {pl_formula}")
             return pl_formula
         except jpype.JException as e:
             logger.error(f"JPype JException parsing PL formula '{formula_str}' (normalized to '{normalized_formula}'): {e.getMessage()}", exc_info=True)
             raise ValueError(f"Error parsing PL formula '{formula_str}': {e.getMessage()}") from e
+        except ValueError as e:
+            logger.error(f"Error parsing PL formula '{formula_str}' (normalized to '{normalized_formula}'): {e}")
+            raise ValueError(f"Error parsing PL formula '{formula_str}': {e}") from e
         except Exception as e:
             logger.error(f"Unexpected error parsing PL formula '{formula_str}' (normalized to '{normalized_formula}'): {e}", exc_info=True)
             raise
 
+    def _parse_normalized(self, normalized_formula: str, constants: Optional[List[str]] = None):
+        """Parses an already normalised formula with Tweety's `PlParser`."""
+        if constants:
+            PlSignature = jpype.JClass("org.tweetyproject.logics.pl.syntax.PlSignature")
+            signature = PlSignature()
+            Proposition = jpype.JClass("org.tweetyproject.logics.pl.syntax.Proposition")
+            for const_name in constants:
+                proposition = Proposition(jpype.JClass("java.lang.String")(const_name))
+                if not signature.contains(proposition):
+                    signature.add(proposition)
+            return self._pl_parser.parseFormula(jpype.JString(normalized_formula), signature)
+        # Using JString is a good practice to avoid ambiguity.
+        return self._pl_parser.parseFormula(jpype.JString(normalized_formula))
+
+    def _new_belief_set(self, source=None):
+        """Creates an empty `PlBeliefSet`, or a copy of `source`."""
+        PlBeliefSet = jpype.JClass("org.tweetyproject.logics.pl.syntax.PlBeliefSet")
+        return PlBeliefSet() if source is None else PlBeliefSet(source)
+
+    def _contradiction(self):
+        """The formula `false`, used to test consistency."""
+        return jpype.JClass("org.tweetyproject.logics.pl.syntax.Contradiction")()
+
+    @staticmethod
+    def _split_knowledge_base(knowledge_base_str: str) -> List[str]:
+        """Splits a KB string into cleaned formula strings (one per line, trailing '%' removed)."""
+        formula_strings = []
+        for line in knowledge_base_str.split('\n'):
+            line = line.strip()
+            if not line or line == '```':
+                continue
+            # Remove trailing '%' if present, as it was a previous workaround
+            cleaned = line.rstrip('%').strip()
+            if cleaned:
+                formula_strings.append(cleaned)
+        return formula_strings
+
+    @staticmethod
+    def _cache_key(knowledge_base_str: str, constants: Optional[List[str]]) -> str:
+        digest = hashlib.sha256(knowledge_base_str.encode('utf-8'))
+        for constant in constants or ():
+            digest.update(b'\0' + constant.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _parse_cached(self, formula_str: str, constants: Optional[List[str]] = None):
+        """`parse_pl_formula` with an LRU cache (parsing errors are not cached)."""
+        key = (formula_str, tuple(constants or ()))
+        with self._cache_lock:
+            if key in self._formula_cache:
+                self._formula_cache.move_to_end(key)
+                self.cache_stats["formula_hits"] += 1
+                return self._formula_cache[key]
+            self.cache_stats["formula_misses"] += 1
+
+        parsed_formula = self.parse_pl_formula(formula_str, constants)
+
+        with self._cache_lock:
+            self._formula_cache[key] = parsed_formula
+            while len(self._formula_cache) > self._formula_cache_size:
+                self._formula_cache.popitem(last=False)
+        return parsed_formula
+
+    def _get_compiled_kb(self, knowledge_base_str: str, constants: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Returns the compiled entry for a KB string: the shared `PlBeliefSet`, its
+        formula count and its memoised consistency.
+
+        Raises:
+            ValueError: If a formula of the KB cannot be parsed.
+        """
+        key = self._cache_key(knowledge_base_str, constants)
+        with self._cache_lock:
+            entry = self._kb_cache.get(key)
+            if entry is not None:
+                self._kb_cache.move_to_end(key)
+                self.cache_stats["kb_hits"] += 1
+                return entry
+            self.cache_stats["kb_misses"] += 1
+
+        belief_set = self._new_belief_set()
+        formula_count = 0
+        for f_str in self._split_knowledge_base(knowledge_base_str):
+            parsed_formula = self._parse_cached(f_str, constants)
+            if parsed_formula:
+                belief_set.add(parsed_formula)
+                formula_count += 1
+
+        entry = {"belief_set": belief_set, "formula_count": formula_count, "consistent": None}
+        with self._cache_lock:
+            # Another thread may have compiled the same KB meanwhile: keep the first entry
+            entry = self._kb_cache.setdefault(key, entry)
+            self._kb_cache.move_to_end(key)
+            while len(self._kb_cache) > self._kb_cache_size:
+                self._kb_cache.popitem(last=False)
+        return entry
+
+    def clear_cache(self) -> None:
+        """Drops every compiled knowledge base and parsed formula."""
+        with self._cache_lock:
+            self._kb_cache.clear()
+            self._formula_cache.clear()
+
+    def create_belief_base_from_string(self, formula_string: str, constants: Optional[List[str]] = None):
+        """Returns a new `PlBeliefSet` holding the formulas of a KB string (a copy of the cached one)."""
+        return self._new_belief_set(self._get_compiled_kb(formula_string, constants)["belief_set"])
+
+    def _prepare_query(self, query_formula_str: str, constants: Optional[List[str]] = None):
+        """Cleans and parses a query string; returns None when there is nothing to evaluate."""
+        cleaned_query_str = query_formula_str.rstrip('%').strip()
+        if not cleaned_query_str or cleaned_query_str == '```':
+            logger.warning(f"Query string is invalid or empty after cleaning: '{query_formula_str}'")
+            return None
+
+        query_formula = self._parse_cached(cleaned_query_str, constants)
+        if not query_formula:
+            logger.warning(f"Skipping empty or invalid query after parsing: '{cleaned_query_str}'")
+            return None
+        return query_formula
+
     def pl_check_consistency(self, knowledge_base_str: str, constants: Optional[List[str]] = None) -> bool:
         """
-        Checks if a PL knowledge base (string of formulas, semicolon-separated) is consistent.
+        Checks if a PL knowledge base (string of formulas, one per line) is consistent.
+        The result is memoised with the compiled knowledge base.
         """
         logger.debug(f"Checking PL consistency for: {knowledge_base_str}")
         try:
-            # Parse the knowledge base string into a PlBeliefSet
-            # Tweety's PlParser can parse a belief set directly if formulas are separated by ';'
-            # However, it's often safer to parse individual formulas and add them to a knowledge base.
-            # For simplicity here, assuming parseBeliefSet handles it or we adapt.
-            
-            # Let's refine this: parse individual formulas and add to a PlBeliefSet
-            formulas = []
-            # Handle potential empty strings or formulas correctly
-            formula_strings = [f.strip() for f in knowledge_base_str.split('\n') if f.strip() and f.strip() != '```']
-            
-            if not formula_strings:
+            entry = self._get_compiled_kb(knowledge_base_str, constants)
+
+            if not entry["formula_count"]:
                 logger.info("Empty knowledge base is considered consistent.")
                 return True
 
-            PlBeliefSet = jpype.JClass("org.tweetyproject.logics.pl.syntax.PlBeliefSet")
-            kb = PlBeliefSet()
+            if entry["consistent"] is not None:
+                return entry["consistent"]
 
-            for f_str in formula_strings:
-                # Remove trailing '%' if present, as it was a previous workaround
-                cleaned_f_str = f_str.rstrip('%').strip()
-                if cleaned_f_str:
-                    parsed_formula = self.parse_pl_formula(cleaned_f_str, constants)
-                    if parsed_formula:
-                        kb.add(parsed_formula)
-            
-            logger.info(f"DEBUG: Méthodes disponibles pour _pl_reasoner: {dir(self._pl_reasoner)}")
-            
             # Contournement pour le bug JPype avec isConsistent.
             # Une KB est cohérente si elle n'entraîne pas de contradiction (false).
             # On vérifie donc si la KB entraîne la formule "false".
             try:
-                Contradiction = jpype.JClass("org.tweetyproject.logics.pl.syntax.Contradiction")
-                parsed_false = Contradiction()
+                parsed_false = self._contradiction()
                 
                 # self._pl_reasoner.query(kb, formula) retourne true si kb |= formula
-                entails_contradiction = self._pl_reasoner.query(kb, parsed_false)
+                entails_contradiction = self._pl_reasoner.query(entry["belief_set"], parsed_false)
                 is_consistent = not entails_contradiction
                 logger.info(f"Vérification de cohérence via query(kb, false). Entraîne contradiction: {entails_contradiction}. Cohérent: {is_consistent}")
 
@@ -171,8 +292,9 @@ class PLHandler:
                 # Fallback ou lever une exception ? Pour l'instant, on lève.
                 raise RuntimeError("Échec de la vérification de cohérence alternative.") from query_exc
 
+            entry["consistent"] = bool(is_consistent)
             logger.info(f"PL Knowledge base consistency for '{knowledge_base_str}': {is_consistent}")
-            return bool(is_consistent)
+            return entry["consistent"]
         except ValueError as e: # Catch parsing errors from parse_pl_formula
             logger.error(f"Error parsing formula in knowledge base for consistency check: {e}", exc_info=True)
             raise
@@ -186,32 +308,16 @@ class PLHandler:
     def pl_query(self, knowledge_base_str: str, query_formula_str: str, constants: Optional[List[str]] = None) -> bool:
         """
         Checks if a query formula is entailed by a PL knowledge base.
-        Knowledge base: string of formulas, semicolon-separated.
+        Knowledge base: string of formulas, one per line.
         Query: single formula string.
         """
         logger.debug(f"Performing PL query. KB: '{knowledge_base_str}', Query: '{query_formula_str}'")
         try:
-            PlBeliefSet = jpype.JClass("org.tweetyproject.logics.pl.syntax.PlBeliefSet")
-            kb = PlBeliefSet()
-
-            formula_strings = [f.strip() for f in knowledge_base_str.split('\n') if f.strip() and f.strip() != '```']
-            for f_str in formula_strings:
-                cleaned_f_str = f_str.rstrip('%').strip()
-                if cleaned_f_str:
-                    parsed_formula = self.parse_pl_formula(cleaned_f_str, constants)
-                    if parsed_formula:
-                        kb.add(parsed_formula)
-            
-            # Nettoyer également la chaîne de la requête
-            cleaned_query_str = query_formula_str.rstrip('%').strip()
-            if not cleaned_query_str or cleaned_query_str == '```':
-                logger.warning(f"Query string is invalid or empty after cleaning: '{query_formula_str}'")
-                return False # Ou une autre gestion d'erreur appropriée
+            kb = self._get_compiled_kb(knowledge_base_str, constants)["belief_set"]
 
-            query_formula = self.parse_pl_formula(cleaned_query_str, constants)
-            if not query_formula:
-                logger.warning(f"Skipping empty or invalid query after parsing: '{cleaned_query_str}'")
-                return False
+            query_formula = self._prepare_query(query_formula_str, constants)
+            if query_formula is None:
+                return False # Ou une autre gestion d'erreur appropriée
             
             entails = self._pl_reasoner.query(kb, query_formula)
             logger.info(f"PL Query: KB entails '{query_formula_str}'? {entails}")
@@ -226,4 +332,42 @@ class PLHandler:
             logger.error(f"Unexpected error during PL query: {e}", exc_info=True)
             raise
 
+    def pl_query_batch(self, knowledge_base_str: str, queries: List[str],
+                       constants: Optional[List[str]] = None) -> List[Optional[bool]]:
+        """
+        Evaluates several queries against the same PL knowledge base.
+
+        The KB is compiled once (or taken from the cache) and each distinct
+        query is parsed and evaluated once, so the per-query cost is the
+        reasoner call itself. A query that cannot be parsed or evaluated does
+        not abort the batch.
+
+        Returns:
+            One result per query, in order: True/False for entailment, None when
+            the query is empty, invalid or its evaluation failed.
+
+        Raises:
+            ValueError: If a formula of the knowledge base cannot be parsed.
+        """
+        logger.debug(f"Performing {len(queries)} PL queries. KB: '{knowledge_base_str}'")
+        kb = self._get_compiled_kb(knowledge_base_str, constants)["belief_set"]
+
+        results: Dict[str, Optional[bool]] = {}
+        for query_formula_str in queries:
+            if query_formula_str in results:
+                continue
+            try:
+                query_formula = self._prepare_query(query_formula_str, constants)
+                results[query_formula_str] = (None if query_formula is None
+                                              else bool(self._pl_reasoner.query(kb, query_formula)))
+            except ValueError as e:
+                logger.error(f"Error parsing PL query '{query_formula_str}' in batch: {e}")
+                results[query_formula_str] = None
+            except jpype.JException as e:
+                logger.error(f"JPype JException during batched PL query '{query_formula_str}': {e.getMessage()}")
+                results[query_formula_str] = None
+
+        logger.info(f"PL batch: {len(queries)} queries ({len(results)} distinct) evaluated on one compiled KB")
+        return [results[query_formula_str] for query_formula_str in queries]
+
     # Add other PL-specific methods as needed, e.g., model finding, transformations, etc.
\ No newline at end of file
@@ -30,6 +30,7 @@ from pydantic import Field
 
 from ..abc.agent_bases import BaseLogicAgent
 from .belief_set import BeliefSet, PropositionalBeliefSet
+from .query_executor import format_pl_result
 from .tweety_bridge import TweetyBridge
 from .tweety_initializer import TweetyInitializer
 
@@ -221,7 +222,7 @@ class PropositionalLogicAgent(BaseLogicAgent):
     service: Optional[ChatCompletionClientBase] = Field(default=None, exclude=True)
     settings: Optional[Any] = Field(default=None, exclude=True)
 
-    def __init__(self, kernel: Kernel, agent_name: str = "PropositionalLogicAgent", system_prompt: Optional[str] = None, service_id: Optional[str] = None):
+    def __init__(self, kernel: Kernel, agent_name: str = "PropositionalLogicAgent", system_prompt: Optional[str] = None, service_id: Optional[str] = None, pl_backend: Optional[str] = None):
         """
         Initialise l'agent de logique propositionnelle.
 
@@ -232,15 +233,29 @@ class PropositionalLogicAgent(BaseLogicAgent):
                 Si `None`, `SYSTEM_PROMPT_PL` est utilisé.
             service_id (Optional[str], optional): ID du service LLM à utiliser
                 pour les fonctions sémantiques.
+            pl_backend (Optional[str], optional): Backend PL de cet agent
+                ("tweety" ou "sat"). Si `None`, le backend par défaut du
+                `TweetyBridge` est utilisé.
         """
         actual_system_prompt = system_prompt or SYSTEM_PROMPT_PL
         super().__init__(kernel, agent_name=agent_name, logic_type_name="PL", system_prompt=actual_system_prompt)
         self._llm_service_id = service_id
         self._tweety_bridge = TweetyBridge()
+        self._pl_backend = pl_backend
         self.logger.info(f"TweetyBridge initialisé pour {self.name}. Vérification de la JVM via TweetyInitializer...")
-        if not TweetyInitializer.is_jvm_ready():
+        if not self._logic_backend_ready():
             self.logger.error("La JVM n'est pas prête selon TweetyInitializer. Les fonctionnalités logiques sont compromises.")
 
+    def _logic_backend_ready(self) -> bool:
+        """Le backend SAT et le mode client du pont n'ont pas besoin de JVM locale."""
+        if (self._pl_backend or self._tweety_bridge.pl_backend) == "sat" or self._tweety_bridge.is_client_mode:
+            return True
+        return TweetyInitializer.is_jvm_ready()
+
+    def _get_pl_handler(self):
+        """Handler PL du backend choisi pour cet agent."""
+        return self._tweety_bridge.get_pl_handler(self._pl_backend)
+
     def get_agent_capabilities(self) -> Dict[str, Any]:
         return {
             "name": self.name,
@@ -259,7 +274,7 @@ class PropositionalLogicAgent(BaseLogicAgent):
         super().setup_agent_components(llm_service_id)
         self.logger.info(f"Configuration des composants sémantiques pour {self.name}...")
 
-        if not TweetyInitializer.is_jvm_ready():
+        if not self._logic_backend_ready():
             self.logger.error(f"La JVM pour TweetyBridge de {self.name} n'est pas prête.")
             return
 
@@ -412,7 +427,7 @@ class PropositionalLogicAgent(BaseLogicAgent):
             return None, "Aucune formule valide n'a pu être générée ou conservée après filtrage."
 
         belief_set_content = "\n".join(valid_formulas)
-        is_consistent = self._tweety_bridge.pl_handler.pl_check_consistency(belief_set_content)
+        is_consistent = self._get_pl_handler().pl_check_consistency(belief_set_content)
         if not is_consistent:
             self.logger.error(f"Ensemble de croyances final invalide: Incohérent\nContenu:\n{belief_set_content}")
             return None, f"Ensemble de croyances invalide: Incohérent"
@@ -504,10 +519,11 @@ class PropositionalLogicAgent(BaseLogicAgent):
     
     def execute_query(self, belief_set: BeliefSet, query: str) -> Tuple[Optional[bool], str]:
         """
-        Exécute une seule requête PL sur un `BeliefSet` via `TweetyBridge`.
+        Exécute une seule requête PL sur un `BeliefSet` avec le handler PL du
+        backend de l'agent (Tweety, SAT ou workers distants).
 
         Cette méthode valide d'abord la syntaxe de la requête avant de la soumettre
-        au moteur logique de Tweety.
+        au moteur logique.
 
         Args:
             belief_set (BeliefSet): L'ensemble de croyances sur lequel la requête
@@ -518,27 +534,21 @@ class PropositionalLogicAgent(BaseLogicAgent):
             Tuple[Optional[bool], str]: Un tuple contenant :
             - Le résultat booléen (`True` si la requête est prouvée, `False` sinon,
               `None` en cas d'erreur).
-            - Le message de sortie brut de Tweety, utile pour le débogage.
+            - Le message de sortie formaté, utile pour le débogage.
         """
         self.logger.info(f"Exécution de la requête PL: '{query}'...")
         
         try:
             bs_str = belief_set.content
+            handler = self._get_pl_handler()
             
-            is_valid, validation_message = self._tweety_bridge.validate_formula(formula_string=query)
-            if not is_valid:
-                msg = f"Requête invalide: {query}. Raison: {validation_message}"
+            if not self._tweety_bridge.validate_pl_formula(query, self._pl_backend):
+                msg = f"Requête invalide: {query}"
                 self.logger.error(msg)
                 return None, f"FUNC_ERROR: {msg}"
 
-            is_entailed, raw_output_str = self._tweety_bridge.execute_pl_query(
-                belief_set_content=bs_str,
-                query_string=query
-            )
-
-            if "FUNC_ERROR:" in raw_output_str:
-                self.logger.error(f"Erreur de TweetyBridge pour la requête '{query}': {raw_output_str}")
-                return None, raw_output_str
+            is_entailed = handler.pl_query(bs_str, query)
+            raw_output_str = format_pl_result(query, is_entailed)
             
             self.logger.info(f"Résultat de l'exécution pour '{query}': {is_entailed}, Output brut: '{raw_output_str}'")
             return is_entailed, raw_output_str
@@ -599,9 +609,9 @@ class PropositionalLogicAgent(BaseLogicAgent):
     def validate_formula(self, formula: str) -> bool:
         self.logger.debug(f"Validation de la formule PL: '{formula}'")
         try:
-            is_valid, message = self._tweety_bridge.validate_formula(formula_string=formula)
+            is_valid = self._tweety_bridge.validate_pl_formula(formula, self._pl_backend)
             if not is_valid:
-                self.logger.warning(f"Formule PL invalide: '{formula}'. Message: {message}")
+                self.logger.warning(f"Formule PL invalide: '{formula}'.")
             return is_valid
         except Exception as e:
             self.logger.error(f"Erreur lors de la validation de la formule PL '{formula}': {e}", exc_info=True)
@@ -611,8 +621,7 @@ class PropositionalLogicAgent(BaseLogicAgent):
         self.logger.debug("Vérification de la cohérence de l'ensemble de croyances PL.")
         try:
             belief_set_content = belief_set.content
-            # Correction: Appeler pl_check_consistency sur le _pl_handler du bridge.
-            is_valid = self._tweety_bridge._pl_handler.pl_check_consistency(belief_set_content)
+            is_valid = self._get_pl_handler().pl_check_consistency(belief_set_content)
             
             if is_valid:
                 details = "Belief set is consistent."
@@ -8,10 +8,20 @@ from typing import Dict, List, Optional, Any, Tuple
 
 from .belief_set import BeliefSet
 from .tweety_bridge import TweetyBridge
+from .tweety_initializer import TweetyInitializer
 
 # Configuration du logger
 logger = logging.getLogger("Orchestration.QueryExecutor")
 
+
+def format_pl_result(query: str, result: Optional[bool]) -> str:
+    """Message de résultat d'une requête PL, au format des sorties Tweety du projet."""
+    if result is None:
+        return f"Tweety Result: Unknown for query '{query}'."
+    label = "ACCEPTED (True)" if result else "REJECTED (False)"
+    return f"Tweety Result: Query '{query}' is {label}."
+
+
 class QueryExecutor:
     """
     Exécuteur de requêtes logiques.
@@ -20,12 +30,24 @@ class QueryExecutor:
     sur différents types d'ensembles de croyances.
     """
     
-    def __init__(self):
+    def __init__(self, pl_backend: Optional[str] = None):
         """
         Initialise l'exécuteur de requêtes.
+
+        :param pl_backend: Backend des requêtes propositionnelles ("tweety" ou "sat").
+                           Si None, le backend courant de `TweetyBridge` est utilisé.
+        :type pl_backend: Optional[str]
         """
         self._logger = logger
         self._tweety_bridge = TweetyBridge()
+        self._pl_backend = pl_backend
+
+    def _logic_backend_ready(self, logic_type: str) -> bool:
+        """Le backend PL "sat" et le mode client du pont n'ont pas besoin de JVM locale."""
+        if logic_type == "propositional" and (
+                (self._pl_backend or self._tweety_bridge.pl_backend) == "sat" or self._tweety_bridge.is_client_mode):
+            return True
+        return TweetyInitializer.is_jvm_ready()
     
     def execute_query(self, belief_set: BeliefSet, query: str) -> Tuple[Optional[bool], str]:
         """
@@ -47,8 +69,8 @@ class QueryExecutor:
         """
         self._logger.info(f"Exécution de la requête '{query}' sur un ensemble de croyances de type '{belief_set.logic_type}'")
         
-        # Vérifier si la JVM est prête
-        if not self._tweety_bridge.is_jvm_ready():
+        # Vérifier si la JVM est prête (sauf pour les backends qui s'en passent)
+        if not self._logic_backend_ready(belief_set.logic_type):
             error_msg = "JVM non prête ou composants Tweety non chargés"
             self._logger.error(error_msg)
             return None, f"FUNC_ERROR: {error_msg}"
@@ -90,9 +112,10 @@ class QueryExecutor:
     
     def _execute_propositional_query(self, belief_set: BeliefSet, query: str) -> Tuple[Optional[bool], str]:
         """
-        Exécute une requête de logique propositionnelle via `TweetyBridge`.
+        Exécute une requête de logique propositionnelle avec le handler PL du
+        backend choisi (`TweetyBridge.get_pl_handler`).
 
-        Valide d'abord la formule, puis l'exécute et parse le résultat.
+        Valide d'abord la formule, puis l'exécute et formate le résultat.
 
         :param belief_set: L'ensemble de croyances propositionnelles.
         :type belief_set: BeliefSet
@@ -102,26 +125,16 @@ class QueryExecutor:
         :rtype: Tuple[Optional[bool], str]
         """
         try:
+            handler = self._tweety_bridge.get_pl_handler(self._pl_backend)
+
             # Valider la requête
-            is_valid, validation_msg = self._tweety_bridge.validate_formula(query)
-            if not is_valid:
-                self._logger.error(f"Requête propositionnelle invalide: {validation_msg}")
-                return None, f"FUNC_ERROR: Requête invalide: {validation_msg}"
+            if not self._tweety_bridge.validate_pl_formula(query, self._pl_backend):
+                self._logger.error(f"Requête propositionnelle invalide: {query}")
+                return None, f"FUNC_ERROR: Requête invalide: {query}"
             
             # Exécuter la requête
-            result_str = self._tweety_bridge.execute_pl_query(belief_set.content, query)
-            
-            # Analyser le résultat
-            if "FUNC_ERROR" in result_str:
-                self._logger.error(f"Erreur lors de l'exécution de la requête propositionnelle: {result_str}")
-                return None, result_str
-            
-            if "ACCEPTED" in result_str:
-                return True, result_str
-            elif "REJECTED" in result_str:
-                return False, result_str
-            else:
-                return None, result_str
+            result = handler.pl_query(belief_set.content, query)
+            return result, format_pl_result(query, result)
         
         except Exception as e:
             error_msg = f"Erreur lors de l'exécution de la requête propositionnelle: {str(e)}"
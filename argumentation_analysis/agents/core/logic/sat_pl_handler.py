@@ -0,0 +1,95 @@
+# argumentation_analysis/agents/core/logic/sat_pl_handler.py
+"""
+Backend propositionnel en processus, sans JVM.
+
+`SatPLHandler` expose la même interface que `PLHandler` (cohérence, requêtes
+simples et groupées, caches de bases compilées) mais s'appuie sur le solveur
+CDCL de `sat_solver` au lieu de Tweety. Chaque base de connaissances est
+encodée une seule fois en CNF dans un solveur incrémental ; une requête `q`
+est une conséquence de la base si la base est insatisfiable sous l'hypothèse
+`!q`, ce qui conserve les clauses apprises d'une requête à l'autre.
+"""
+
+import logging
+import threading
+from typing import Iterable, List, Optional
+
+from .pl_handler import DEFAULT_FORMULA_CACHE_SIZE, DEFAULT_KB_CACHE_SIZE, PLHandler
+from .sat_solver import FALSE, CNFEncoder, Formula, parse_formula
+
+logger = logging.getLogger(__name__)
+
+
+class SatBeliefSet:
+    """
+    Ensemble de formules propositionnelles, encodé paresseusement dans un
+    solveur incrémental lors de la première requête.
+    """
+
+    def __init__(self, source: Optional[Iterable[Formula]] = None):
+        self.formulas: List[Formula] = list(source) if source is not None else []
+        self._encoder: Optional[CNFEncoder] = None
+        self._lock = threading.Lock()
+
+    def add(self, formula: Formula) -> None:
+        """Ajoute une formule à la base."""
+        with self._lock:
+            self.formulas.append(formula)
+            if self._encoder is not None:
+                self._encoder.assert_formula(formula)
+
+    def __iter__(self):
+        return iter(self.formulas)
+
+    def __len__(self):
+        return len(self.formulas)
+
+    def entails(self, formula: Formula) -> bool:
+        """Indique si la base entraîne la formule."""
+        with self._lock:
+            if self._encoder is None:
+                self._encoder = CNFEncoder()
+                for belief in self.formulas:
+                    self._encoder.assert_formula(belief)
+            solver = self._encoder.solver
+            if formula == FALSE:
+                return not solver.solve()
+            return not solver.solve([-self._encoder.encode(formula)])
+
+    @property
+    def solver_stats(self) -> dict:
+        """Statistiques du solveur (vide tant que la base n'a pas été interrogée)."""
+        return dict(self._encoder.solver.stats) if self._encoder is not None else {}
+
+
+class SatPlReasoner:
+    """Raisonneur au sens de Tweety : `query(kb, formula)` teste l'entraînement."""
+
+    def query(self, belief_set: SatBeliefSet, formula: Formula) -> bool:
+        return belief_set.entails(formula)
+
+
+class SatPLHandler(PLHandler):
+    """
+    `PLHandler` dont l'analyse syntaxique et le raisonnement sont faits en
+    Python par le solveur CDCL. Les formules analysées sont des arbres de
+    `sat_solver` ; les résultats sont identiques à ceux de `SimplePlReasoner`.
+    """
+
+    def __init__(self, kb_cache_size: int = DEFAULT_KB_CACHE_SIZE,
+                 formula_cache_size: int = DEFAULT_FORMULA_CACHE_SIZE):
+        # Pas d'appel à PLHandler.__init__ : aucun composant Tweety n'est nécessaire
+        self._initializer_instance = None
+        self._init_caches(kb_cache_size, formula_cache_size)
+        self._pl_parser = None
+        self._pl_reasoner = SatPlReasoner()
+
+    def _parse_normalized(self, normalized_formula: str, constants: Optional[List[str]] = None) -> Formula:
+        # Les constantes ne servent qu'à la signature Tweety : sans effet sur l'entraînement
+        return parse_formula(normalized_formula)
+
+    def _new_belief_set(self, source=None) -> SatBeliefSet:
+        return SatBeliefSet(source)
+
+    def _contradiction(self) -> Formula:
+        return FALSE
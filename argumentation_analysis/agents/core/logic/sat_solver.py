@@ -0,0 +1,602 @@
+# argumentation_analysis/agents/core/logic/sat_solver.py
+"""
+Solveur SAT CDCL en Python pur pour le raisonnement propositionnel sans JVM.
+
+Le module fournit :
+
+- `parse_formula` : analyse d'une formule propositionnelle déjà normalisée
+  (syntaxe de `PLHandler._normalize_formula` : `!`, `&`, `|`, `=>`, `<=>`,
+  parenthèses ; `&&` et `||` sont aussi acceptés) en un arbre de tuples ;
+- `CNFEncoder` : conversion de Tseitin des formules en clauses, avec partage
+  des sous-formules identiques ;
+- `CDCLSolver` : solveur CDCL (littéraux surveillés, apprentissage 1-UIP avec
+  minimisation, heuristique VSIDS, sauvegarde de phase, redémarrages de Luby,
+  réduction de la base de clauses apprises) et résolution sous hypothèses,
+  ce qui permet de tester plusieurs conséquences d'une même base en
+  conservant les clauses apprises.
+
+Les littéraux suivent la convention DIMACS : la variable `v` (entier > 0)
+donne les littéraux `v` et `-v`.
+"""
+
+import heapq
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# Arbre de formule : ("var", nom), ("not", f), ("and", f1, ..., fn), ("or", f1, ..., fn),
+# ("imp", f, g), ("iff", f, g), ("true",), ("false",)
+Formula = Tuple
+
+TRUE: Formula = ("true",)
+FALSE: Formula = ("false",)
+
+_TOKEN_RE = re.compile(r"\s*(<=>|=>|&&|\|\||[&|!()+\-]|[A-Za-z0-9_]+)")
+
+
+class FormulaSyntaxError(ValueError):
+    """Formule propositionnelle mal formée."""
+
+
+def _tokenize(text: str) -> List[str]:
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if not match:
+            raise FormulaSyntaxError(f"Caractère inattendu à la position {position} dans '{text}'")
+        tokens.append(match.group(1))
+        position = match.end()
+    return tokens
+
+
+def parse_formula(text: str) -> Formula:
+    """
+    Analyse une formule propositionnelle.
+
+    Priorités (de la plus faible à la plus forte) : `<=>`, `=>` (associatif à
+    droite), `|`, `&`, `!`. `+` et `-` désignent la tautologie et la contradiction.
+
+    Raises:
+        FormulaSyntaxError: Si la formule est mal formée.
+    """
+    tokens = _tokenize(text)
+    if not tokens:
+        raise FormulaSyntaxError("Formule vide")
+    position = 0
+
+    def peek() -> Optional[str]:
+        return tokens[position] if position < len(tokens) else None
+
+    def take() -> str:
+        nonlocal position
+        token = peek()
+        if token is None:
+            raise FormulaSyntaxError(f"Fin de formule inattendue dans '{text}'")
+        position += 1
+        return token
+
+    def parse_iff() -> Formula:
+        left = parse_imp()
+        while peek() == "<=>":
+            take()
+            left = ("iff", left, parse_imp())
+        return left
+
+    def parse_imp() -> Formula:
+        left = parse_or()
+        if peek() == "=>":
+            take()
+            return ("imp", left, parse_imp())
+        return left
+
+    def parse_nary(operator: str, symbols: Tuple[str, ...], parse_operand) -> Formula:
+        operands = [parse_operand()]
+        while peek() in symbols:
+            take()
+            operands.append(parse_operand())
+        return operands[0] if len(operands) == 1 else (operator, *operands)
+
+    def parse_or() -> Formula:
+        return parse_nary("or", ("|", "||"), parse_and)
+
+    def parse_and() -> Formula:
+        return parse_nary("and", ("&", "&&"), parse_unary)
+
+    def parse_unary() -> Formula:
+        token = take()
+        if token == "!":
+            return ("not", parse_unary())
+        if token == "(":
+            inner = parse_iff()
+            if take() != ")":
+                raise FormulaSyntaxError(f"Parenthèse fermante attendue dans '{text}'")
+            return inner
+        if token == "+":
+            return TRUE
+        if token == "-":
+            return FALSE
+        if token in ("<=>", "=>", "&", "&&", "|", "||", ")"):
+            raise FormulaSyntaxError(f"Opérateur '{token}' inattendu dans '{text}'")
+        return ("var", token)
+
+    formula = parse_iff()
+    if position != len(tokens):
+        raise FormulaSyntaxError(f"Symbole inattendu '{tokens[position]}' dans '{text}'")
+    return formula
+
+
+def formula_atoms(formula: Formula) -> set:
+    """Noms des propositions d'une formule."""
+    atoms = set()
+    stack = [formula]
+    while stack:
+        node = stack.pop()
+        if node[0] == "var":
+            atoms.add(node[1])
+        else:
+            stack.extend(node[1:])
+    return atoms
+
+
+class CDCLSolver:
+    """
+    Solveur CDCL incrémental.
+
+    Les clauses sont ajoutées par `add_clause` (au niveau 0) et conservées
+    entre les appels à `solve`, de même que les clauses apprises, qui restent
+    valides quelles que soient les hypothèses.
+    """
+
+    RESTART_BASE = 100
+    VAR_DECAY = 0.95
+
+    def __init__(self):
+        self.num_vars = 0
+        self.ok = True  # False si les clauses sont insatisfiables sans hypothèse
+        self._assign: List[int] = [0]  # 0 : libre, 1 : vrai, -1 : faux
+        self._level: List[int] = [0]
+        self._reason: List[Optional[list]] = [None]
+        self._polarity: List[bool] = [False]
+        self._activity: List[float] = [0.0]
+        self._watches: List[List[list]] = [[], []]  # Indexé par 2*v + (littéral négatif)
+        self._clauses: List[list] = []
+        self._learnts: List[list] = []
+        self._lbd: Dict[int, int] = {}  # id(clause apprise) -> LBD
+        self._trail: List[int] = []
+        self._trail_lim: List[int] = []
+        self._qhead = 0
+        self._heap: List[Tuple[float, int]] = []
+        self._var_inc = 1.0
+        self._max_learnts = 2000
+        self.model: Optional[List[bool]] = None
+        self.stats = {"decisions": 0, "propagations": 0, "conflicts": 0, "restarts": 0, "learnts": 0}
+
+    # -- Variables et clauses ------------------------------------------------------
+
+    def new_var(self) -> int:
+        """Crée une variable et retourne son numéro."""
+        self.num_vars += 1
+        self._assign.append(0)
+        self._level.append(0)
+        self._reason.append(None)
+        self._polarity.append(False)
+        self._activity.append(0.0)
+        self._watches.append([])
+        self._watches.append([])
+        heapq.heappush(self._heap, (0.0, self.num_vars))
+        return self.num_vars
+
+    def _value(self, literal: int) -> int:
+        value = self._assign[literal if literal > 0 else -literal]
+        return value if literal > 0 else -value
+
+    def add_clause(self, literals: Iterable[int]) -> bool:
+        """
+        Ajoute une clause. Retourne False si la base devient insatisfiable.
+        """
+        if not self.ok:
+            return False
+        self._cancel_until(0)
+        clause = []
+        seen = set()
+        for literal in literals:
+            if -literal in seen:
+                return True  # Tautologie
+            if literal in seen:
+                continue
+            value = self._value(literal)
+            if value == 1:
+                return True  # Déjà satisfaite au niveau 0
+            if value == 0:
+                seen.add(literal)
+                clause.append(literal)
+        if not clause:
+            self.ok = False
+            return False
+        if len(clause) == 1:
+            self._enqueue(clause[0], None)
+            if self._propagate() is not None:
+                self.ok = False
+                return False
+            return True
+        self._clauses.append(clause)
+        self._attach(clause)
+        return True
+
+    def _attach(self, clause: list) -> None:
+        self._watches[self._index(clause[0])].append(clause)
+        self._watches[self._index(clause[1])].append(clause)
+
+    @staticmethod
+    def _index(literal: int) -> int:
+        return 2 * literal if literal > 0 else -2 * literal + 1
+
+    # -- Propagation -------------------------------------------------------------
+
+    def _enqueue(self, literal: int, reason: Optional[list]) -> None:
+        var = literal if literal > 0 else -literal
+        self._assign[var] = 1 if literal > 0 else -1
+        self._level[var] = len(self._trail_lim)
+        self._reason[var] = reason
+        self._trail.append(literal)
+
+    def _propagate(self) -> Optional[list]:
+        """Propagation unitaire ; retourne la clause en conflit ou None."""
+        assign = self._assign
+        watches = self._watches
+        trail = self._trail
+        conflict = None
+        while self._qhead < len(trail):
+            false_literal = -trail[self._qhead]
+            self._qhead += 1
+            self.stats["propagations"] += 1
+            watch_list = watches[2 * false_literal if false_literal > 0 else -2 * false_literal + 1]
+            kept = 0
+            i = 0
+            count = len(watch_list)
+            while i < count:
+                clause = watch_list[i]
+                i += 1
+                if clause[0] == false_literal:
+                    clause[0], clause[1] = clause[1], false_literal
+                first = clause[0]
+                first_value = assign[first] if first > 0 else -assign[-first]
+                if first_value == 1:
+                    watch_list[kept] = clause
+                    kept += 1
+                    continue
+                # Chercher un autre littéral non faux à surveiller
+                for k in range(2, len(clause)):
+                    literal = clause[k]
+                    if (assign[literal] if literal > 0 else -assign[-literal]) != -1:
+                        clause[1], clause[k] = literal, false_literal
+                        watches[2 * literal if literal > 0 else -2 * literal + 1].append(clause)
+                        break
+                else:
+                    watch_list[kept] = clause
+                    kept += 1
+                    if first_value == -1:
+                        conflict = clause
+                        while i < count:
+                            watch_list[kept] = watch_list[i]
+                            kept += 1
+                            i += 1
+                    else:
+                        self._enqueue(first, clause)
+            del watch_list[kept:]
+            if conflict is not None:
+                self._qhead = len(trail)
+                return conflict
+        return None
+
+    # -- Analyse de conflit ------------------------------------------------------
+
+    def _bump(self, var: int) -> None:
+        activity = self._activity[var] + self._var_inc
+        self._activity[var] = activity
+        if activity > 1e100:
+            self._rescale()
+        elif self._assign[var] == 0:
+            heapq.heappush(self._heap, (-activity, var))
+
+    def _rescale(self) -> None:
+        self._activity = [a * 1e-100 for a in self._activity]
+        self._var_inc *= 1e-100
+        self._heap = [(-self._activity[v], v) for v in range(1, self.num_vars + 1) if self._assign[v] == 0]
+        heapq.heapify(self._heap)
+
+    def _analyze(self, conflict: list) -> Tuple[list, int]:
+        """Apprentissage 1-UIP ; retourne la clause apprise et le niveau de retour."""
+        seen = {}
+        learnt = [0]
+        current_level = len(self._trail_lim)
+        counter = 0
+        literal = None
+        index = len(self._trail) - 1
+        clause = conflict
+        while True:
+            for other in (clause if literal is None else clause[1:]):
+                var = other if other > 0 else -other
+                if var not in seen and self._level[var] > 0:
+                    seen[var] = True
+                    self._bump(var)
+                    if self._level[var] >= current_level:
+                        counter += 1
+                    else:
+                        learnt.append(other)
+            while (self._trail[index] if self._trail[index] > 0 else -self._trail[index]) not in seen:
+                index -= 1
+            literal = self._trail[index]
+            index -= 1
+            var = literal if literal > 0 else -literal
+            clause = self._reason[var]
+            counter -= 1
+            if counter == 0:
+                break
+        learnt[0] = -literal
+
+        # Minimisation locale : retirer les littéraux impliqués par les autres
+        minimized = [learnt[0]]
+        for other in learnt[1:]:
+            reason = self._reason[other if other > 0 else -other]
+            if reason is None or any(
+                (r if r > 0 else -r) not in seen and self._level[r if r > 0 else -r] > 0
+                for r in reason[1:]
+            ):
+                minimized.append(other)
+        learnt = minimized
+
+        if len(learnt) == 1:
+            return learnt, 0
+        # Le littéral de plus haut niveau (hors UIP) devient le second surveillé
+        best = max(range(1, len(learnt)), key=lambda k: self._level[abs(learnt[k])])
+        learnt[1], learnt[best] = learnt[best], learnt[1]
+        return learnt, self._level[abs(learnt[1])]
+
+    def _cancel_until(self, level: int) -> None:
+        if len(self._trail_lim) <= level:
+            return
+        limit = self._trail_lim[level]
+        for literal in reversed(self._trail[limit:]):
+            var = literal if literal > 0 else -literal
+            self._assign[var] = 0
+            self._reason[var] = None
+            self._polarity[var] = literal > 0
+            heapq.heappush(self._heap, (-self._activity[var], var))
+        del self._trail[limit:]
+        del self._trail_lim[level:]
+        self._qhead = len(self._trail)
+
+    # -- Décisions ----------------------------------------------------------------
+
+    def _pick_branch_variable(self) -> int:
+        heap = self._heap
+        while heap:
+            negative_activity, var = heapq.heappop(heap)
+            if self._assign[var] == 0 and -negative_activity == self._activity[var]:
+                return var
+        # Entrées périmées épuisées : chercher une variable libre restante
+        for var in range(1, self.num_vars + 1):
+            if self._assign[var] == 0:
+                return var
+        return 0
+
+    def _reduce_learnts(self) -> None:
+        """Supprime la moitié des clauses apprises les moins utiles (LBD élevé)."""
+        def locked(clause):
+            var = abs(clause[0])
+            return self._reason[var] is clause and self._value(clause[0]) == 1
+
+        ranked = sorted(self._learnts, key=lambda c: (self._lbd.get(id(c), 0), len(c)))
+        keep = len(ranked) // 2
+        kept = []
+        for position, clause in enumerate(ranked):
+            if position < keep or self._lbd.get(id(clause), 0) <= 2 or locked(clause):
+                kept.append(clause)
+            else:
+                self._lbd.pop(id(clause), None)
+        self._learnts = kept
+        # Les littéraux surveillés sont toujours les deux premiers : reconstruire les listes
+        for watch_list in self._watches:
+            watch_list.clear()
+        for clause in self._clauses:
+            self._attach(clause)
+        for clause in self._learnts:
+            self._attach(clause)
+        self._max_learnts = int(self._max_learnts * 1.1)
+
+    @staticmethod
+    def _luby(index: int) -> int:
+        size, sequence = 1, 0
+        while size < index + 1:
+            sequence += 1
+            size = 2 * size + 1
+        while size - 1 != index:
+            size = (size - 1) >> 1
+            sequence -= 1
+            index %= size
+        return 1 << sequence
+
+    # -- Résolution -----------------------------------------------------------------
+
+    def solve(self, assumptions: Sequence[int] = (), max_conflicts: Optional[int] = None) -> Optional[bool]:
+        """
+        Cherche un modèle des clauses vérifiant les hypothèses.
+
+        Args:
+            assumptions: Littéraux supposés vrais pour cette résolution seulement
+            max_conflicts: Nombre maximal de conflits (None : pas de limite)
+
+        Returns:
+            True (satisfiable, modèle dans `model`), False (insatisfiable sous
+            ces hypothèses) ou None si la limite de conflits est atteinte.
+        """
+        self.model = None
+        if not self.ok:
+            return False
+        self._cancel_until(0)
+        if self._propagate() is not None:
+            self.ok = False
+            return False
+
+        total_conflicts = 0
+        restart = 0
+        while True:
+            budget = self.RESTART_BASE * self._luby(restart)
+            status = self._search(assumptions, budget)
+            total_conflicts += budget if status is None else 0
+            if status is not None:
+                self._cancel_until(0)
+                return status
+            if max_conflicts is not None and total_conflicts >= max_conflicts:
+                self._cancel_until(0)
+                return None
+            restart += 1
+            self.stats["restarts"] += 1
+
+    def _search(self, assumptions: Sequence[int], budget: int) -> Optional[bool]:
+        conflicts = 0
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.stats["conflicts"] += 1
+                conflicts += 1
+                if not self._trail_lim:
+                    self.ok = False
+                    return False
+                learnt, backtrack_level = self._analyze(conflict)
+                self._cancel_until(backtrack_level)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], None)
+                else:
+                    self._learnts.append(learnt)
+                    self._lbd[id(learnt)] = len({self._level[abs(l)] for l in learnt})
+                    self._attach(learnt)
+                    self._enqueue(learnt[0], learnt)
+                self.stats["learnts"] += 1
+                self._var_inc /= self.VAR_DECAY
+                continue
+
+            if conflicts >= budget:
+                self._cancel_until(0)
+                return None
+            if len(self._learnts) - len(self._trail) >= self._max_learnts:
+                self._reduce_learnts()
+
+            # Hypothèses d'abord, une par niveau de décision
+            literal = 0
+            while len(self._trail_lim) < len(assumptions):
+                assumption = assumptions[len(self._trail_lim)]
+                value = self._value(assumption)
+                if value == 1:
+                    self._trail_lim.append(len(self._trail))  # Niveau factice
+                elif value == -1:
+                    return False
+                else:
+                    literal = assumption
+                    break
+
+            if literal == 0:
+                var = self._pick_branch_variable()
+                if var == 0:
+                    self.model = [False] + [self._assign[v] == 1 for v in range(1, self.num_vars + 1)]
+                    return True
+                literal = var if self._polarity[var] else -var
+                self.stats["decisions"] += 1
+
+            self._trail_lim.append(len(self._trail))
+            self._enqueue(literal, None)
+
+
+class CNFEncoder:
+    """
+    Conversion de Tseitin de formules vers un `CDCLSolver`.
+
+    Chaque sous-formule reçoit une variable définie par des clauses
+    d'équivalence ; les sous-formules identiques partagent leur variable,
+    y compris entre la base de connaissances et les requêtes.
+    """
+
+    def __init__(self, solver: Optional[CDCLSolver] = None):
+        self.solver = solver or CDCLSolver()
+        self.atoms: Dict[str, int] = {}
+        self._definitions: Dict[Formula, int] = {}
+        self._true_literal: Optional[int] = None
+
+    def atom(self, name: str) -> int:
+        """Variable associée à une proposition."""
+        var = self.atoms.get(name)
+        if var is None:
+            var = self.atoms[name] = self.solver.new_var()
+        return var
+
+    def _constant_true(self) -> int:
+        if self._true_literal is None:
+            self._true_literal = self.solver.new_var()
+            self.solver.add_clause([self._true_literal])
+        return self._true_literal
+
+    def encode(self, formula: Formula) -> int:
+        """Retourne un littéral équivalent à la formule (en ajoutant ses définitions)."""
+        kind = formula[0]
+        if kind == "var":
+            return self.atom(formula[1])
+        if kind == "not":
+            return -self.encode(formula[1])
+        if kind == "true":
+            return self._constant_true()
+        if kind == "false":
+            return -self._constant_true()
+
+        literal = self._definitions.get(formula)
+        if literal is not None:
+            return literal
+
+        add = self.solver.add_clause
+        if kind in ("and", "or"):
+            children = [self.encode(child) for child in formula[1:]]
+            literal = self.solver.new_var()
+            if kind == "and":
+                for child in children:
+                    add([-literal, child])
+                add([literal] + [-child for child in children])
+            else:
+                add([-literal] + children)
+                for child in children:
+                    add([literal, -child])
+        elif kind == "imp":
+            return self.encode(("or", ("not", formula[1]), formula[2]))
+        elif kind == "iff":
+            left, right = self.encode(formula[1]), self.encode(formula[2])
+            literal = self.solver.new_var()
+            add([-literal, -left, right])
+            add([-literal, left, -right])
+            add([literal, left, right])
+            add([literal, -left, -right])
+        else:
+            raise ValueError(f"Unknown formula node: {kind}")
+
+        self._definitions[formula] = literal
+        return literal
+
+    def assert_formula(self, formula: Formula) -> bool:
+        """
+        Ajoute une formule comme contrainte. Les conjonctions sont éclatées et
+        les disjonctions de littéraux deviennent directement des clauses.
+
+        Returns:
+            False si les contraintes sont devenues insatisfiables
+        """
+        kind = formula[0]
+        if kind == "and":
+            return all([self.assert_formula(child) for child in formula[1:]])
+        if kind == "or" and all(self._is_literal(child) for child in formula[1:]):
+            return self.solver.add_clause([self.encode(child) for child in formula[1:]])
+        if kind == "imp" and self._is_literal(formula[1]) and self._is_literal(formula[2]):
+            return self.solver.add_clause([-self.encode(formula[1]), self.encode(formula[2])])
+        return self.solver.add_clause([self.encode(formula)])
+
+    @staticmethod
+    def _is_literal(formula: Formula) -> bool:
+        return formula[0] == "var" or (formula[0] == "not" and formula[1][0] == "var")
@@ -28,11 +28,17 @@ from typing import Optional, Dict, List, Tuple, Any
 # Pour éviter les dépendances circulaires, on les importe et on les type-hint comme ça
 from .pl_handler import PLHandler as PropositionalLogicHandler
 from .fol_handler import FOLHandler as FirstOrderLogicHandler
+from .sat_pl_handler import SatPLHandler
 from .tweety_initializer import TweetyInitializer
+from .tweety_worker_pool import RemotePLHandler, TweetyWorkerPool, get_tweety_worker_pool
+from argumentation_analysis.config.settings import settings
 
 
 logger = logging.getLogger(__name__)
 
+# Backends disponibles pour la logique propositionnelle : Tweety (JVM) ou solveur SAT en processus
+PL_BACKENDS = ("tweety", "sat")
+
 class TweetyBridge:
     """
     Un pont singleton pour interagir avec la bibliothèque Java TweetyProject.
@@ -46,6 +52,14 @@ class TweetyBridge:
     # Handlers pour les différentes logiques. Initialisés avec la logique du pont.
     _pl_handler: Optional[PropositionalLogicHandler] = None
     _fol_handler: Optional[FirstOrderLogicHandler] = None
+    _sat_pl_handler: Optional[SatPLHandler] = None
+    _remote_pl_handler: Optional[RemotePLHandler] = None
+
+    # Mode client : le raisonnement Tweety est délégué à un pool de workers
+    _worker_pool: Optional[TweetyWorkerPool] = None
+
+    # Backend PL par défaut, utilisé par `pl_handler`
+    pl_backend: str = "tweety"
     
     # Nouvel attribut pour l'initialiseur
     _initializer: Optional[TweetyInitializer] = None
@@ -57,16 +71,37 @@ class TweetyBridge:
                     cls._instance = super(TweetyBridge, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self, jar_directory: Optional[str] = None):
+    def __init__(self, jar_directory: Optional[str] = None, pl_backend: Optional[str] = None,
+                 worker_pool: Optional[TweetyWorkerPool] = None):
         """
         Initialise le pont. La JVM n'est pas démarrée ici, mais dans `initialize_jvm`.
         Les handlers sont chargés paresseusement (lazy-loaded) lors du premier accès.
+
+        Args:
+            jar_directory: Répertoire des JARs Tweety.
+            pl_backend: Backend PL par défaut ("tweety" ou "sat"). Si None, le
+                backend courant est conservé.
+            worker_pool: Pool de workers Tweety : le pont passe en mode client
+                et ne démarre pas de JVM. Si `settings.jvm.tweety_workers` est
+                positif, le pool partagé est utilisé par défaut.
         """
         if not hasattr(self, '_initialized'):
             self.jar_directory = jar_directory or self._find_default_jar_dir()
-            self._initializer = TweetyInitializer()
+            if worker_pool is None and settings.jvm.tweety_workers > 0:
+                worker_pool = get_tweety_worker_pool()
+            self._worker_pool = worker_pool
+            # En mode client, la JVM vit dans les workers : pas d'initialiseur local
+            self._initializer = TweetyInitializer() if worker_pool is None else None
             # Les handlers ne sont plus initialisés ici pour éviter les erreurs de JVM
             self._initialized = True
+        elif worker_pool is not None and worker_pool is not self._worker_pool:
+            # Singleton déjà construit : le pool explicitement fourni remplace le précédent
+            self._worker_pool = worker_pool
+            self._initializer = None
+            self._remote_pl_handler = None
+            self._fol_handler = None
+        if pl_backend is not None:
+            self.set_pl_backend(pl_backend)
 
     def _find_default_jar_dir(self) -> str:
         """
@@ -88,9 +123,30 @@ class TweetyBridge:
             cls._instance = TweetyBridge(jar_directory)
         return cls._instance
 
-    @property
-    def pl_handler(self) -> PropositionalLogicHandler:
-        """Retourne le handler pour la logique propositionnelle, en l'initialisant si nécessaire."""
+    def set_pl_backend(self, backend: str) -> None:
+        """Choisit le backend PL par défaut : "tweety" (JVM) ou "sat" (solveur CDCL en Python)."""
+        if backend not in PL_BACKENDS:
+            raise ValueError(f"Backend PL inconnu : '{backend}'. Valeurs possibles : {PL_BACKENDS}")
+        self.pl_backend = backend
+        logger.info(f"Backend PL sélectionné : {backend}")
+
+    def get_pl_handler(self, backend: Optional[str] = None) -> PropositionalLogicHandler:
+        """
+        Retourne le handler PL du backend demandé (par défaut `pl_backend`),
+        en l'initialisant si nécessaire. Le backend "sat" ne nécessite pas la JVM.
+        """
+        backend = backend or self.pl_backend
+        if backend == "sat":
+            if self._sat_pl_handler is None:
+                logger.debug("Chargement paresseux (lazy-loading) du SatPLHandler.")
+                self._sat_pl_handler = SatPLHandler()
+            return self._sat_pl_handler
+        if backend not in PL_BACKENDS:
+            raise ValueError(f"Backend PL inconnu : '{backend}'. Valeurs possibles : {PL_BACKENDS}")
+        if self.is_client_mode:
+            if self._remote_pl_handler is None:
+                self._remote_pl_handler = RemotePLHandler(self._worker_pool)
+            return self._remote_pl_handler
         if not self.initializer.is_jvm_ready():
             raise RuntimeError("La JVM n'est pas démarrée. Appelez initialize_jvm() en premier.")
         if self._pl_handler is None:
@@ -98,9 +154,16 @@ class TweetyBridge:
             self._pl_handler = PropositionalLogicHandler(self._initializer)
         return self._pl_handler
 
+    @property
+    def pl_handler(self) -> PropositionalLogicHandler:
+        """Retourne le handler pour la logique propositionnelle du backend courant."""
+        return self.get_pl_handler()
+
     @property
     def fol_handler(self) -> FirstOrderLogicHandler:
         """Retourne le handler pour la logique du premier ordre, en l'initialisant si nécessaire."""
+        if self.is_client_mode:
+            raise RuntimeError("Le handler FOL n'est pas disponible en mode client (pas de JVM locale).")
         if not self.initializer.is_jvm_ready():
             raise RuntimeError("La JVM n'est pas démarrée. Appelez initialize_jvm() en premier.")
         if self._fol_handler is None:
@@ -112,6 +175,15 @@ class TweetyBridge:
     def initializer(self) -> TweetyInitializer:
         """Retourne l'initialiseur Tweety, qui gère le chargement des classes Java."""
         return self._initializer
+
+    @property
+    def is_client_mode(self) -> bool:
+        """Indique si le raisonnement Tweety est délégué à un pool de workers."""
+        return self._worker_pool is not None
+
+    @property
+    def worker_pool(self) -> Optional[TweetyWorkerPool]:
+        return self._worker_pool
         
 
     async def wait_for_jvm(self, timeout: int = 30) -> None:
@@ -181,11 +253,17 @@ class TweetyBridge:
                 self._jvm_started = False
                 logger.info("La JVM a été arrêtée via le gestionnaire centralisé.")
 
-    def validate_pl_formula(self, formula: str) -> bool:
-        """Valide la syntaxe d'une formule de logique propositionnelle en tentant de la parser."""
+    def validate_pl_formula(self, formula: str, backend: Optional[str] = None) -> bool:
+        """
+        Valide la syntaxe d'une formule de logique propositionnelle en tentant de la parser
+        avec le handler du backend demandé (par défaut `pl_backend`).
+        """
+        handler = self.get_pl_handler(backend)
+        if isinstance(handler, RemotePLHandler):
+            return handler.validate_pl_formula(formula)
         try:
             # La validation se fait en tentant un parsing. Si ça ne lève pas d'erreur, c'est valide.
-            self.pl_handler.parse_pl_formula(formula)
+            handler.parse_pl_formula(formula)
             return True
         except ValueError:
             return False
@@ -197,8 +275,17 @@ class TweetyBridge:
         """
         return self.pl_handler.pl_query(knowledge_base, query)
 
+    def pl_query_batch(self, knowledge_base: str, queries: List[str]) -> List[Optional[bool]]:
+        """
+        Exécute plusieurs requêtes sur une même base de connaissances, compilée une seule fois.
+        Retourne un résultat par requête (None pour une requête invalide).
+        """
+        return self.pl_handler.pl_query_batch(knowledge_base, queries)
+
     def create_pl_belief_base_from_string(self, formula_string: str) -> Optional["java.lang.Object"]:
         """Crée un objet PlBeliefSet Java à partir d'une chaîne."""
+        if self.is_client_mode:
+            raise RuntimeError("Les objets PlBeliefSet Java ne sont pas disponibles en mode client (pas de JVM locale).")
         return self.pl_handler.create_belief_base_from_string(formula_string)
 
     # ===============================================
@@ -215,6 +302,8 @@ class TweetyBridge:
 
     def fol_check_consistency(self, belief_set: Any) -> Tuple[bool, str]:
         """Vérifie la consistance d'un ensemble de croyances FOL."""
+        if self.is_client_mode:
+            raise RuntimeError("La logique FOL n'est pas disponible en mode client (pas de JVM locale).")
         if not self._initializer.FolBeliefSet:
             logger.error("FolBeliefSet class not loaded.")
             return False, "FolBeliefSet class not loaded."
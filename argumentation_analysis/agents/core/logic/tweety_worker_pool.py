@@ -0,0 +1,405 @@
+# argumentation_analysis/agents/core/logic/tweety_worker_pool.py
+"""
+Pool de processus workers hébergeant chacun une JVM Tweety.
+
+JPype ne permet qu'une JVM par processus, qui ne peut pas être redémarrée.
+Ce module déporte le raisonnement dans des processus workers (démarrés en
+mode "spawn") : chaque worker démarre sa propre JVM et traite des requêtes
+typées (`TweetyRequest` -> `TweetyResponse`) reçues par un pipe local. Les
+requêtes sont envoyées par lots (un aller-retour par lot).
+
+Côté client, `TweetyWorkerPool` répartit les lots sur le worker le moins
+chargé, redémarre un worker dont le processus est mort (la requête est alors
+rejouée une fois) et tue un worker qui dépasse le délai imparti. Le processus
+client n'a jamais besoin de la JVM.
+"""
+
+import itertools
+import logging
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TweetyRequest:
+    """Requête adressée à un worker : nom d'opération et arguments nommés."""
+    op: str
+    args: Dict[str, Any] = field(default_factory=dict)
+    request_id: int = 0
+
+
+@dataclass
+class TweetyResponse:
+    """Réponse d'un worker : résultat, ou type et message de l'exception levée."""
+    request_id: int
+    ok: bool
+    result: Any = None
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+
+
+class TweetyWorkerError(RuntimeError):
+    """Worker indisponible : échec du démarrage, processus mort ou délai dépassé."""
+
+
+class TweetyRemoteError(RuntimeError):
+    """Exception levée par une opération dans un worker."""
+
+    def __init__(self, message: str, error_type: Optional[str] = None):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+# Exceptions levées à l'identique côté client (les autres deviennent TweetyRemoteError)
+_REMOTE_EXCEPTIONS = {"ValueError": ValueError, "TypeError": TypeError, "KeyError": KeyError}
+
+
+# -- Côté worker -------------------------------------------------------------------
+
+class WorkerContext:
+    """État d'un worker : le pont Tweety local, créé au démarrage (JVM comprise)."""
+
+    def __init__(self):
+        from argumentation_analysis.config.settings import settings
+        from .tweety_bridge import TweetyBridge
+        # Le worker héberge la JVM : pas de pool imbriqué
+        settings.jvm.tweety_workers = 0
+        self.bridge = TweetyBridge()
+
+
+def default_worker_setup() -> WorkerContext:
+    """Initialisation par défaut d'un worker : démarre la JVM et les handlers Tweety."""
+    return WorkerContext()
+
+
+def _op_ping(context) -> int:
+    return os.getpid()
+
+
+def _op_pl_query(context, knowledge_base: str, query: str) -> Optional[bool]:
+    return context.bridge.pl_query(knowledge_base, query)
+
+
+def _op_pl_query_batch(context, knowledge_base: str, queries: List[str]) -> List[Optional[bool]]:
+    return context.bridge.pl_query_batch(knowledge_base, queries)
+
+
+def _op_pl_check_consistency(context, knowledge_base: str) -> bool:
+    return context.bridge.pl_handler.pl_check_consistency(knowledge_base)
+
+
+def _op_validate_pl_formula(context, formula: str) -> bool:
+    return context.bridge.validate_pl_formula(formula)
+
+
+def _op_dung_extensions(context, arguments: List[str], attacks: List[Sequence[str]],
+                        semantics: List[str]) -> Dict[str, list]:
+    from abs_arg_dung.agent import DungAgent
+    agent = DungAgent(backend='tweety')
+    agent.add_arguments(arguments)
+    agent.add_attacks([tuple(pair) for pair in attacks])
+    return {name: agent._get_extensions(name) for name in semantics}
+
+
+DEFAULT_OPERATIONS: Dict[str, Callable[..., Any]] = {
+    "ping": _op_ping,
+    "pl_query": _op_pl_query,
+    "pl_query_batch": _op_pl_query_batch,
+    "pl_check_consistency": _op_pl_check_consistency,
+    "validate_pl_formula": _op_validate_pl_formula,
+    "dung_extensions": _op_dung_extensions,
+}
+
+
+def _handle(context, operations: Dict[str, Callable[..., Any]], request: TweetyRequest) -> TweetyResponse:
+    operation = operations.get(request.op)
+    if operation is None:
+        return TweetyResponse(request.request_id, False, error=f"Opération inconnue : '{request.op}'",
+                              error_type="ValueError")
+    try:
+        return TweetyResponse(request.request_id, True, result=operation(context, **request.args))
+    except Exception as e:
+        return TweetyResponse(request.request_id, False, error=str(e), error_type=type(e).__name__)
+
+
+def _worker_main(conn, setup: Callable[[], Any], operations: Dict[str, Callable[..., Any]]) -> None:
+    """Boucle d'un worker : initialisation, puis un lot de requêtes par message."""
+    try:
+        context = setup()
+    except BaseException as e:
+        conn.send(("init_error", f"{type(e).__name__}: {e}"))
+        conn.close()
+        return
+    conn.send(("ready", os.getpid()))
+    while True:
+        try:
+            batch = conn.recv()
+        except (EOFError, OSError):
+            break
+        if batch is None:
+            break
+        conn.send([_handle(context, operations, request) for request in batch])
+    conn.close()
+
+
+# -- Côté client -------------------------------------------------------------------
+
+class _Worker:
+    def __init__(self, index: int):
+        self.index = index
+        self.process = None
+        self.conn = None
+        self.ready = False
+        self.pending = 0
+        self.restarts = 0
+        self.lock = threading.Lock()
+
+
+class TweetyWorkerPool:
+    """
+    Pool de workers Tweety avec équilibrage de charge et redémarrage automatique.
+
+    Args:
+        size: Nombre de workers (par défaut, le nombre de cœurs).
+        setup: Fonction (picklable) exécutée au démarrage de chaque worker ;
+            son résultat est passé aux opérations.
+        operations: Opérations disponibles, par nom (fonctions picklables
+            `op(context, **args)`).
+        request_timeout: Délai maximal d'un lot, en secondes ; au-delà le
+            worker est tué et redémarré.
+        startup_timeout: Délai maximal de démarrage d'un worker (JVM comprise).
+        start_method: Méthode de démarrage multiprocessing ("spawn" : une JVM
+            ne survit pas à un fork).
+    """
+
+    def __init__(self, size: Optional[int] = None, setup: Callable[[], Any] = default_worker_setup,
+                 operations: Optional[Dict[str, Callable[..., Any]]] = None,
+                 request_timeout: float = 120.0, startup_timeout: float = 300.0,
+                 start_method: str = "spawn"):
+        self.size = max(1, size or os.cpu_count() or 1)
+        self.request_timeout = request_timeout
+        self.startup_timeout = startup_timeout
+        self._setup = setup
+        self._operations = dict(operations if operations is not None else DEFAULT_OPERATIONS)
+        self._mp = multiprocessing.get_context(start_method)
+        self._balance_lock = threading.Lock()
+        self._request_ids = itertools.count(1)
+        self._dispatcher = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="tweety-client")
+        self._closed = False
+        self.stats = {"batches": 0, "requests": 0, "restarts": 0, "timeouts": 0}
+        self._workers = [_Worker(index) for index in range(self.size)]
+        for worker in self._workers:
+            self._start(worker)
+
+    # -- Cycle de vie des workers ----------------------------------------------------
+
+    def _start(self, worker: _Worker) -> None:
+        parent_conn, child_conn = self._mp.Pipe()
+        process = self._mp.Process(target=_worker_main, args=(child_conn, self._setup, self._operations),
+                                   name=f"tweety-worker-{worker.index}", daemon=True)
+        process.start()
+        child_conn.close()
+        worker.process, worker.conn, worker.ready = process, parent_conn, False
+
+    def _stop(self, worker: _Worker) -> None:
+        if worker.process is not None and worker.process.is_alive():
+            worker.process.kill()
+        if worker.process is not None:
+            worker.process.join(timeout=5)
+        if worker.conn is not None:
+            worker.conn.close()
+        worker.process = worker.conn = None
+
+    def _restart(self, worker: _Worker, reason: str) -> None:
+        logger.warning(f"Redémarrage du worker Tweety {worker.index} : {reason}")
+        self._stop(worker)
+        with self._balance_lock:
+            worker.restarts += 1
+            self.stats["restarts"] += 1
+        if not self._closed:
+            self._start(worker)
+
+    def _ensure_ready(self, worker: _Worker) -> None:
+        """Attend le message de démarrage du worker (appelé sous `worker.lock`)."""
+        if worker.ready:
+            return
+        if not worker.conn.poll(self.startup_timeout):
+            self._restart(worker, "délai de démarrage dépassé")
+            raise TweetyWorkerError(f"Le worker Tweety {worker.index} n'a pas démarré à temps")
+        try:
+            status, detail = worker.conn.recv()
+        except (EOFError, OSError) as e:
+            self._restart(worker, "processus mort au démarrage")
+            raise TweetyWorkerError(f"Le worker Tweety {worker.index} s'est arrêté au démarrage") from e
+        if status != "ready":
+            self._stop(worker)
+            self._start(worker)
+            raise TweetyWorkerError(f"Échec du démarrage du worker Tweety {worker.index} : {detail}")
+        worker.ready = True
+
+    def wait_ready(self) -> None:
+        """Attend que tous les workers aient démarré leur JVM."""
+        for worker in self._workers:
+            with worker.lock:
+                self._ensure_ready(worker)
+
+    # -- Échanges ---------------------------------------------------------------------
+
+    def _acquire(self) -> _Worker:
+        with self._balance_lock:
+            worker = min(self._workers, key=lambda w: (w.pending, w.restarts))
+            worker.pending += 1
+            return worker
+
+    def _release(self, worker: _Worker) -> None:
+        with self._balance_lock:
+            worker.pending -= 1
+
+    def _exchange(self, batch: List[TweetyRequest], retries: int = 1) -> List[TweetyResponse]:
+        worker = self._acquire()
+        try:
+            with worker.lock:
+                if self._closed:
+                    raise TweetyWorkerError("Le pool de workers Tweety est fermé")
+                if worker.process is None or not worker.process.is_alive():
+                    self._restart(worker, "processus mort")
+                self._ensure_ready(worker)
+                try:
+                    worker.conn.send(batch)
+                    if not worker.conn.poll(self.request_timeout):
+                        with self._balance_lock:
+                            self.stats["timeouts"] += 1
+                        self._restart(worker, f"délai de {self.request_timeout}s dépassé")
+                        raise TweetyWorkerError(f"Délai dépassé pour un lot de {len(batch)} requête(s)")
+                    return worker.conn.recv()
+                except (EOFError, OSError) as e:
+                    self._restart(worker, f"connexion perdue ({e})")
+                    crash = e
+        finally:
+            self._release(worker)
+        if retries > 0:
+            return self._exchange(batch, retries - 1)
+        raise TweetyWorkerError("Le worker Tweety s'est arrêté pendant le traitement du lot") from crash
+
+    def execute(self, requests: Sequence[TweetyRequest]) -> List[TweetyResponse]:
+        """
+        Exécute des requêtes et retourne une réponse par requête, dans l'ordre.
+
+        Les requêtes sont réparties en lots sur les workers et traitées en
+        parallèle. Les erreurs des opérations sont rapportées dans les
+        réponses ; seule l'indisponibilité d'un worker lève une exception.
+
+        Raises:
+            TweetyWorkerError: Si un lot n'a pas pu être traité.
+        """
+        requests = list(requests)
+        for request in requests:
+            if not request.request_id:
+                request.request_id = next(self._request_ids)
+        if not requests:
+            return []
+        chunk_size = math.ceil(len(requests) / self.size)
+        batches = [requests[i:i + chunk_size] for i in range(0, len(requests), chunk_size)]
+        with self._balance_lock:
+            self.stats["batches"] += len(batches)
+            self.stats["requests"] += len(requests)
+        if len(batches) == 1:
+            return self._exchange(batches[0])
+        futures = [self._dispatcher.submit(self._exchange, batch) for batch in batches]
+        return [response for future in futures for response in future.result()]
+
+    def call(self, op: str, **args) -> Any:
+        """
+        Exécute une opération et retourne son résultat.
+
+        Raises:
+            ValueError, TypeError, KeyError: Levées telles quelles par l'opération.
+            TweetyRemoteError: Autre exception levée par l'opération.
+            TweetyWorkerError: Si aucun worker n'a pu traiter la requête.
+        """
+        return self.unwrap(self.execute([TweetyRequest(op, args)])[0])
+
+    @staticmethod
+    def unwrap(response: TweetyResponse) -> Any:
+        """Résultat d'une réponse, ou l'exception correspondante."""
+        if response.ok:
+            return response.result
+        exception_class = _REMOTE_EXCEPTIONS.get(response.error_type)
+        if exception_class is not None:
+            raise exception_class(response.error)
+        raise TweetyRemoteError(f"{response.error_type}: {response.error}", response.error_type)
+
+    def get_pool_info(self) -> Dict[str, Any]:
+        with self._balance_lock:
+            return {
+                "size": self.size,
+                "workers": [{"index": w.index, "pid": w.process.pid if w.process else None,
+                             "alive": bool(w.process and w.process.is_alive()), "ready": w.ready,
+                             "pending": w.pending, "restarts": w.restarts} for w in self._workers],
+                "stats": dict(self.stats),
+            }
+
+    def close(self) -> None:
+        """Arrête les workers."""
+        if self._closed:
+            return
+        self._closed = True
+        self._dispatcher.shutdown(wait=True)
+        for worker in self._workers:
+            with worker.lock:
+                if worker.conn is not None and worker.process is not None and worker.process.is_alive():
+                    try:
+                        worker.conn.send(None)
+                    except OSError:
+                        pass
+                    worker.process.join(timeout=5)
+                self._stop(worker)
+
+
+class RemotePLHandler:
+    """
+    Équivalent de `PLHandler` dont le raisonnement est délégué aux workers.
+    Seules les opérations à entrées et sorties textuelles sont disponibles.
+    """
+
+    def __init__(self, pool: TweetyWorkerPool):
+        self._pool = pool
+
+    def pl_check_consistency(self, knowledge_base_str: str) -> bool:
+        return self._pool.call("pl_check_consistency", knowledge_base=knowledge_base_str)
+
+    def pl_query(self, knowledge_base_str: str, query_formula_str: str) -> Optional[bool]:
+        return self._pool.call("pl_query", knowledge_base=knowledge_base_str, query=query_formula_str)
+
+    def pl_query_batch(self, knowledge_base_str: str, queries: List[str]) -> List[Optional[bool]]:
+        return self._pool.call("pl_query_batch", knowledge_base=knowledge_base_str, queries=list(queries))
+
+    def validate_pl_formula(self, formula_str: str) -> bool:
+        return self._pool.call("validate_pl_formula", formula=formula_str)
+
+
+_default_pool: Optional[TweetyWorkerPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_tweety_worker_pool(size: Optional[int] = None) -> TweetyWorkerPool:
+    """
+    Pool partagé par le processus, créé au premier appel. Sa taille vient de
+    `size`, sinon de `settings.jvm.tweety_workers`, sinon du nombre de cœurs.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            from argumentation_analysis.config.settings import settings
+            import atexit
+            _default_pool = TweetyWorkerPool(size=size or settings.jvm.tweety_workers or None,
+                                             request_timeout=settings.jvm.tweety_worker_timeout)
+            atexit.register(_default_pool.close)
+        return _default_pool
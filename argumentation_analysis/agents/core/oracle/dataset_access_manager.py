@@ -9,8 +9,11 @@ des requêtes, et l'exécution effective des requêtes sur le jeu de données
 sous-jacent.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional, Union
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Any, Optional, Union
 from datetime import datetime, timedelta
 from functools import lru_cache
 
@@ -22,10 +25,38 @@ from .permissions import (
 from .cluedo_dataset import CluedoDataset
 
 
+def _freeze(value: Any) -> Hashable:
+    """Convertit récursivement des paramètres de requête en valeur hashable."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+def make_query_key(agent_name: str, query_type: QueryType, query_params: Dict[str, Any]) -> Hashable:
+    """
+    Clé structurelle d'une requête : deux requêtes de mêmes agent, type et
+    paramètres (à l'ordre des clés près) ont la même clé.
+    """
+    return (agent_name, query_type.value, _freeze(query_params))
+
+
 class QueryCache:
     """
     Implémente un cache pour les résultats de requêtes avec une politique
-    d'éviction basée sur la taille et une durée de vie (TTL).
+    d'éviction LRU basée sur la taille et une durée de vie (TTL).
+
+    Les entrées sont conservées dans un `OrderedDict` dans l'ordre du dernier
+    accès : lecture, insertion et éviction sont en O(1). Le TTL court depuis le
+    dernier accès, les entrées expirées sont donc toujours en tête et sont
+    purgées paresseusement (à la lecture et à l'insertion).
 
     Attributes:
         max_size (int): Nombre maximum d'entrées dans le cache.
@@ -42,17 +73,33 @@ class QueryCache:
         """
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._access_times: Dict[str, datetime] = {}
+        self._cache: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._access_times: Dict[Hashable, float] = {}
         self._logger = logging.getLogger(self.__class__.__name__)
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Remet à zéro les compteurs de succès, d'échecs et d'évictions."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
 
-    def _generate_key(self, agent_name: str, query_type: QueryType, query_params: Dict[str, Any]) -> str:
+    def _generate_key(self, agent_name: str, query_type: QueryType, query_params: Dict[str, Any]) -> Hashable:
         """Génère une clé de cache unique et déterministe pour une requête."""
-        import hashlib
-        import json
-        
-        content = f"{agent_name}:{query_type.value}:{json.dumps(query_params, sort_keys=True)}"
-        return hashlib.md5(content.encode()).hexdigest()
+        return make_query_key(agent_name, query_type, query_params)
+
+    def _is_expired(self, key: Hashable, now: float) -> bool:
+        return now - self._access_times[key] > self.ttl_seconds
+
+    def _purge_expired(self, now: float) -> None:
+        """Supprime les entrées expirées, toutes situées en tête de l'ordre LRU."""
+        while self._cache:
+            oldest_key = next(iter(self._cache))
+            if not self._is_expired(oldest_key, now):
+                break
+            self._remove_entry(oldest_key)
+            self.expirations += 1
     
     def get(self, agent_name: str, query_type: QueryType, query_params: Dict[str, Any]) -> Optional[QueryResult]:
         """
@@ -71,17 +118,22 @@ class QueryCache:
             valide, sinon `None`.
         """
         key = self._generate_key(agent_name, query_type, query_params)
+        now = time.monotonic()
         
         if key not in self._cache:
+            self.misses += 1
             return None
         
         # Vérification TTL
-        if datetime.now() - self._access_times[key] > timedelta(seconds=self.ttl_seconds):
-            self._remove_entry(key)
+        if self._is_expired(key, now):
+            self._purge_expired(now)
+            self.misses += 1
             return None
         
         # Mise à jour du temps d'accès
-        self._access_times[key] = datetime.now()
+        self._access_times[key] = now
+        self._cache.move_to_end(key)
+        self.hits += 1
         
         cached_data = self._cache[key]
         self._logger.debug(f"Cache HIT pour {agent_name}:{query_type.value}")
@@ -108,9 +160,11 @@ class QueryCache:
             result (QueryResult): L'objet résultat à mettre en cache.
         """
         key = self._generate_key(agent_name, query_type, query_params)
+        now = time.monotonic()
+        self._purge_expired(now)
         
         # Nettoyage si cache plein
-        if len(self._cache) >= self.max_size:
+        if key not in self._cache and len(self._cache) >= self.max_size:
             self._evict_oldest()
         
         self._cache[key] = {
@@ -120,22 +174,24 @@ class QueryCache:
             "timestamp": result.timestamp,
             "metadata": result.metadata
         }
-        self._access_times[key] = datetime.now()
+        self._cache.move_to_end(key)
+        self._access_times[key] = now
         
         self._logger.debug(f"Cache STORE pour {agent_name}:{query_type.value}")
     
-    def _remove_entry(self, key: str) -> None:
+    def _remove_entry(self, key: Hashable) -> None:
         """Supprime une entrée du cache."""
         self._cache.pop(key, None)
         self._access_times.pop(key, None)
     
     def _evict_oldest(self) -> None:
-        """Supprime l'entrée la plus ancienne."""
-        if not self._access_times:
+        """Supprime l'entrée la moins récemment utilisée."""
+        if not self._cache:
             return
         
-        oldest_key = min(self._access_times.keys(), key=lambda k: self._access_times[k])
-        self._remove_entry(oldest_key)
+        oldest_key, _ = self._cache.popitem(last=False)
+        self._access_times.pop(oldest_key, None)
+        self.evictions += 1
         self._logger.debug(f"Cache EVICTION: {oldest_key}")
     
     def clear(self) -> None:
@@ -146,18 +202,27 @@ class QueryCache:
     
     def get_stats(self) -> Dict[str, Any]:
         """Retourne les statistiques du cache."""
-        now = datetime.now()
-        expired_count = sum(
-            1 for access_time in self._access_times.values()
-            if now - access_time > timedelta(seconds=self.ttl_seconds)
-        )
+        # Les entrées expirées formant un préfixe de l'ordre LRU, le comptage
+        # s'arrête à la première entrée valide.
+        now = time.monotonic()
+        expired_count = 0
+        for key in self._cache:
+            if not self._is_expired(key, now):
+                break
+            expired_count += 1
+        lookups = self.hits + self.misses
         
         return {
             "total_entries": len(self._cache),
             "expired_entries": expired_count,
             "cache_size_limit": self.max_size,
             "ttl_seconds": self.ttl_seconds,
-            "utilization": len(self._cache) / self.max_size if self.max_size > 0 else 0.0
+            "utilization": len(self._cache) / self.max_size if self.max_size > 0 else 0.0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups > 0 else 0.0
         }
 
 
@@ -197,8 +262,12 @@ class DatasetAccessManager:
         self.successful_queries = 0
         self.denied_queries = 0
         self.cached_queries = 0
+        self.coalesced_queries = 0
         self.start_time = datetime.now()
         
+        # Requêtes en cours d'exécution, partagées par les appels identiques concurrents
+        self._inflight_queries: Dict[Hashable, asyncio.Future] = {}
+        
         self._logger.info(f"DatasetAccessManager initialisé avec dataset: {type(dataset).__name__}")
     
     async def execute_query(self, agent_name: str, query_type: QueryType, query_params: Dict[str, Any]) -> QueryResult:
@@ -209,7 +278,9 @@ class DatasetAccessManager:
         1.  Vérification des permissions via `PermissionManager`.
         2.  Tentative de récupération depuis le `QueryCache`.
         3.  Validation des paramètres de la requête.
-        4.  Exécution de la requête sur le jeu de données.
+        4.  Exécution de la requête sur le jeu de données ; les appels identiques
+            concurrents (même agent, type et paramètres) partagent une seule
+            exécution.
         5.  Filtrage des champs du résultat selon les permissions.
         6.  Mise en cache du résultat final.
         7.  Enregistrement de l'accès pour l'audit.
@@ -265,11 +336,24 @@ class DatasetAccessManager:
                     metadata={"error_type": "invalid_params"}
                 )
             
-            # Exécution de la requête sur le dataset
-            result = await self._execute_dataset_query(agent_name, query_type, query_params)
+            # Requête identique déjà en cours : partager son résultat
+            query_key = make_query_key(agent_name, query_type, query_params)
+            inflight = self._inflight_queries.get(query_key)
+            if inflight is not None:
+                self.coalesced_queries += 1
+                shared_result = await asyncio.shield(inflight)
+                if shared_result.success:
+                    self.successful_queries += 1
+                else:
+                    self.denied_queries += 1
+                self.permission_manager.log_access(agent_name, query_type, shared_result.success, "Résultat partagé avec une requête identique en cours")
+                return shared_result
             
-            # Filtrage selon permissions
-            filtered_result = self._apply_permission_filters(agent_name, result)
+            # Exécution de la requête sur le dataset et filtrage selon permissions
+            inflight = asyncio.ensure_future(self._execute_filtered_query(agent_name, query_type, query_params))
+            self._inflight_queries[query_key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight_queries.pop(query_key, None))
+            filtered_result = await asyncio.shield(inflight)
             
             # Mise en cache du résultat (seulement si succès)
             if filtered_result.success:
@@ -325,7 +409,7 @@ class DatasetAccessManager:
             return "Les paramètres doivent être un dictionnaire"
         
         return None
-    def _generate_cache_key(self, agent_name: str, query_type: QueryType, query_params: Dict[str, Any]) -> str:
+    def _generate_cache_key(self, agent_name: str, query_type: QueryType, query_params: Dict[str, Any]) -> Hashable:
         """
         Génère une clé de cache unique pour une requête.
         
@@ -337,15 +421,12 @@ class DatasetAccessManager:
         Returns:
             Clé de cache unique
         """
-        import hashlib
-        import json
-        
-        # Créer une représentation sérialisable des paramètres
-        params_str = json.dumps(query_params, sort_keys=True)
-        cache_data = f"{agent_name}:{query_type.value}:{params_str}"
-        
-        # Générer un hash pour éviter les clés trop longues
-        return hashlib.md5(cache_data.encode()).hexdigest()
+        return make_query_key(agent_name, query_type, query_params)
+    
+    async def _execute_filtered_query(self, agent_name: str, query_type: QueryType, query_params: Dict[str, Any]) -> QueryResult:
+        """Exécute la requête sur le dataset puis applique les filtres de permission."""
+        result = await self._execute_dataset_query(agent_name, query_type, query_params)
+        return self._apply_permission_filters(agent_name, result)
     
     async def _execute_dataset_query(self, agent_name: str, query_type: QueryType, query_params: Dict[str, Any]) -> QueryResult:
         """Exécute la requête sur le dataset approprié."""
@@ -488,6 +569,8 @@ class DatasetAccessManager:
                 "successful_queries": self.successful_queries,
                 "denied_queries": self.denied_queries,
                 "cached_queries": self.cached_queries,
+                "coalesced_queries": self.coalesced_queries,
+                "inflight_queries": len(self._inflight_queries),
                 "success_rate": self.successful_queries / self.total_queries if self.total_queries > 0 else 0.0,
                 "cache_hit_rate": self.cached_queries / self.total_queries if self.total_queries > 0 else 0.0,
                 "uptime_seconds": uptime,
@@ -505,8 +588,10 @@ class DatasetAccessManager:
         self.successful_queries = 0
         self.denied_queries = 0
         self.cached_queries = 0
+        self.coalesced_queries = 0
         self.start_time = datetime.now()
         self.query_cache.clear()
+        self.query_cache.reset_stats()
         self.permission_manager.reset_daily_counts()
         self._logger.info("Statistiques remises à zéro")
 
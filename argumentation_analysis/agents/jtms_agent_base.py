@@ -5,9 +5,10 @@ Selon les spécifications du RAPPORT_ARCHITECTURE_INTEGRATION_JTMS.md - AXE A
 
 import logging
 import json
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Iterable
 from datetime import datetime
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 
 import semantic_kernel as sk
 from semantic_kernel import Kernel
@@ -105,6 +106,7 @@ class JTMSSession:
         # Versioning et checkpoints
         self.version = 1
         self.checkpoints = []
+        self._batch_depth = 0
     
     def add_belief(self, name: str, agent_source: str, context: Dict = None, confidence: float = 0.0):
         """Ajoute croyance étendue à la session"""
@@ -150,6 +152,61 @@ class JTMSSession:
         self.total_inferences += 1
         self.last_modified = datetime.now()
     
+    @contextmanager
+    def batch(self):
+        """
+        Lot transactionnel : propagation et analyse des cycles du JTMS sont
+        différées jusqu'à la sortie du bloc (voir ``JTMS.batch``).
+        Si le bloc lève une exception, le JTMS est restauré et les croyances
+        étendues et ``total_inferences`` retrouvent leur état d'entrée.
+        """
+        snapshot = None
+        if self._batch_depth == 0:
+            snapshot = (dict(self.extended_beliefs), self.total_inferences,
+                        {name: (dict(belief.context), belief.confidence, len(belief.modification_history))
+                         for name, belief in self.extended_beliefs.items()})
+        self._batch_depth += 1
+        try:
+            with self.jtms.batch():
+                yield self
+        except BaseException:
+            if snapshot is not None:
+                beliefs, self.total_inferences, states = snapshot
+                self.extended_beliefs.clear()
+                self.extended_beliefs.update(beliefs)
+                for name, (context, confidence, history_length) in states.items():
+                    belief = beliefs[name]
+                    belief.context.clear()
+                    belief.context.update(context)
+                    belief.confidence = confidence
+                    del belief.modification_history[history_length:]
+            raise
+        finally:
+            self._batch_depth -= 1
+        self.last_modified = datetime.now()
+    
+    def bulk_load(self, justifications: Iterable[Dict], agent_source: str = "unknown",
+                  initial: Iterable[str] = ()) -> int:
+        """
+        Charge un ensemble de justifications (format ``{"in", "out", "conclusion"}``
+        ou ``{"in_list", "out_list", "conclusion"}``) en un seul lot et fixe à
+        vrai les croyances de ``initial``. Retourne le nombre de justifications.
+        """
+        count = 0
+        with self.batch():
+            for justification in justifications:
+                self.add_justification(
+                    justification.get("in", justification.get("in_list", [])),
+                    justification.get("out", justification.get("out_list", [])),
+                    justification["conclusion"],
+                    agent_source
+                )
+                count += 1
+            for belief_name in initial:
+                self.add_belief(belief_name, agent_source)
+                self.jtms.set_belief_validity(belief_name, True)
+        return count
+    
     def explain_belief(self, belief_name: str) -> str:
         """Explication enrichie avec contexte agent"""
         if belief_name not in self.extended_beliefs:
@@ -383,6 +440,17 @@ class JTMSAgentBase(ABC):
         
         other_beliefs = other_agent_state.get("beliefs", {})
         
+        with self._jtms_session.batch():
+            self._import_beliefs(other_beliefs, conflict_resolution, import_report)
+        
+        self._logger.info(f"Import terminé: {len(import_report['imported_beliefs'])} importées, "
+                         f"{len(import_report['conflicts'])} conflits, "
+                         f"{len(import_report['skipped'])} ignorées")
+        
+        return import_report
+    
+    def _import_beliefs(self, other_beliefs: Dict, conflict_resolution: str, import_report: Dict) -> None:
+        """Importe les croyances une à une (appelé dans un lot de session)"""
         for belief_name, belief_data in other_beliefs.items():
             try:
                 if belief_name in self._jtms_session.extended_beliefs:
@@ -421,12 +489,6 @@ class JTMSAgentBase(ABC):
             except Exception as e:
                 self._logger.error(f"Erreur import croyance '{belief_name}': {e}")
                 import_report["skipped"].append(belief_name)
-        
-        self._logger.info(f"Import terminé: {len(import_report['imported_beliefs'])} importées, "
-                         f"{len(import_report['conflicts'])} conflits, "
-                         f"{len(import_report['skipped'])} ignorées")
-        
-        return import_report
     
     # === MÉTHODES ABSTRAITES POUR SPÉCIALISATION ===
     
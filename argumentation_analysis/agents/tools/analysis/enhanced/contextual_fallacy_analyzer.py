@@ -42,6 +42,7 @@ from argumentation_analysis.agents.tools.analysis.contextual_fallacy_analyzer im
 
 # Importations pour les modèles de langage avancés
 from argumentation_analysis.paths import DATA_DIR
+from argumentation_analysis.agents.tools.analysis.enhanced.nlp_model_manager import nlp_model_manager
 
 # Importations pour les modèles de langage avancés, avec fallback
 try:
@@ -130,6 +131,12 @@ class EnhancedContextualFallacyAnalyzer(BaseAnalyzer):
         # Cette modification permet de débloquer les tests fonctionnels qui ne dépendent
         # pas directement de ces modèles.
         # TODO: Rétablir le chargement, potentiellement conditionné par une variable d'environnement.
+        # Les modèles déjà chargés par le gestionnaire partagé sont en revanche utilisés.
+        if nlp_model_manager.are_models_loaded():
+            models = {name: nlp_model_manager.get_model(name) for name in ("sentiment", "ner")}
+            if all(models.values()):
+                self.logger.info("Utilisation des modèles NLP du gestionnaire partagé.")
+                return models
         self.logger.warning("CHARGEMENT DES MODÈLES NLP DÉSACTIVÉ TEMPORAIREMENT POUR LES TESTS.")
         return {}
     
@@ -308,6 +315,19 @@ class EnhancedContextualFallacyAnalyzer(BaseAnalyzer):
         
         return context_analysis
     
+    def _infer_sentences(self, model_name: str, sentences: List[str]) -> List[Any]:
+        """
+        Applique un modèle à plusieurs phrases.
+
+        Les modèles du gestionnaire partagé passent par sa file de micro-batching
+        (un batch pour toutes les phrases et tous les appelants concurrents) ;
+        les autres sont appelés phrase par phrase.
+        """
+        model = self.nlp_models[model_name]
+        if nlp_model_manager.are_models_loaded() and model is nlp_model_manager.get_model(model_name):
+            return nlp_model_manager.infer(model_name, sentences)
+        return [model(sentence) for sentence in sentences]
+
     def _identify_potential_fallacies_with_nlp(self, text: str) -> List[Dict[str, Any]]:
         """
         Identifie les sophismes potentiels dans un texte en utilisant des techniques de NLP.
@@ -325,14 +345,14 @@ class EnhancedContextualFallacyAnalyzer(BaseAnalyzer):
         if HAS_TRANSFORMERS and self.nlp_models:
             try:
                 # Diviser le texte en phrases pour une analyse plus précise
-                sentences = text.split(". ")
+                sentences = [sentence for sentence in text.split(". ") if sentence.strip()]
                 
-                for i, sentence in enumerate(sentences):
-                    if not sentence.strip():
-                        continue
-                    
+                # Sentiment et entités de toutes les phrases, calculés par batch
+                sentiment_results = self._infer_sentences("sentiment", sentences)
+                all_ner_results = self._infer_sentences("ner", sentences)
+                
+                for sentence, sentiment_result, ner_results in zip(sentences, sentiment_results, all_ner_results):
                     # Analyser le sentiment pour détecter les appels à l'émotion
-                    sentiment_result = self.nlp_models["sentiment"](sentence)
                     sentiment = sentiment_result[0]["label"]
                     sentiment_score = sentiment_result[0]["score"]
                     
@@ -349,7 +369,6 @@ class EnhancedContextualFallacyAnalyzer(BaseAnalyzer):
                             })
                     
                     # Extraire les entités nommées pour détecter les appels à l'autorité
-                    ner_results = self.nlp_models["ner"](sentence)
                     person_entities = [entity for entity in ner_results if entity["entity"] in ["B-PER", "I-PER"]]
                     
                     if person_entities and ("expert" in sentence.lower() or "autorité" in sentence.lower() or "scientifique" in sentence.lower()):
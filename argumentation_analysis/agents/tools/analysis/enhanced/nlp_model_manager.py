@@ -13,11 +13,20 @@ Son rôle est de :
 - Centraliser la configuration des noms de modèles utilisés.
 - Fournir une interface thread-safe pour le chargement et l'accès aux modèles.
 - Gérer gracieusement l'absence de la bibliothèque `transformers`.
+- Regrouper les inférences de tous les appelants en micro-batchs (voir
+  `BatchingInferenceQueue`), avec un cache LRU des résultats par phrase.
 """
 
+import copy
+import hashlib
 import logging
 import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
 from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
@@ -42,6 +51,144 @@ TEXT_CLASSIFICATION_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
 NER_MODEL = "dbmdz/bert-large-cased-finetuned-conll03-english"
 TEXT_GENERATION_MODEL = "gpt2"
 
+# --- Paramètres par défaut du micro-batching ---
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_BATCH_WINDOW_MS = 5.0
+DEFAULT_CACHE_SIZE = 4096
+
+
+def _sentence_key(sentence: str) -> str:
+    return hashlib.sha256(sentence.encode("utf-8")).hexdigest()
+
+
+class BatchingInferenceQueue:
+    """
+    File d'inférence à micro-batching pour un pipeline Hugging Face.
+
+    Les phrases soumises par tous les appelants sont collectées pendant une
+    courte fenêtre (`batch_window_ms`, ou jusqu'à `max_batch_size` phrases),
+    puis passées en un seul appel au pipeline, qui les complète (padding) et
+    les traite comme un batch. Chaque appelant reçoit un `Future` résolu avec
+    le résultat de sa phrase, sous la même forme qu'un appel du pipeline sur
+    une phrase seule.
+
+    - Les résultats sont gardés dans un cache LRU indexé par le hash de la
+      phrase ; une phrase déjà en attente n'est soumise qu'une fois.
+    - Chaque `Future` reçoit sa propre copie du résultat : un appelant peut la
+      modifier sans altérer le cache ni le résultat des autres appelants.
+    - Une erreur du pipeline est propagée à tous les `Future` du batch.
+    """
+
+    def __init__(self, name: str, model: Callable, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 batch_window_ms: float = DEFAULT_BATCH_WINDOW_MS, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.name = name
+        self.model = model
+        self.max_batch_size = max(1, max_batch_size)
+        self.batch_window = max(0.0, batch_window_ms) / 1000.0
+        self.cache_size = cache_size
+        self._pending: "deque[tuple]" = deque()
+        self._in_flight: Dict[str, List[Future]] = {}
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._condition = threading.Condition()
+        self._closed = False
+        self.stats = {"requests": 0, "cache_hits": 0, "coalesced": 0, "batches": 0,
+                      "batched_sentences": 0, "largest_batch": 0, "failed_batches": 0}
+        self._worker = threading.Thread(target=self._run, name=f"nlp-batch-{name}", daemon=True)
+        self._worker.start()
+
+    def submit(self, sentence: str) -> Future:
+        """Soumet une phrase et retourne le `Future` de son résultat."""
+        key = _sentence_key(sentence)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError(f"La file d'inférence '{self.name}' est fermée.")
+            self.stats["requests"] += 1
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.stats["cache_hits"] += 1
+                future = Future()
+                future.set_result(copy.deepcopy(self._cache[key]))
+                return future
+            future = Future()
+            waiting = self._in_flight.get(key)
+            if waiting is not None:
+                self.stats["coalesced"] += 1
+                waiting.append(future)
+                return future
+            self._in_flight[key] = [future]
+            self._pending.append((key, sentence))
+            self._condition.notify()
+            return future
+
+    def _next_batch(self) -> Optional[List[tuple]]:
+        with self._condition:
+            while not self._pending and not self._closed:
+                self._condition.wait()
+            if not self._pending:
+                return None
+            # Fenêtre de collecte ouverte par la première phrase en attente
+            deadline = time.monotonic() + self.batch_window
+            while len(self._pending) < self.max_batch_size and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            size = min(self.max_batch_size, len(self._pending))
+            return [self._pending.popleft() for _ in range(size)]
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._process(batch)
+
+    def _process(self, batch: List[tuple]) -> None:
+        sentences = [sentence for _, sentence in batch]
+        try:
+            outputs = self.model(sentences, batch_size=len(sentences))
+            if len(outputs) != len(sentences):
+                raise RuntimeError(f"Le pipeline '{self.name}' a retourné {len(outputs)} résultats "
+                                   f"pour {len(sentences)} phrases.")
+        except Exception as e:
+            logger.error(f"Erreur d'inférence du modèle '{self.name}' sur un batch de {len(sentences)} phrases : {e}")
+            with self._condition:
+                self.stats["failed_batches"] += 1
+                futures = [future for key, _ in batch for future in self._in_flight.pop(key)]
+            for future in futures:
+                future.set_exception(e)
+            return
+
+        with self._condition:
+            self.stats["batches"] += 1
+            self.stats["batched_sentences"] += len(sentences)
+            self.stats["largest_batch"] = max(self.stats["largest_batch"], len(sentences))
+            resolved = []
+            for (key, _), output in zip(batch, outputs):
+                # Un pipeline appelé sur une liste retourne, pour la classification,
+                # un dictionnaire par phrase au lieu d'une liste d'un élément
+                result = output if isinstance(output, list) else [output]
+                if self.cache_size > 0:
+                    self._cache[key] = copy.deepcopy(result)
+                resolved.append((self._in_flight.pop(key), result))
+            while len(self._cache) > max(0, self.cache_size):
+                self._cache.popitem(last=False)
+        for futures, result in resolved:
+            futures[0].set_result(result)
+            for future in futures[1:]:
+                future.set_result(copy.deepcopy(result))
+
+    def clear_cache(self) -> None:
+        with self._condition:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Traite les phrases encore en attente puis arrête le thread de la file."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join()
+
 
 class NLPModelManager:
     """
@@ -56,12 +203,18 @@ class NLPModelManager:
        Le constructeur est non-bloquant.
     2. Le chargement réel est déclenché par l'appel à `load_models_sync()`.
        Cette méthode est bloquante et doit être gérée avec soin.
-    3. Les modèles sont ensuite accessibles via `get_model(model_name)`.
+    3. Les modèles sont ensuite accessibles via `get_model(model_name)`, ou
+       utilisés à travers la file de micro-batching avec `infer(...)`,
+       `submit(...)` ou la coroutine `infer_many(...)`.
     """
     _instance = None
     _lock = Lock()
     _models = {}
     _models_loaded = False
+    _queues: Dict[str, BatchingInferenceQueue] = {}
+    _batching_config = {"max_batch_size": DEFAULT_MAX_BATCH_SIZE,
+                        "batch_window_ms": DEFAULT_BATCH_WINDOW_MS,
+                        "cache_size": DEFAULT_CACHE_SIZE}
 
     def __new__(cls):
         if cls._instance is None:
@@ -137,5 +290,68 @@ class NLPModelManager:
         """Vérifie si les modèles sont chargés."""
         return self._models_loaded
 
+    # --- Inférence par micro-batchs ---
+
+    def configure_batching(self, max_batch_size: Optional[int] = None, batch_window_ms: Optional[float] = None,
+                           cache_size: Optional[int] = None):
+        """
+        Modifie les paramètres du micro-batching. Les files existantes sont
+        fermées et recréées avec les nouveaux paramètres au prochain appel.
+        """
+        updates = {"max_batch_size": max_batch_size, "batch_window_ms": batch_window_ms, "cache_size": cache_size}
+        with self._lock:
+            self._batching_config.update({k: v for k, v in updates.items() if v is not None})
+        self.shutdown()
+
+    def _get_queue(self, model_name: str) -> BatchingInferenceQueue:
+        with self._lock:
+            model = self._models.get(model_name) if self._models_loaded else None
+            if model is None:
+                raise RuntimeError(f"Le modèle NLP '{model_name}' n'est pas chargé.")
+            queue = self._queues.get(model_name)
+            if queue is None or queue.model is not model:
+                if queue is not None:
+                    queue.close()
+                queue = BatchingInferenceQueue(model_name, model, **self._batching_config)
+                self._queues[model_name] = queue
+            return queue
+
+    def submit(self, model_name: str, sentences: Sequence[str]) -> List[Future]:
+        """
+        Soumet des phrases à la file du modèle et retourne un `Future` par phrase.
+
+        Raises:
+            RuntimeError: Si le modèle n'est pas chargé.
+        """
+        queue = self._get_queue(model_name)
+        return [queue.submit(sentence) for sentence in sentences]
+
+    def infer(self, model_name: str, sentences: Sequence[str]) -> List[Any]:
+        """
+        Résultats du modèle pour chaque phrase, calculés par micro-batchs
+        partagés avec les autres appelants. Bloquant.
+
+        Chaque résultat a la forme d'un appel du pipeline sur la phrase seule.
+        """
+        return [future.result() for future in self.submit(model_name, sentences)]
+
+    async def infer_many(self, model_name: str, sentences: Sequence[str]) -> List[Any]:
+        """Version asynchrone de `infer`, qui n'occupe pas la boucle d'événements."""
+        futures = [asyncio.wrap_future(future) for future in self.submit(model_name, sentences)]
+        return list(await asyncio.gather(*futures))
+
+    def get_inference_stats(self) -> Dict[str, Dict[str, int]]:
+        """Statistiques des files d'inférence (batchs, hits du cache...), par modèle."""
+        with self._lock:
+            queues = dict(self._queues)
+        return {name: dict(queue.stats) for name, queue in queues.items()}
+
+    def shutdown(self):
+        """Ferme les files d'inférence (les modèles restent chargés)."""
+        with self._lock:
+            queues, self._queues = list(self._queues.values()), {}
+        for queue in queues:
+            queue.close()
+
 # L'instance sera maintenant gérée par l'application principale
 nlp_model_manager = NLPModelManager()
\ No newline at end of file
@@ -78,6 +78,10 @@ class JVMSettings(BaseSettings):
     tweety_version: str = "1.28"
     tweety_libs_dir: Path = Path("libs/tweety")
     native_libs_dir: Path = Path("libs/native")
+    # Raisonnement Tweety hors processus : nombre de workers hébergeant chacun une JVM
+    # (0 : JVM dans le processus courant) et délai maximal d'une requête en secondes
+    tweety_workers: int = 0
+    tweety_worker_timeout: float = 120.0
 
     azure_openai: AzureOpenAISettings = AzureOpenAISettings()
     model_config = SettingsConfigDict(env_prefix='JVM_')
@@ -260,7 +260,11 @@ def initialize_project_environment(env_path_str: str = None, root_path_str: str
 
     # Utiliser un attribut sur le module `sys` pour un état vraiment global
     # qui survit au rechargement de module par Uvicorn.
-    if hasattr(sys, '_jvm_initialized') and sys._jvm_initialized:
+    if settings and settings.jvm.tweety_workers > 0:
+        # Les reasoners Tweety tournent dans le pool de workers : pas de JVM dans ce processus
+        logger.info(f"Pool de {settings.jvm.tweety_workers} worker(s) Tweety configuré : la JVM n'est pas démarrée dans ce processus.")
+        context.jvm_initialized = False
+    elif hasattr(sys, '_jvm_initialized') and sys._jvm_initialized:
         logger.info("JVM déjà initialisée dans ce processus (détecté via sys._jvm_initialized). On saute la ré-initialisation.")
         context.jvm_initialized = True
     else:
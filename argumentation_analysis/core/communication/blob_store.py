@@ -0,0 +1,358 @@
+"""
+Stockage adressé par contenu des données volumineuses du canal de données.
+
+Chaque contenu binaire (blob) est identifié par l'empreinte SHA-256 de ses
+octets : des versions identiques partagent le même blob, compté par
+références. Les blobs sont éventuellement compressés (zstd ou lz4 s'ils sont
+installés, gzip sinon) et conservés en mémoire dans la limite d'un budget ;
+au-delà, les moins récemment utilisés sont déplacés dans un fichier segment
+sur disque et rechargés à la demande.
+"""
+
+import io
+import gzip
+import zlib
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Iterator, Union
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+
+logger = logging.getLogger(__name__)
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Le segment est réécrit quand l'espace mort dépasse l'espace utile et ce seuil
+COMPACTION_MIN_DEAD_BYTES = 1024 * 1024
+
+
+def available_codecs() -> Dict[str, bool]:
+    """Codecs de compression utilisables dans cet environnement."""
+    return {"none": True, "gzip": True, "zstd": zstandard is not None, "lz4": lz4_frame is not None}
+
+
+def _resolve_codec(codec: str) -> str:
+    if codec == "auto":
+        if zstandard is not None:
+            return "zstd"
+        if lz4_frame is not None:
+            return "lz4"
+        return "gzip"
+    if not available_codecs().get(codec):
+        raise ValueError(f"Compression codec '{codec}' is not available "
+                         f"(available: {', '.join(c for c, ok in available_codecs().items() if ok)})")
+    return codec
+
+
+def _compress(codec: str, payload: BytesLike) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor().compress(payload)
+    if codec == "lz4":
+        return lz4_frame.compress(payload)
+    return gzip.compress(payload, compresslevel=6)
+
+
+def _decompressor(codec: str):
+    """Décompresseur incrémental exposant ``decompress(chunk)``."""
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompressobj()
+    if codec == "lz4":
+        return lz4_frame.LZ4FrameDecompressor()
+    return zlib.decompressobj(wbits=31)  # Format gzip
+
+
+def _decompress(codec: str, payload: BytesLike) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(payload)
+    if codec == "lz4":
+        return lz4_frame.decompress(payload)
+    return gzip.decompress(payload)
+
+
+class _Blob:
+    """Entrée du stockage : octets stockés en mémoire et/ou position dans le segment."""
+
+    __slots__ = ("digest", "codec", "size", "stored_size", "refcount", "data", "offset")
+
+    def __init__(self, digest: str, codec: str, size: int, data: bytes):
+        self.digest = digest
+        self.codec = codec
+        self.size = size
+        self.stored_size = len(data)
+        self.refcount = 0
+        self.data: Optional[bytes] = data
+        self.offset: Optional[int] = None
+
+
+class BlobStore:
+    """
+    Stockage de blobs adressés par leur empreinte SHA-256.
+
+    Les blobs identiques sont dédupliqués et comptés par références
+    (``put``/``release``). ``get`` retourne un ``memoryview`` en lecture seule :
+    sans copie pour un blob non compressé présent en mémoire. ``open_stream``
+    lit un blob par morceaux, en décompressant au fil de l'eau, sans le
+    charger entièrement.
+    """
+
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET, codec: str = "auto",
+                 compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+                 spill_dir: Optional[str] = None):
+        """
+        Initialise le stockage.
+
+        Args:
+            memory_budget: Taille maximale en octets des blobs gardés en mémoire
+            codec: Codec de compression ("auto", "zstd", "lz4", "gzip" ou "none")
+            compression_threshold: Taille en dessous de laquelle les blobs ne sont pas compressés
+            spill_dir: Répertoire du fichier segment (répertoire temporaire par défaut)
+        """
+        self.memory_budget = memory_budget
+        self.codec = _resolve_codec(codec)
+        self.compression_threshold = compression_threshold
+        self.spill_dir = spill_dir
+        self.blobs: Dict[str, _Blob] = {}
+        self._resident: "OrderedDict[str, _Blob]" = OrderedDict()  # Ordre LRU des blobs en mémoire
+        self._memory_used = 0
+        self._segment = None
+        self._segment_live = 0
+        self._segment_dead = 0
+        self.lock = threading.RLock()
+        self.stats = {"puts": 0, "deduplicated": 0, "spilled": 0, "loaded": 0, "compactions": 0}
+
+    def put(self, payload: BytesLike, compress: bool = True) -> str:
+        """
+        Ajoute un contenu (ou une référence s'il est déjà présent).
+
+        Args:
+            payload: Les octets à stocker
+            compress: Autorise la compression du contenu
+
+        Returns:
+            L'empreinte SHA-256 du contenu
+        """
+        digest = hashlib.sha256(payload).hexdigest()
+        with self.lock:
+            self.stats["puts"] += 1
+            blob = self.blobs.get(digest)
+            if blob is not None:
+                blob.refcount += 1
+                self.stats["deduplicated"] += 1
+                return digest
+
+        size = len(payload) if not isinstance(payload, memoryview) else payload.nbytes
+        codec, data = "none", None
+        if compress and self.codec != "none" and size >= self.compression_threshold:
+            compressed = _compress(self.codec, payload)
+            if len(compressed) < size:
+                codec, data = self.codec, compressed
+        if data is None:
+            data = payload if isinstance(payload, bytes) else bytes(payload)
+
+        with self.lock:
+            blob = self.blobs.get(digest)
+            if blob is None:  # Pas d'insertion concurrente du même contenu pendant la compression
+                blob = _Blob(digest, codec, size, data)
+                self.blobs[digest] = blob
+                self._make_resident(blob)
+            blob.refcount += 1
+            return digest
+
+    def get(self, digest: str) -> memoryview:
+        """
+        Retourne le contenu d'un blob.
+
+        Raises:
+            KeyError: Si le blob n'existe pas
+        """
+        with self.lock:
+            blob = self._blob(digest)
+            data = self._load(blob)
+        if blob.codec == "none":
+            return memoryview(data)
+        return memoryview(_decompress(blob.codec, data))
+
+    def open_stream(self, digest: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[memoryview]:
+        """
+        Lit un blob par morceaux d'au plus ``chunk_size`` octets.
+
+        Un blob présent sur disque est lu par morceaux sans être rechargé en
+        mémoire ; un blob compressé est décompressé au fil de la lecture.
+
+        Raises:
+            KeyError: Si le blob n'existe pas (à la création de l'itérateur)
+        """
+        with self.lock:
+            blob = self._blob(digest)
+            data = blob.data
+            if data is not None:
+                self._resident.move_to_end(digest)
+            # Le segment est capturé : une compaction ultérieure en crée un nouveau
+            segment, offset = self._segment, blob.offset
+        return self._iter_stream(blob.codec, blob.stored_size, data, segment, offset, chunk_size)
+
+    def release(self, digest: str) -> bool:
+        """
+        Retire une référence à un blob et le supprime quand il n'est plus référencé.
+
+        Returns:
+            True si le blob existait
+        """
+        with self.lock:
+            blob = self.blobs.get(digest)
+            if blob is None:
+                return False
+            blob.refcount -= 1
+            if blob.refcount > 0:
+                return True
+            del self.blobs[digest]
+            if blob.data is not None:
+                self._resident.pop(digest, None)
+                self._memory_used -= blob.stored_size
+            if blob.offset is not None:
+                self._segment_live -= blob.stored_size
+                self._segment_dead += blob.stored_size
+                self._maybe_compact()
+            return True
+
+    def info(self, digest: str) -> Optional[Dict[str, Any]]:
+        """Informations sur un blob (taille, codec, références, emplacement)."""
+        with self.lock:
+            blob = self.blobs.get(digest)
+            if blob is None:
+                return None
+            return {
+                "digest": digest,
+                "codec": blob.codec,
+                "size": blob.size,
+                "stored_size": blob.stored_size,
+                "refcount": blob.refcount,
+                "in_memory": blob.data is not None,
+                "on_disk": blob.offset is not None
+            }
+
+    def get_store_info(self) -> Dict[str, Any]:
+        """Occupation mémoire et disque du stockage."""
+        with self.lock:
+            return {
+                "blob_count": len(self.blobs),
+                "codec": self.codec,
+                "memory_budget": self.memory_budget,
+                "memory_used": self._memory_used,
+                "segment_live_bytes": self._segment_live,
+                "segment_dead_bytes": self._segment_dead,
+                **self.stats
+            }
+
+    def close(self) -> None:
+        """Libère tous les blobs et ferme le fichier segment."""
+        with self.lock:
+            self.blobs.clear()
+            self._resident.clear()
+            self._memory_used = 0
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
+            self._segment_live = self._segment_dead = 0
+
+    def _blob(self, digest: str) -> _Blob:
+        blob = self.blobs.get(digest)
+        if blob is None:
+            raise KeyError(f"Blob {digest} not found")
+        return blob
+
+    def _load(self, blob: _Blob) -> bytes:
+        """Octets stockés d'un blob, rechargés depuis le segment si nécessaire (verrou détenu)."""
+        if blob.data is not None:
+            self._resident.move_to_end(blob.digest)
+            return blob.data
+        self._segment.seek(blob.offset)
+        data = self._segment.read(blob.stored_size)
+        self.stats["loaded"] += 1
+        blob.data = data
+        self._make_resident(blob)
+        return data
+
+    def _make_resident(self, blob: _Blob) -> None:
+        """Place un blob en mémoire et déplace les moins récemment utilisés vers le segment (verrou détenu)."""
+        self._resident[blob.digest] = blob
+        self._memory_used += blob.stored_size
+        while self._memory_used > self.memory_budget and self._resident:
+            _, victim = self._resident.popitem(last=False)
+            if victim.offset is None:
+                self._spill(victim)
+            self._memory_used -= victim.stored_size
+            victim.data = None
+
+    def _spill(self, blob: _Blob) -> None:
+        if self._segment is None:
+            self._segment = tempfile.TemporaryFile(prefix="datastore-segment-", dir=self.spill_dir)
+        self._segment.seek(0, io.SEEK_END)
+        blob.offset = self._segment.tell()
+        self._segment.write(blob.data)
+        self._segment_live += blob.stored_size
+        self.stats["spilled"] += 1
+
+    def _maybe_compact(self) -> None:
+        """Réécrit le segment sans l'espace mort (verrou détenu)."""
+        if self._segment_dead < COMPACTION_MIN_DEAD_BYTES or self._segment_dead < self._segment_live:
+            return
+        old_segment = self._segment
+        self._segment = tempfile.TemporaryFile(prefix="datastore-segment-", dir=self.spill_dir)
+        for blob in self.blobs.values():
+            if blob.offset is None:
+                continue
+            old_segment.seek(blob.offset)
+            data = old_segment.read(blob.stored_size)
+            blob.offset = self._segment.tell()
+            self._segment.write(data)
+        # L'ancien segment est fermé quand les flux en cours ne le référencent plus
+        self._segment_dead = 0
+        self.stats["compactions"] += 1
+
+    def _iter_stream(self, codec: str, stored_size: int, data: Optional[bytes], segment,
+                     offset: Optional[int], chunk_size: int) -> Iterator[memoryview]:
+        if data is not None:
+            raw_chunks = (memoryview(data)[i:i + chunk_size] for i in range(0, stored_size, chunk_size))
+        else:
+            raw_chunks = self._read_segment(segment, offset, stored_size, chunk_size)
+
+        if codec == "none":
+            yield from raw_chunks
+            return
+
+        decompressor = _decompressor(codec)
+        for chunk in raw_chunks:
+            output = decompressor.decompress(chunk)
+            for i in range(0, len(output), chunk_size):
+                yield memoryview(output)[i:i + chunk_size]
+        flush = getattr(decompressor, "flush", None)
+        tail = flush() if flush is not None else b""
+        if tail:
+            yield memoryview(tail)
+
+    def _read_segment(self, segment, offset: int, stored_size: int, chunk_size: int) -> Iterator[bytes]:
+        position, end = offset, offset + stored_size
+        while position < end:
+            with self.lock:
+                segment.seek(position)
+                chunk = segment.read(min(chunk_size, end - position))
+            if not chunk:
+                raise IOError("Unexpected end of data segment")
+            position += len(chunk)
+            yield chunk
@@ -42,7 +42,12 @@ class Channel(abc.ABC):
         config (Dict[str, Any]): Dictionnaire de configuration pour le canal.
         subscribers (Dict[str, Dict]): Dictionnaire des abonnés au canal.
         _message_queue (List[Message]): File d'attente de messages en mémoire.
+        notifies_delivery (bool): True si le canal appelle `_signal_delivery` à
+            chaque message déposé ; le middleware peut alors attendre sans
+            interroger périodiquement le canal.
     """
+
+    notifies_delivery = False
     
     def __init__(self, channel_id: str, channel_type: ChannelType, config: Optional[Dict[str, Any]] = None):
         self.id = channel_id
@@ -50,6 +55,20 @@ class Channel(abc.ABC):
         self.config = config or {}
         self.subscribers: Dict[str, Dict[str, Any]] = {} # subscriber_id -> {"callback": callback, "filter": filter}
         self._message_queue: List[Message] = [] # Simple file d'attente en mémoire pour LocalChannel
+        self._delivery_listeners: List[Callable[[str], None]] = []
+    
+    def add_delivery_listener(self, listener: Callable[[str], None]) -> None:
+        """Enregistre une fonction appelée avec l'identifiant du destinataire de chaque message déposé."""
+        self._delivery_listeners.append(listener)
+    
+    def _signal_delivery(self, *recipient_ids: str) -> None:
+        """Signale aux écouteurs qu'un message est disponible pour ces destinataires."""
+        for listener in list(self._delivery_listeners):
+            for recipient_id in recipient_ids:
+                try:
+                    listener(recipient_id)
+                except Exception as e:
+                    logger_channel.error(f"Canal '{self.id}': Erreur lors de la signalisation pour {recipient_id}: {e}")
     
     @abc.abstractmethod
     def send_message(self, message: Message) -> bool:
@@ -123,6 +142,8 @@ class LocalChannel(Channel):
     Le mécanisme de souscription notifie les abonnés de manière synchrone lorsqu'un
     message correspondant à leurs filtres est envoyé.
     """
+    notifies_delivery = True
+
     def __init__(self, channel_id: str, middleware: Optional[Any] = None, config: Optional[Dict[str, Any]] = None):
         # Le middleware n'est pas directement utilisé par ce canal simple, mais l'API est conservée.
         # Le type est défini comme LOCAL.
@@ -137,6 +158,7 @@ class LocalChannel(Channel):
         
         # Version simple: ajouter à une file et notifier les abonnés qui correspondent au filtre
         self._message_queue.append(message) # Pour receive_message
+        self._signal_delivery(message.recipient, "*")
         
         for sub_id, sub_info in list(self.subscribers.items()): # list() pour permettre la désinscription pendant l'itération
             callback = sub_info.get("callback")
@@ -144,6 +144,8 @@ class CollaborationChannel(Channel):
     Ce canal supporte les communications many-to-many, la création de groupes
     de collaboration et le partage de contexte entre agents.
     """
+
+    notifies_delivery = True
     
     def __init__(self, channel_id: str, config: Optional[Dict[str, Any]] = None):
         """
@@ -233,6 +235,7 @@ class CollaborationChannel(Channel):
             
             # Ajouter le message à l'historique du groupe
             group.add_message(message)
+            self._signal_delivery(*(member for member in group.members if member != message.sender))
             
             # Mettre à jour les statistiques
             self.stats["messages_sent"] += 1
@@ -267,6 +270,7 @@ class CollaborationChannel(Channel):
                 "timestamp": datetime.now(),
                 "read": False
             })
+            self._signal_delivery(message.recipient)
             
             # Mettre à jour les statistiques
             self.stats["messages_sent"] += 1
@@ -10,14 +10,14 @@ import uuid
 import threading
 import logging
 import json
-import gzip
-import base64
-from typing import Dict, Any, Optional, List, Callable, Set, Tuple
+import codecs
+from typing import Dict, Any, Optional, List, Callable, Set, Tuple, Iterator, Union
 from datetime import datetime
 from collections import defaultdict
 
 from .channel_interface import Channel, ChannelType, ChannelException
 from .message import Message, MessageType, MessagePriority, AgentLevel
+from .blob_store import BlobStore, DEFAULT_MEMORY_BUDGET, DEFAULT_COMPRESSION_THRESHOLD, DEFAULT_CHUNK_SIZE
 
 from argumentation_analysis.paths import DATA_DIR
 
@@ -27,8 +27,16 @@ class DataStore:
     """
     Stockage de données pour le canal de données.
     
-    Cette classe gère le stockage et la récupération des données volumineuses,
-    avec support pour la compression, le versionnement et le streaming.
+    Cette classe gère le versionnement des données volumineuses. Le contenu
+    sérialisé de chaque version est confié à un `BlobStore` adressé par
+    contenu : les versions identiques partagent le même blob, la compression
+    est optionnelle (zstd, lz4 ou gzip) et les blobs peu utilisés sont déplacés
+    sur disque au-delà du budget mémoire.
+    
+    Configuration reconnue : ``memory_budget``, ``compression`` (codec,
+    "auto" par défaut), ``compression_threshold``, ``spill_dir`` et
+    ``max_versions`` (nombre de versions conservées par élément, illimité
+    par défaut).
     """
     
     def __init__(self, store_id: str, config: Optional[Dict[str, Any]] = None):
@@ -43,6 +51,13 @@ class DataStore:
         self.config = config or {}
         self.data_items = {}  # Dictionnaire des éléments de données par ID
         self.versions = defaultdict(list)  # Historique des versions par ID de données
+        self.max_versions = self.config.get("max_versions")
+        self.blobs = BlobStore(
+            memory_budget=self.config.get("memory_budget", DEFAULT_MEMORY_BUDGET),
+            codec=self.config.get("compression", "auto"),
+            compression_threshold=self.config.get("compression_threshold", DEFAULT_COMPRESSION_THRESHOLD),
+            spill_dir=self.config.get("spill_dir")
+        )
         self.lock = threading.RLock()
         self.logger = logging.getLogger(f"DataStore.{store_id}")
     
@@ -51,6 +66,9 @@ class DataStore:
         """
         Stocke un élément de données.
         
+        Les données binaires (bytes, bytearray, memoryview) sont stockées
+        telles quelles ; les autres sont sérialisées en JSON.
+        
         Args:
             data_id: Identifiant de l'élément de données
             data: Les données à stocker
@@ -62,36 +80,39 @@ class DataStore:
         """
         version_id = f"v-{uuid.uuid4().hex[:8]}"
         
+        # Sérialiser les données
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            payload, encoding = data, "binary"
+        else:
+            payload, encoding = self._serialize_data(data).encode('utf-8'), "json"
+        
+        # Le contenu est haché et compressé hors du verrou du stockage
+        digest = self.blobs.put(payload, compress=compress)
+        blob_info = self.blobs.info(digest)
+        
         with self.lock:
-            # Sérialiser les données
-            serialized_data = self._serialize_data(data)
-            
-            # Compresser les données si nécessaire
-            if compress and len(serialized_data) > 1024:  # Seuil de compression
-                compressed_data = gzip.compress(serialized_data.encode('utf-8'))
-                data_content = base64.b64encode(compressed_data).decode('utf-8')
-                is_compressed = True
-            else:
-                data_content = serialized_data
-                is_compressed = False
-            
             # Créer l'élément de données
             data_item = {
                 "id": data_id,
                 "version_id": version_id,
-                "content": data_content,
+                "digest": digest,
+                "encoding": encoding,
                 "metadata": metadata or {},
-                "is_compressed": is_compressed,
-                "size": len(serialized_data),
-                "compressed_size": len(data_content) if is_compressed else None,
+                "codec": blob_info["codec"],
+                "is_compressed": blob_info["codec"] != "none",
+                "size": blob_info["size"],
+                "compressed_size": blob_info["stored_size"] if blob_info["codec"] != "none" else None,
                 "created_at": datetime.now().isoformat()
             }
             
             # Stocker l'élément de données
             self.data_items[f"{data_id}:{version_id}"] = data_item
             
-            # Ajouter la version à l'historique
+            # Ajouter la version à l'historique et oublier les plus anciennes
             self.versions[data_id].append(version_id)
+            if self.max_versions is not None:
+                while len(self.versions[data_id]) > self.max_versions:
+                    self._remove_version(data_id, self.versions[data_id][0])
             
             self.logger.info(f"Data item {data_id} stored with version {version_id}")
             return version_id
@@ -105,39 +126,60 @@ class DataStore:
             version_id: Identifiant de version (None pour la dernière version)
             
         Returns:
-            Un tuple (données, métadonnées)
+            Un tuple (données, métadonnées) ; les données binaires sont retournées en bytes
             
         Raises:
             KeyError: Si l'élément de données n'existe pas
         """
-        with self.lock:
-            # Déterminer la version à récupérer
-            if version_id is None:
-                if data_id not in self.versions or not self.versions[data_id]:
-                    raise KeyError(f"Data item {data_id} not found")
-                
-                version_id = self.versions[data_id][-1]  # Dernière version
-            
-            # Récupérer l'élément de données
-            item_key = f"{data_id}:{version_id}"
-            if item_key not in self.data_items:
-                raise KeyError(f"Data item {data_id} with version {version_id} not found")
+        view, data_item = self._get_view(data_id, version_id)
+        
+        if data_item["encoding"] == "binary":
+            data = view.tobytes()
+        else:
+            data = self._deserialize_data(view)
+        
+        self.logger.info(f"Data item {data_id} with version {data_item['version_id']} retrieved")
+        return data, data_item["metadata"]
+    
+    def get_data_view(self, data_id: str, version_id: Optional[str] = None) -> Tuple[memoryview, Dict[str, Any]]:
+        """
+        Récupère le contenu sérialisé d'un élément de données sans le désérialiser.
+        
+        La vue est en lecture seule et ne copie pas le contenu s'il est stocké
+        non compressé en mémoire.
+        
+        Args:
+            data_id: Identifiant de l'élément de données
+            version_id: Identifiant de version (None pour la dernière version)
             
-            data_item = self.data_items[item_key]
+        Returns:
+            Un tuple (vue sur les octets, métadonnées)
             
-            # Décompresser les données si nécessaire
-            if data_item["is_compressed"]:
-                compressed_data = base64.b64decode(data_item["content"])
-                decompressed_data = gzip.decompress(compressed_data).decode('utf-8')
-                data_content = decompressed_data
-            else:
-                data_content = data_item["content"]
+        Raises:
+            KeyError: Si l'élément de données n'existe pas
+        """
+        view, data_item = self._get_view(data_id, version_id)
+        return view, data_item["metadata"]
+    
+    def get_data_stream(self, data_id: str, version_id: Optional[str] = None,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[memoryview]:
+        """
+        Lit le contenu sérialisé d'un élément de données par morceaux.
+        
+        Args:
+            data_id: Identifiant de l'élément de données
+            version_id: Identifiant de version (None pour la dernière version)
+            chunk_size: Taille maximale des morceaux en octets
             
-            # Désérialiser les données
-            data = self._deserialize_data(data_content)
+        Returns:
+            Un itérateur de vues sur les morceaux successifs
             
-            self.logger.info(f"Data item {data_id} with version {version_id} retrieved")
-            return data, data_item["metadata"]
+        Raises:
+            KeyError: Si l'élément de données n'existe pas
+        """
+        with self.lock:
+            data_item = self._get_item(data_id, version_id)
+            return self.blobs.open_stream(data_item["digest"], chunk_size)
     
     def delete_data(self, data_id: str, version_id: Optional[str] = None) -> bool:
         """
@@ -157,27 +199,18 @@ class DataStore:
             
             if version_id is None:
                 # Supprimer toutes les versions
-                for v_id in self.versions[data_id]:
-                    item_key = f"{data_id}:{v_id}"
-                    if item_key in self.data_items:
-                        del self.data_items[item_key]
+                for v_id in list(self.versions[data_id]):
+                    self._remove_version(data_id, v_id)
                 
-                del self.versions[data_id]
                 self.logger.info(f"All versions of data item {data_id} deleted")
                 return True
             else:
                 # Supprimer une version spécifique
-                item_key = f"{data_id}:{version_id}"
-                if item_key not in self.data_items:
+                if f"{data_id}:{version_id}" not in self.data_items:
                     self.logger.warning(f"Data item {data_id} with version {version_id} not found")
                     return False
                 
-                del self.data_items[item_key]
-                self.versions[data_id].remove(version_id)
-                
-                if not self.versions[data_id]:
-                    del self.versions[data_id]
-                
+                self._remove_version(data_id, version_id)
                 self.logger.info(f"Data item {data_id} with version {version_id} deleted")
                 return True
     
@@ -206,24 +239,46 @@ class DataStore:
             Un dictionnaire d'informations sur l'élément de données ou None s'il n'existe pas
         """
         with self.lock:
-            # Déterminer la version à récupérer
-            if version_id is None:
-                if data_id not in self.versions or not self.versions[data_id]:
-                    return None
-                
-                version_id = self.versions[data_id][-1]  # Dernière version
-            
-            # Récupérer l'élément de données
-            item_key = f"{data_id}:{version_id}"
-            if item_key not in self.data_items:
+            try:
+                data_item = self._get_item(data_id, version_id)
+            except KeyError:
                 return None
+            return data_item.copy()
+    
+    def _get_item(self, data_id: str, version_id: Optional[str]) -> Dict[str, Any]:
+        """
+        Retourne l'enregistrement d'une version (verrou détenu).
+        
+        Raises:
+            KeyError: Si l'élément de données n'existe pas
+        """
+        # Déterminer la version à récupérer
+        if version_id is None:
+            if data_id not in self.versions or not self.versions[data_id]:
+                raise KeyError(f"Data item {data_id} not found")
             
-            data_item = self.data_items[item_key].copy()
-            
-            # Supprimer le contenu pour alléger l'information
-            data_item.pop("content", None)
-            
-            return data_item
+            version_id = self.versions[data_id][-1]  # Dernière version
+        
+        item_key = f"{data_id}:{version_id}"
+        if item_key not in self.data_items:
+            raise KeyError(f"Data item {data_id} with version {version_id} not found")
+        
+        return self.data_items[item_key]
+    
+    def _get_view(self, data_id: str, version_id: Optional[str]) -> Tuple[memoryview, Dict[str, Any]]:
+        with self.lock:
+            data_item = self._get_item(data_id, version_id)
+            # Le blob reste référencé tant que la version existe : lecture sous verrou
+            return self.blobs.get(data_item["digest"]), data_item
+    
+    def _remove_version(self, data_id: str, version_id: str) -> None:
+        """Supprime une version et libère sa référence au blob (verrou détenu)."""
+        data_item = self.data_items.pop(f"{data_id}:{version_id}", None)
+        if data_item is not None:
+            self.blobs.release(data_item["digest"])
+        self.versions[data_id].remove(version_id)
+        if not self.versions[data_id]:
+            del self.versions[data_id]
     
     def _serialize_data(self, data: Any) -> str:
         """
@@ -237,16 +292,18 @@ class DataStore:
         """
         return json.dumps(data)
     
-    def _deserialize_data(self, serialized_data: str) -> Any:
+    def _deserialize_data(self, serialized_data: Union[str, bytes, memoryview]) -> Any:
         """
         Désérialise des données JSON.
         
         Args:
-            serialized_data: Les données sérialisées
+            serialized_data: Les données sérialisées (texte ou octets UTF-8)
             
         Returns:
             Les données désérialisées
         """
+        if isinstance(serialized_data, memoryview):
+            serialized_data = codecs.decode(serialized_data, 'utf-8')
         return json.loads(serialized_data)
 
 
@@ -257,6 +314,8 @@ class DataChannel(Channel):
     Ce canal optimise le transfert de grandes quantités de données structurées
     entre agents, avec support pour la compression, le streaming et le versionnement.
     """
+
+    notifies_delivery = True
     
     def __init__(self, channel_id: str, config: Optional[Dict[str, Any]] = None):
         """
@@ -314,7 +373,8 @@ class DataChannel(Channel):
             
             # Vérifier si le message contient des données volumineuses
             data = message.content.get("data")
-            if data and isinstance(data, dict) and len(str(data)) > self.max_inline_data_size:
+            data_size = len(str(data)) if data and isinstance(data, dict) else 0
+            if data_size > self.max_inline_data_size:
                 # Stocker les données séparément
                 data_id = f"data-{uuid.uuid4().hex[:8]}"
                 version_id = self.data_store.store_data(
@@ -334,13 +394,11 @@ class DataChannel(Channel):
                 message.content["data_reference"] = {
                     "data_id": data_id,
                     "version_id": version_id,
-                    "size": len(str(data))
+                    "size": data_size
                 }
                 
                 # Mettre à jour les statistiques
-                with self.lock:
-                    self.stats["data_items_stored"] += 1
-                    self.stats["total_data_size"] += len(str(data))
+                self._record_stored(data_id, version_id, data_size)
                 
                 self.logger.info(f"Large data from message {message.id} stored separately with ID {data_id}")
             
@@ -355,6 +413,8 @@ class DataChannel(Channel):
                 # Mettre à jour les statistiques
                 self.stats["messages_sent"] += 1
             
+            self._signal_delivery(message.recipient)
+            
             # Notifier les abonnés
             self._notify_subscribers(message)
             
@@ -540,7 +600,8 @@ class DataChannel(Channel):
                 "stats": self.stats,
                 "subscriber_count": len(self.subscribers),
                 "compression_threshold": self.compression_threshold,
-                "max_inline_data_size": self.max_inline_data_size
+                "max_inline_data_size": self.max_inline_data_size,
+                "store": self.data_store.blobs.get_store_info()
             }
     
     def _notify_subscribers(self, message: Message) -> None:
@@ -578,12 +639,19 @@ class DataChannel(Channel):
         version_id = self.data_store.store_data(data_id, data, metadata, compress)
         
         # Mettre à jour les statistiques
-        with self.lock:
-            self.stats["data_items_stored"] += 1
-            self.stats["total_data_size"] += len(str(data))
+        size = len(data) if isinstance(data, (bytes, bytearray, memoryview)) else len(str(data))
+        self._record_stored(data_id, version_id, size)
         
         return version_id
     
+    def _record_stored(self, data_id: str, version_id: str, size: int) -> None:
+        """Met à jour les statistiques après le stockage d'une version."""
+        info = self.data_store.get_data_info(data_id, version_id) or {}
+        with self.lock:
+            self.stats["data_items_stored"] += 1
+            self.stats["total_data_size"] += size
+            self.stats["compressed_data_size"] += info.get("compressed_size") or 0
+    
     def get_data(self, data_id: str, version_id: Optional[str] = None) -> Tuple[Any, Dict[str, Any]]:
         """
         Récupère des données du canal.
@@ -603,6 +671,33 @@ class DataChannel(Channel):
         
         return data, metadata
     
+    def get_data_view(self, data_id: str, version_id: Optional[str] = None) -> Tuple[memoryview, Dict[str, Any]]:
+        """
+        Récupère le contenu sérialisé de données sous forme de vue en lecture seule.
+        
+        Voir DataStore.get_data_view.
+        """
+        view, metadata = self.data_store.get_data_view(data_id, version_id)
+        
+        with self.lock:
+            self.stats["data_items_retrieved"] += 1
+        
+        return view, metadata
+    
+    def get_data_stream(self, data_id: str, version_id: Optional[str] = None,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[memoryview]:
+        """
+        Lit le contenu sérialisé de données par morceaux.
+        
+        Voir DataStore.get_data_stream.
+        """
+        stream = self.data_store.get_data_stream(data_id, version_id, chunk_size)
+        
+        with self.lock:
+            self.stats["data_items_retrieved"] += 1
+        
+        return stream
+    
     def delete_data(self, data_id: str, version_id: Optional[str] = None) -> bool:
         """
         Supprime des données du canal.
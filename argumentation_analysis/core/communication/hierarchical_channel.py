@@ -25,6 +25,8 @@ class HierarchicalChannel(Channel):
     stratégique, tactique et opérationnel, avec garantie de livraison et
     ordonnancement des messages.
     """
+
+    notifies_delivery = True
     
     def __init__(self, channel_id: str, config: Optional[Dict[str, Any]] = None):
         """
@@ -105,6 +107,7 @@ class HierarchicalChannel(Channel):
             
             # Ajouter le message à la file d'attente du destinataire
             self.message_queues[message.recipient].put((priority_value, datetime.now(), message))
+            self._signal_delivery(message.recipient)
             
             # Mettre à jour les statistiques
             with self.lock:
@@ -151,7 +154,7 @@ class HierarchicalChannel(Channel):
                     self.message_queues[recipient_id] = queue.PriorityQueue()
             
             q_size = self.message_queues[recipient_id].qsize()
-            self.logger.info(f"Attempting to get message for {recipient_id}. Queue size: {q_size}. Timeout: {timeout}")
+            self.logger.debug(f"Attempting to get message for {recipient_id}. Queue size: {q_size}. Timeout: {timeout}")
             
             # Récupérer un message de la file d'attente
             try:
@@ -166,7 +169,8 @@ class HierarchicalChannel(Channel):
                 return message_obj
                 
             except queue.Empty:
-                self.logger.warning(f"Queue empty for {recipient_id} after timeout {timeout}s.")
+                # Cas courant : le middleware interroge les canaux sans attente (timeout 0)
+                self.logger.debug(f"Queue empty for {recipient_id} after timeout {timeout}s.")
                 return None
             
         except Exception as e:
@@ -9,13 +9,29 @@ import uuid
 import threading
 import logging
 import asyncio
-from typing import Dict, Any, Optional, List, Callable, Union, Set
+import time
+from typing import Dict, Any, Optional, List, Callable, Union, Set, Tuple
 from datetime import datetime
 
 from .message import Message, MessageType, MessagePriority, AgentLevel
 from .channel_interface import Channel, ChannelType, ChannelException
 
 
+class _RecipientWaiter:
+    """
+    Signalisation des messages déposés pour un destinataire.
+
+    `sequence` est incrémenté à chaque dépôt : un récepteur lit la séquence,
+    interroge les canaux, puis n'attend que si elle n'a pas changé, ce qui
+    évite de manquer un message déposé entre l'interrogation et l'attente.
+    """
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.sequence = 0
+        self.async_events: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+
 class MessageMiddleware:
     """
     Middleware de messagerie central pour le système de communication multi-canal.
@@ -38,6 +54,12 @@ class MessageMiddleware:
         self.global_handlers = []  # Gestionnaires globaux pour tous les messages
         self.lock = threading.RLock()  # Verrou pour les opérations concurrentes
         
+        # Attente des messages par destinataire (sans interrogation active)
+        self._waiters: Dict[str, _RecipientWaiter] = {}
+        self._closed = False
+        # Intervalle d'interrogation, utilisé seulement pour les canaux qui ne signalent pas leurs dépôts
+        self.poll_interval = self.config.get("poll_interval", 0.05)
+        
         # Configuration du logger
         self.logger = logging.getLogger("MessageMiddleware")
         self.logger.setLevel(logging.INFO)
@@ -70,8 +92,31 @@ class MessageMiddleware:
                 "received": 0,
                 "errors": 0
             }
+            if getattr(channel, "notifies_delivery", False):
+                channel.add_delivery_listener(self._on_delivery)
             self.logger.info(f"Channel registered: {channel.type.value}")
     
+    def _get_waiter(self, recipient_id: str) -> _RecipientWaiter:
+        with self.lock:
+            waiter = self._waiters.get(recipient_id)
+            if waiter is None:
+                waiter = self._waiters[recipient_id] = _RecipientWaiter()
+            return waiter
+    
+    def _on_delivery(self, recipient_id: str) -> None:
+        """Réveille les récepteurs (synchrones et asynchrones) en attente pour ce destinataire."""
+        waiter = self._get_waiter(recipient_id)
+        with waiter.condition:
+            waiter.sequence += 1
+            waiter.condition.notify_all()
+            events = list(waiter.async_events)
+        for loop, event in events:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Boucle fermée : le récepteur n'attend plus
+                pass
+    
     def get_channel(self, channel_type: ChannelType) -> Optional[Channel]:
         """
         Récupère un canal par son type.
@@ -214,6 +259,11 @@ class MessageMiddleware:
         """
         Reçoit un message pour un destinataire spécifique.
         
+        Le récepteur est bloqué sur une variable de condition propre au
+        destinataire et réveillé dès qu'un canal y dépose un message : pas
+        d'interrogation périodique (sauf pour les canaux qui ne signalent pas
+        leurs dépôts, interrogés toutes les `poll_interval` secondes).
+        
         Args:
             recipient_id: Identifiant du destinataire
             channel_type: Type de canal à écouter (optionnel)
@@ -223,74 +273,35 @@ class MessageMiddleware:
             Le message reçu ou None si timeout
         """
         try:
-            # Si le canal est spécifié, écouter uniquement ce canal
-            if channel_type:
-                channel = self.get_channel(channel_type)
-                if not channel:
-                    self.logger.error(f"Channel not found: {channel_type.value}")
-                    return None
-                
-                message = channel.receive_message(recipient_id, timeout)
-                
-                if message:
-                    # Mettre à jour les statistiques
-                    with self.lock:
-                        self.stats["messages_received"] += 1
-                        self.stats["by_channel"][channel_type.value]["received"] += 1
-                    
-                    # Vérifier si c'est une réponse à une requête en attente
-                    if message.type == MessageType.RESPONSE and self.request_response:
-                        request_id = message.metadata.get("reply_to")
-                        if request_id:
-                            self.logger.info(f"Received response {message.id} for request {request_id}")
-                            result = self.request_response.handle_response(message)
-                            self.logger.info(f"Response handler result: {result}")
-                    
-                    # Appeler les gestionnaires de messages
-                    self._handle_message(message)
-                
-                return message
-            
-            # Sinon, écouter tous les canaux
-            # Créer une liste de tous les canaux
-            channels = list(self.channels.values())
+            channels = self._listened_channels(channel_type)
+            if channels is None:
+                return None
             
-            # Attendre un message sur n'importe quel canal
-            # Implémentation simple: vérifier chaque canal séquentiellement
-            # Une implémentation plus avancée utiliserait des files d'attente et des threads
+            if channel_type and not getattr(channels[0], "notifies_delivery", False):
+                # Canal sans signalisation : il gère lui-même l'attente
+                message = channels[0].receive_message(recipient_id, timeout)
+                return self._accept_message(message, channels[0]) if message else None
             
-            if timeout is not None:
-                end_time = datetime.now().timestamp() + timeout
+            waiter = self._get_waiter(recipient_id)
+            fallback = self._fallback_interval(channels)
+            deadline = time.monotonic() + timeout if timeout is not None else None
             
             while True:
-                for channel in channels:
-                    message = channel.receive_message(recipient_id, 0)  # Pas d'attente
-                    
-                    if message:
-                        # Mettre à jour les statistiques
-                        with self.lock:
-                            self.stats["messages_received"] += 1
-                            self.stats["by_channel"][channel.type.value]["received"] += 1
-                        
-                        # Vérifier si c'est une réponse à une requête en attente
-                        if message.type == MessageType.RESPONSE and self.request_response:
-                            request_id = message.metadata.get("reply_to")
-                            if request_id:
-                                self.logger.info(f"Received response {message.id} for request {request_id}")
-                                result = self.request_response.handle_response(message)
-                                self.logger.info(f"Response handler result: {result}")
-                        
-                        # Appeler les gestionnaires de messages
-                        self._handle_message(message)
-                        
-                        return message
+                with waiter.condition:
+                    sequence = waiter.sequence
                 
-                # Vérifier si le timeout est atteint
-                if timeout is not None and datetime.now().timestamp() > end_time:
-                    return None
+                message, channel = self._poll_channels(recipient_id, channels)
+                if message:
+                    return self._accept_message(message, channel)
                 
-                # Petite pause pour éviter de surcharger le CPU
-                threading.Event().wait(0.01)
+                with waiter.condition:
+                    remaining = deadline - time.monotonic() if deadline is not None else None
+                    if self._closed or (remaining is not None and remaining <= 0):
+                        return None
+                    if waiter.sequence == sequence:
+                        if fallback is not None:
+                            remaining = fallback if remaining is None else min(remaining, fallback)
+                        waiter.condition.wait(remaining)
             
         except Exception as e:
             # Mettre à jour les statistiques d'erreur
@@ -306,6 +317,9 @@ class MessageMiddleware:
         """
         Version asynchrone de receive_message.
         
+        Attend un `asyncio.Event` déclenché par les dépôts de messages, sans
+        occuper de thread de l'exécuteur.
+        
         Args:
             recipient_id: Identifiant du destinataire
             channel_type: Type de canal à écouter (optionnel)
@@ -314,13 +328,94 @@ class MessageMiddleware:
         Returns:
             Le message reçu ou None si timeout
         """
-        # Cette implémentation est simplifiée et utilise la version synchrone
-        # Une implémentation complète utiliserait des primitives asyncio
+        channels = self._listened_channels(channel_type)
+        if channels is None:
+            return None
+        
+        if channel_type and not getattr(channels[0], "notifies_delivery", False):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, lambda: self.receive_message(recipient_id, channel_type, timeout)
+            )
+        
+        waiter = self._get_waiter(recipient_id)
+        fallback = self._fallback_interval(channels)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        entry = (asyncio.get_running_loop(), asyncio.Event())
+        with waiter.condition:
+            waiter.async_events.add(entry)
         
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, lambda: self.receive_message(recipient_id, channel_type, timeout)
-        )
+        try:
+            while True:
+                # Effacé avant l'interrogation : un dépôt ultérieur le redéclenche
+                entry[1].clear()
+                message, channel = self._poll_channels(recipient_id, channels)
+                if message:
+                    return self._accept_message(message, channel)
+                
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if self._closed or (remaining is not None and remaining <= 0):
+                    return None
+                if fallback is not None:
+                    remaining = fallback if remaining is None else min(remaining, fallback)
+                try:
+                    await asyncio.wait_for(entry[1].wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+                
+        except Exception as e:
+            with self.lock:
+                self.stats["errors"] += 1
+            self.logger.error(f"Error receiving message: {str(e)}")
+            return None
+        finally:
+            with waiter.condition:
+                waiter.async_events.discard(entry)
+    
+    def _listened_channels(self, channel_type: Optional[ChannelType]) -> Optional[List[Channel]]:
+        """Canaux à écouter ; None si le canal demandé n'est pas enregistré."""
+        if channel_type:
+            channel = self.get_channel(channel_type)
+            if not channel:
+                self.logger.error(f"Channel not found: {channel_type.value}")
+                return None
+            return [channel]
+        with self.lock:
+            return list(self.channels.values())
+    
+    def _fallback_interval(self, channels: List[Channel]) -> Optional[float]:
+        """Intervalle d'interrogation si un des canaux ne signale pas ses dépôts, None sinon."""
+        if all(getattr(channel, "notifies_delivery", False) for channel in channels):
+            return None
+        return self.poll_interval
+    
+    def _poll_channels(self, recipient_id: str, channels: List[Channel]) -> Tuple[Optional[Message], Optional[Channel]]:
+        """Interroge chaque canal sans attente et retourne le premier message trouvé."""
+        for channel in channels:
+            message = channel.receive_message(recipient_id, 0)
+            if message:
+                return message, channel
+        return None, None
+    
+    def _accept_message(self, message: Message, channel: Channel) -> Message:
+        """Met à jour les statistiques et appelle les gestionnaires pour un message reçu."""
+        # Mettre à jour les statistiques
+        with self.lock:
+            self.stats["messages_received"] += 1
+            self.stats["by_channel"][channel.type.value]["received"] += 1
+        
+        # Vérifier si c'est une réponse à une requête en attente
+        if message.type == MessageType.RESPONSE and self.request_response:
+            request_id = message.metadata.get("reply_to")
+            if request_id:
+                self.logger.info(f"Received response {message.id} for request {request_id}")
+                result = self.request_response.handle_response(message)
+                self.logger.info(f"Response handler result: {result}")
+        
+        # Appeler les gestionnaires de messages
+        self._handle_message(message)
+        
+        return message
     
     def _handle_message(self, message: Message) -> None:
         """
@@ -511,5 +606,12 @@ class MessageMiddleware:
         if self.publish_subscribe:
             self.publish_subscribe.shutdown()
         
+        # Réveiller les récepteurs en attente, qui retournent None
+        self._closed = True
+        with self.lock:
+            recipients = list(self._waiters)
+        for recipient_id in recipients:
+            self._on_delivery(recipient_id)
+        
         # Journaliser l'arrêt
         self.logger.info("MessageMiddleware shutdown")
\ No newline at end of file
@@ -6,24 +6,334 @@ auxquels d'autres agents peuvent s'abonner. Ce modèle découple les émetteurs
 récepteurs et permet une communication one-to-many efficace.
 """
 
+import io
+import time
 import uuid
+import pickle
+import logging
+import tempfile
 import threading
 import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, Callable, List, Set
 from datetime import datetime, timedelta
 
 from .message import Message, MessageType, MessagePriority, AgentLevel
 
 
+logger = logging.getLogger(__name__)
+
+# Politiques appliquées quand la file de livraison d'un abonné est pleine :
+# - "drop_oldest" : le message le plus ancien de la file est abandonné ;
+# - "block" : l'éditeur attend qu'une place se libère (au plus block_timeout) ;
+# - "spill" : les messages excédentaires sont écrits dans un fichier temporaire
+#   et relus dans l'ordre quand la file se vide.
+BACKPRESSURE_POLICIES = ("drop_oldest", "block", "spill")
+
+DEFAULT_MAX_HISTORY = 100
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_DELIVERY_WORKERS = 4
+# Nombre de messages livrés avant de rendre le thread au pool (équité entre abonnés)
+DELIVERY_BATCH = 64
+
+
+def _accept_all(message: Message) -> bool:
+    return True
+
+
+def _value_check(extract: Callable[[Message], Any], expected: Any) -> Callable[[Message], bool]:
+    """Test d'égalité, ou d'appartenance si ``expected`` est une liste."""
+    if isinstance(expected, list):
+        candidates = tuple(expected)
+        try:
+            allowed = frozenset(candidates)
+        except TypeError:  # Valeurs attendues non hachables
+            return lambda message: extract(message) in candidates
+        
+        def check(message: Message) -> bool:
+            value = extract(message)
+            try:
+                return value in allowed
+            except TypeError:  # Valeur du message non hachable : comparaison par égalité
+                return value in candidates
+        return check
+    return lambda message: extract(message) == expected
+
+
+def compile_filter(filter_criteria: Optional[Dict[str, Any]]) -> Callable[[Message], bool]:
+    """
+    Compile des critères de filtrage en un prédicat sur les messages.
+    
+    Les critères sont analysés une seule fois (à l'abonnement) au lieu d'être
+    réinterprétés pour chaque message publié.
+    
+    Args:
+        filter_criteria: Critères sur ``sender``, ``priority``, ``sender_level``
+            et ``content`` (une valeur ou une liste de valeurs acceptées)
+        
+    Returns:
+        Une fonction qui retourne True si le message correspond aux critères
+    """
+    if not filter_criteria:
+        return _accept_all
+    
+    checks = []
+    if "sender" in filter_criteria:
+        checks.append(_value_check(lambda m: m.sender, filter_criteria["sender"]))
+    if "priority" in filter_criteria:
+        checks.append(_value_check(lambda m: m.priority.value, filter_criteria["priority"]))
+    if "sender_level" in filter_criteria:
+        checks.append(_value_check(lambda m: m.sender_level.value, filter_criteria["sender_level"]))
+    
+    for content_key, content_value in (filter_criteria.get("content") or {}).items():
+        value_check = _value_check(lambda m, key=content_key: m.content[key], content_value)
+        checks.append(lambda m, key=content_key, check=value_check: key in m.content and check(m))
+    
+    if not checks:
+        return _accept_all
+    if len(checks) == 1:
+        return checks[0]
+    return lambda message: all(check(message) for check in checks)
+
+
+class Subscription:
+    """
+    Abonnement à un topic, avec sa propre file de livraison.
+    
+    Les messages acceptés sont placés dans la file de l'abonné puis livrés au
+    callback, dans l'ordre, par une tâche du pool de livraison : un abonné lent
+    n'occupe qu'un thread du pool et ne ralentit ni les éditeurs ni les autres
+    abonnés. Une seule tâche à la fois vide la file d'un abonné.
+    """
+    
+    def __init__(
+        self,
+        subscription_id: str,
+        subscriber_id: str,
+        callback: Optional[Callable[[Message], Any]],
+        filter_criteria: Optional[Dict[str, Any]],
+        submit: Callable[[Callable[[], None]], Any],
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        backpressure: str = "drop_oldest",
+        block_timeout: Optional[float] = None
+    ):
+        """
+        Initialise un abonnement.
+        
+        Args:
+            subscription_id: Identifiant d'abonnement
+            subscriber_id: Identifiant de l'abonné
+            callback: Fonction (ou coroutine) appelée pour chaque message (optionnel)
+            filter_criteria: Critères de filtrage des messages (optionnel)
+            submit: Fonction qui planifie une tâche sur le pool de livraison
+            queue_size: Taille maximale de la file de livraison
+            backpressure: Politique appliquée quand la file est pleine
+            block_timeout: Attente maximale d'un éditeur avec la politique "block"
+                (None pour attendre indéfiniment)
+        """
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {backpressure} "
+                             f"(expected one of {', '.join(BACKPRESSURE_POLICIES)})")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        
+        self.id = subscription_id
+        self.subscriber_id = subscriber_id
+        self.callback = callback
+        self.filter_criteria = filter_criteria
+        self.matches = compile_filter(filter_criteria)
+        self.created_at = datetime.now()
+        self.queue_size = queue_size
+        self.backpressure = backpressure
+        self.block_timeout = block_timeout
+        self.active = True
+        
+        # Les callbacks asynchrones s'exécutent dans la boucle active à l'abonnement
+        self.loop = None
+        if asyncio.iscoroutinefunction(callback):
+            try:
+                self.loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+        
+        self._submit = submit
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._scheduled = False  # Une tâche de livraison est planifiée ou en cours
+        self._worker = None  # Thread qui vide actuellement la file
+        self._spill_file = None
+        self._spill_offset = 0
+        self._spilled = 0
+        
+        self.stats = {"delivered": 0, "dropped": 0, "spilled": 0, "errors": 0}
+    
+    def offer(self, message: Message) -> bool:
+        """
+        Place un message dans la file de livraison en appliquant la politique
+        de contre-pression.
+        
+        Args:
+            message: Le message à livrer
+            
+        Returns:
+            True si le message sera livré, False s'il a été abandonné
+        """
+        with self._condition:
+            if not self.active:
+                return False
+            
+            if self._spilled or len(self._queue) >= self.queue_size:
+                policy = self.backpressure
+                if policy == "block" and self._worker is threading.current_thread():
+                    # Publication depuis le callback de cet abonné : attendre bloquerait
+                    # la seule tâche capable de vider la file
+                    policy = "drop_oldest"
+                
+                if policy == "drop_oldest":
+                    self._queue.popleft()
+                    self.stats["dropped"] += 1
+                    self._queue.append(message)
+                elif policy == "block":
+                    if not self._condition.wait_for(
+                        lambda: len(self._queue) < self.queue_size or not self.active,
+                        self.block_timeout
+                    ) or not self.active:
+                        self.stats["dropped"] += 1
+                        return False
+                    self._queue.append(message)
+                elif not self._spill(message):
+                    return False
+            else:
+                self._queue.append(message)
+            
+            if self._scheduled:
+                return True
+            self._scheduled = True
+        
+        self._schedule()
+        return True
+    
+    def drain(self) -> None:
+        """Livre les messages de la file au callback (exécuté par le pool)."""
+        with self._condition:
+            self._worker = threading.current_thread()
+        
+        for _ in range(DELIVERY_BATCH):
+            with self._condition:
+                if not self._queue and self._spilled:
+                    self._unspill()
+                if not self._queue or not self.active:
+                    self._worker = None
+                    self._scheduled = False
+                    self._condition.notify_all()
+                    return
+                message = self._queue.popleft()
+                # Une place s'est libérée pour les éditeurs bloqués
+                self._condition.notify_all()
+            
+            self._deliver(message)
+        
+        # Lot terminé : rendre le thread au pool et replanifier la suite
+        with self._condition:
+            self._worker = None
+        self._schedule()
+    
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Attend que tous les messages en file aient été livrés.
+        
+        Returns:
+            True si la file est vide, False si le délai a expiré
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._scheduled, timeout)
+    
+    def close(self) -> None:
+        """Désactive l'abonnement, abandonne les messages en attente et réveille les éditeurs bloqués."""
+        with self._condition:
+            self.active = False
+            self._queue.clear()
+            self._spilled = 0
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+            self._condition.notify_all()
+    
+    def pending_count(self) -> int:
+        """Nombre de messages en attente de livraison (en mémoire et sur disque)."""
+        with self._condition:
+            return len(self._queue) + self._spilled
+    
+    def _schedule(self) -> None:
+        try:
+            self._submit(self.drain)
+        except RuntimeError as e:  # Pool de livraison arrêté
+            logger.warning(f"Cannot schedule delivery for subscription {self.id}: {e}")
+            with self._condition:
+                self._worker = None
+                self._scheduled = False
+                self._condition.notify_all()
+    
+    def _deliver(self, message: Message) -> None:
+        if self.callback is None:
+            return
+        try:
+            result = self.callback(message)
+            if asyncio.iscoroutine(result):
+                if self.loop is not None and self.loop.is_running():
+                    asyncio.run_coroutine_threadsafe(result, self.loop).result()
+                else:
+                    asyncio.run(result)
+            self.stats["delivered"] += 1
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"Error in subscriber callback ({self.subscriber_id}): {e}")
+    
+    def _spill(self, message: Message) -> bool:
+        """Écrit un message excédentaire en fin du fichier de débordement (verrou détenu)."""
+        try:
+            if self._spill_file is None:
+                self._spill_file = tempfile.TemporaryFile(prefix="pubsub-spill-")
+                self._spill_offset = 0
+            self._spill_file.seek(0, io.SEEK_END)
+            pickle.dump(message, self._spill_file, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.error(f"Cannot spill message {message.id} for subscription {self.id}: {e}")
+            self.stats["dropped"] += 1
+            return False
+        self._spilled += 1
+        self.stats["spilled"] += 1
+        return True
+    
+    def _unspill(self) -> None:
+        """Recharge dans la file les plus anciens messages du fichier de débordement (verrou détenu)."""
+        self._spill_file.seek(self._spill_offset)
+        while self._spilled and len(self._queue) < self.queue_size:
+            self._queue.append(pickle.load(self._spill_file))
+            self._spilled -= 1
+        self._spill_offset = self._spill_file.tell()
+        if not self._spilled:
+            self._spill_file.seek(0)
+            self._spill_file.truncate()
+            self._spill_offset = 0
+
+
 class Topic:
     """
     Représentation d'un sujet (topic) dans le système de publication-abonnement.
     
     Un topic est un canal logique sur lequel des messages peuvent être publiés
-    et auquel des agents peuvent s'abonner.
+    et auquel des agents peuvent s'abonner. La publication ne fait que placer
+    le message dans la file de chaque abonné concerné ; les callbacks sont
+    appelés par un pool de threads de livraison, hors du verrou du topic.
+    L'ordre des messages est préservé pour chaque abonné.
     """
     
-    def __init__(self, topic_id: str, description: Optional[str] = None, ttl: Optional[int] = None):
+    def __init__(self, topic_id: str, description: Optional[str] = None, ttl: Optional[int] = None,
+                 max_history: int = DEFAULT_MAX_HISTORY, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 backpressure: str = "drop_oldest", block_timeout: Optional[float] = None,
+                 executor: Optional[ThreadPoolExecutor] = None):
         """
         Initialise un nouveau topic.
         
@@ -31,17 +341,41 @@ class Topic:
             topic_id: Identifiant unique du topic
             description: Description du topic (optionnel)
             ttl: Durée de vie par défaut des messages en secondes (optionnel)
+            max_history: Nombre maximum de messages conservés dans l'historique
+            queue_size: Taille par défaut des files de livraison des abonnés
+            backpressure: Politique par défaut quand une file de livraison est pleine
+            block_timeout: Attente maximale des éditeurs avec la politique "block"
+            executor: Pool de livraison partagé (optionnel, un pool propre au
+                topic est créé à la demande sinon)
         """
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {backpressure}")
+        
         self.id = topic_id
         self.description = description
         self.ttl = ttl
-        self.subscribers = {}  # Dictionnaire des abonnés avec leurs filtres
-        self.messages = []  # Historique des messages (pour les abonnés tardifs)
-        self.max_history = 100  # Nombre maximum de messages à conserver
+        self.queue_size = queue_size
+        self.backpressure = backpressure
+        self.block_timeout = block_timeout
+        self.subscribers: Dict[str, Subscription] = {}  # Abonnements par identifiant
+        self.messages = deque(maxlen=max_history)  # Historique des messages (pour les abonnés tardifs)
         self.lock = threading.RLock()  # Verrou pour les opérations concurrentes
+        self._executor = executor
+        self._owns_executor = False
+    
+    @property
+    def max_history(self) -> int:
+        """Nombre maximum de messages à conserver."""
+        return self.messages.maxlen
+    
+    @max_history.setter
+    def max_history(self, value: int) -> None:
+        with self.lock:
+            self.messages = deque(self.messages, maxlen=value)
     
     def add_subscriber(self, subscriber_id: str, callback: Optional[Callable[[Message], None]] = None,
-                      filter_criteria: Optional[Dict[str, Any]] = None) -> str:
+                      filter_criteria: Optional[Dict[str, Any]] = None,
+                      queue_size: Optional[int] = None, backpressure: Optional[str] = None) -> str:
         """
         Ajoute un abonné à ce topic.
         
@@ -49,19 +383,22 @@ class Topic:
             subscriber_id: Identifiant de l'abonné
             callback: Fonction de rappel à appeler lors de la réception d'un message (optionnel)
             filter_criteria: Critères de filtrage des messages (optionnel)
+            queue_size: Taille de la file de livraison de l'abonné (optionnel)
+            backpressure: Politique quand la file est pleine (optionnel)
             
         Returns:
             Un identifiant d'abonnement
         """
         subscription_id = f"sub-{uuid.uuid4().hex[:8]}"
+        subscription = Subscription(
+            subscription_id, subscriber_id, callback, filter_criteria, self._submit,
+            queue_size=queue_size or self.queue_size,
+            backpressure=backpressure or self.backpressure,
+            block_timeout=self.block_timeout
+        )
         
         with self.lock:
-            self.subscribers[subscription_id] = {
-                "subscriber_id": subscriber_id,
-                "callback": callback,
-                "filter_criteria": filter_criteria,
-                "created_at": datetime.now()
-            }
+            self.subscribers[subscription_id] = subscription
         
         return subscription_id
     
@@ -76,10 +413,11 @@ class Topic:
             True si désabonnement réussi, False sinon
         """
         with self.lock:
-            if subscription_id in self.subscribers:
-                del self.subscribers[subscription_id]
-                return True
+            subscription = self.subscribers.pop(subscription_id, None)
+        if subscription is None:
             return False
+        subscription.close()
+        return True
     
     def publish_message(self, message: Message) -> List[str]:
         """
@@ -89,35 +427,21 @@ class Topic:
             message: Le message à publier
             
         Returns:
-            Liste des identifiants des abonnés qui ont reçu le message
+            Liste des identifiants des abonnés à qui le message sera livré
         """
-        recipients = []
-        
         with self.lock:
-            # Ajouter le message à l'historique
+            # L'historique borné élimine lui-même les messages les plus anciens
             self.messages.append({
                 "message": message,
                 "published_at": datetime.now()
             })
-            
-            # Limiter la taille de l'historique
-            if len(self.messages) > self.max_history:
-                self.messages = self.messages[-self.max_history:]
-            
-            # Distribuer le message aux abonnés
-            for subscription_id, subscriber in self.subscribers.items():
-                # Vérifier si le message correspond aux critères de filtrage
-                if self._matches_filter(message, subscriber.get("filter_criteria")):
-                    # Appeler le callback si présent
-                    if subscriber.get("callback"):
-                        try:
-                            subscriber["callback"](message)
-                        except Exception as e:
-                            print(f"Error in subscriber callback: {e}")
-                    
-                    recipients.append(subscriber["subscriber_id"])
+            subscriptions = list(self.subscribers.values())
         
-        return recipients
+        # La mise en file se fait hors du verrou : la politique "block" peut faire attendre l'éditeur
+        return [
+            subscription.subscriber_id for subscription in subscriptions
+            if subscription.matches(message) and subscription.offer(message)
+        ]
     
     def get_recent_messages(self, count: Optional[int] = None, 
                            filter_criteria: Optional[Dict[str, Any]] = None) -> List[Message]:
@@ -131,18 +455,15 @@ class Topic:
         Returns:
             Liste des messages récents
         """
+        matches = compile_filter(filter_criteria)
         with self.lock:
-            # Filtrer les messages selon les critères
-            filtered_messages = [
-                entry["message"] for entry in self.messages
-                if not filter_criteria or self._matches_filter(entry["message"], filter_criteria)
-            ]
-            
-            # Limiter le nombre de messages
-            if count is not None:
-                filtered_messages = filtered_messages[-count:]
-            
-            return filtered_messages
+            filtered_messages = [entry["message"] for entry in self.messages if matches(entry["message"])]
+        
+        # Limiter le nombre de messages (0 : tous, comme le slice [-0:])
+        if count is not None:
+            filtered_messages = filtered_messages[-count:]
+        
+        return filtered_messages
     
     def _matches_filter(self, message: Message, filter_criteria: Optional[Dict[str, Any]]) -> bool:
         """
@@ -155,44 +476,69 @@ class Topic:
         Returns:
             True si le message correspond aux critères, False sinon
         """
-        if not filter_criteria:
-            return True
-        
-        # Vérifier les critères de base
-        for key, value in filter_criteria.items():
-            if key == "sender":
-                if isinstance(value, list):
-                    if message.sender not in value:
-                        return False
-                elif message.sender != value:
-                    return False
-            elif key == "priority":
-                if isinstance(value, list):
-                    if message.priority.value not in value:
-                        return False
-                elif message.priority.value != value:
-                    return False
-            elif key == "sender_level":
-                if isinstance(value, list):
-                    if message.sender_level.value not in value:
-                        return False
-                elif message.sender_level.value != value:
-                    return False
+        return compile_filter(filter_criteria)(message)
+    
+    def purge_expired(self, now: Optional[datetime] = None) -> int:
+        """
+        Retire de l'historique les messages dont la durée de vie est écoulée.
         
-        # Vérifier les critères de contenu
-        if "content" in filter_criteria:
-            content_filter = filter_criteria["content"]
-            for content_key, content_value in content_filter.items():
-                if content_key not in message.content:
-                    return False
-                if isinstance(content_value, list):
-                    if message.content[content_key] not in content_value:
-                        return False
-                elif message.content[content_key] != content_value:
-                    return False
+        Args:
+            now: Date de référence (maintenant par défaut)
+            
+        Returns:
+            Le nombre de messages retirés
+        """
+        now = now or datetime.now()
+        with self.lock:
+            kept = deque((
+                entry for entry in self.messages
+                if not entry["message"].metadata.get("ttl") or
+                entry["published_at"] + timedelta(seconds=entry["message"].metadata["ttl"]) > now
+            ), maxlen=self.messages.maxlen)
+            removed = len(self.messages) - len(kept)
+            self.messages = kept
+        return removed
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Attend que les messages publiés aient été livrés à tous les abonnés.
         
+        Args:
+            timeout: Délai maximal d'attente en secondes (None pour attendre indéfiniment)
+            
+        Returns:
+            True si toutes les files sont vides, False si le délai a expiré
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.lock:
+            subscriptions = list(self.subscribers.values())
+        for subscription in subscriptions:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not subscription.wait_idle(remaining):
+                return False
         return True
     
+    def close(self) -> None:
+        """Ferme les abonnements du topic et arrête son pool de livraison propre."""
+        with self.lock:
+            subscriptions = list(self.subscribers.values())
+            self.subscribers.clear()
+        for subscription in subscriptions:
+            subscription.close()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self._owns_executor = False
+    
+    def _submit(self, task: Callable[[], None]) -> None:
+        with self.lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=DEFAULT_DELIVERY_WORKERS,
+                                                    thread_name_prefix=f"topic-{self.id}")
+                self._owns_executor = True
+            executor = self._executor
+        executor.submit(task)
+    
     def get_subscriber_count(self) -> int:
         """
         Récupère le nombre d'abonnés à ce topic.
@@ -221,15 +567,20 @@ class Topic:
             Un dictionnaire d'informations sur le topic
         """
         with self.lock:
-            return {
+            subscriptions = list(self.subscribers.values())
+            info = {
                 "id": self.id,
                 "description": self.description,
                 "ttl": self.ttl,
                 "subscriber_count": len(self.subscribers),
                 "message_count": len(self.messages),
                 "created_at": self.messages[0]["published_at"].isoformat() if self.messages else None,
-                "last_message_at": self.messages[-1]["published_at"].isoformat() if self.messages else None
+                "last_message_at": self.messages[-1]["published_at"].isoformat() if self.messages else None,
+                "backpressure": self.backpressure
             }
+        info["pending_deliveries"] = sum(subscription.pending_count() for subscription in subscriptions)
+        info["dropped_messages"] = sum(subscription.stats["dropped"] for subscription in subscriptions)
+        return info
 
 
 class PublishSubscribeProtocol:
@@ -237,7 +588,18 @@ class PublishSubscribeProtocol:
     Implémentation du protocole de publication-abonnement.
     
     Ce protocole gère la création de topics, l'abonnement des agents et la
-    publication de messages.
+    publication de messages. Les callbacks des abonnés de tous les topics sont
+    appelés par un pool de livraison partagé.
+    
+    Configuration lue dans ``middleware.config`` :
+    
+    - ``pubsub_workers`` : taille du pool de livraison (défaut 4) ;
+    - ``pubsub_queue_size`` : taille des files de livraison (défaut 1000) ;
+    - ``pubsub_backpressure`` : politique par défaut quand une file est
+      pleine, parmi ``BACKPRESSURE_POLICIES`` (défaut "drop_oldest") ;
+    - ``pubsub_block_timeout`` : attente maximale des éditeurs avec la
+      politique "block" (défaut None, sans limite) ;
+    - ``pubsub_max_history`` : taille de l'historique des topics (défaut 100).
     """
     
     def __init__(self, middleware):
@@ -251,14 +613,24 @@ class PublishSubscribeProtocol:
         self.topics = {}  # Dictionnaire des topics
         self.lock = threading.RLock()  # Verrou pour les opérations concurrentes
         
+        config = getattr(middleware, "config", None)
+        config = config if isinstance(config, dict) else {}
+        self.queue_size = config.get("pubsub_queue_size", DEFAULT_QUEUE_SIZE)
+        self.backpressure = config.get("pubsub_backpressure", "drop_oldest")
+        self.block_timeout = config.get("pubsub_block_timeout")
+        self.max_history = config.get("pubsub_max_history", DEFAULT_MAX_HISTORY)
+        self.executor = ThreadPoolExecutor(max_workers=config.get("pubsub_workers", DEFAULT_DELIVERY_WORKERS),
+                                           thread_name_prefix="pubsub-delivery")
+        
         # Démarrer le thread de nettoyage des messages expirés
         self.running = True
+        self._stop_event = threading.Event()
         self.cleanup_thread = threading.Thread(target=self._cleanup_expired_messages)
         self.cleanup_thread.daemon = True
         self.cleanup_thread.start()
     
     def create_topic(self, topic_id: str, description: Optional[str] = None, 
-                    ttl: Optional[int] = None) -> Topic:
+                    ttl: Optional[int] = None, backpressure: Optional[str] = None) -> Topic:
         """
         Crée un nouveau topic.
         
@@ -266,6 +638,7 @@ class PublishSubscribeProtocol:
             topic_id: Identifiant unique du topic
             description: Description du topic (optionnel)
             ttl: Durée de vie par défaut des messages en secondes (optionnel)
+            backpressure: Politique par défaut des abonnés quand leur file est pleine (optionnel)
             
         Returns:
             Le topic créé
@@ -274,7 +647,9 @@ class PublishSubscribeProtocol:
             if topic_id in self.topics:
                 return self.topics[topic_id]
             
-            topic = Topic(topic_id, description, ttl)
+            topic = Topic(topic_id, description, ttl, max_history=self.max_history,
+                          queue_size=self.queue_size, backpressure=backpressure or self.backpressure,
+                          block_timeout=self.block_timeout, executor=self.executor)
             self.topics[topic_id] = topic
             return topic
     
@@ -302,10 +677,11 @@ class PublishSubscribeProtocol:
             True si suppression réussie, False sinon
         """
         with self.lock:
-            if topic_id in self.topics:
-                del self.topics[topic_id]
-                return True
+            topic = self.topics.pop(topic_id, None)
+        if topic is None:
             return False
+        topic.close()
+        return True
     
     def publish(
         self,
@@ -364,7 +740,9 @@ class PublishSubscribeProtocol:
         topic_id: str,
         subscriber_id: str,
         callback: Optional[Callable[[Message], None]] = None,
-        filter_criteria: Optional[Dict[str, Any]] = None
+        filter_criteria: Optional[Dict[str, Any]] = None,
+        queue_size: Optional[int] = None,
+        backpressure: Optional[str] = None
     ) -> str:
         """
         Abonne un agent à un topic.
@@ -372,8 +750,10 @@ class PublishSubscribeProtocol:
         Args:
             topic_id: Identifiant du topic
             subscriber_id: Identifiant de l'abonné
-            callback: Fonction de rappel à appeler lors de la réception d'un message (optionnel)
+            callback: Fonction (ou coroutine) de rappel à appeler lors de la réception d'un message (optionnel)
             filter_criteria: Critères de filtrage des messages (optionnel)
+            queue_size: Taille de la file de livraison de l'abonné (optionnel)
+            backpressure: Politique quand la file de livraison est pleine (optionnel)
             
         Returns:
             Un identifiant d'abonnement
@@ -382,7 +762,8 @@ class PublishSubscribeProtocol:
         topic = self.create_topic(topic_id)
         
         # Ajouter l'abonné au topic
-        subscription_id = topic.add_subscriber(subscriber_id, callback, filter_criteria)
+        subscription_id = topic.add_subscriber(subscriber_id, callback, filter_criteria,
+                                               queue_size=queue_size, backpressure=backpressure)
         
         # Créer un message d'abonnement
         message = Message(
@@ -449,31 +830,57 @@ class PublishSubscribeProtocol:
         
         return topic.get_topic_info()
     
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Attend que les messages publiés aient été livrés aux abonnés de tous les topics.
+        
+        Args:
+            timeout: Délai maximal d'attente en secondes (None pour attendre indéfiniment)
+            
+        Returns:
+            True si toutes les livraisons sont terminées, False si le délai a expiré
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.lock:
+            topics = list(self.topics.values())
+        for topic in topics:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not topic.flush(remaining):
+                return False
+        return True
+    
     def _cleanup_expired_messages(self):
         """Thread qui nettoie périodiquement les messages expirés."""
         while self.running:
             try:
-                now = datetime.now()
-                
                 with self.lock:
-                    for topic_id, topic in self.topics.items():
-                        with topic.lock:
-                            # Filtrer les messages non expirés
-                            topic.messages = [
-                                entry for entry in topic.messages
-                                if not entry["message"].metadata.get("ttl") or
-                                entry["published_at"] + timedelta(seconds=entry["message"].metadata["ttl"]) > now
-                            ]
+                    topics = list(self.topics.values())
+                now = datetime.now()
+                for topic in topics:
+                    topic.purge_expired(now)
                 
                 # Attendre avant le prochain nettoyage
-                threading.Event().wait(60)  # Nettoyer toutes les minutes
+                self._stop_event.wait(60)  # Nettoyer toutes les minutes
                 
             except Exception as e:
-                print(f"Error in message cleanup: {e}")
-                threading.Event().wait(5)  # Attendre un peu en cas d'erreur
+                logger.error(f"Error in message cleanup: {e}")
+                self._stop_event.wait(5)  # Attendre un peu en cas d'erreur
     
-    def shutdown(self):
-        """Arrête proprement le protocole."""
+    def shutdown(self, timeout: float = 2.0):
+        """
+        Arrête proprement le protocole.
+        
+        Args:
+            timeout: Délai laissé aux livraisons en cours avant l'arrêt du pool
+        """
         self.running = False
+        self._stop_event.set()
         if self.cleanup_thread.is_alive():
-            self.cleanup_thread.join(timeout=2)
\ No newline at end of file
+            self.cleanup_thread.join(timeout=timeout)
+        
+        self.flush(timeout)
+        with self.lock:
+            topics = list(self.topics.values())
+        for topic in topics:
+            topic.close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,175 @@
+"""
+Tests du stockage adressé par contenu du canal de données.
+"""
+
+import hashlib
+import json
+import os
+import unittest
+
+from argumentation_analysis.core.communication.blob_store import BlobStore, available_codecs
+from argumentation_analysis.core.communication.data_channel import DataStore, DataChannel
+
+
+def payload(index, size=4096):
+    """Contenu peu compressible de ``size`` octets."""
+    return b"".join(hashlib.sha256(f"{index}-{i}".encode()).digest() for i in range(size // 32))
+
+
+class TestBlobStore(unittest.TestCase):
+    """Déduplication, budget mémoire, débordement sur disque et lecture par morceaux."""
+
+    def setUp(self):
+        self.stores = []
+
+    def tearDown(self):
+        for store in self.stores:
+            store.close()
+
+    def make_store(self, **kwargs):
+        store = BlobStore(**kwargs)
+        self.stores.append(store)
+        return store
+
+    def test_identical_content_is_deduplicated(self):
+        store = self.make_store()
+        first = store.put(b"x" * 5000)
+        second = store.put(bytearray(b"x" * 5000))
+        self.assertEqual(first, second)
+        self.assertEqual(first, hashlib.sha256(b"x" * 5000).hexdigest())
+        self.assertEqual(store.info(first)["refcount"], 2)
+        self.assertEqual(store.get_store_info()["blob_count"], 1)
+
+        self.assertTrue(store.release(first))
+        self.assertEqual(store.get(first).tobytes(), b"x" * 5000)
+        self.assertTrue(store.release(first))
+        self.assertIsNone(store.info(first))
+        with self.assertRaises(KeyError):
+            store.get(first)
+
+    def test_uncompressed_get_is_zero_copy(self):
+        store = self.make_store(codec="none")
+        data = payload(0)
+        digest = store.put(data)
+        view = store.get(digest)
+        self.assertTrue(view.readonly)
+        self.assertIs(view.obj, data)
+
+    def test_compression_is_kept_only_when_smaller(self):
+        store = self.make_store(codec="gzip")
+        compressible = store.put(b"abc" * 10000)
+        random_like = store.put(payload(1))
+        small = store.put(b"abc" * 10)
+        self.assertEqual(store.info(compressible)["codec"], "gzip")
+        self.assertLess(store.info(compressible)["stored_size"], 30000)
+        self.assertEqual(store.info(random_like)["codec"], "none")
+        self.assertEqual(store.info(small)["codec"], "none")
+        self.assertEqual(store.get(compressible).tobytes(), b"abc" * 10000)
+
+    def test_unavailable_codec_is_rejected(self):
+        for codec, available in available_codecs().items():
+            if not available:
+                with self.assertRaises(ValueError):
+                    BlobStore(codec=codec)
+        with self.assertRaises(ValueError):
+            BlobStore(codec="brotli")
+
+    def test_lru_spill_to_segment(self):
+        store = self.make_store(memory_budget=3 * 4096, codec="none")
+        digests = [store.put(payload(i)) for i in range(10)]
+        info = store.get_store_info()
+        self.assertLessEqual(info["memory_used"], 3 * 4096)
+        self.assertEqual(info["spilled"], 7)
+        self.assertFalse(store.info(digests[0])["in_memory"])
+
+        # Relecture depuis le segment puis remise en mémoire
+        self.assertEqual(store.get(digests[0]).tobytes(), payload(0))
+        self.assertTrue(store.info(digests[0])["in_memory"])
+        self.assertEqual(store.get_store_info()["loaded"], 1)
+        for i, digest in enumerate(digests):
+            self.assertEqual(store.get(digest).tobytes(), payload(i))
+
+    def test_segment_compaction(self):
+        store = self.make_store(memory_budget=0, codec="none")
+        digests = [store.put(payload(i, 64 * 1024)) for i in range(40)]
+        for digest in digests[:30]:
+            store.release(digest)
+        info = store.get_store_info()
+        self.assertEqual(info["compactions"], 1)
+        self.assertEqual(info["segment_live_bytes"], 10 * 64 * 1024)
+        for i, digest in enumerate(digests[30:], 30):
+            self.assertEqual(store.get(digest).tobytes(), payload(i, 64 * 1024))
+
+    def test_stream_chunks(self):
+        for codec in ("none", "gzip"):
+            for budget in (0, 1 << 20):
+                store = self.make_store(memory_budget=budget, codec=codec)
+                data = b"0123456789" * 10000 if codec == "gzip" else payload(2, 100000)
+                digest = store.put(data)
+                chunks = list(store.open_stream(digest, chunk_size=4096))
+                self.assertTrue(all(len(chunk) <= 4096 for chunk in chunks))
+                self.assertEqual(b"".join(chunks), data)
+
+
+class TestDataStore(unittest.TestCase):
+    """Versionnement des données au-dessus du stockage de blobs."""
+
+    def setUp(self):
+        self.store = DataStore("test-store", {"memory_budget": 1 << 20})
+
+    def tearDown(self):
+        self.store.blobs.close()
+
+    def test_round_trip_and_versions_share_blobs(self):
+        data = {"text": "argument " * 500, "beliefs": list(range(100))}
+        v1 = self.store.store_data("doc", data, {"source": "test"})
+        v2 = self.store.store_data("doc", data)
+        v3 = self.store.store_data("doc", {"text": "changed"})
+        self.assertEqual(self.store.get_versions("doc"), [v1, v2, v3])
+
+        info1 = self.store.get_data_info("doc", v1)
+        self.assertEqual(info1["digest"], self.store.get_data_info("doc", v2)["digest"])
+        self.assertTrue(info1["is_compressed"])
+        self.assertEqual(self.store.blobs.get_store_info()["blob_count"], 2)
+
+        retrieved, metadata = self.store.get_data("doc", v1)
+        self.assertEqual(retrieved, data)
+        self.assertEqual(metadata, {"source": "test"})
+        self.assertEqual(self.store.get_data("doc")[0], {"text": "changed"})
+
+        self.assertTrue(self.store.delete_data("doc", v1))
+        self.assertEqual(self.store.get_data("doc", v2)[0], data)
+        self.assertTrue(self.store.delete_data("doc"))
+        self.assertEqual(self.store.blobs.get_store_info()["blob_count"], 0)
+        with self.assertRaises(KeyError):
+            self.store.get_data("doc")
+
+    def test_binary_data_view_and_stream(self):
+        embedding = os.urandom(50000)
+        self.store.store_data("embedding", embedding)
+        view, _ = self.store.get_data_view("embedding")
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(view.tobytes(), embedding)
+        self.assertEqual(self.store.get_data("embedding")[0], embedding)
+        self.assertEqual(b"".join(self.store.get_data_stream("embedding", chunk_size=8192)), embedding)
+
+        self.store.store_data("doc", {"a": [1, 2, 3]})
+        self.assertEqual(json.loads(b"".join(self.store.get_data_stream("doc"))), {"a": [1, 2, 3]})
+
+    def test_max_versions(self):
+        store = DataStore("bounded", {"max_versions": 2})
+        versions = [store.store_data("doc", {"n": i}) for i in range(5)]
+        self.assertEqual(store.get_versions("doc"), versions[-2:])
+        self.assertEqual(store.blobs.get_store_info()["blob_count"], 2)
+        store.blobs.close()
+
+    def test_channel_stores_large_message_data(self):
+        channel = DataChannel("data", {"max_inline_data_size": 100, "memory_budget": 1 << 20})
+        version_id = channel.store_data("result", {"values": list(range(1000))})
+        self.assertEqual(channel.get_data("result", version_id)[0], {"values": list(range(1000))})
+        self.assertGreater(channel.get_channel_info()["stats"]["compressed_data_size"], 0)
+        self.assertEqual(channel.get_channel_info()["store"]["blob_count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+Benchmarks de latence et de débit de la réception de messages par le middleware.
+
+Les récepteurs bloqués sont réveillés par les dépôts de messages des canaux
+(variable de condition ou `asyncio.Event` par destinataire) : la latence ne
+dépend plus d'un intervalle d'interrogation et un récepteur inactif ne
+consomme pas de CPU.
+
+Les tests de comportement s'exécutent toujours ; les mesures de latence, de
+CPU et de débit, sensibles à la charge de la machine, seulement si
+RUN_BENCHMARKS=true.
+"""
+
+import asyncio
+import os
+import statistics
+import threading
+import time
+import unittest
+
+from argumentation_analysis.core.communication.message import Message, MessageType, AgentLevel
+from argumentation_analysis.core.communication.middleware import MessageMiddleware
+from argumentation_analysis.core.communication.hierarchical_channel import HierarchicalChannel
+from argumentation_analysis.core.communication.data_channel import DataChannel
+from argumentation_analysis.core.communication.collaboration_channel import CollaborationChannel
+
+
+def make_message(recipient, channel="hierarchical", index=0):
+    return Message(
+        message_type=MessageType.INFORMATION,
+        sender="benchmark-sender",
+        sender_level=AgentLevel.TACTICAL,
+        content={"info_type": "benchmark", "index": index},
+        recipient=recipient,
+        channel=channel
+    )
+
+
+class MiddlewareTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.middleware = MessageMiddleware()
+        self.middleware.register_channel(HierarchicalChannel("hierarchical"))
+        self.middleware.register_channel(DataChannel("data"))
+        self.middleware.register_channel(CollaborationChannel("collaboration"))
+
+    def tearDown(self):
+        self.middleware.shutdown()
+
+    def _receive_in_thread(self, recipient, timeout=5.0):
+        result = {}
+
+        def receive():
+            result["message"] = self.middleware.receive_message(recipient, timeout=timeout)
+            result["received_at"] = time.perf_counter()
+
+        thread = threading.Thread(target=receive)
+        thread.start()
+        return thread, result
+
+    def _produce_and_consume(self, recipient, count):
+        received = []
+
+        def consume():
+            while len(received) < count:
+                message = self.middleware.receive_message(recipient, timeout=5.0)
+                if message is None:
+                    return
+                received.append(message.content["index"])
+
+        consumer = threading.Thread(target=consume)
+        start = time.perf_counter()
+        consumer.start()
+        for index in range(count):
+            self.middleware.send_message(make_message(recipient, "data", index))
+        consumer.join(30)
+        return received, time.perf_counter() - start
+
+    def _serve_async_receivers(self, recipients):
+        async def scenario():
+            tasks = [asyncio.ensure_future(self.middleware.receive_message_async(r, timeout=5.0))
+                     for r in recipients]
+            await asyncio.sleep(0.05)
+            sent_at = time.perf_counter()
+            threading.Thread(target=lambda: [
+                self.middleware.send_message(make_message(r, "data")) for r in recipients
+            ]).start()
+            messages = await asyncio.gather(*tasks)
+            return messages, time.perf_counter() - sent_at
+
+        return asyncio.run(scenario())
+
+
+class TestMessageDelivery(MiddlewareTestCase):
+    """Réveil, délai et arrêt de `receive_message`, sans seuil de performance."""
+
+    def test_blocked_receiver_gets_message_on_every_channel(self):
+        for index, channel in enumerate(("hierarchical", "data", "collaboration")):
+            thread, result = self._receive_in_thread("wakeup-agent")
+            time.sleep(0.005)  # Le récepteur est bloqué avant l'envoi
+            self.middleware.send_message(make_message("wakeup-agent", channel, index))
+            thread.join(5)
+            self.assertEqual(result["message"].content["index"], index)
+
+    def test_timeout_is_honoured(self):
+        start = time.monotonic()
+        self.assertIsNone(self.middleware.receive_message("nobody", timeout=0.2))
+        self.assertTrue(0.2 <= time.monotonic() - start < 2.0)
+
+    def test_shutdown_wakes_blocked_receiver(self):
+        thread, result = self._receive_in_thread("blocked-agent", timeout=None)
+        time.sleep(0.05)
+        self.middleware.shutdown()
+        thread.join(2)
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(result["message"])
+
+    def test_producer_consumer_delivers_every_message(self):
+        received, _ = self._produce_and_consume("producer-agent", 200)
+        self.assertEqual(sorted(received), list(range(200)))
+
+    def test_async_receivers_await_natively(self):
+        # Plus de récepteurs que de threads de l'exécuteur par défaut
+        recipients = [f"async-agent-{i}" for i in range(100)]
+        messages, _ = self._serve_async_receivers(recipients)
+        self.assertEqual([m.recipient for m in messages], recipients)
+        self.assertIsNone(asyncio.run(self.middleware.receive_message_async("nobody", timeout=0.1)))
+
+
+@unittest.skipUnless(os.environ.get('RUN_BENCHMARKS') == 'true', "Benchmark : définir RUN_BENCHMARKS=true")
+class TestMessageDeliveryBenchmark(MiddlewareTestCase):
+    """Latence, débit et absence d'attente active de `receive_message`."""
+
+    def test_wakeup_latency_on_every_channel(self):
+        latencies = []
+        for index in range(30):
+            channel = ("hierarchical", "data", "collaboration")[index % 3]
+            thread, result = self._receive_in_thread("latency-agent")
+            time.sleep(0.005)  # Le récepteur est bloqué avant l'envoi
+            sent_at = time.perf_counter()
+            self.middleware.send_message(make_message("latency-agent", channel, index))
+            thread.join(5)
+            self.assertEqual(result["message"].content["index"], index)
+            latencies.append(result["received_at"] - sent_at)
+
+        # L'ancienne boucle d'interrogation ajoutait jusqu'à 10 ms par message
+        self.assertLess(statistics.median(latencies), 0.005)
+
+    def test_idle_receiver_does_not_spin(self):
+        cpu_before = time.process_time()
+        message = self.middleware.receive_message("idle-agent", timeout=0.5)
+        cpu_used = time.process_time() - cpu_before
+        self.assertIsNone(message)
+        self.assertLess(cpu_used, 0.05)
+
+    def test_throughput_producer_consumer(self):
+        count = 2000
+        received, elapsed = self._produce_and_consume("throughput-agent", count)
+        self.assertEqual(sorted(received), list(range(count)))
+        self.assertLess(elapsed, 10.0)
+
+    def test_async_receivers_latency(self):
+        recipients = [f"async-agent-{i}" for i in range(100)]
+        messages, elapsed = self._serve_async_receivers(recipients)
+        self.assertEqual([m.recipient for m in messages], recipients)
+        self.assertLess(elapsed, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
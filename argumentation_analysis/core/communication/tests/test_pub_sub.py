@@ -0,0 +1,301 @@
+"""
+Tests de la livraison asynchrone du protocole de publication-abonnement.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from argumentation_analysis.core.communication.message import Message, MessageType, MessagePriority, AgentLevel
+from argumentation_analysis.core.communication.pub_sub import (
+    Topic, PublishSubscribeProtocol, compile_filter
+)
+
+
+def make_message(index=0, sender="publisher", priority=MessagePriority.NORMAL, **content):
+    return Message(
+        message_type=MessageType.PUBLICATION,
+        sender=sender,
+        sender_level=AgentLevel.TACTICAL,
+        content={"index": index, **content},
+        priority=priority
+    )
+
+
+class TestTopicDelivery(unittest.TestCase):
+    """Files de livraison par abonné, contre-pression et historique borné."""
+
+    def setUp(self):
+        self.topics = []
+
+    def tearDown(self):
+        for topic in self.topics:
+            topic.close()
+
+    def make_topic(self, **kwargs):
+        topic = Topic("test-topic", **kwargs)
+        self.topics.append(topic)
+        return topic
+
+    def test_delivery_preserves_order_per_subscriber(self):
+        topic = self.make_topic()
+        received = []
+        topic.add_subscriber("agent", lambda m: received.append(m.content["index"]))
+
+        for index in range(500):
+            topic.publish_message(make_message(index))
+
+        self.assertTrue(topic.flush(5))
+        self.assertEqual(received, list(range(500)))
+
+    def test_slow_subscriber_does_not_stall_publisher_or_others(self):
+        topic = self.make_topic()
+        release = threading.Event()
+        fast_received = []
+        topic.add_subscriber("slow", lambda m: release.wait(5))
+        topic.add_subscriber("fast", lambda m: fast_received.append(m.content["index"]))
+
+        start = time.monotonic()
+        for index in range(20):
+            self.assertEqual(topic.publish_message(make_message(index)), ["slow", "fast"])
+        self.assertLess(time.monotonic() - start, 0.5)
+
+        deadline = time.monotonic() + 2
+        while len(fast_received) < 20 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(fast_received, list(range(20)))
+
+        release.set()
+        self.assertTrue(topic.flush(5))
+
+    def test_drop_oldest_policy(self):
+        topic = self.make_topic(queue_size=5)
+        release = threading.Event()
+        received = []
+
+        def slow_callback(message):
+            release.wait(5)
+            received.append(message.content["index"])
+
+        topic.add_subscriber("agent", slow_callback)
+        topic.publish_message(make_message(0))
+        time.sleep(0.05)  # Le message 0 est en cours de livraison
+        for index in range(1, 21):
+            topic.publish_message(make_message(index))
+
+        release.set()
+        self.assertTrue(topic.flush(5))
+        self.assertEqual(received, [0, 16, 17, 18, 19, 20])
+        self.assertEqual(topic.get_topic_info()["dropped_messages"], 15)
+
+    def test_block_policy_applies_backpressure(self):
+        topic = self.make_topic(queue_size=2, backpressure="block")
+        received = []
+
+        def slow_callback(message):
+            time.sleep(0.02)
+            received.append(message.content["index"])
+
+        topic.add_subscriber("agent", slow_callback)
+        start = time.monotonic()
+        for index in range(10):
+            topic.publish_message(make_message(index))
+        # L'éditeur a été ralenti au rythme de l'abonné
+        self.assertGreater(time.monotonic() - start, 0.1)
+
+        self.assertTrue(topic.flush(5))
+        self.assertEqual(received, list(range(10)))
+
+    def test_block_policy_timeout_drops_message(self):
+        topic = self.make_topic(queue_size=1, backpressure="block", block_timeout=0.05)
+        release = threading.Event()
+        topic.add_subscriber("agent", lambda m: release.wait(5))
+
+        topic.publish_message(make_message(0))
+        time.sleep(0.05)
+        self.assertEqual(topic.publish_message(make_message(1)), ["agent"])
+        self.assertEqual(topic.publish_message(make_message(2)), [])
+
+        release.set()
+        self.assertTrue(topic.flush(5))
+
+    def test_spill_policy_keeps_every_message(self):
+        topic = self.make_topic(queue_size=10, backpressure="spill")
+        release = threading.Event()
+        received = []
+
+        def slow_callback(message):
+            release.wait(5)
+            received.append(message.content["index"])
+
+        topic.add_subscriber("agent", slow_callback)
+        for index in range(200):
+            topic.publish_message(make_message(index))
+        # Un message peut déjà être en cours de livraison
+        self.assertIn(topic.get_topic_info()["pending_deliveries"], (199, 200))
+
+        release.set()
+        self.assertTrue(topic.flush(5))
+        self.assertEqual(received, list(range(200)))
+
+        # Le fichier de débordement est réutilisé après avoir été vidé
+        for index in range(200, 230):
+            topic.publish_message(make_message(index))
+        self.assertTrue(topic.flush(5))
+        self.assertEqual(received, list(range(230)))
+
+    def test_unknown_policy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            Topic("invalid", backpressure="discard")
+
+    def test_callback_errors_are_isolated(self):
+        topic = self.make_topic()
+        received = []
+
+        def failing_callback(message):
+            if message.content["index"] == 1:
+                raise RuntimeError("boom")
+            received.append(message.content["index"])
+
+        topic.add_subscriber("agent", failing_callback)
+        for index in range(3):
+            topic.publish_message(make_message(index))
+        self.assertTrue(topic.flush(5))
+        self.assertEqual(received, [0, 2])
+
+    def test_unsubscribe_releases_blocked_publisher(self):
+        topic = self.make_topic(queue_size=1, backpressure="block")
+        release = threading.Event()
+        subscription_id = topic.add_subscriber("agent", lambda m: release.wait(5))
+        topic.publish_message(make_message(0))
+        time.sleep(0.05)
+        topic.publish_message(make_message(1))
+
+        publisher = threading.Thread(target=topic.publish_message, args=(make_message(2),))
+        publisher.start()
+        time.sleep(0.05)
+        self.assertTrue(publisher.is_alive())
+        self.assertTrue(topic.remove_subscriber(subscription_id))
+        publisher.join(1)
+        self.assertFalse(publisher.is_alive())
+        release.set()
+
+    def test_history_is_bounded(self):
+        topic = self.make_topic(max_history=10)
+        for index in range(25):
+            topic.publish_message(make_message(index))
+        recent = topic.get_recent_messages()
+        self.assertEqual([m.content["index"] for m in recent], list(range(15, 25)))
+        self.assertEqual([m.content["index"] for m in topic.get_recent_messages(count=3)], [22, 23, 24])
+        # count=0 se comporte comme le slice [-0:] : tous les messages
+        self.assertEqual(len(topic.get_recent_messages(count=0)), 10)
+
+        topic.max_history = 5
+        self.assertEqual(topic.get_message_count(), 5)
+
+    def test_filtered_subscription(self):
+        topic = self.make_topic()
+        received = []
+        topic.add_subscriber("agent", lambda m: received.append(m.content["index"]),
+                             {"sender": ["a", "b"], "content": {"kind": "x"}})
+        topic.publish_message(make_message(0, sender="a", kind="x"))
+        topic.publish_message(make_message(1, sender="c", kind="x"))
+        topic.publish_message(make_message(2, sender="b", kind="y"))
+        topic.publish_message(make_message(3, sender="b"))
+        self.assertTrue(topic.flush(5))
+        self.assertEqual(received, [0])
+
+
+class TestCompileFilter(unittest.TestCase):
+    """Prédicats compilés équivalents aux critères de filtrage."""
+
+    def test_criteria(self):
+        message = make_message(sender="a", priority=MessagePriority.HIGH, kind="x", tags="t")
+        self.assertTrue(compile_filter(None)(message))
+        self.assertTrue(compile_filter({})(message))
+        self.assertTrue(compile_filter({"sender": "a"})(message))
+        self.assertFalse(compile_filter({"sender": ["b", "c"]})(message))
+        self.assertTrue(compile_filter({"priority": "high"})(message))
+        self.assertTrue(compile_filter({"sender_level": ["tactical", "strategic"]})(message))
+        self.assertTrue(compile_filter({"content": {"kind": ["x", "y"], "tags": "t"}})(message))
+        self.assertFalse(compile_filter({"content": {"missing": 1}})(message))
+        self.assertFalse(compile_filter({"sender": "a", "priority": "low"})(message))
+        # Valeurs non hachables dans une liste
+        self.assertFalse(compile_filter({"content": {"kind": [["x"], {"a": 1}]}})(message))
+        # Valeur non hachable dans le message, comparée à une liste de valeurs hachables
+        tagged = make_message(tags=["t", "u"], meta={"a": 1})
+        self.assertFalse(compile_filter({"content": {"tags": ["t", "u"]}})(tagged))
+        self.assertTrue(compile_filter({"content": {"tags": [["t", "u"], "v"]}})(tagged))
+        self.assertFalse(compile_filter({"content": {"meta": ["x", 1]}})(tagged))
+        self.assertTrue(compile_filter({"content": {"meta": [{"a": 1}]}})(tagged))
+
+
+class TestPublishSubscribeProtocol(unittest.TestCase):
+    """Intégration avec le middleware et callbacks asynchrones."""
+
+    def setUp(self):
+        self.middleware = MagicMock()
+        self.middleware.config = {"pubsub_queue_size": 50, "pubsub_workers": 2, "pubsub_backpressure": "block"}
+        self.protocol = PublishSubscribeProtocol(self.middleware)
+
+    def tearDown(self):
+        self.protocol.shutdown()
+
+    def test_many_subscribers_share_delivery_pool(self):
+        counts = {}
+        lock = threading.Lock()
+
+        def callback_for(name):
+            def callback(message):
+                with lock:
+                    counts[name] = counts.get(name, 0) + 1
+            return callback
+
+        for i in range(20):
+            self.protocol.subscribe("events", f"agent-{i}", callback_for(f"agent-{i}"))
+        for index in range(100):
+            recipients = self.protocol.publish("events", "publisher", AgentLevel.STRATEGIC, {"index": index})
+            self.assertEqual(len(recipients), 20)
+
+        self.assertTrue(self.protocol.flush(5))
+        self.assertEqual(counts, {f"agent-{i}": 100 for i in range(20)})
+        self.assertEqual(self.protocol.get_topic("events").queue_size, 50)
+
+    def test_coroutine_callback_runs_in_subscriber_loop(self):
+        async def scenario():
+            received = []
+            loop_threads = []
+
+            async def callback(message):
+                loop_threads.append(threading.current_thread())
+                received.append(message.content["index"])
+
+            self.protocol.subscribe("async-events", "agent", callback)
+            for index in range(5):
+                self.protocol.publish("async-events", "publisher", AgentLevel.STRATEGIC, {"index": index})
+            while len(received) < 5:
+                await asyncio.sleep(0.01)
+            return received, loop_threads
+
+        received, loop_threads = asyncio.run(asyncio.wait_for(scenario(), 5))
+        self.assertEqual(received, list(range(5)))
+        self.assertTrue(all(thread is threading.main_thread() for thread in loop_threads))
+
+    def test_delete_topic_closes_subscriptions(self):
+        self.protocol.subscribe("temp", "agent", lambda m: None)
+        topic = self.protocol.get_topic("temp")
+        self.assertTrue(self.protocol.delete_topic("temp"))
+        self.assertEqual(topic.get_subscriber_count(), 0)
+        self.assertFalse(self.protocol.delete_topic("temp"))
+
+    def test_shutdown_is_prompt(self):
+        start = time.monotonic()
+        self.protocol.shutdown(timeout=1)
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertFalse(self.protocol.cleanup_thread.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,16 +1,306 @@
 import subprocess
 import os
-import tempfile
+import atexit
+import shutil
+import hashlib
+import logging
+import threading
+import queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
 
 PROVER9_BIN_DIR = Path(__file__).parent.parent.parent / "libs" / "prover9" / "bin"
 PROVER9_EXECUTABLE = PROVER9_BIN_DIR / "prover9.bat"
 
+# Codes de sortie de Prover9 : 0 preuve trouvée, 2 espace de recherche épuisé (pas de preuve),
+# 3-7 arrêt sur une limite (max_megs, max_seconds, max_given, max_kept, action)
+EXIT_PROOF = 0
+EXIT_SOS_EMPTY = 2
+LIMIT_EXIT_CODES = {3: "max_megs", 4: "max_seconds", 5: "max_given", 6: "max_kept", 7: "action"}
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MEMORY_LIMIT_MB = 500
+DEFAULT_CACHE_SIZE = 512
+# Marge accordée au processus au-delà de ses propres limites avant qu'il ne soit tué
+_TIMEOUT_GRACE = 2.0
+_RLIMIT_MARGIN_MB = 64
+
+
+class Prover9Result(NamedTuple):
+    """Verdict d'un appel à Prover9."""
+    proved: bool
+    status: str  # "proof", "sos_empty", nom de la limite atteinte, ou "timeout"
+    exit_code: Optional[int]
+    output: str = ""
+    cached: bool = False
+
+
+def normalize_prover9_input(input_content: str) -> str:
+    """
+    Forme canonique d'une entrée Prover9, utilisée comme clé de cache :
+    commentaires `%` retirés, espaces réduits, lignes vides supprimées.
+    """
+    lines = []
+    for line in input_content.splitlines():
+        line = " ".join(line.split("%", 1)[0].split())
+        if line:
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def find_prover9_stdin_command() -> List[str]:
+    """
+    Commande lançant Prover9 en lecture sur l'entrée standard.
+
+    Le wrapper `prover9.bat` appelle `--help` lorsqu'il ne reçoit pas
+    d'argument ; on lance donc directement l'exécutable.
+    """
+    if os.name == "nt":
+        native = PROVER9_BIN_DIR / "prover9.exe.original"
+        if native.is_file():
+            return [str(native)]
+    else:
+        local = PROVER9_BIN_DIR / "prover9"
+        if local.is_file() and os.access(local, os.X_OK):
+            return [str(local)]
+        found = shutil.which("prover9")
+        if found:
+            return [found]
+    raise FileNotFoundError(f"Prover9 executable not found in {PROVER9_BIN_DIR} or on PATH")
+
+
+class Prover9Service:
+    """
+    Service Prover9 à processus pré-lancés, avec cache des verdicts.
+
+    Prover9 traite un seul problème par processus : le service garde
+    `pool_size` processus déjà démarrés et bloqués sur leur entrée standard,
+    de sorte que le coût de lancement est payé hors du chemin critique. Chaque
+    appel prend un processus prêt, lui envoie le problème sur stdin, lit le
+    résultat sur stdout, et un remplaçant est lancé en arrière-plan.
+
+    - Les appels simultanés sont bornés par `max_concurrency`.
+    - Chaque appel est limité en temps (`assign(max_seconds, ...)` plus une
+      horloge murale qui tue le processus) et en mémoire (`assign(max_megs,
+      ...)`, plus `RLIMIT_AS` sous Linux).
+    - Les verdicts définitifs (preuve, ou espace de recherche épuisé) sont
+      gardés dans un cache LRU indexé par l'entrée normalisée. Les arrêts sur
+      limite ne sont pas mis en cache.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, max_concurrency: Optional[int] = None,
+                 timeout: float = DEFAULT_TIMEOUT, memory_limit_mb: Optional[int] = DEFAULT_MEMORY_LIMIT_MB,
+                 cache_size: int = DEFAULT_CACHE_SIZE, command: Optional[List[str]] = None):
+        self.pool_size = max(0, pool_size)
+        self.max_concurrency = max(1, max_concurrency or pool_size or 1)
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.cache_size = cache_size
+        self._command = command
+        self._idle: "queue.Queue[subprocess.Popen]" = queue.Queue()
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._spawner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prover9-spawn")
+        self._cache: "OrderedDict[str, Prover9Result]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {"calls": 0, "cache_hits": 0, "runs": 0, "prespawned_used": 0, "timeouts": 0, "limits": 0}
+        for _ in range(self.pool_size):
+            self._spawner.submit(self._refill)
+
+    @property
+    def command(self) -> List[str]:
+        if self._command is None:
+            self._command = find_prover9_stdin_command()
+        return self._command
+
+    # -- Gestion des processus ----------------------------------------------------
+
+    def _limit_memory(self, process: subprocess.Popen) -> None:
+        """
+        Applique RLIMIT_AS au processus lancé (Linux, `prlimit`). Le processus
+        attend son entrée sur stdin : la limite est en place avant tout calcul.
+        Pas de `preexec_fn`, qui n'est pas sûr dans un programme multi-thread.
+        """
+        if not self.memory_limit_mb or resource is None or not hasattr(resource, "prlimit"):
+            return
+        limit = (self.memory_limit_mb + _RLIMIT_MARGIN_MB) * 1024 * 1024
+        try:
+            resource.prlimit(process.pid, resource.RLIMIT_AS, (limit, limit))
+        except (OSError, ValueError) as e:  # Processus déjà terminé, limite refusée...
+            logger.debug(f"RLIMIT_AS non appliquée au processus Prover9 {process.pid} : {e}")
+
+    def _spawn(self) -> subprocess.Popen:
+        process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="ascii",
+            errors="replace",
+            cwd=str(PROVER9_BIN_DIR) if PROVER9_BIN_DIR.is_dir() else None,
+        )
+        self._limit_memory(process)
+        return process
+
+    def _refill(self) -> None:
+        if self._closed or self._idle.qsize() >= self.pool_size:
+            return
+        try:
+            self._idle.put(self._spawn())
+        except OSError as e:
+            logger.warning(f"Impossible de pré-lancer un processus Prover9 : {e}")
+
+    def _acquire_process(self) -> subprocess.Popen:
+        while True:
+            try:
+                process = self._idle.get_nowait()
+            except queue.Empty:
+                return self._spawn()
+            if process.poll() is None:
+                with self._lock:
+                    self.stats["prespawned_used"] += 1
+                return process
+            # Processus mort entre-temps (tué, limite système...) : on l'écarte
+
+    # -- Exécution -----------------------------------------------------------------
+
+    def _with_limits(self, input_content: str, timeout: float, memory_limit_mb: Optional[int]) -> str:
+        header = [f"assign(max_seconds, {max(1, int(timeout))})."]
+        if memory_limit_mb:
+            header.append(f"assign(max_megs, {int(memory_limit_mb)}).")
+        # Les assignations de l'entrée, placées après, restent prioritaires
+        return "\n".join(header) + "\n" + input_content
+
+    def _execute(self, input_content: str, timeout: Optional[float], memory_limit_mb: Optional[int]) -> Prover9Result:
+        if self._closed:
+            raise RuntimeError("Prover9Service is closed")
+        timeout = self.timeout if timeout is None else timeout
+        memory_limit_mb = self.memory_limit_mb if memory_limit_mb is None else memory_limit_mb
+        payload = self._with_limits(input_content, timeout, memory_limit_mb)
+
+        with self._slots:
+            process = self._acquire_process()
+            if self.pool_size and not self._closed:
+                try:
+                    self._spawner.submit(self._refill)
+                except RuntimeError:  # Service fermé entre-temps
+                    pass
+            with self._lock:
+                self.stats["runs"] += 1
+            try:
+                stdout, stderr = process.communicate(payload, timeout=timeout + _TIMEOUT_GRACE)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                stdout, _ = process.communicate()
+                with self._lock:
+                    self.stats["timeouts"] += 1
+                logger.warning(f"Prover9 tué après {timeout + _TIMEOUT_GRACE:.1f}s")
+                return Prover9Result(False, "timeout", None, stdout or "")
+
+        code = process.returncode
+        if code == EXIT_PROOF:
+            return Prover9Result(True, "proof", code, stdout)
+        if code == EXIT_SOS_EMPTY:
+            return Prover9Result(False, "sos_empty", code, stdout)
+        if code in LIMIT_EXIT_CODES:
+            with self._lock:
+                self.stats["limits"] += 1
+            return Prover9Result("END OF PROOF" in stdout, LIMIT_EXIT_CODES[code], code, stdout)
+        error_message = f"Prover9 failed with exit code {code}.\n"
+        error_message += f"Input was:\n{input_content}\n"
+        error_message += f"Stderr:\n{stderr}"
+        raise subprocess.CalledProcessError(code, self.command, output=stdout, stderr=error_message)
+
+    def run(self, input_content: str, timeout: Optional[float] = None,
+            memory_limit_mb: Optional[int] = None) -> str:
+        """Exécute Prover9 sans passer par le cache et retourne sa sortie."""
+        return self._execute(input_content, timeout, memory_limit_mb).output
+
+    def prove(self, input_content: str, timeout: Optional[float] = None,
+              memory_limit_mb: Optional[int] = None) -> Prover9Result:
+        """
+        Retourne le verdict de Prover9 pour une entrée, depuis le cache si
+        une entrée équivalente a déjà été résolue.
+
+        Raises:
+            FileNotFoundError: Si Prover9 est introuvable.
+            subprocess.CalledProcessError: Si Prover9 échoue (entrée invalide...).
+        """
+        key = hashlib.sha256(normalize_prover9_input(input_content).encode("utf-8")).hexdigest()
+        with self._lock:
+            self.stats["calls"] += 1
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.stats["cache_hits"] += 1
+                return cached
+
+        result = self._execute(input_content, timeout, memory_limit_mb)
+        if result.status in ("proof", "sos_empty") and self.cache_size > 0:
+            with self._lock:
+                # Le cache ne garde que le verdict, pas la sortie complète
+                self._cache[key] = result._replace(output="", cached=True)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Arrête les processus pré-lancés."""
+        self._closed = True
+        self._spawner.shutdown(wait=True)
+        while True:
+            try:
+                process = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            process.kill()
+            process.communicate()
+
+
+_default_service: Optional[Prover9Service] = None
+_default_service_lock = threading.Lock()
+
+
+def get_prover9_service() -> Prover9Service:
+    """Service Prover9 partagé par le processus (créé au premier appel)."""
+    global _default_service
+    with _default_service_lock:
+        if _default_service is None:
+            _default_service = Prover9Service()
+            atexit.register(_default_service.close)
+        return _default_service
+
+
+def configure_prover9_service(**kwargs) -> Prover9Service:
+    """Remplace le service partagé par un service configuré (voir `Prover9Service`)."""
+    global _default_service
+    with _default_service_lock:
+        previous, _default_service = _default_service, Prover9Service(**kwargs)
+        atexit.register(_default_service.close)
+    if previous is not None:
+        previous.close()
+    return _default_service
+
+
 def run_prover9(input_content: str) -> str:
     """
-    Exécute Prover9 dans un processus externe avec le contenu d'entrée fourni.
-    Utilise désormais un fichier temporaire pour passer l'entrée, conformément
-    au fonctionnement du wrapper prover9.bat.
+    Exécute Prover9 avec le contenu d'entrée fourni, via le service partagé
+    (processus pré-lancés alimentés par l'entrée standard).
 
     Args:
         input_content: Une chaîne de caractères contenant la logique à envoyer à Prover9.
@@ -22,39 +312,4 @@ def run_prover9(input_content: str) -> str:
         FileNotFoundError: Si l'exécutable de Prover9 n'est pas trouvé.
         subprocess.CalledProcessError: Si Prover9 retourne un code d'erreur.
     """
-    if not PROVER9_EXECUTABLE.is_file():
-        raise FileNotFoundError(f"Prover9 executable not found at {PROVER9_EXECUTABLE}")
-
-    try:
-        # Créer un fichier temporaire pour l'entrée
-        # Créer un fichier temporaire en ASCII avec des fins de ligne Unix (\n) pour Prover9
-        with tempfile.NamedTemporaryFile(
-            mode='w+',
-            delete=False,
-            suffix=".in",
-            encoding='ascii',
-            newline='\n'
-        ) as temp_input_file:
-            temp_input_file.write(input_content)
-            temp_input_path = temp_input_file.name
-
-        # La commande inclut maintenant le chemin du fichier d'entrée
-        command = [str(PROVER9_EXECUTABLE), "-f", temp_input_path]
-
-        process = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=True,
-            cwd=str(PROVER9_BIN_DIR)
-        )
-        return process.stdout
-    except subprocess.CalledProcessError as e:
-        error_message = f"Prover9 failed with exit code {e.returncode}.\n"
-        error_message += f"Input was:\n{input_content}\n"
-        error_message += f"Stderr:\n{e.stderr}"
-        raise subprocess.CalledProcessError(e.returncode, e.cmd, output=e.stdout, stderr=error_message)
-    finally:
-        # S'assurer que le fichier temporaire est supprimé
-        if 'temp_input_path' in locals() and os.path.exists(temp_input_path):
-            os.remove(temp_input_path)
+    return get_prover9_service().run(input_content)
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du service Prover9 (processus pré-lancés, limites et cache des verdicts).
+
+Un faux exécutable Python lisant son entrée standard remplace Prover9 : il
+reproduit les codes de sortie de Prover9 (0 preuve, 2 pas de preuve,
+4 max_seconds, 1 erreur).
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from argumentation_analysis.core.prover9_runner import (
+    _RLIMIT_MARGIN_MB, Prover9Service, normalize_prover9_input, resource
+)
+
+FAKE_PROVER9 = r'''
+import os, sys, time
+data = sys.stdin.read()
+start = time.time()
+if "slow" in data:
+    time.sleep(float(data.split("slow(")[1].split(")")[0]))
+with open(os.environ["FAKE_PROVER9_LOG"], "a") as log:
+    log.write(f"{start} {time.time()}\n")
+if "syntax_error" in data:
+    sys.exit(1)
+if "max_megs" not in data or "max_seconds" not in data:
+    sys.exit(1)
+if "loop" in data:
+    print("SEARCH FAILED")
+    sys.exit(4)
+if "contradiction" in data:
+    print("THEOREM PROVED\n============================== end of proof ==========\nEND OF PROOF")
+    sys.exit(0)
+print("SEARCH FAILED")
+sys.exit(2)
+'''
+
+CONSISTENT = "formulas(assumptions).\np(a).\nend_of_list.\n\ngoals.\n$F.\nend_of_list."
+INCONSISTENT = "formulas(assumptions).\np(a).\n-p(a). % contradiction\nend_of_list.\ngoals.\n$F.\nend_of_list."
+
+
+class TestProver9Service(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        script = os.path.join(self.tmpdir.name, "fake_prover9.py")
+        with open(script, "w") as f:
+            f.write(FAKE_PROVER9)
+        self.log = os.path.join(self.tmpdir.name, "runs.log")
+        os.environ["FAKE_PROVER9_LOG"] = self.log
+        self.command = [sys.executable, script]
+        self.services = []
+
+    def tearDown(self):
+        for service in self.services:
+            service.close()
+        os.environ.pop("FAKE_PROVER9_LOG", None)
+        self.tmpdir.cleanup()
+
+    def make_service(self, **kwargs):
+        kwargs.setdefault("memory_limit_mb", None if sys.platform == "win32" else 1024)
+        service = Prover9Service(command=self.command, **kwargs)
+        self.services.append(service)
+        return service
+
+    def run_count(self):
+        if not os.path.exists(self.log):
+            return 0
+        with open(self.log) as f:
+            return len(f.readlines())
+
+    def test_verdicts(self):
+        service = self.make_service(pool_size=1)
+        proof = service.prove(INCONSISTENT)
+        self.assertTrue(proof.proved)
+        self.assertEqual(proof.status, "proof")
+        self.assertIn("END OF PROOF", proof.output)
+
+        no_proof = service.prove(CONSISTENT)
+        self.assertFalse(no_proof.proved)
+        self.assertEqual(no_proof.status, "sos_empty")
+
+        with self.assertRaises(subprocess.CalledProcessError):
+            service.prove("syntax_error")
+
+    def test_equivalent_inputs_are_answered_from_cache(self):
+        service = self.make_service(pool_size=1)
+        service.prove(INCONSISTENT)
+        reformatted = INCONSISTENT.replace("\n", "\n\n  ").replace("% contradiction", "%  other comment")
+        self.assertEqual(normalize_prover9_input(reformatted), normalize_prover9_input(INCONSISTENT))
+        result = service.prove(reformatted)
+        self.assertTrue(result.proved)
+        self.assertTrue(result.cached)
+        self.assertEqual(service.stats["runs"], 1)
+        self.assertEqual(service.stats["cache_hits"], 1)
+        self.assertEqual(self.run_count(), 1)
+
+    def test_limit_results_are_not_cached(self):
+        service = self.make_service(pool_size=0)
+        self.assertEqual(service.prove("loop").status, "max_seconds")
+        self.assertEqual(service.prove("loop").status, "max_seconds")
+        self.assertEqual(service.stats["runs"], 2)
+        self.assertEqual(service.stats["limits"], 2)
+
+    def test_wall_clock_timeout_kills_the_worker(self):
+        service = self.make_service(pool_size=0, timeout=0.2)
+        start = time.monotonic()
+        result = service.prove("slow(20)")
+        self.assertLess(time.monotonic() - start, 10)
+        self.assertEqual(result.status, "timeout")
+        self.assertIsNone(result.exit_code)
+        self.assertEqual(service.stats["timeouts"], 1)
+
+    def test_prespawned_workers_are_used_and_replaced(self):
+        service = self.make_service(pool_size=2)
+        deadline = time.monotonic() + 10
+        while service._idle.qsize() < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        service.prove(CONSISTENT)
+        service.prove(INCONSISTENT)
+        self.assertEqual(service.stats["prespawned_used"], 2)
+        # Les processus consommés sont remplacés en arrière-plan
+        deadline = time.monotonic() + 10
+        while service._idle.qsize() < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(service._idle.qsize(), 2)
+
+    def test_concurrency_is_bounded(self):
+        service = self.make_service(pool_size=0, max_concurrency=2)
+        threads = [threading.Thread(target=service.prove, args=(f"slow(0.3)\n{i}",)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with open(self.log) as f:
+            intervals = [tuple(map(float, line.split())) for line in f]
+        self.assertEqual(len(intervals), 6)
+        peak = max(sum(1 for s, e in intervals if s <= start < e) for start, _ in intervals)
+        self.assertLessEqual(peak, 2)
+
+    @unittest.skipUnless(resource is not None and hasattr(resource, "prlimit"), "prlimit indisponible")
+    def test_memory_limit_is_applied_after_spawn(self):
+        service = self.make_service(pool_size=0, memory_limit_mb=256)
+        process = service._spawn()
+        try:
+            limit = (256 + _RLIMIT_MARGIN_MB) * 1024 * 1024
+            self.assertEqual(resource.prlimit(process.pid, resource.RLIMIT_AS), (limit, limit))
+        finally:
+            process.kill()
+            process.communicate()
+        self.assertEqual(service.prove(CONSISTENT).status, "sos_empty")
+
+    def test_fol_consistency_follows_the_verdict_status(self):
+        from argumentation_analysis.agents.core.logic import fol_handler
+
+        initializer = MagicMock()
+        handler = fol_handler.FOLHandler(initializer)
+        service = self.make_service(pool_size=0)
+
+        def check(formulas):
+            belief_set = MagicMock()
+            belief_set.toString.return_value = formulas
+            return asyncio.run(handler.fol_check_consistency(belief_set))
+
+        with patch.object(fol_handler, "get_prover9_service", return_value=service):
+            self.assertTrue(check("p(a)")[0])
+            self.assertFalse(check("contradiction(a)")[0])
+            # Arrêt sur limite : ni cohérent ni incohérent
+            with self.assertRaises(RuntimeError):
+                check("loop(a)")
+
+    def test_closed_service_rejects_calls(self):
+        service = self.make_service(pool_size=1)
+        service.close()
+        with self.assertRaises(RuntimeError):
+            service.prove(CONSISTENT)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -55,6 +55,8 @@ class OrchestrationConfig:
     enable_communication_middleware: bool = True
     max_concurrent_analyses: int = 10
     analysis_timeout_seconds: int = 300
+    # Délais par étape du pipeline opérationnel ("extract", "informal", "logic", "synthesis")
+    operational_stage_timeouts: Dict[str, float] = dataclasses.field(default_factory=dict)
     auto_select_orchestrator_enabled: bool = True
     hierarchical_coordination_level: str = "full"
     specialized_orchestrator_priority_order: List[str] = dataclasses.field(
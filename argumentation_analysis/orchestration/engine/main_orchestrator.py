@@ -91,7 +91,10 @@ class MainOrchestrator:
         # Instancier l'exécuteur pour le pipeline opérationnel direct (import tardif)
         try:
             from argumentation_analysis.orchestration.operational.direct_executor import DirectOperationalExecutor
-            self.direct_operational_executor = DirectOperationalExecutor(kernel=self.kernel)
+            self.direct_operational_executor = DirectOperationalExecutor(
+                kernel=self.kernel,
+                stage_timeouts=getattr(self.config, "operational_stage_timeouts", None)
+            )
         except ImportError as e:
             self.direct_operational_executor = None
             logger.error(f"ECHEC de l'importation de DirectOperationalExecutor: {e}", exc_info=True)
@@ -271,7 +274,8 @@ class MainOrchestrator:
             # Appel du pipeline réel
             operational_results = await self.direct_operational_executor.execute_operational_pipeline(
                 text_input=text_input,
-                tactical_results=tactical_coordination_results
+                tactical_results=tactical_coordination_results,
+                timeout=getattr(self.config, "analysis_timeout_seconds", None)
             )
             logger.info("[OPERATIONAL] Exécution via DirectOperationalExecutor terminée.")
             return operational_results
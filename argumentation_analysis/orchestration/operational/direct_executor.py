@@ -1,10 +1,12 @@
+import asyncio
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import semantic_kernel as sk
 from argumentation_analysis.agents.core.extract import ExtractAgent, ExtractResult
 from argumentation_analysis.agents.core.informal import InformalAnalysisAgent
 from argumentation_analysis.agents.core.logic.propositional_logic_agent import PropositionalLogicAgent
 from argumentation_analysis.agents.core.synthesis import SynthesisAgent, LogicAnalysisResult, InformalAnalysisResult
+from argumentation_analysis.orchestration.operational.stage_scheduler import Stage, StageScheduler
 
 # Configuration de base pour le logger
 logging.basicConfig(level=logging.INFO)
@@ -13,13 +15,18 @@ logger = logging.getLogger(__name__)
 class DirectOperationalExecutor:
     """
     Exécuteur opérationnel direct pour le Pipeline 1.
-    Coordonne les agents spécialisés de manière séquentielle.
+    Coordonne les agents spécialisés selon un graphe de dépendances entre étapes.
     """
-    def __init__(self, kernel: sk.Kernel):
+    def __init__(self, kernel: sk.Kernel, stage_timeouts: Optional[Dict[str, float]] = None):
         """
         Initialise l'exécuteur avec un kernel Semantic Kernel.
+
+        Args:
+            stage_timeouts: Délais par étape en secondes ("extract", "informal",
+                "logic", "synthesis"), appliqués par défaut à chaque exécution.
         """
         self.kernel = kernel
+        self.stage_timeouts = dict(stage_timeouts or {})
         self.extract_agent = ExtractAgent(kernel)
         self.extract_agent.setup_agent_components(llm_service_id="default")
         
@@ -34,32 +41,74 @@ class DirectOperationalExecutor:
 
         logger.info("DirectOperationalExecutor initialisé avec tous les agents opérationnels.")
 
-    async def execute_operational_pipeline(self, text_input: str, tactical_results: Dict, chat_history: List[Dict[str, str]] = None) -> Dict:
+    async def execute_operational_pipeline(self, text_input: str, tactical_results: Dict, chat_history: List[Dict[str, str]] = None,
+                                           stage_timeouts: Optional[Dict[str, float]] = None,
+                                           timeout: Optional[float] = None) -> Dict:
         """
         Exécute la pipeline opérationnelle avec de vrais agents.
         
-        Séquence d'exécution :
+        Graphe d'exécution :
         1. ExtractAgent : Extraction d'informations structurées
-        2. InformalAgent : Analyse rhétorique et sophismes
-        3. PropositionalLogicAgent : Analyse logique formelle
-        4. SynthesisAgent : Synthèse unifiée des résultats
+        2. InformalAgent et PropositionalLogicAgent, en parallèle : ces deux
+           analyses ne dépendent que de l'extraction
+        3. SynthesisAgent : Synthèse unifiée des résultats
+
+        Une étape en échec ou hors délai est remplacée par un résultat d'erreur
+        et la synthèse s'exécute sur les résultats partiels. Les durées par
+        étape sont retournées sous la clé "metrics".
+
+        Args:
+            stage_timeouts: Délais par étape, prioritaires sur ceux de l'instance.
+            timeout: Délai global ; à son expiration les étapes en cours sont annulées.
         """
-        
-        # Étape 1 : Extraction
-        extract_results = await self._execute_extract_agent(text_input, tactical_results)
-        
-        # Étape 2 : Analyse Informelle
-        informal_results = await self._execute_informal_agent(text_input, extract_results)
-        
-        # Étape 3 : Analyse Logique
-        logic_results = await self._execute_logic_agent(text_input, extract_results, chat_history)
-        
-        # Étape 4 : Synthèse
-        synthesis_results = await self._execute_synthesis_agent(
-            text_input, extract_results, informal_results, logic_results
-        )
-        
-        return self._format_unified_results(synthesis_results)
+        scheduler = StageScheduler(self.build_operational_stages(
+            text_input, tactical_results, chat_history, {**self.stage_timeouts, **(stage_timeouts or {})}
+        ))
+        try:
+            run = await scheduler.run(timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"La pipeline opérationnelle a dépassé le délai global de {timeout}s.")
+            return {
+                "status": "error",
+                "message": f"La pipeline opérationnelle a dépassé le délai global de {timeout}s.",
+                "details": None
+            }
+
+        formatted = self._format_unified_results(run.results["synthesis"])
+        formatted["metrics"] = run.metrics_dict()
+        return formatted
+
+    def build_operational_stages(self, text_input: str, tactical_results: Dict, chat_history: List[Dict[str, str]] = None,
+                                 stage_timeouts: Optional[Dict[str, float]] = None) -> List[Stage]:
+        """
+        Construit le graphe des étapes opérationnelles (extract -> informal | logic -> synthesis).
+        """
+        timeouts = stage_timeouts or {}
+
+        def error_result(key: str, empty: Any):
+            return lambda status, message: {key: empty, "status": status, "message": message}
+
+        return [
+            Stage("extract",
+                  lambda deps: self._execute_extract_agent(text_input, tactical_results),
+                  timeout=timeouts.get("extract"),
+                  fallback=error_result("extracted_data", [])),
+            Stage("informal",
+                  lambda deps: self._execute_informal_agent(text_input, deps["extract"]),
+                  depends_on=("extract",),
+                  timeout=timeouts.get("informal"),
+                  fallback=error_result("informal_analysis", [])),
+            Stage("logic",
+                  lambda deps: self._execute_logic_agent(text_input, deps["extract"], chat_history),
+                  depends_on=("extract",),
+                  timeout=timeouts.get("logic"),
+                  fallback=error_result("logic_analysis", None)),
+            Stage("synthesis",
+                  lambda deps: self._execute_synthesis_agent(text_input, deps["extract"], deps["informal"], deps["logic"]),
+                  depends_on=("extract", "informal", "logic"),
+                  timeout=timeouts.get("synthesis"),
+                  fallback=error_result("synthesis_report", None)),
+        ]
 
     async def _execute_extract_agent(self, text_input: str, tactical_results: Dict) -> Dict:
         """
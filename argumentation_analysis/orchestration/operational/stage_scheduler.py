@@ -0,0 +1,161 @@
+"""
+Ordonnanceur asynchrone d'un graphe de dépendances entre étapes.
+
+Chaque étape est une coroutine qui reçoit les résultats de ses dépendances.
+Toutes les étapes sont lancées ensemble (`asyncio.gather`) et chacune attend
+uniquement ses propres dépendances : les branches indépendantes s'exécutent
+en parallèle et la latence totale est celle du chemin critique plutôt que la
+somme des étapes.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATUS_COMPLETED = "completed"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+STATUS_CANCELLED = "cancelled"
+STATUS_SKIPPED = "skipped"
+
+
+@dataclass
+class Stage:
+    """
+    Étape du graphe.
+
+    Attributs:
+        name: Identifiant unique de l'étape.
+        func: Coroutine appelée avec le dictionnaire {dépendance: résultat}.
+        depends_on: Noms des étapes dont le résultat est requis.
+        timeout: Délai maximal en secondes (None = pas de limite).
+        fallback: Fonction (statut, message) -> résultat utilisé à la place du
+            résultat de l'étape en cas d'erreur ou de dépassement de délai ; les
+            étapes dépendantes s'exécutent alors normalement. Sans fallback,
+            elles sont marquées "skipped".
+    """
+    name: str
+    func: Callable[[Dict[str, Any]], Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    fallback: Optional[Callable[[str, str], Any]] = None
+
+
+@dataclass
+class SchedulerRun:
+    """Résultats et métriques d'une exécution du graphe."""
+    results: Dict[str, Any] = field(default_factory=dict)
+    metrics: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    total_duration: float = 0.0
+
+    def metrics_dict(self) -> Dict[str, Any]:
+        """Métriques sérialisables, jointes aux résultats des pipelines."""
+        return {"total_duration": self.total_duration, "stages": self.metrics}
+
+
+class StageScheduler:
+    """
+    Exécute un graphe acyclique d'étapes asynchrones.
+
+    Le graphe est validé à la construction (noms uniques, dépendances connues,
+    absence de cycle). L'annulation de `run()` (ou le dépassement de son délai
+    global) annule les étapes en cours, marquées "cancelled" dans les métriques.
+    """
+
+    def __init__(self, stages: List[Stage], default_timeout: Optional[float] = None):
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Étape en double dans le graphe: '{stage.name}'")
+            self.stages[stage.name] = stage
+        for stage in stages:
+            unknown = [dep for dep in stage.depends_on if dep not in self.stages]
+            if unknown:
+                raise ValueError(f"L'étape '{stage.name}' dépend d'étapes inconnues: {unknown}")
+        self.order = self._topological_order()
+        self.default_timeout = default_timeout
+
+    def _topological_order(self) -> List[str]:
+        remaining = {name: set(stage.depends_on) for name, stage in self.stages.items()}
+        order = []
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Cycle détecté entre les étapes: {sorted(remaining)}")
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+
+    async def run(self, timeout: Optional[float] = None) -> SchedulerRun:
+        """
+        Exécute toutes les étapes et retourne leurs résultats et métriques.
+
+        Args:
+            timeout: Délai global ; à son expiration, les étapes non terminées
+                sont annulées et `asyncio.TimeoutError` est levée.
+        """
+        run = SchedulerRun()
+        origin = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+        for name in self.order:
+            run.metrics[name] = {"status": "pending", "depends_on": list(self.stages[name].depends_on)}
+            tasks[name] = asyncio.ensure_future(self._run_stage(self.stages[name], tasks, run, origin))
+
+        try:
+            await asyncio.wait_for(asyncio.gather(*tasks.values(), return_exceptions=True), timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            for task in tasks.values():
+                task.cancel()
+            # Laisser les étapes enregistrer leur annulation
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        finally:
+            run.total_duration = time.perf_counter() - origin
+        return run
+
+    async def _run_stage(self, stage: Stage, tasks: Dict[str, asyncio.Task], run: SchedulerRun, origin: float):
+        metrics = run.metrics[stage.name]
+        try:
+            inputs = {}
+            for dep in stage.depends_on:
+                await tasks[dep]
+                if dep not in run.results:
+                    # Dépendance en échec sans repli : pas de résultat pour cette étape
+                    metrics["status"] = STATUS_SKIPPED
+                    metrics["message"] = f"Dépendance '{dep}' en échec"
+                    return
+                inputs[dep] = run.results[dep]
+
+            timeout = stage.timeout if stage.timeout is not None else self.default_timeout
+            start = time.perf_counter()
+            metrics["start"] = start - origin
+            try:
+                result = await asyncio.wait_for(stage.func(inputs), timeout)
+                status, message = STATUS_COMPLETED, None
+            except asyncio.TimeoutError:
+                status, message = STATUS_TIMEOUT, f"Délai de {timeout}s dépassé pour l'étape '{stage.name}'"
+            except Exception as e:
+                status, message = STATUS_ERROR, str(e)
+            end = time.perf_counter()
+            metrics.update(status=status, end=end - origin, duration=end - start)
+
+            if status == STATUS_COMPLETED:
+                run.results[stage.name] = result
+            else:
+                metrics["message"] = message
+                logger.error(f"Étape '{stage.name}' en échec ({status}): {message}")
+                if stage.fallback is not None:
+                    run.results[stage.name] = stage.fallback(status, message)
+        except asyncio.CancelledError:
+            metrics["status"] = STATUS_CANCELLED
+            if "start" in metrics:
+                metrics["end"] = time.perf_counter() - origin
+                metrics["duration"] = metrics["end"] - metrics["start"]
+            raise
@@ -711,7 +711,9 @@ Réponds au format JSON avec les clés: entites, relations, patterns, persuasion
             
             # Faire l'appel LLM authentique async
             chat_function = self.kernel.create_function_from_prompt(prompt=operational_prompt, function_name="operational_analysis")
-            response = await self.kernel.invoke(chat_function)
+            # Délai optionnel (secondes) : un appel LLM bloqué ne retient pas l'analyse
+            timeout = (options or {}).get('operational_timeout')
+            response = await asyncio.wait_for(self.kernel.invoke(chat_function), timeout)
             
             # Mesurer le temps de fin
             end_time = time.time()
@@ -383,26 +383,32 @@ class JTMSService:
         instance_id = await self.create_jtms_instance(session_id)
         jtms = self.instances[instance_id]
         
-        # Reconstruire l'état
+        # Reconstruire l'état en un seul lot : une seule analyse des cycles et
+        # une seule propagation à la validation, d'où une restauration linéaire.
         beliefs_data = state.get("beliefs", {})
         
-        # Créer toutes les croyances d'abord
-        for belief_name in beliefs_data:
-            jtms.add_belief(belief_name)
-        
-        # Ajouter les justifications
-        for belief_name, belief_info in beliefs_data.items():
-            for justification in belief_info.get("justifications", []):
-                jtms.add_justification(
-                    justification["in_beliefs"],
-                    justification["out_beliefs"],
-                    justification["conclusion"]
-                )
-        
-        # Restaurer les valeurs de validité
-        for belief_name, belief_info in beliefs_data.items():
-            if belief_info["valid"] is not None:
-                jtms.set_belief_validity(belief_name, belief_info["valid"])
+        with jtms.batch():
+            # Créer toutes les croyances d'abord
+            for belief_name in beliefs_data:
+                jtms.add_belief(belief_name)
+            
+            # Ajouter les justifications
+            for belief_name, belief_info in beliefs_data.items():
+                for justification in belief_info.get("justifications", []):
+                    jtms.add_justification(
+                        justification["in_beliefs"],
+                        justification["out_beliefs"],
+                        justification["conclusion"]
+                    )
+            
+            # Restaurer les valeurs de validité
+            for belief_name, belief_info in beliefs_data.items():
+                if belief_info["valid"] is not None:
+                    jtms.set_belief_validity(belief_name, belief_info["valid"])
+        
+        total_justifications = sum(len(belief.justifications) for belief in jtms.beliefs.values())
+        self.metadata[instance_id]["beliefs_count"] = len(jtms.beliefs)
+        self.metadata[instance_id]["justifications_count"] = total_justifications
         
         return instance_id
     
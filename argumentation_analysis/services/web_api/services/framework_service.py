@@ -6,24 +6,54 @@ Service de construction de frameworks de Dung.
 """
 
 import time
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional, Set, Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Any, Optional, Set, Tuple
 
 from argumentation_analysis.services.web_api.models.request_models import FrameworkRequest, Argument, FrameworkOptions
 from argumentation_analysis.services.web_api.models.response_models import (
     FrameworkResponse, ArgumentNode, Extension, FrameworkVisualization
 )
+from abs_arg_dung.native_solver import NativeDungSolver, NativeDungTheory, SolverTimeout
 
 logger = logging.getLogger("FrameworkService")
 
+# Nombre maximal d'extensions retournées par requête
+MAX_EXTENSIONS = 1000
+# Délai maximal (secondes) de l'énumération des extensions
+SOLVER_TIMEOUT = 10.0
+# Nombre de résultats (framework, sémantique) conservés en cache
+EXTENSION_CACHE_SIZE = 128
+# Sémantiques exposées par l'API
+SEMANTICS = ('grounded', 'complete', 'preferred', 'stable', 'semi-stable')
+
+
+def framework_key(arguments: List[str], attacks: List[Tuple[str, str]]) -> str:
+    """
+    Empreinte canonique d'un framework : indépendante de l'ordre des arguments
+    et des attaques (et des attaques en double).
+    """
+    digest = hashlib.sha256()
+    for name in sorted(set(arguments)):
+        digest.update(b'a\0' + name.encode('utf-8') + b'\0')
+    for attacker, target in sorted(set(attacks)):
+        digest.update(b'r\0' + attacker.encode('utf-8') + b'\0' + target.encode('utf-8') + b'\0')
+    return digest.hexdigest()
+
 
 class FrameworkService:
     """
     Service pour la construction et l'analyse de frameworks de Dung.
     
-    Ce service implémente les algorithmes de base pour calculer
-    les extensions selon différentes sémantiques.
+    Les extensions sont calculées par `NativeDungSolver` ; les résultats sont
+    partagés entre instances dans un cache LRU indexé par l'empreinte
+    canonique du framework et la sémantique.
     """
+
+    _extension_cache: "OrderedDict[Tuple[str, str], List[FrozenSet[str]]]" = OrderedDict()
+    _cache_lock = threading.Lock()
     
     def __init__(self):
         """Initialise le service de framework."""
@@ -128,25 +158,24 @@ class FrameworkService:
         """
         nodes = []
         
+        # Calcul des relations inverses en un seul passage
+        attacked_by: Dict[str, List[str]] = {}
+        supported_by: Dict[str, List[str]] = {}
+        for other_arg in arguments:
+            for target_id in dict.fromkeys(other_arg.attacks or []):
+                attacked_by.setdefault(target_id, []).append(other_arg.id)
+            for target_id in dict.fromkeys(other_arg.supports or []):
+                supported_by.setdefault(target_id, []).append(other_arg.id)
+        
         for arg in arguments:
-            # Calcul des relations inverses
-            attacked_by = []
-            supported_by = []
-            
-            for other_arg in arguments:
-                if arg.id in (other_arg.attacks or []):
-                    attacked_by.append(other_arg.id)
-                if arg.id in (other_arg.supports or []):
-                    supported_by.append(other_arg.id)
-            
             node = ArgumentNode(
                 id=arg.id,
                 content=arg.content,
                 status="undecided",
                 attacks=arg.attacks or [],
-                attacked_by=attacked_by,
+                attacked_by=list(attacked_by.get(arg.id, [])),
                 supports=arg.supports or [],
-                supported_by=supported_by
+                supported_by=list(supported_by.get(arg.id, []))
             )
             nodes.append(node)
         
@@ -197,7 +226,9 @@ class FrameworkService:
     def _compute_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]], semantics: str) -> List[Extension]:
         """Calcule les extensions sémantiques d'un framework d'argumentation.
 
-        Route vers la méthode de calcul appropriée en fonction de la sémantique demandée.
+        Les extensions sont énumérées par `NativeDungSolver` (étiquetages
+        IN/OUT/UNDEC, décomposition en SCC) et mémorisées selon l'empreinte canonique du
+        framework. Au plus `MAX_EXTENSIONS` extensions sont retournées.
 
         :param nodes: Liste des nœuds d'argument du framework.
         :type nodes: List[ArgumentNode]
@@ -207,241 +238,80 @@ class FrameworkService:
         :type semantics: str
         :return: Une liste d'objets `Extension`.
         :rtype: List[Extension]
+        :raises SolverTimeout: Si l'énumération dépasse `SOLVER_TIMEOUT` secondes.
         """
+        if semantics not in SEMANTICS:
+            self.logger.warning(f"Sémantique inconnue: {semantics}")
+            return []
+
         try:
-            if semantics == "grounded":
-                return self._compute_grounded_extension(nodes, attacks)
-            elif semantics == "complete":
-                return self._compute_complete_extensions(nodes, attacks)
-            elif semantics == "preferred":
-                return self._compute_preferred_extensions(nodes, attacks)
-            elif semantics == "stable":
-                return self._compute_stable_extensions(nodes, attacks)
-            elif semantics == "semi-stable":
-                return self._compute_semi_stable_extensions(nodes, attacks)
-            else:
-                self.logger.warning(f"Sémantique inconnue: {semantics}")
-                return []
-        
+            argument_sets = self._solve_extensions(nodes, attacks, semantics)
+        except SolverTimeout:
+            self.logger.error(
+                f"Calcul des extensions '{semantics}' interrompu après {SOLVER_TIMEOUT}s "
+                f"({len(nodes)} arguments, {len(attacks)} attaques)"
+            )
+            raise
         except Exception as e:
             self.logger.error(f"Erreur calcul extensions: {e}")
             return []
-    
-    def _compute_grounded_extension(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]]) -> List[Extension]:
-        """Calcule l'extension grounded (fondée) unique d'un framework d'argumentation.
-
-        :param nodes: Liste des nœuds d'argument.
-        :type nodes: List[ArgumentNode]
-        :param attacks: Liste des relations d'attaque.
-        :type attacks: List[Dict[str, str]]
-        :return: Une liste contenant l'unique extension grounded.
-        :rtype: List[Extension]
-        """
-        # Construction du graphe d'attaque
-        attack_graph = self._build_attack_graph(nodes, attacks)
-        
-        # Algorithme de l'extension grounded
-        in_set = set()
-        out_set = set()
-        undecided = {node.id for node in nodes}
-        
-        changed = True
-        while changed:
-            changed = False
-            
-            # Arguments sans attaquants -> IN
-            for arg_id in list(undecided):
-                attackers = attack_graph.get(arg_id, set())
-                if not attackers or attackers.issubset(out_set):
-                    in_set.add(arg_id)
-                    undecided.remove(arg_id)
-                    changed = True
-            
-            # Arguments attaqués par IN -> OUT
-            for arg_id in list(undecided):
-                attackers = attack_graph.get(arg_id, set())
-                if attackers.intersection(in_set):
-                    out_set.add(arg_id)
-                    undecided.remove(arg_id)
-                    changed = True
-        
-        return [Extension(
-            type="grounded",
-            arguments=list(in_set),
-            is_complete=True,
-            is_preferred=True
-        )]
-    
-    def _compute_complete_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]]) -> List[Extension]:
-        """Calcule toutes les extensions complètes d'un framework d'argumentation.
-        (Implémentation simplifiée/heuristique actuelle).
 
-        :param nodes: Liste des nœuds d'argument.
-        :type nodes: List[ArgumentNode]
-        :param attacks: Liste des relations d'attaque.
-        :type attacks: List[Dict[str, str]]
-        :return: Une liste d'objets `Extension` représentant les extensions complètes.
-        :rtype: List[Extension]
-        """
-        attack_graph = self._build_attack_graph(nodes, attacks)
-        all_args = {node.id for node in nodes}
-        
-        # Génération de tous les sous-ensembles possibles
         extensions = []
-        
-        # Pour simplifier, on utilise une approche heuristique
-        # Dans un vrai système, il faudrait implémenter l'algorithme complet
-        
-        # Extension vide (toujours complète)
-        if self._is_complete_extension(set(), attack_graph, all_args):
-            extensions.append(Extension(
-                type="complete",
-                arguments=[],
-                is_complete=True,
-                is_preferred=False
-            ))
-        
-        # Extension grounded
-        grounded = self._compute_grounded_extension(nodes, attacks)
-        if grounded:
+        for arguments in argument_sets:
+            if semantics == "complete":
+                # Seules les extensions complètes maximales sont préférées
+                is_preferred = not any(arguments < other for other in argument_sets)
+            else:
+                is_preferred = True
             extensions.append(Extension(
-                type="complete",
-                arguments=grounded[0].arguments,
+                type=semantics,
+                arguments=[node.id for node in nodes if node.id in arguments],
                 is_complete=True,
-                is_preferred=len(grounded[0].arguments) > 0
+                is_preferred=is_preferred
             ))
-        
         return extensions
-    
-    def _compute_preferred_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]]) -> List[Extension]:
-        """Calcule les extensions préférées d'un framework d'argumentation.
-        (Implémentation simplifiée actuelle : retourne l'extension grounded).
-
-        :param nodes: Liste des nœuds d'argument.
-        :type nodes: List[ArgumentNode]
-        :param attacks: Liste des relations d'attaque.
-        :type attacks: List[Dict[str, str]]
-        :return: Une liste d'objets `Extension` représentant les extensions préférées.
-        :rtype: List[Extension]
-        """
-        # Pour simplifier, on retourne l'extension grounded comme préférée
-        grounded = self._compute_grounded_extension(nodes, attacks)
-        
-        if grounded:
-            return [Extension(
-                type="preferred",
-                arguments=grounded[0].arguments,
-                is_complete=True,
-                is_preferred=True
-            )]
-        
-        return []
-    
-    def _compute_stable_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]]) -> List[Extension]:
-        """Calcule les extensions stables d'un framework d'argumentation.
-        (Implémentation simplifiée actuelle : vérifie si l'extension grounded est stable).
-
-        :param nodes: Liste des nœuds d'argument.
-        :type nodes: List[ArgumentNode]
-        :param attacks: Liste des relations d'attaque.
-        :type attacks: List[Dict[str, str]]
-        :return: Une liste d'objets `Extension` représentant les extensions stables.
-        :rtype: List[Extension]
-        """
-        attack_graph = self._build_attack_graph(nodes, attacks)
-        all_args = {node.id for node in nodes}
-        
-        # Une extension stable attaque tous les arguments qu'elle ne contient pas
-        extensions = []
-        
-        # Vérification de l'extension grounded
-        grounded = self._compute_grounded_extension(nodes, attacks)
-        if grounded and grounded[0].arguments:
-            in_set = set(grounded[0].arguments)
-            out_set = all_args - in_set
-            
-            # Vérifier si tous les arguments OUT sont attaqués par IN
-            is_stable = True
-            for out_arg in out_set:
-                attackers = attack_graph.get(out_arg, set())
-                if not attackers.intersection(in_set):
-                    is_stable = False
-                    break
-            
-            if is_stable:
-                extensions.append(Extension(
-                    type="stable",
-                    arguments=list(in_set),
-                    is_complete=True,
-                    is_preferred=True
-                ))
-        
-        return extensions
-    
-    def _compute_semi_stable_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]]) -> List[Extension]:
-        """Calcule les extensions semi-stables d'un framework d'argumentation.
-        (Implémentation simplifiée actuelle : retourne les extensions préférées).
 
-        :param nodes: Liste des nœuds d'argument.
-        :type nodes: List[ArgumentNode]
-        :param attacks: Liste des relations d'attaque.
-        :type attacks: List[Dict[str, str]]
-        :return: Une liste d'objets `Extension` représentant les extensions semi-stables.
-        :rtype: List[Extension]
-        """
-        # Pour simplifier, on retourne les extensions préférées
-        return self._compute_preferred_extensions(nodes, attacks)
-    
-    def _build_attack_graph(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]]) -> Dict[str, Set[str]]:
-        """Construit une représentation du graphe d'attaque.
+    def _solve_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]], semantics: str) -> List[FrozenSet[str]]:
+        """Énumère les extensions avec `NativeDungSolver`, en passant par le cache de résultats.
 
         :param nodes: Liste des nœuds d'argument.
         :type nodes: List[ArgumentNode]
         :param attacks: Liste des relations d'attaque.
         :type attacks: List[Dict[str, str]]
-        :return: Un dictionnaire où les clés sont les IDs des arguments cibles
-                 et les valeurs sont des ensembles d'IDs des arguments attaquants.
-        :rtype: Dict[str, Set[str]]
-        """
-        graph = {node.id: set() for node in nodes}
-        
-        for attack in attacks:
-            target = attack['target']
-            attacker = attack['attacker']
-            if target in graph:
-                graph[target].add(attacker)
-        
-        return graph
-    
-    def _is_complete_extension(self, extension: Set[str], attack_graph: Dict[str, Set[str]], all_args: Set[str]) -> bool:
-        """Vérifie si un ensemble d'arguments donné est une extension complète.
-        (Implémentation simplifiée actuelle : vérifie uniquement l'absence de conflit).
-
-        Une extension complète doit être sans conflit, défendre tous ses arguments,
-        et contenir tous les arguments qu'elle défend.
-
-        :param extension: L'ensemble d'IDs d'arguments à vérifier.
-        :type extension: Set[str]
-        :param attack_graph: Le graphe d'attaque.
-        :type attack_graph: Dict[str, Set[str]]
-        :param all_args: L'ensemble de tous les IDs d'arguments dans le framework.
-        :type all_args: Set[str]
-        :return: True si l'ensemble est (partiellement) considéré comme complet, False sinon.
-        :rtype: bool
+        :param semantics: Une sémantique de `SEMANTICS`.
+        :type semantics: str
+        :return: Les extensions, sous forme d'ensembles d'IDs d'arguments.
+        :rtype: List[FrozenSet[str]]
         """
-        # Un ensemble S est complet si :
-        # 1. S est sans conflit (conflict-free)
-        # 2. S défend tous ses éléments
-        # 3. S contient tous les arguments qu'il défend
-        
-        # Vérification sans conflit
-        for arg in extension:
-            attackers = attack_graph.get(arg, set())
-            if attackers.intersection(extension):
-                return False
-        
-        # Vérification défense (simplifié)
-        return True
+        argument_ids = [node.id for node in nodes]
+        known = set(argument_ids)
+        pairs = [
+            (attack['attacker'], attack['target']) for attack in attacks
+            if attack['attacker'] in known and attack['target'] in known
+        ]
+        key = (framework_key(argument_ids, pairs), semantics)
+
+        with self._cache_lock:
+            cached = self._extension_cache.get(key)
+            if cached is not None:
+                self._extension_cache.move_to_end(key)
+                return cached
+
+        theory = NativeDungTheory()
+        theory.add_arguments(argument_ids)
+        theory.add_attacks(pairs)
+        solver = NativeDungSolver(theory)
+        extensions = solver.extensions(semantics, limit=MAX_EXTENSIONS, timeout=SOLVER_TIMEOUT)
+        if len(extensions) == MAX_EXTENSIONS:
+            self.logger.warning(f"Énumération '{semantics}' tronquée à {MAX_EXTENSIONS} extensions")
+        names = [argument.name for argument in theory.arguments]
+        argument_sets = [frozenset(names[i] for i in extension) for extension in extensions]
+
+        with self._cache_lock:
+            self._extension_cache[key] = argument_sets
+            if len(self._extension_cache) > EXTENSION_CACHE_SIZE:
+                self._extension_cache.popitem(last=False)
+        return argument_sets
     
     def _update_argument_status(self, nodes: List[ArgumentNode], extensions: List[Extension]) -> None:
         """Met à jour le statut ('accepted', 'rejected', 'undecided') de chaque nœud d'argument
@@ -456,7 +326,9 @@ class FrameworkService:
         """
         # Collecte des arguments dans les extensions
         in_args = set()
+        extension_args = set()
         for ext in extensions:
+            extension_args.update(ext.arguments)
             if ext.is_preferred:
                 in_args.update(ext.arguments)
         
@@ -464,7 +336,7 @@ class FrameworkService:
         for node in nodes:
             if node.id in in_args:
                 node.status = "accepted"
-            elif any(node.id in ext.arguments for ext in extensions):
+            elif node.id in extension_args:
                 node.status = "undecided"
             else:
                 node.status = "rejected"
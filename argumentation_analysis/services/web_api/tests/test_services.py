@@ -348,7 +348,52 @@ class TestFrameworkService:
         assert response is not None
         assert response.framework_options == options.dict()
         assert response.semantics_used == "preferred"
-    
+
+    def test_extensions_of_even_cycle(self, framework_service):
+        """Test des extensions exactes d'un cycle pair attaquant un troisième argument."""
+        arguments = [
+            Argument(id="a", content="A", attacks=["b"]),
+            Argument(id="b", content="B", attacks=["a", "c"]),
+            Argument(id="c", content="C")
+        ]
+
+        def extensions(semantics):
+            request = FrameworkRequest(
+                arguments=arguments,
+                options=FrameworkOptions(compute_extensions=True, semantics=semantics)
+            )
+            response = framework_service.build_framework(request)
+            assert response.success
+            return response
+
+        preferred = extensions("preferred")
+        assert sorted(ext.arguments for ext in preferred.extensions) == [["a", "c"], ["b"]]
+        assert all(node.status == "accepted" for node in preferred.arguments)
+
+        complete = extensions("complete")
+        assert sorted(ext.arguments for ext in complete.extensions) == [[], ["a", "c"], ["b"]]
+        assert [ext.is_preferred for ext in complete.extensions if not ext.arguments] == [False]
+
+        assert [ext.arguments for ext in extensions("grounded").extensions] == [[]]
+        assert sorted(ext.arguments for ext in extensions("stable").extensions) == [["a", "c"], ["b"]]
+
+    def test_extensions_are_cached_by_canonical_framework(self, framework_service):
+        """Test du cache de résultats, indépendant de l'ordre des arguments."""
+        options = FrameworkOptions(compute_extensions=True, semantics="semi-stable")
+        arguments = [
+            Argument(id="x", content="X", attacks=["y"]),
+            Argument(id="y", content="Y", attacks=["x"])
+        ]
+        framework_service.build_framework(FrameworkRequest(arguments=arguments, options=options))
+
+        with patch('argumentation_analysis.services.web_api.services.framework_service.NativeDungSolver') as solver:
+            response = framework_service.build_framework(
+                FrameworkRequest(arguments=list(reversed(arguments)), options=options)
+            )
+
+        solver.assert_not_called()
+        assert response.extension_count == 2
+
     def test_framework_argument_validation(self):
         """Test de validation des arguments du framework."""
         with pytest.raises(ValueError):
@@ -11,13 +11,19 @@ asynchrones avec gestion robuste des timeouts et des erreurs.
 import asyncio
 import logging
 import functools
+import math
 import threading
 import time
 from typing import Any, Callable, Coroutine, Optional, Union, Dict, List
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as ConcurrentTimeoutError
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as ConcurrentTimeoutError
 from datetime import datetime, timedelta
 
 
+def _timed_call(func: Callable, args: tuple, kwargs: dict):
+    """Exécute `func` dans un worker et retourne (heure de démarrage, résultat)."""
+    return time.monotonic(), func(*args, **kwargs)
+
+
 class AsyncManager:
     """
     Gestionnaire asynchrone hybride avec gestion des timeouts et fallbacks.
@@ -31,13 +37,14 @@ class AsyncManager:
         Initialise le gestionnaire asynchrone.
         
         Args:
-            max_workers: Nombre maximum de workers pour le ThreadPoolExecutor
+            max_workers: Nombre maximum de workers des pools de threads et de processus
             default_timeout: Timeout par défaut en secondes
         """
         self.logger = logging.getLogger(__name__)
         self.max_workers = max_workers
         self.default_timeout = default_timeout
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.process_executor: Optional[ProcessPoolExecutor] = None
         self.active_tasks = {}
         self.task_counter = 0
         self._loop = None
@@ -81,7 +88,7 @@ class AsyncManager:
             Résultat de l'exécution ou fallback_result
         """
         task_id = self._generate_task_id()
-        timeout = timeout or self.default_timeout
+        timeout = timeout if timeout is not None else self.default_timeout
         
         self.logger.debug(f"Exécution hybride task_{task_id}: {func_or_coro}")
         
@@ -182,56 +189,167 @@ class AsyncManager:
         self, 
         tasks: List[Dict[str, Any]], 
         max_concurrent: int = 5,
-        global_timeout: float = 60.0
+        global_timeout: float = 60.0,
+        executor: str = "thread"
     ) -> List[Any]:
         """
         Exécute plusieurs tâches en parallèle de manière hybride.
         
+        Version synchrone de `run_multiple_async` : les tâches sont exécutées
+        dans une boucle d'événements dédiée (dans un thread séparé si l'appelant
+        est lui-même dans une boucle en cours).
+        
         Args:
             tasks: Liste de dictionnaires avec 'func', 'args', 'kwargs'
+                (et optionnellement 'timeout', 'fallback_result', 'executor')
             max_concurrent: Nombre maximum de tâches concurrentes
             global_timeout: Timeout global en secondes
+            executor: Pool utilisé pour les fonctions synchrones,
+                "thread" (I/O) ou "process" (calcul, fonctions picklables)
             
         Returns:
-            Liste des résultats
+            Liste des résultats, dans l'ordre des tâches
+        """
+        coro = self.run_multiple_async(tasks, max_concurrent, global_timeout, executor)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return self._run_in_new_loop(coro)
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            return runner.submit(self._run_in_new_loop, coro).result()
+    
+    @staticmethod
+    def _run_in_new_loop(coro: Coroutine) -> Any:
+        """Exécute une coroutine dans une boucle privée, sans toucher à la boucle courante du thread."""
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+    
+    async def run_multiple_async(
+        self,
+        tasks: List[Dict[str, Any]],
+        max_concurrent: int = 5,
+        global_timeout: float = 60.0,
+        executor: str = "thread"
+    ) -> List[Any]:
+        """
+        Exécute plusieurs tâches en parallèle, au plus `max_concurrent` à la fois.
+        
+        Les coroutines s'exécutent dans la boucle courante, les fonctions
+        synchrones dans le pool de threads ou de processus. Chaque tâche a son
+        propre timeout (mesuré à partir de son démarrage) ; à l'expiration du
+        timeout global, les tâches non terminées sont annulées. Une tâche en
+        échec, hors délai ou annulée produit son 'fallback_result'.
+        
+        Le délai d'attente (file) et la durée d'exécution de chaque tâche sont
+        enregistrés dans `active_tasks` et agrégés par `get_performance_stats`.
+        
+        Returns:
+            Liste des résultats, dans l'ordre des tâches
         """
-        self.logger.info(f"Exécution de {len(tasks)} tâches en parallèle")
+        self.logger.info(f"Exécution de {len(tasks)} tâches en parallèle (max {max_concurrent}, pool {executor})")
         
-        results = []
-        start_time = time.time()
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        submitted = time.monotonic()
+        runners = [
+            asyncio.ensure_future(self._run_bounded_task(task_def, semaphore, submitted, executor))
+            for task_def in tasks
+        ]
+        if not runners:
+            return []
         
-        # Diviser les tâches en batches
-        for i in range(0, len(tasks), max_concurrent):
-            batch = tasks[i:i + max_concurrent]
-            batch_results = []
-            
-            # Vérifier le timeout global
-            elapsed = time.time() - start_time
-            if elapsed >= global_timeout:
-                self.logger.warning("Timeout global atteint")
-                break
-            
-            remaining_timeout = global_timeout - elapsed
-            
-            for task_def in batch:
-                try:
-                    func = task_def['func']
-                    args = task_def.get('args', ())
-                    kwargs = task_def.get('kwargs', {})
-                    task_timeout = task_def.get('timeout', min(remaining_timeout / len(batch), 10.0))
-                    fallback = task_def.get('fallback_result')
-                    
-                    result = self.run_hybrid(func, *args, timeout=task_timeout, fallback_result=fallback, **kwargs)
-                    batch_results.append(result)
-                    
-                except Exception as e:
-                    self.logger.error(f"Erreur dans une tâche du batch: {e}")
-                    batch_results.append(task_def.get('fallback_result'))
-            
-            results.extend(batch_results)
+        done, pending = await asyncio.wait(runners, timeout=global_timeout)
+        if pending:
+            self.logger.warning(f"Timeout global atteint: {len(pending)} tâche(s) annulée(s)")
+            for runner in pending:
+                runner.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
         
+        results = []
+        for task_def, runner in zip(tasks, runners):
+            if runner.cancelled() or runner.exception() is not None:
+                results.append(task_def.get('fallback_result'))
+            else:
+                results.append(runner.result())
         return results
     
+    async def _run_bounded_task(
+        self,
+        task_def: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+        submitted: float,
+        executor: str
+    ) -> Any:
+        """Exécute une tâche de `run_multiple_async` une fois un créneau obtenu."""
+        task_id = self._generate_task_id()
+        func = task_def['func']
+        args = task_def.get('args', ())
+        kwargs = task_def.get('kwargs', {})
+        timeout = task_def.get('timeout')
+        if timeout is None:
+            timeout = self.default_timeout
+        info = self.active_tasks[task_id] = {
+            'start_time': datetime.now(),
+            'timeout': timeout,
+            'status': 'queued'
+        }
+        
+        try:
+            async with semaphore:
+                if asyncio.iscoroutine(func) or asyncio.iscoroutinefunction(func):
+                    coro = func if asyncio.iscoroutine(func) else func(*args, **kwargs)
+                    started = time.monotonic()
+                    info['status'] = 'running'
+                    info['queue_delay'] = started - submitted
+                    result = await asyncio.wait_for(coro, timeout=timeout)
+                else:
+                    pool = self._get_pool(task_def.get('executor', executor))
+                    loop = asyncio.get_running_loop()
+                    info['status'] = 'running'
+                    # L'heure de démarrage est prise dans le worker : l'attente
+                    # dans la file interne du pool compte comme délai de file.
+                    started, result = await asyncio.wait_for(
+                        loop.run_in_executor(pool, _timed_call, func, args, kwargs),
+                        timeout=timeout
+                    )
+                    info['queue_delay'] = started - submitted
+            info['status'] = 'completed'
+            return result
+        
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Timeout de {task_id} après {timeout}s")
+            info['status'] = 'timeout'
+            raise
+        except asyncio.CancelledError:
+            info['status'] = 'cancelled'
+            raise
+        except Exception as e:
+            self.logger.error(f"Erreur lors de l'exécution {task_id}: {e}")
+            info['status'] = 'error'
+            info['error'] = str(e)
+            raise
+        
+        finally:
+            end_time = datetime.now()
+            info['end_time'] = end_time
+            if 'queue_delay' in info:
+                info['duration'] = max(0.0, time.monotonic() - submitted - info['queue_delay'])
+            else:
+                info['duration'] = 0.0
+    
+    def _get_pool(self, executor: str):
+        """Retourne le pool de threads ou de processus (créé à la demande)."""
+        if executor == "thread":
+            return self.executor
+        if executor == "process":
+            if self.process_executor is None:
+                self.process_executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self.process_executor
+        raise ValueError(f"Pool inconnu: '{executor}' (attendu: 'thread' ou 'process')")
+    
     def create_async_wrapper(self, sync_func: Callable) -> Callable:
         """
         Crée un wrapper asynchrone pour une fonction synchrone.
@@ -312,34 +430,43 @@ class AsyncManager:
         """
         Retourne les statistiques de performance.
         
+        Les délais d'attente ne concernent que les tâches lancées par
+        `run_multiple_hybrid` / `run_multiple_async`.
+        
         Returns:
             Dictionnaire des statistiques
         """
+        tasks = list(self.active_tasks.values())
         completed_tasks = [
-            task for task in self.active_tasks.values() 
+            task for task in tasks
             if task.get('status') == 'completed' and 'duration' in task
         ]
+        queue_delays = [task['queue_delay'] for task in tasks if 'queue_delay' in task]
         
-        if not completed_tasks:
-            return {
-                'total_tasks': len(self.active_tasks),
-                'completed_tasks': 0,
-                'error_tasks': len([t for t in self.active_tasks.values() if t.get('status') == 'error']),
-                'average_duration': 0,
-                'max_duration': 0,
-                'min_duration': 0
-            }
-        
-        durations = [task['duration'] for task in completed_tasks]
-        
-        return {
-            'total_tasks': len(self.active_tasks),
+        stats = {
+            'total_tasks': len(tasks),
             'completed_tasks': len(completed_tasks),
-            'error_tasks': len([t for t in self.active_tasks.values() if t.get('status') == 'error']),
-            'average_duration': sum(durations) / len(durations),
-            'max_duration': max(durations),
-            'min_duration': min(durations)
+            'error_tasks': len([t for t in tasks if t.get('status') == 'error']),
+            'timeout_tasks': len([t for t in tasks if t.get('status') == 'timeout']),
+            'cancelled_tasks': len([t for t in tasks if t.get('status') == 'cancelled']),
+            'average_duration': 0,
+            'max_duration': 0,
+            'min_duration': 0,
+            'p50_duration': 0,
+            'p95_duration': 0,
+            'average_queue_delay': sum(queue_delays) / len(queue_delays) if queue_delays else 0,
+            'max_queue_delay': max(queue_delays) if queue_delays else 0,
         }
+        if completed_tasks:
+            durations = sorted(task['duration'] for task in completed_tasks)
+            stats.update(
+                average_duration=sum(durations) / len(durations),
+                max_duration=durations[-1],
+                min_duration=durations[0],
+                p50_duration=_percentile(durations, 0.50),
+                p95_duration=_percentile(durations, 0.95),
+            )
+        return stats
     
     def shutdown(self):
         """Arrête proprement le gestionnaire asynchrone."""
@@ -347,6 +474,8 @@ class AsyncManager:
         
         try:
             self.executor.shutdown(wait=True)
+            if self.process_executor is not None:
+                self.process_executor.shutdown(wait=True)
             
             if self._loop and not self._loop.is_closed():
                 # Annuler toutes les tâches en cours
@@ -361,6 +490,12 @@ class AsyncManager:
             self.logger.error(f"Erreur lors de l'arrêt: {e}")
 
 
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Percentile (rang le plus proche) d'une liste triée non vide."""
+    index = max(0, min(len(sorted_values) - 1, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
 # Instance globale
 async_manager = AsyncManager()
 
@@ -280,6 +280,14 @@ class TaxonomyLoader:
                     sniffer = csv.Sniffer()
                     delimiter = sniffer.sniff(sample).delimiter
                     
+                    # L'instantané binaire est compilé avec le délimiteur par défaut de pandas
+                    if delimiter == ',':
+                        entries = self._load_entries_from_snapshot(taxonomy_path)
+                        if entries is not None:
+                            logger.info(f"Taxonomie réelle chargée depuis l'instantané: {len(entries)} entrées")
+                            return entries
+                        entries = []
+                    
                     reader = csv.DictReader(f, delimiter=delimiter)
                     for row in reader:
                         # Normaliser les clés des colonnes
@@ -300,6 +308,41 @@ class TaxonomyLoader:
                 logger.warning("Fallback vers les données mock en raison de l'erreur")
                 return self._load_mock_taxonomy()
     
+    def _load_entries_from_snapshot(self, taxonomy_path):
+        """
+        Construit les entrées depuis l'instantané binaire de la taxonomie.
+        
+        Les entrées sont identiques à celles du parcours csv.DictReader : clés et
+        valeurs nettoyées, valeurs vides ignorées, nombres entiers rendus sans
+        partie décimale (pandas les lit en flottants lorsque la colonne a des trous).
+        
+        Returns:
+            list ou None: Les entrées, ou None si l'instantané est indisponible
+        """
+        from argumentation_analysis.utils.taxonomy_snapshot import load_taxonomy_snapshot
+        
+        df = load_taxonomy_snapshot(taxonomy_path)
+        if df is None:
+            return None
+        
+        # pandas nomme "Unnamed: N" les colonnes sans en-tête, ignorées par le parcours CSV
+        keys = ['' if str(column).startswith('Unnamed: ') else str(column).strip() for column in df.columns]
+        entries = []
+        for row in zip(*(df[column].tolist() for column in df.columns)):
+            normalized_row = {}
+            for key, value in zip(keys, row):
+                if not key or value is None or value != value:  # NaN
+                    continue
+                if isinstance(value, float) and value.is_integer():
+                    value = str(int(value))
+                else:
+                    value = str(value).strip()
+                if value:
+                    normalized_row[key] = value
+            if normalized_row:
+                entries.append(normalized_row)
+        return entries
+    
     def _load_mock_taxonomy(self):
         """Méthode privée pour charger les données mock (utilisée comme fallback)"""
         logger.info("Chargement des données mock de taxonomie")
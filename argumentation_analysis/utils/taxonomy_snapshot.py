@@ -0,0 +1,309 @@
+"""
+Cache binaire de la taxonomie des sophismes, partagé entre processus.
+
+La taxonomie CSV est compilée une fois en un instantané (snapshot) : un
+manifeste JSON et un fichier de données unique, mappé en mémoire, dans lequel
+chaque colonne est rangée sous forme de tableaux numpy bruts :
+- les colonnes numériques sont des vues sur le fichier, mappé en copie à
+  l'écriture : le DataFrame est modifiable, et une page n'est copiée dans la
+  mémoire du processus que si elle est modifiée ;
+- les colonnes texte sont un blob UTF-8, des offsets et un masque des valeurs
+  manquantes. Les cellules sont séparées par un octet nul (sauf si l'une
+  d'elles en contient un) : une colonne est décodée puis découpée en un seul
+  appel au chargement.
+
+Le répertoire de l'instantané est nommé d'après la somme SHA-256 du CSV et la
+version du format : un CSV modifié n'est jamais servi depuis un ancien
+instantané. Un fichier pointeur garde la taille, la date de modification et la
+somme du CSV : tant que les deux premières sont inchangées, le CSV n'est pas
+relu au chargement. Les pages des fichiers mappés sont partagées par le
+système entre les workers qui chargent la même taxonomie, et le coût de
+l'analyse CSV disparaît du démarrage.
+
+Usage (étape de compilation, par exemple au déploiement) :
+    python -m argumentation_analysis.utils.taxonomy_snapshot chemin/taxonomie.csv
+
+Variables d'environnement :
+    TAXONOMY_SNAPSHOT_DIR : répertoire des instantanés (par défaut
+        `.taxonomy_cache/` à côté du CSV).
+    TAXONOMY_SNAPSHOT_DISABLED : si défini à "1", les loaders lisent
+        directement le CSV.
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 3
+MANIFEST_NAME = "manifest.json"
+DATA_NAME = "data.bin"
+_ALIGNMENT = 8
+_SEPARATOR = b'\0'
+# Un CSV modifié il y a moins longtemps que cela peut encore changer sans que sa
+# date de modification ne bouge (granularité du système de fichiers) : on ne
+# mémorise pas sa taille et sa date pour éviter de sauter le calcul de la somme.
+_RACY_WINDOW_SECONDS = 2.0
+
+
+def _view(data, offset: int, dtype, count: int) -> np.ndarray:
+    """Tableau sur une portion du fichier de données mappé (copie à l'écriture)."""
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    return np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+
+
+def _read_text_column(data, column: Dict[str, Any], rows: int) -> pd.Series:
+    """
+    Colonne texte `column` (entrée du manifeste) du fichier de données mappé
+    `data`. Le type est inféré par pandas comme pour `pd.read_csv` (chaînes,
+    ou flottants si toutes les valeurs manquent).
+    """
+    if rows == 0:
+        return pd.Series([], name=column["name"], dtype=object)
+    offsets = _view(data, column["offsets"], np.int64, rows + 1)
+    missing = _view(data, column["missing"], np.bool_, rows)
+    separated = column["separated"]
+    # Le dernier séparateur n'est pas écrit
+    blob = data[int(offsets[0]):int(offsets[-1]) - (1 if separated else 0)]
+    values = np.empty(rows, dtype=object)
+    if separated:
+        values[:] = blob.decode('utf-8').split('\0')
+    else:
+        bounds = (offsets - offsets[0]).tolist()
+        values[:] = [blob[start:end].decode('utf-8') for start, end in zip(bounds, bounds[1:])]
+    values[missing] = np.nan
+    return pd.Series(values, name=column["name"])
+
+
+def snapshots_enabled() -> bool:
+    return os.environ.get("TAXONOMY_SNAPSHOT_DISABLED", "0") != "1"
+
+
+def file_checksum(path: Union[str, Path]) -> str:
+    """Somme SHA-256 du fichier source."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def snapshot_dir_for(csv_path: Union[str, Path], checksum: str) -> Path:
+    """Répertoire de l'instantané correspondant à un CSV et à sa somme de contrôle."""
+    csv_path = Path(csv_path)
+    base = Path(os.environ.get("TAXONOMY_SNAPSHOT_DIR") or csv_path.parent / ".taxonomy_cache")
+    return base / f"{csv_path.stem}-{checksum[:16]}-v{SNAPSHOT_VERSION}"
+
+
+def write_snapshot(df: pd.DataFrame, target: Path, checksum: str) -> Path:
+    """
+    Écrit `df` dans `target` de façon atomique (répertoire temporaire puis
+    renommage) : des workers concurrents ne voient jamais un instantané partiel.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(prefix=f".{target.name}-", dir=target.parent))
+    try:
+        columns: List[Dict[str, Any]] = []
+        with open(tmp_dir / DATA_NAME, 'wb') as data:
+
+            def append(payload: bytes) -> int:
+                """Écrit un segment aligné et retourne sa position dans le fichier."""
+                data.write(b'\0' * (-data.tell() % _ALIGNMENT))
+                position = data.tell()
+                data.write(payload)
+                return position
+
+            for name in df.columns:
+                series = df[name]
+                if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_extension_array_dtype(series.dtype):
+                    values = np.ascontiguousarray(series.to_numpy())
+                    columns.append({"name": name, "kind": "numeric", "dtype": values.dtype.str,
+                                    "offset": append(values.tobytes())})
+                else:
+                    missing = series.isna().to_numpy(dtype=bool)
+                    encoded = [b'' if is_missing else str(value).encode('utf-8')
+                               for value, is_missing in zip(series.tolist(), missing)]
+                    separated = not any(_SEPARATOR in cell for cell in encoded)
+                    separator = _SEPARATOR if separated else b''
+                    blob_position = append(separator.join(encoded))
+                    # Offsets absolus des cellules dans le fichier de données, séparateur compris
+                    offsets = np.full(len(encoded) + 1, blob_position, dtype=np.int64)
+                    np.cumsum([len(b) + len(separator) for b in encoded], out=offsets[1:])
+                    offsets[1:] += blob_position
+                    columns.append({"name": name, "kind": "text", "separated": separated,
+                                    "offsets": append(offsets.tobytes()),
+                                    "missing": append(missing.tobytes())})
+
+        manifest = {
+            "version": SNAPSHOT_VERSION,
+            "sha256": checksum,
+            "rows": len(df),
+            "columns": columns,
+        }
+        with open(tmp_dir / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+        try:
+            os.replace(tmp_dir, target)
+        except OSError:
+            # Un autre worker a publié le même instantané entre-temps
+            if not (target / MANIFEST_NAME).exists():
+                raise
+        return target
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _pointer_path(csv_path: Union[str, Path]) -> Path:
+    csv_path = Path(csv_path)
+    base = Path(os.environ.get("TAXONOMY_SNAPSHOT_DIR") or csv_path.parent / ".taxonomy_cache")
+    path_hash = hashlib.sha256(str(csv_path.resolve()).encode('utf-8')).hexdigest()[:16]
+    return base / f"{csv_path.stem}-{path_hash}.current.json"
+
+
+def _read_pointer(csv_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    try:
+        with open(_pointer_path(csv_path), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_pointer(csv_path: Union[str, Path], stat: os.stat_result, checksum: str) -> None:
+    """Mémorise la somme du CSV pour sa taille et sa date de modification actuelles (écriture atomique)."""
+    if time.time() - stat.st_mtime < _RACY_WINDOW_SECONDS:
+        return
+    pointer = _pointer_path(csv_path)
+    pointer.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{pointer.name}-", dir=pointer.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": checksum}, f)
+        os.replace(tmp_name, pointer)
+    except OSError:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def current_checksum(csv_path: Union[str, Path]) -> str:
+    """
+    Somme SHA-256 du CSV. Elle n'est recalculée que si la taille ou la date de
+    modification du fichier diffèrent de celles du pointeur.
+    """
+    stat = os.stat(csv_path)
+    pointer = _read_pointer(csv_path)
+    if pointer is not None and pointer.get("size") == stat.st_size and pointer.get("mtime_ns") == stat.st_mtime_ns:
+        return pointer["sha256"]
+    checksum = file_checksum(csv_path)
+    try:
+        _write_pointer(csv_path, stat, checksum)
+    except OSError as e:
+        logger.debug(f"Pointeur d'instantané non écrit pour {csv_path}: {e}")
+    return checksum
+
+
+def compile_taxonomy_snapshot(csv_path: Union[str, Path], checksum: Optional[str] = None) -> Optional[Path]:
+    """
+    Compile le CSV en instantané binaire (sans effet s'il existe déjà).
+
+    Returns:
+        Le répertoire de l'instantané, ou None si la compilation a échoué
+        (répertoire non inscriptible, CSV illisible...).
+    """
+    try:
+        checksum = checksum or current_checksum(csv_path)
+        target = snapshot_dir_for(csv_path, checksum)
+        if (target / MANIFEST_NAME).exists():
+            return target
+        df = pd.read_csv(csv_path, encoding='utf-8')
+        write_snapshot(df, target, checksum)
+        logger.info(f"Instantané de taxonomie compilé: {target} ({len(df)} lignes)")
+        return target
+    except Exception as e:
+        logger.warning(f"Impossible de compiler l'instantané de taxonomie pour {csv_path}: {e}")
+        return None
+
+
+def read_snapshot(target: Path, checksum: Optional[str] = None) -> pd.DataFrame:
+    """
+    Reconstruit le DataFrame d'un instantané : les colonnes numériques sont
+    des vues sur le fichier de données mappé en copie à l'écriture, les
+    colonnes texte sont décodées.
+
+    Raises:
+        ValueError: Si la version du format, ou la somme attendue, ne correspond pas.
+    """
+    with open(target / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Version d'instantané {manifest.get('version')} non supportée")
+    if checksum is not None and manifest.get("sha256") != checksum:
+        raise ValueError(f"L'instantané {target} ne correspond pas à la somme du CSV")
+
+    rows = manifest["rows"]
+    with open(target / DATA_NAME, 'rb') as f:
+        # Un fichier vide ne peut pas être mappé (aucune colonne, ou aucune ligne)
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY) if os.fstat(f.fileno()).st_size else b''
+
+    columns = {}
+    for column in manifest["columns"]:
+        if column["kind"] == "numeric":
+            columns[column["name"]] = _view(data, column["offset"], np.dtype(column["dtype"]), rows)
+        else:
+            columns[column["name"]] = _read_text_column(data, column, rows)
+    return pd.DataFrame(columns, columns=[c["name"] for c in manifest["columns"]], copy=False)
+
+
+def load_taxonomy_snapshot(csv_path: Union[str, Path], compile_if_missing: bool = True) -> Optional[pd.DataFrame]:
+    """
+    Charge la taxonomie depuis son instantané binaire.
+
+    Le résultat a les mêmes valeurs et les mêmes types que
+    `pd.read_csv(csv_path)` et peut être modifié sans effet sur l'instantané
+    ni sur les autres processus. Si le CSV n'a
+    pas changé depuis le dernier chargement (même taille, même date), il n'est
+    pas relu. Si l'instantané est absent, il est compilé (sauf
+    `compile_if_missing=False`).
+
+    Returns:
+        Le DataFrame, ou None si le CSV n'existe pas ou si les instantanés
+        sont désactivés : l'appelant lit alors le CSV lui-même.
+    """
+    if not snapshots_enabled() or not os.path.isfile(csv_path):
+        return None
+    try:
+        checksum = current_checksum(csv_path)
+        target = snapshot_dir_for(csv_path, checksum)
+        if not (target / MANIFEST_NAME).exists():
+            if not compile_if_missing or compile_taxonomy_snapshot(csv_path, checksum) is None:
+                return None
+        df = read_snapshot(target, checksum)
+        logger.info(f"Taxonomie chargée depuis l'instantané {target} ({len(df)} lignes)")
+        return df
+    except Exception as e:
+        logger.warning(f"Instantané de taxonomie inutilisable pour {csv_path}, lecture du CSV: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    paths = sys.argv[1:]
+    if not paths:
+        print("Usage: python -m argumentation_analysis.utils.taxonomy_snapshot <taxonomie.csv> [...]")
+        sys.exit(2)
+    failures = [path for path in paths if compile_taxonomy_snapshot(path) is None]
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# tests/agents/core/logic/test_pl_handler.py
+"""
+Tests unitaires du cache de bases de connaissances compilées et des requêtes
+groupées de PLHandler, avec des classes Tweety simulées (sans JVM).
+"""
+import unittest
+from unittest.mock import MagicMock, patch
+
+from argumentation_analysis.agents.core.logic import pl_handler as pl_handler_module
+from argumentation_analysis.agents.core.logic.pl_handler import PLHandler
+
+
+class FakePlBeliefSet:
+    def __init__(self, formulas=()):
+        self.formulas = list(formulas)
+
+    def add(self, formula):
+        self.formulas.append(formula)
+
+    def __iter__(self):
+        return iter(self.formulas)
+
+
+class FakeContradiction:
+    def __str__(self):
+        return "false"
+
+
+class FakeParser:
+    def __init__(self):
+        self.calls = 0
+
+    def parseFormula(self, formula, signature=None):
+        self.calls += 1
+        if "bad_syntax" in formula:
+            raise ValueError("syntax error")
+        return formula
+
+
+class FakeReasoner:
+    """Entailment simulé : la requête appartient à la base."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def query(self, kb, formula):
+        self.calls += 1
+        return str(formula) in [str(f) for f in kb]
+
+
+def fake_jclass(name):
+    return {
+        "org.tweetyproject.logics.pl.syntax.PlBeliefSet": FakePlBeliefSet,
+        "org.tweetyproject.logics.pl.syntax.Contradiction": FakeContradiction,
+        "org.tweetyproject.logics.pl.reasoner.SimplePlReasoner": FakeReasoner,
+    }[name]
+
+
+class TestPLHandlerCache(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = FakeParser()
+        initializer = MagicMock()
+        initializer.get_pl_parser.return_value = self.parser
+        self.patchers = [
+            patch.object(pl_handler_module.jpype, "JClass", side_effect=fake_jclass),
+            patch.object(pl_handler_module.jpype, "JString", side_effect=str),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        self.handler = PLHandler(initializer, kb_cache_size=2)
+        self.reasoner = self.handler._pl_reasoner
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_knowledge_base_is_compiled_once(self):
+        kb = "a\nb\n```\nc%"
+        self.assertTrue(self.handler.pl_query(kb, "a"))
+        self.assertTrue(self.handler.pl_query(kb, "c"))
+        self.assertFalse(self.handler.pl_query(kb, "d"))
+        # 3 formules de la base + la requête "d" (les autres sont déjà en cache)
+        self.assertEqual(self.parser.calls, 4)
+        self.assertEqual(self.handler.cache_stats["kb_misses"], 1)
+        self.assertEqual(self.handler.cache_stats["kb_hits"], 2)
+
+    def test_consistency_is_memoised(self):
+        self.assertTrue(self.handler.pl_check_consistency("a\nb"))
+        self.assertTrue(self.handler.pl_check_consistency("a\nb"))
+        self.assertEqual(self.reasoner.calls, 1)
+        self.assertFalse(self.handler.pl_check_consistency("a\nfalse"))
+        self.assertTrue(self.handler.pl_check_consistency("```\n"))
+
+    def test_lru_eviction(self):
+        for kb in ("a", "b", "c"):
+            self.handler.pl_query(kb, "a")
+        self.assertEqual(len(self.handler._kb_cache), 2)
+        self.handler.pl_query("a", "a")
+        self.assertEqual(self.handler.cache_stats["kb_misses"], 4)
+        self.handler.clear_cache()
+        self.assertEqual(len(self.handler._kb_cache), 0)
+
+    def test_constants_are_part_of_the_key(self):
+        self.assertNotEqual(PLHandler._cache_key("a", None), PLHandler._cache_key("a", ["x"]))
+        self.assertEqual(PLHandler._cache_key("a", None), PLHandler._cache_key("a", []))
+
+    def test_query_batch(self):
+        results = self.handler.pl_query_batch("a\nb", ["a", "c", "a", "", "bad_syntax", "b"])
+        self.assertEqual(results, [True, False, True, None, None, True])
+        # Requêtes distinctes évaluées une seule fois ; la requête vide n'atteint pas le raisonneur
+        self.assertEqual(self.reasoner.calls, 3)
+        self.assertEqual(self.handler.cache_stats["kb_misses"], 1)
+
+    def test_invalid_knowledge_base_raises(self):
+        with self.assertRaises(ValueError):
+            self.handler.pl_query_batch("a\nbad_syntax", ["a"])
+        # Une base invalide n'est pas mise en cache
+        self.assertEqual(len(self.handler._kb_cache), 0)
+
+    def test_create_belief_base_returns_a_copy(self):
+        copy = self.handler.create_belief_base_from_string("a\nb")
+        copy.add("c")
+        self.assertFalse(self.handler.pl_query("a\nb", "c"))
+
+
+if __name__ == "__main__":
+    unittest.main()
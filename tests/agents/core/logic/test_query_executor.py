@@ -28,6 +28,7 @@ class ConcreteQueryExecutor(QueryExecutor):
         # On n'appelle pas super().__init__() pour éviter l'instanciation réelle de TweetyBridge.
         self._logger = logging.getLogger(__name__)
         # L'attribut _tweety_bridge sera injecté dans le test.
+        self._pl_backend = None
     
     # La méthode execute_query n'est plus nécessaire ici car nous allons mocker
     # les appels à _tweety_bridge. On utilisera l'implémentation de la classe parente
@@ -64,10 +65,15 @@ class TestQueryExecutor:
                 
                 # Configurer les mocks
                 self.mock_tweety_bridge = self.query_executor._tweety_bridge
-                self.mock_tweety_bridge.is_jvm_ready.return_value = True
+                self.mock_tweety_bridge.pl_backend = "tweety"
+                self.mock_tweety_bridge.is_client_mode = False
+                self.mock_pl_handler = self.mock_tweety_bridge.get_pl_handler.return_value
                 
                 self.mock_tweety_bridge_class = mock_tweety_bridge_class
-                yield
+                with patch('argumentation_analysis.agents.core.logic.query_executor.TweetyInitializer') as mock_initializer:
+                    self.mock_initializer = mock_initializer
+                    self.mock_initializer.is_jvm_ready.return_value = True
+                    yield
     
     @pytest.mark.asyncio
     async def test_initialization(self):
@@ -79,27 +85,44 @@ class TestQueryExecutor:
     @pytest.mark.asyncio
     async def test_execute_query_jvm_not_ready(self):
         """Test de l'exécution d'une requête lorsque la JVM n'est pas prête."""
-        self.mock_tweety_bridge.is_jvm_ready.return_value = False
+        self.mock_initializer.is_jvm_ready.return_value = False
         
         belief_set = PropositionalBeliefSet("a => b")
         result, message = self.query_executor.execute_query(belief_set, "a")
         
-        self.mock_tweety_bridge.is_jvm_ready.assert_called_once()
+        self.mock_initializer.is_jvm_ready.assert_called_once()
         
         assert result is None
         assert "FUNC_ERROR" in message
     
+    @pytest.mark.asyncio
+    async def test_execute_query_sat_backend_without_jvm(self):
+        """Le backend PL "sat" ne nécessite pas la JVM."""
+        self.mock_initializer.is_jvm_ready.return_value = False
+        self.query_executor._pl_backend = "sat"
+        self.mock_tweety_bridge.validate_pl_formula.return_value = True
+        self.mock_pl_handler.pl_query.return_value = True
+        
+        belief_set = PropositionalBeliefSet("a => b")
+        result, message = self.query_executor.execute_query(belief_set, "a")
+        
+        self.mock_tweety_bridge.get_pl_handler.assert_called_once_with("sat")
+        self.mock_tweety_bridge.validate_pl_formula.assert_called_once_with("a", "sat")
+        assert result is True
+        assert message == "Tweety Result: Query 'a' is ACCEPTED (True)."
+    
     @pytest.mark.asyncio
     async def test_execute_query_propositional_accepted(self):
         """Test de l'exécution d'une requête propositionnelle acceptée."""
-        self.mock_tweety_bridge.validate_formula.return_value = (True, "OK")
-        self.mock_tweety_bridge.execute_pl_query.return_value = "Tweety Result: Query 'a' is ACCEPTED (True)."
+        self.mock_tweety_bridge.validate_pl_formula.return_value = True
+        self.mock_pl_handler.pl_query.return_value = True
         
         belief_set = PropositionalBeliefSet("a => b")
         result, message = self.query_executor.execute_query(belief_set, "a")
         
-        self.mock_tweety_bridge.validate_formula.assert_called_once_with("a")
-        self.mock_tweety_bridge.execute_pl_query.assert_called_once_with("a => b", "a")
+        self.mock_tweety_bridge.get_pl_handler.assert_called_once_with(None)
+        self.mock_tweety_bridge.validate_pl_formula.assert_called_once_with("a", None)
+        self.mock_pl_handler.pl_query.assert_called_once_with("a => b", "a")
         
         assert result is True
         assert message == "Tweety Result: Query 'a' is ACCEPTED (True)."
@@ -107,14 +130,14 @@ class TestQueryExecutor:
     @pytest.mark.asyncio
     async def test_execute_query_propositional_rejected(self):
         """Test de l'exécution d'une requête propositionnelle rejetée."""
-        self.mock_tweety_bridge.validate_formula.return_value = (True, "OK")
-        self.mock_tweety_bridge.execute_pl_query.return_value = "Tweety Result: Query 'a' is REJECTED (False)."
+        self.mock_tweety_bridge.validate_pl_formula.return_value = True
+        self.mock_pl_handler.pl_query.return_value = False
         
         belief_set = PropositionalBeliefSet("a => b")
         result, message = self.query_executor.execute_query(belief_set, "a")
         
-        self.mock_tweety_bridge.validate_formula.assert_called_once_with("a")
-        self.mock_tweety_bridge.execute_pl_query.assert_called_once_with("a => b", "a")
+        self.mock_tweety_bridge.validate_pl_formula.assert_called_once_with("a", None)
+        self.mock_pl_handler.pl_query.assert_called_once_with("a => b", "a")
         
         assert result is False
         assert message == "Tweety Result: Query 'a' is REJECTED (False)."
@@ -122,17 +145,17 @@ class TestQueryExecutor:
     @pytest.mark.asyncio
     async def test_execute_query_propositional_error(self):
         """Test de l'exécution d'une requête propositionnelle avec erreur."""
-        self.mock_tweety_bridge.validate_formula.return_value = (True, "OK")
-        self.mock_tweety_bridge.execute_pl_query.return_value = "FUNC_ERROR: Erreur de syntaxe"
+        self.mock_tweety_bridge.validate_pl_formula.return_value = True
+        self.mock_pl_handler.pl_query.side_effect = ValueError("Erreur de syntaxe")
         
         belief_set = PropositionalBeliefSet("a => b")
         result, message = self.query_executor.execute_query(belief_set, "a")
         
-        self.mock_tweety_bridge.validate_formula.assert_called_once_with("a")
-        self.mock_tweety_bridge.execute_pl_query.assert_called_once_with("a => b", "a")
+        self.mock_pl_handler.pl_query.assert_called_once_with("a => b", "a")
         
         assert result is None
-        assert message == "FUNC_ERROR: Erreur de syntaxe"
+        assert message.startswith("FUNC_ERROR")
+        assert "Erreur de syntaxe" in message
     
     @pytest.mark.asyncio
     async def test_execute_query_first_order_accepted(self):
@@ -180,21 +203,14 @@ class TestQueryExecutor:
     @pytest.mark.asyncio
     async def test_execute_queries(self):
         """Test de l'exécution de plusieurs requêtes."""
-        self.mock_tweety_bridge.validate_formula.side_effect = [
-            (True, "OK"),
-            (True, "OK"),
-            (False, "Syntax Error in c")
-        ]
-        self.mock_tweety_bridge.execute_pl_query.side_effect = [
-            "Tweety Result: Query 'a' is ACCEPTED (True).",
-            "Tweety Result: Query 'b' is REJECTED (False)."
-        ]
+        self.mock_tweety_bridge.validate_pl_formula.side_effect = [True, True, False]
+        self.mock_pl_handler.pl_query.side_effect = [True, False]
         
         belief_set = PropositionalBeliefSet("a => b")
         results = self.query_executor.execute_queries(belief_set, ["a", "b", "c"])
         
-        assert self.mock_tweety_bridge.validate_formula.call_count == 3
-        assert self.mock_tweety_bridge.execute_pl_query.call_count == 2
+        assert self.mock_tweety_bridge.validate_pl_formula.call_count == 3
+        assert self.mock_pl_handler.pl_query.call_count == 2
         
         assert len(results) == 3
         
@@ -211,4 +227,4 @@ class TestQueryExecutor:
         query3, result3, message3 = results[2]
         assert query3 == "c"
         assert result3 is None
-        assert message3 == "FUNC_ERROR: Requête invalide: Syntax Error in c"
\ No newline at end of file
+        assert message3 == "FUNC_ERROR: Requête invalide: c"
\ No newline at end of file
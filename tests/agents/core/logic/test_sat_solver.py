@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+# tests/agents/core/logic/test_sat_solver.py
+"""
+Tests du solveur CDCL en processus et du backend PL "sat" (sans JVM).
+"""
+import itertools
+import os
+import random
+import time
+import unittest
+from unittest.mock import patch
+
+from argumentation_analysis.agents.core.logic.sat_pl_handler import SatPLHandler
+from argumentation_analysis.agents.core.logic.sat_solver import (
+    CDCLSolver, CNFEncoder, FormulaSyntaxError, formula_atoms, parse_formula
+)
+from argumentation_analysis.agents.core.logic.tweety_bridge import TweetyBridge
+
+
+def brute_force_sat(num_vars, clauses, assumptions=()):
+    for bits in itertools.product((False, True), repeat=num_vars):
+        def value(literal):
+            return bits[abs(literal) - 1] == (literal > 0)
+        if all(value(a) for a in assumptions) and all(any(value(l) for l in c) for c in clauses):
+            return True
+    return False
+
+
+def evaluate(formula, model):
+    kind = formula[0]
+    if kind == "var":
+        return model[formula[1]]
+    if kind == "not":
+        return not evaluate(formula[1], model)
+    if kind == "and":
+        return all(evaluate(f, model) for f in formula[1:])
+    if kind == "or":
+        return any(evaluate(f, model) for f in formula[1:])
+    if kind == "imp":
+        return not evaluate(formula[1], model) or evaluate(formula[2], model)
+    if kind == "iff":
+        return evaluate(formula[1], model) == evaluate(formula[2], model)
+    return kind == "true"
+
+
+def chain_knowledge_base(size, rng):
+    """Base de `size` propositions : chaîne d'implications, disjonctions et équivalences."""
+    lines = ["p0"]
+    for i in range(size - 1):
+        lines.append(f"p{i} => p{i + 1}")
+    for _ in range(size // 2):
+        a, b, c = rng.sample(range(size), 3)
+        lines.append(f"!p{a} || q{b} || q{c}")
+    for i in range(0, size - 1, 10):
+        lines.append(f"r{i} <=> (p{i} && !q{i + 1})")
+    return "\n".join(lines)
+
+
+class TestCDCLSolver(unittest.TestCase):
+
+    def test_matches_brute_force_with_assumptions(self):
+        rng = random.Random(1)
+        for _ in range(300):
+            num_vars = rng.randint(3, 9)
+            clauses = [[rng.choice((1, -1)) * rng.randint(1, num_vars) for _ in range(3)]
+                       for _ in range(rng.randint(1, 40))]
+            solver = CDCLSolver()
+            for _ in range(num_vars):
+                solver.new_var()
+            for clause in clauses:
+                solver.add_clause(clause)
+            # Plusieurs résolutions successives sur le même solveur (incrémental)
+            for _ in range(3):
+                assumptions = [rng.choice((1, -1)) * rng.randint(1, num_vars) for _ in range(rng.randint(0, 3))]
+                result = solver.solve(assumptions)
+                self.assertEqual(result, brute_force_sat(num_vars, clauses, assumptions))
+                if result:
+                    model = solver.model
+                    self.assertTrue(all(any(model[abs(l)] == (l > 0) for l in c) for c in clauses))
+
+    def test_pigeonhole_is_unsatisfiable(self):
+        pigeons, holes = 6, 5
+        solver = CDCLSolver()
+        var = {(p, h): solver.new_var() for p in range(pigeons) for h in range(holes)}
+        for p in range(pigeons):
+            solver.add_clause([var[p, h] for h in range(holes)])
+        for h in range(holes):
+            for a, b in itertools.combinations(range(pigeons), 2):
+                solver.add_clause([-var[a, h], -var[b, h]])
+        self.assertFalse(solver.solve())
+        self.assertGreater(solver.stats["conflicts"], 0)
+        self.assertFalse(solver.ok)
+
+    def test_unsat_under_assumptions_keeps_solver_usable(self):
+        solver = CDCLSolver()
+        a, b = solver.new_var(), solver.new_var()
+        solver.add_clause([-a, b])
+        self.assertFalse(solver.solve([a, -b]))
+        self.assertTrue(solver.ok)
+        self.assertTrue(solver.solve([a]))
+        self.assertTrue(solver.model[b])
+
+
+class TestCNFEncoder(unittest.TestCase):
+
+    def test_parser_precedence(self):
+        self.assertEqual(parse_formula("a | b & !c"), ("or", ("var", "a"), ("and", ("var", "b"), ("not", ("var", "c")))))
+        self.assertEqual(parse_formula("a => b => c"), ("imp", ("var", "a"), ("imp", ("var", "b"), ("var", "c"))))
+        self.assertEqual(parse_formula("a && b <=> c")[0], "iff")
+        for invalid in ("", "a &", "(a | b", "a b", "=> a"):
+            with self.assertRaises(FormulaSyntaxError):
+                parse_formula(invalid)
+
+    def test_tseitin_preserves_models(self):
+        rng = random.Random(7)
+        atoms = ["a", "b", "c", "d"]
+
+        def random_formula(depth):
+            if depth == 0 or rng.random() < 0.3:
+                return ("var", rng.choice(atoms))
+            kind = rng.choice(["not", "and", "or", "imp", "iff"])
+            if kind == "not":
+                return ("not", random_formula(depth - 1))
+            return (kind, random_formula(depth - 1), random_formula(depth - 1))
+
+        for _ in range(100):
+            formula = random_formula(4)
+            satisfiable = any(evaluate(formula, dict(zip(atoms, bits)))
+                              for bits in itertools.product((False, True), repeat=len(atoms)))
+            encoder = CNFEncoder()
+            encoder.assert_formula(formula)
+            self.assertEqual(encoder.solver.solve(), satisfiable)
+            if satisfiable:
+                model = {name: encoder.solver.model[var] for name, var in encoder.atoms.items()}
+                model.update({name: False for name in atoms if name not in model})
+                self.assertTrue(evaluate(formula, model))
+            self.assertLessEqual(formula_atoms(formula), set(atoms))
+
+
+class TestSatPLHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.handler = SatPLHandler()
+
+    def test_entailment_and_consistency(self):
+        kb = "a => b\nb -> c\na%\n```"
+        self.assertTrue(self.handler.pl_check_consistency(kb))
+        self.assertEqual(self.handler.pl_query_batch(kb, ["c", "!c", "a && b", "d", "a ((", ""]),
+                         [True, False, True, False, None, None])
+        self.assertFalse(self.handler.pl_check_consistency("a\n!a"))
+        # Tout est conséquence d'une base incohérente
+        self.assertTrue(self.handler.pl_query("a\n!a", "z"))
+        with self.assertRaises(ValueError):
+            self.handler.pl_query("a &", "a")
+
+    def test_shares_compiled_kb_cache(self):
+        kb = "a || b\n!a"
+        self.assertTrue(self.handler.pl_query(kb, "b"))
+        self.assertFalse(self.handler.pl_query(kb, "a"))
+        self.assertEqual(self.handler.cache_stats["kb_misses"], 1)
+        self.assertEqual(self.handler.cache_stats["kb_hits"], 1)
+        belief_set = self.handler.create_belief_base_from_string(kb)
+        belief_set.add(parse_formula("c"))
+        self.assertFalse(self.handler.pl_query(kb, "c"))
+
+    def test_benchmark_hundreds_of_propositions(self):
+        rng = random.Random(3)
+        kb = chain_knowledge_base(300, rng)
+        queries = [f"p{i}" for i in range(0, 300, 15)] + ["q1 || !q1", "!p299", "q5"]
+        start = time.perf_counter()
+        self.assertTrue(self.handler.pl_check_consistency(kb))
+        results = self.handler.pl_query_batch(kb, queries)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(results[:-3], [True] * 20)
+        self.assertEqual(results[-3:-1], [True, False])
+        print(f"\n[SAT] {len(kb.splitlines())} formules, {len(queries)} requêtes : {elapsed * 1000:.1f} ms")
+        self.assertLess(elapsed, 10.0)
+
+    @unittest.skipUnless(os.environ.get('USE_REAL_JPYPE') == 'true', "Comparaison avec Tweety : nécessite la JVM")
+    def test_agrees_with_tweety(self):
+        bridge = TweetyBridge.get_instance()
+        bridge.initialize_jvm()
+        kb = chain_knowledge_base(200, random.Random(5))
+        queries = [f"p{i}" for i in range(0, 200, 20)] + [f"q{i}" for i in range(0, 200, 20)]
+        start = time.perf_counter()
+        tweety_results = bridge.get_pl_handler("tweety").pl_query_batch(kb, queries)
+        tweety_elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        sat_results = bridge.get_pl_handler("sat").pl_query_batch(kb, queries)
+        sat_elapsed = time.perf_counter() - start
+        print(f"\n[PL] Tweety : {tweety_elapsed * 1000:.1f} ms, SAT : {sat_elapsed * 1000:.1f} ms")
+        self.assertEqual(sat_results, tweety_results)
+
+
+class TestBackendSelection(unittest.TestCase):
+
+    def setUp(self):
+        self.initializer_patcher = patch('argumentation_analysis.agents.core.logic.tweety_bridge.TweetyInitializer', autospec=True)
+        self.initializer_patcher.start().return_value.is_jvm_ready.return_value = False
+        TweetyBridge._instance = None
+
+    def tearDown(self):
+        self.initializer_patcher.stop()
+        TweetyBridge._instance = None
+
+    def test_sat_backend_does_not_need_the_jvm(self):
+        bridge = TweetyBridge()
+        with self.assertRaises(RuntimeError):
+            _ = bridge.pl_handler
+        self.assertIsInstance(bridge.get_pl_handler("sat"), SatPLHandler)
+
+        bridge.set_pl_backend("sat")
+        self.assertTrue(bridge.pl_query("a\na => b", "b"))
+        self.assertEqual(bridge.pl_query_batch("a", ["a", "b"]), [True, False])
+        self.assertTrue(bridge.validate_pl_formula("a & (b | !c)"))
+        self.assertFalse(bridge.validate_pl_formula("a & "))
+        with self.assertRaises(ValueError):
+            bridge.set_pl_backend("minisat")
+
+    def test_query_paths_use_the_selected_backend(self):
+        from semantic_kernel import Kernel
+        from argumentation_analysis.agents.core.logic.belief_set import PropositionalBeliefSet
+        from argumentation_analysis.agents.core.logic.propositional_logic_agent import PropositionalLogicAgent
+        from argumentation_analysis.agents.core.logic.query_executor import QueryExecutor
+
+        belief_set = PropositionalBeliefSet("a\na => b")
+        results = QueryExecutor(pl_backend="sat").execute_queries(belief_set, ["b", "!b", "(("])
+        self.assertEqual([result for _, result, _ in results], [True, False, None])
+        self.assertEqual(results[0][2], "Tweety Result: Query 'b' is ACCEPTED (True).")
+        self.assertTrue(results[2][2].startswith("FUNC_ERROR"))
+
+        agent = PropositionalLogicAgent(Kernel(), pl_backend="sat")
+        self.assertEqual(agent.execute_query(belief_set, "b"), (True, "Tweety Result: Query 'b' is ACCEPTED (True)."))
+        self.assertFalse(agent.execute_query(belief_set, "c")[0])
+        self.assertIsNone(agent.execute_query(belief_set, "a &&")[0])
+        self.assertFalse(agent.validate_formula("a ||"))
+
+    def test_backend_from_constructor(self):
+        bridge = TweetyBridge(pl_backend="sat")
+        self.assertEqual(bridge.pl_backend, "sat")
+        # Un nouvel accès au singleton sans argument conserve le backend
+        self.assertEqual(TweetyBridge().pl_backend, "sat")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+# tests/agents/core/logic/test_tweety_worker_pool.py
+"""
+Tests du pool de workers Tweety et du mode client de TweetyBridge.
+
+Les workers exécutent des opérations factices (sans JVM) : le protocole,
+l'équilibrage, le redémarrage des workers et le routage du pont sont testés
+indépendamment de Tweety.
+"""
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from argumentation_analysis.agents.core.logic.tweety_bridge import TweetyBridge
+from argumentation_analysis.core import bootstrap
+from argumentation_analysis.core.bootstrap import initialize_project_environment
+from argumentation_analysis.agents.core.logic.tweety_worker_pool import (
+    TweetyRemoteError, TweetyRequest, TweetyWorkerError, TweetyWorkerPool
+)
+
+
+class FakeContext:
+    def __init__(self):
+        self.calls = 0
+
+
+def fake_setup():
+    return FakeContext()
+
+
+def failing_setup():
+    raise RuntimeError("JVM introuvable")
+
+
+def op_pid(context, value=None):
+    context.calls += 1
+    time.sleep(0.05)
+    return os.getpid(), value
+
+
+def op_pl_query(context, knowledge_base, query):
+    return query in knowledge_base.split("\n")
+
+
+def op_pl_check_consistency(context, knowledge_base):
+    return "false" not in knowledge_base
+
+
+def op_fail(context, kind):
+    raise {"value": ValueError, "other": LookupError}[kind]("échec simulé")
+
+
+def op_crash(context, marker=None):
+    if marker is None or not os.path.exists(marker):
+        if marker is not None:
+            open(marker, "w").close()
+        os._exit(1)
+    return "recovered"
+
+
+def op_sleep(context, seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def op_dung_extensions(context, arguments, attacks, semantics):
+    from abs_arg_dung.agent import DungAgent
+    agent = DungAgent(backend="native")
+    agent.add_arguments(arguments)
+    agent.add_attacks([tuple(pair) for pair in attacks])
+    return {name: agent._get_extensions(name) for name in semantics}
+
+
+FAKE_OPERATIONS = {
+    "pid": op_pid,
+    "pl_query": op_pl_query,
+    "pl_check_consistency": op_pl_check_consistency,
+    "fail": op_fail,
+    "crash": op_crash,
+    "sleep": op_sleep,
+    "dung_extensions": op_dung_extensions,
+}
+
+
+class TestTweetyWorkerPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = TweetyWorkerPool(size=2, setup=fake_setup, operations=FAKE_OPERATIONS, request_timeout=5)
+        cls.pool.wait_ready()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def test_batch_is_spread_over_workers_in_order(self):
+        responses = self.pool.execute([TweetyRequest("pid", {"value": i}) for i in range(6)])
+        self.assertEqual([r.result[1] for r in responses], list(range(6)))
+        self.assertTrue(all(r.ok for r in responses))
+        self.assertEqual(len({r.result[0] for r in responses}), 2)
+        self.assertEqual(len({r.request_id for r in responses}), 6)
+
+    def test_errors_are_reported_per_request(self):
+        responses = self.pool.execute([TweetyRequest("fail", {"kind": "value"}), TweetyRequest("pid"),
+                                       TweetyRequest("unknown")])
+        self.assertEqual([r.ok for r in responses], [False, True, False])
+        with self.assertRaises(ValueError):
+            self.pool.call("fail", kind="value")
+        with self.assertRaises(TweetyRemoteError) as context:
+            self.pool.call("fail", kind="other")
+        self.assertEqual(context.exception.error_type, "LookupError")
+
+    def test_crashed_worker_is_restarted_and_request_replayed(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            restarts = self.pool.stats["restarts"]
+            self.assertEqual(self.pool.call("crash", marker=os.path.join(tmp, "crashed")), "recovered")
+            self.assertEqual(self.pool.stats["restarts"], restarts + 1)
+        # Un crash systématique n'est rejoué qu'une fois
+        with self.assertRaises(TweetyWorkerError):
+            self.pool.call("crash")
+        self.assertEqual(self.pool.call("pid", value="ok")[1], "ok")
+
+    def test_timeout_kills_the_worker(self):
+        pool = TweetyWorkerPool(size=1, setup=fake_setup, operations=FAKE_OPERATIONS, request_timeout=0.5)
+        try:
+            with self.assertRaises(TweetyWorkerError):
+                pool.call("sleep", seconds=30)
+            self.assertEqual(pool.stats["timeouts"], 1)
+            self.assertEqual(pool.call("sleep", seconds=0), 0)
+        finally:
+            pool.close()
+
+    def test_startup_failure(self):
+        pool = TweetyWorkerPool(size=1, setup=failing_setup, operations=FAKE_OPERATIONS)
+        try:
+            with self.assertRaises(TweetyWorkerError) as context:
+                pool.call("pid")
+            self.assertIn("JVM introuvable", str(context.exception))
+        finally:
+            pool.close()
+
+    def test_dung_agent_remote_backend(self):
+        from abs_arg_dung.agent import DungAgent
+        agent = DungAgent(backend="remote", worker_pool=self.pool)
+        agent.add_arguments(["a", "b", "c"])
+        agent.add_attacks([("a", "b"), ("b", "c")])
+        self.assertEqual(agent.get_grounded_extension(), ["a", "c"])
+        self.assertEqual(agent.get_preferred_extensions(), [["a", "c"]])
+
+    def test_dung_analysis_service_remote_backend(self):
+        from api.services import DungAnalysisService
+        with patch("jpype.isJVMStarted", return_value=False), \
+                patch("argumentation_analysis.agents.core.logic.tweety_worker_pool.get_tweety_worker_pool",
+                      return_value=self.pool):
+            service = DungAnalysisService(backend="remote")
+            results = service.analyze_framework(["a", "b", "c"], [("a", "b"), ("b", "c")],
+                                                {"compute_extensions": True})
+        self.assertEqual(results["extensions"]["grounded"], ["a", "c"])
+        self.assertTrue(results["argument_status"]["a"]["skeptically_accepted"])
+        with patch("jpype.isJVMStarted", return_value=False), self.assertRaises(RuntimeError):
+            DungAnalysisService()
+
+    def test_pool_info_stats(self):
+        pool = TweetyWorkerPool(size=2, setup=fake_setup, operations=FAKE_OPERATIONS)
+        try:
+            pool.execute([TweetyRequest("pid", {"value": i}) for i in range(4)])
+            info = pool.get_pool_info()
+            self.assertEqual(info["stats"]["requests"], 4)
+            self.assertEqual(info["stats"]["batches"], 2)
+            self.assertEqual(sum(worker["pending"] for worker in info["workers"]), 0)
+        finally:
+            pool.close()
+
+
+class TestTweetyBridgeClientMode(unittest.TestCase):
+
+    def setUp(self):
+        TweetyBridge._instance = None
+        self.pool = TweetyWorkerPool(size=1, setup=fake_setup, operations=FAKE_OPERATIONS)
+        self.initializer_patcher = patch('argumentation_analysis.agents.core.logic.tweety_bridge.TweetyInitializer')
+        self.mock_initializer_class = self.initializer_patcher.start()
+
+    def tearDown(self):
+        self.initializer_patcher.stop()
+        self.pool.close()
+        TweetyBridge._instance = None
+
+    def test_bridge_routes_to_workers_without_local_jvm(self):
+        bridge = TweetyBridge(worker_pool=self.pool)
+        self.mock_initializer_class.assert_not_called()
+        self.assertTrue(bridge.is_client_mode)
+        self.assertTrue(bridge.pl_query("a\nb", "b"))
+        self.assertFalse(bridge.pl_query("a\nb", "c"))
+        self.assertFalse(bridge.pl_handler.pl_check_consistency("a\nfalse"))
+        with self.assertRaises(RuntimeError):
+            _ = bridge.fol_handler
+        # Le backend SAT reste local
+        self.assertTrue(bridge.get_pl_handler("sat").pl_query("a\na => b", "b"))
+
+    def test_client_mode_rejects_java_only_methods(self):
+        bridge = TweetyBridge(worker_pool=self.pool)
+        with self.assertRaises(RuntimeError):
+            bridge.fol_check_consistency(object())
+        with self.assertRaises(RuntimeError):
+            bridge.create_pl_belief_base_from_string("a")
+
+    def test_worker_pool_given_after_first_construction(self):
+        with patch('argumentation_analysis.agents.core.logic.tweety_bridge.settings') as mock_settings:
+            mock_settings.jvm.tweety_workers = 0
+            bridge = TweetyBridge()
+        self.assertFalse(bridge.is_client_mode)
+        self.assertIs(TweetyBridge(worker_pool=self.pool), bridge)
+        self.assertTrue(bridge.is_client_mode)
+        self.assertIs(bridge.worker_pool, self.pool)
+        self.assertIsNone(bridge.initializer)
+        self.assertTrue(bridge.pl_query("a\nb", "b"))
+        # Sans pool explicite, une nouvelle construction conserve le mode client
+        TweetyBridge()
+        self.assertIs(bridge.worker_pool, self.pool)
+
+
+
+class TestStartupWithWorkers(unittest.TestCase):
+    """Avec un pool de workers configuré, le démarrage ne lance pas de JVM dans le processus."""
+
+    def setUp(self):
+        self.patchers = [patch.object(bootstrap, 'initialize_jvm_func'),
+                         patch.object(bootstrap.settings.jvm, 'tweety_workers', 2)]
+        self.initialize_jvm = self.patchers[0].start()
+        self.patchers[1].start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_project_environment_skips_the_jvm(self):
+        context = initialize_project_environment(force_mock_llm=True)
+        self.initialize_jvm.assert_not_called()
+        self.assertFalse(context.jvm_initialized)
+
+    def test_api_startup_skips_the_jvm(self):
+        try:
+            from api import main as api_main
+        except ImportError as e:
+            self.skipTest(f"Dépendances de l'API absentes : {e}")
+        api_main.startup_event()
+        self.initialize_jvm.assert_not_called()
+        self.assertFalse(api_main.app.state.project_context.jvm_initialized)
+
+
+if __name__ == "__main__":
+    unittest.main()
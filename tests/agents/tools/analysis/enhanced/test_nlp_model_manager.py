@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+Tests de la file d'inférence à micro-batching de NLPModelManager.
+
+Des pipelines factices remplacent les modèles Hugging Face : ils acceptent une
+liste de phrases comme les pipelines de `transformers` et ont un coût fixe par
+appel, ce qui rend le gain du batching observable sans télécharger de modèle.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from argumentation_analysis.agents.tools.analysis.enhanced.contextual_fallacy_analyzer import (
+    EnhancedContextualFallacyAnalyzer
+)
+from argumentation_analysis.agents.tools.analysis.enhanced import contextual_fallacy_analyzer
+from argumentation_analysis.agents.tools.analysis.enhanced.nlp_model_manager import (
+    BatchingInferenceQueue, NLPModelManager
+)
+
+
+class FakeSentimentPipeline:
+    """Classification : un dictionnaire par phrase pour une liste, une liste pour une phrase seule."""
+
+    def __init__(self, call_cost=0.02):
+        self.call_cost = call_cost
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, inputs, batch_size=None):
+        time.sleep(self.call_cost)
+        batch = [inputs] if isinstance(inputs, str) else list(inputs)
+        with self.lock:
+            self.calls.append(batch)
+        outputs = [{"label": "POSITIVE" if "!" in text else "NEGATIVE", "score": 0.9 if "!" in text else 0.6}
+                   for text in batch]
+        return outputs if not isinstance(inputs, str) else outputs[:1]
+
+
+class FakeNERPipeline:
+    """NER : une liste d'entités par phrase."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, inputs, batch_size=None):
+        self.calls += 1
+        return [[{"entity": "B-PER", "word": word} for word in text.split() if word.istitle()] for text in inputs]
+
+
+class FailingPipeline:
+    def __call__(self, inputs, batch_size=None):
+        raise ValueError("modèle indisponible")
+
+
+class TestBatchingInferenceQueue(unittest.TestCase):
+
+    def test_concurrent_callers_share_batches(self):
+        model = FakeSentimentPipeline()
+        queue = BatchingInferenceQueue("sentiment", model, max_batch_size=16, batch_window_ms=20)
+        try:
+            results = {}
+
+            def caller(i):
+                results[i] = queue.submit(f"phrase {i}!" if i % 2 else f"phrase {i}").result(timeout=10)
+
+            threads = [threading.Thread(target=caller, args=(i,)) for i in range(40)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(results[1], [{"label": "POSITIVE", "score": 0.9}])
+            self.assertEqual(results[2], [{"label": "NEGATIVE", "score": 0.6}])
+            self.assertLess(len(model.calls), 40)
+            self.assertTrue(all(len(batch) <= 16 for batch in model.calls))
+            self.assertEqual(queue.stats["batched_sentences"], 40)
+        finally:
+            queue.close()
+
+    def test_cache_and_coalescing(self):
+        model = FakeSentimentPipeline()
+        queue = BatchingInferenceQueue("sentiment", model, batch_window_ms=20, cache_size=2)
+        try:
+            futures = [queue.submit("même phrase") for _ in range(3)]
+            results = [future.result(timeout=10) for future in futures]
+            self.assertEqual(model.calls, [["même phrase"]])
+            # Chaque appelant reçoit sa propre copie du résultat
+            results[0][0]["label"] = "modifié"
+            self.assertEqual(results[1], [{"label": "NEGATIVE", "score": 0.6}])
+            self.assertIsNot(results[1][0], results[2][0])
+
+            cached = queue.submit("même phrase")
+            self.assertTrue(cached.done())
+            self.assertEqual(cached.result(), [{"label": "NEGATIVE", "score": 0.6}])
+            cached.result()[0]["score"] = 0.0
+            self.assertEqual(queue.submit("même phrase").result()[0]["score"], 0.6)
+            self.assertEqual(queue.stats["cache_hits"], 2)
+            self.assertEqual(queue.stats["coalesced"], 2)
+
+            # Cache LRU borné : la phrase la plus ancienne est évincée
+            queue.submit("b").result(timeout=10)
+            queue.submit("c").result(timeout=10)
+            queue.submit("même phrase").result(timeout=10)
+            self.assertEqual(len(model.calls), 4)
+        finally:
+            queue.close()
+
+    def test_errors_are_propagated_to_every_caller(self):
+        queue = BatchingInferenceQueue("sentiment", FailingPipeline(), batch_window_ms=20)
+        try:
+            futures = [queue.submit("a"), queue.submit("b")]
+            for future in futures:
+                with self.assertRaises(ValueError):
+                    future.result(timeout=10)
+            # Les échecs ne sont pas mis en cache
+            with self.assertRaises(ValueError):
+                queue.submit("a").result(timeout=10)
+            self.assertGreaterEqual(queue.stats["failed_batches"], 2)
+            self.assertEqual(queue.stats["batches"], 0)
+        finally:
+            queue.close()
+        with self.assertRaises(RuntimeError):
+            queue.submit("a")
+
+
+class TestNLPModelManagerInference(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = NLPModelManager()
+        self.saved = (dict(NLPModelManager._models), NLPModelManager._models_loaded)
+        self.sentiment = FakeSentimentPipeline(call_cost=0.05)
+        self.ner = FakeNERPipeline()
+        NLPModelManager._models.update({"sentiment": self.sentiment, "ner": self.ner})
+        NLPModelManager._models_loaded = True
+
+    def tearDown(self):
+        self.manager.shutdown()
+        NLPModelManager._models.clear()
+        NLPModelManager._models.update(self.saved[0])
+        NLPModelManager._models_loaded = self.saved[1]
+
+    def test_infer_returns_single_sentence_shapes(self):
+        sentences = ["Marie est experte", "quel scandale !"]
+        self.assertEqual(self.manager.infer("ner", sentences)[0],
+                         [{"entity": "B-PER", "word": "Marie"}])
+        sentiments = self.manager.infer("sentiment", sentences)
+        self.assertEqual(sentiments[1][0]["label"], "POSITIVE")
+        # Les résultats sont des copies : les modifier n'altère pas le cache
+        sentiments[1][0]["label"] = "modifié"
+        self.assertEqual(self.manager.infer("sentiment", sentences)[1][0]["label"], "POSITIVE")
+        self.assertEqual(self.manager.get_inference_stats()["sentiment"]["cache_hits"], 2)
+
+    def test_infer_many_batches_concurrent_coroutines(self):
+        async def run():
+            return await asyncio.gather(*[self.manager.infer_many("sentiment", [f"phrase {i}", f"autre {i} !"])
+                                          for i in range(20)])
+
+        start = time.perf_counter()
+        results = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+        self.assertEqual(len(results), 20)
+        self.assertEqual(results[3][1][0]["label"], "POSITIVE")
+        # 40 phrases, 0,05 s par appel du pipeline : bien moins que 2 s grâce aux batchs
+        self.assertLessEqual(len(self.sentiment.calls), 3)
+        self.assertLess(elapsed, 1.0)
+
+    def test_unloaded_model(self):
+        with self.assertRaises(RuntimeError):
+            self.manager.infer("generation", ["texte"])
+        NLPModelManager._models_loaded = False
+        with self.assertRaises(RuntimeError):
+            self.manager.infer("sentiment", ["texte"])
+
+    def test_configure_batching_recreates_queues(self):
+        self.manager.infer("sentiment", ["a"])
+        self.manager.configure_batching(max_batch_size=4)
+        try:
+            self.manager.infer("sentiment", [str(i) for i in range(10)])
+            self.assertEqual(self.manager.get_inference_stats()["sentiment"]["largest_batch"], 4)
+        finally:
+            self.manager.configure_batching(max_batch_size=32)
+
+    def test_analyzer_uses_shared_models_in_batch(self):
+        original = contextual_fallacy_analyzer.HAS_TRANSFORMERS
+        contextual_fallacy_analyzer.HAS_TRANSFORMERS = True
+        try:
+            analyzer = EnhancedContextualFallacyAnalyzer()
+            self.assertIs(analyzer.nlp_models["sentiment"], self.sentiment)
+            text = "Le scientifique Pasteur le confirme. Quelle honte absolue ! Rien à ajouter"
+            fallacies = analyzer._identify_potential_fallacies_with_nlp(text)
+        finally:
+            contextual_fallacy_analyzer.HAS_TRANSFORMERS = original
+        detected = {(fallacy["fallacy_type"], fallacy.get("detection_method")) for fallacy in fallacies}
+        self.assertIn(("Appel à l'émotion", "sentiment_analysis"), detected)
+        self.assertIn(("Appel à l'autorité", None), detected)
+        # Toutes les phrases passent par un seul appel de chaque pipeline
+        self.assertEqual(len(self.sentiment.calls), 1)
+        self.assertEqual(self.ner.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -141,6 +141,48 @@ class TestJTMSSession:
         assert checkpoint["beliefs_count"] == 2
         assert "belief1" in checkpoint["beliefs_state"]
         assert "belief2" in checkpoint["beliefs_state"]
+    
+    def test_bulk_load_defers_propagation(self):
+        """Test du chargement en lot : une seule propagation à la validation"""
+        session = JTMSSession("test_session", "test_agent")
+        
+        with session.batch():
+            session.add_justification(["evidence"], [], "hypothesis", "test_agent")
+            session.jtms.set_belief_validity("evidence", True)
+            assert session.jtms.beliefs["hypothesis"].valid is None
+        
+        assert session.jtms.beliefs["hypothesis"].valid is True
+        
+        count = session.bulk_load(
+            [{"in": ["hypothesis"], "out": ["alibi"], "conclusion": "suspect"}],
+            agent_source="test_agent"
+        )
+        assert count == 1
+        assert session.total_inferences == 2
+        assert session.jtms.beliefs["suspect"].valid is True
+        assert "alibi" in session.extended_beliefs
+
+    def test_batch_rollback_restores_session_state(self):
+        """Test d'un lot annulé : la session retrouve l'état du JTMS"""
+        session = JTMSSession("test_session", "test_agent", strict_mode=True)
+        session.add_justification(["evidence"], [], "hypothesis", "test_agent")
+        beliefs_before = dict(session.extended_beliefs)
+        history_before = len(session.extended_beliefs["hypothesis"].modification_history)
+        
+        with pytest.raises(RuntimeError):
+            with session.batch():
+                session.add_justification(["hypothesis", "motive"], [], "suspect", "test_agent")
+                session.add_justification(["motive"], [], "hypothesis", "test_agent")
+                raise RuntimeError("échec du lot")
+        
+        assert session.extended_beliefs == beliefs_before
+        assert session.total_inferences == 1
+        assert len(session.extended_beliefs["hypothesis"].modification_history) == history_before
+        assert set(session.jtms.beliefs) == set(beliefs_before)
+        # En mode strict, la session et le JTMS restent cohérents après l'annulation
+        session.add_justification(["motive"], [], "suspect", "test_agent")
+        assert session.total_inferences == 2
+        assert "motive" in session.jtms.beliefs
 
 class TestJTMSAgentBase:
     """Tests pour la classe JTMSAgentBase"""
@@ -40,7 +40,11 @@ def main():
                 "b": {"credulously_accepted": False, "skeptically_accepted": False, "grounded_accepted": False, "stable_accepted": False},
                 "c": {"credulously_accepted": True, "skeptically_accepted": True, "grounded_accepted": False, "stable_accepted": True}
             },
-            "graph_properties": {"num_arguments": 3, "num_attacks": 2, "has_cycles": False, "cycles": [], "self_attacking_nodes": []}
+            "graph_properties": {
+                "num_arguments": 3, "num_attacks": 2, "has_cycles": False, "cycles": [], "self_attacking_nodes": [],
+                "is_acyclic": True, "num_sccs": 3, "cyclic_sccs": [], "largest_scc_size": 1,
+                "has_odd_cycle": False, "has_even_cycle": False, "girth": None, "cycles_exhaustive": True
+            }
         }
         mock_service.analyze_framework.return_value = mock_response_success
         request_data_success = {"arguments": ["a", "b", "c"], "attacks": [["a", "b"], ["b", "c"]]}
@@ -65,7 +69,11 @@ def main():
                 "admissible": [[]], "ideal": [], "semi_stable": [[]]
             },
             "argument_status": {},
-            "graph_properties": {"num_arguments": 0, "num_attacks": 0, "has_cycles": False, "cycles": [], "self_attacking_nodes": []}
+            "graph_properties": {
+                "num_arguments": 0, "num_attacks": 0, "has_cycles": False, "cycles": [], "self_attacking_nodes": [],
+                "is_acyclic": True, "num_sccs": 0, "cyclic_sccs": [], "largest_scc_size": 0,
+                "has_odd_cycle": False, "has_even_cycle": False, "girth": None, "cycles_exhaustive": True
+            }
         }
         mock_service.analyze_framework.return_value = mock_response_empty
         request_data_empty = {"arguments": [], "attacks": []}
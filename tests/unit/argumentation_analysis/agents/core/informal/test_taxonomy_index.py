@@ -0,0 +1,140 @@
+import random
+
+import pandas as pd
+import pytest
+
+from argumentation_analysis.agents.core.informal.taxonomy_index import AhoCorasickAutomaton, TaxonomyIndex
+
+
+@pytest.fixture
+def taxonomy_df():
+    """Petite taxonomie avec chemins, FK_Parent et une valeur manquante."""
+    df = pd.DataFrame([
+        {'PK': 0, 'FK_Parent': None, 'path': '1', 'depth': 0, 'Name': 'Fallacy', 'nom_vulgarisé': 'Sophisme',
+         'Famille': 'Racine', 'text_fr': 'Erreur de raisonnement générale'},
+        {'PK': 1, 'FK_Parent': 0, 'path': '1.1', 'depth': 1, 'Name': 'Ad hominem', 'nom_vulgarisé': 'Attaque personnelle',
+         'Famille': 'Influence', 'text_fr': "Attaquer la personne plutôt que l'argument avancé"},
+        {'PK': 2, 'FK_Parent': 0, 'path': '1.2', 'depth': 1, 'Name': 'Straw man', 'nom_vulgarisé': 'Homme de paille',
+         'Famille': 'Influence', 'text_fr': "Déformer la position adverse pour l'attaquer"},
+        {'PK': 3, 'FK_Parent': 1, 'path': '1.1.1', 'depth': 2, 'Name': 'Tu quoque', 'nom_vulgarisé': None,
+         'Famille': 'Influence', 'text_fr': 'Toi aussi : retourner une accusation'},
+    ])
+    return df.set_index('PK')
+
+
+def reference_score(df, text):
+    """Ancienne implémentation par iterrows, utilisée comme référence."""
+    text_lower = text.lower()
+    detections = []
+    for pk, row in df.iterrows():
+        confidence, matches = 0.0, []
+        name = str(row.get('Name') or '').lower()
+        nom_vulgarise = str(row.get('nom_vulgarisé') or '').lower()
+        description = str(row.get('text_fr') or '').lower()
+        if nom_vulgarise and nom_vulgarise in text_lower:
+            confidence += 0.7
+            matches.append(f"Nom vulgarisé: '{nom_vulgarise}'")
+        if name and name in text_lower:
+            confidence += 0.5
+            matches.append(f"Nom officiel: '{name}'")
+        for word in [w for w in description.split() if len(w) > 4][:5]:
+            if word in text_lower:
+                confidence += 0.1
+                matches.append(f"Mot-clé: '{word}'")
+        if confidence >= 0.3:
+            detections.append((int(pk), min(confidence, 1.0), matches))
+    detections.sort(key=lambda d: d[1], reverse=True)
+    return detections
+
+
+def test_automaton_matches_substring_search():
+    for seed in range(200):
+        rng = random.Random(seed)
+        patterns = [''.join(rng.choice('abc') for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 8))]
+        text = ''.join(rng.choice('abcd') for _ in range(rng.randint(0, 30)))
+        automaton = AhoCorasickAutomaton()
+        for pattern in patterns:
+            automaton.add(pattern)
+        automaton.build()
+        found = {automaton.patterns[i] for i in automaton.find(text)}
+        assert found == {p for p in patterns if p in text}
+
+
+@pytest.mark.parametrize("text", [
+    "C'est une attaque personnelle, un pur ad hominem !",
+    "Tu quoque : toi aussi tu mens, et c'est un homme de paille.",
+    "Rien à signaler ici.",
+    "Attaquer la personne plutôt que l'argument : déformer la position adverse.",
+])
+def test_score_matches_reference_implementation(taxonomy_df, text):
+    index = TaxonomyIndex(taxonomy_df)
+    expected = reference_score(taxonomy_df, text)
+    actual = [(d['taxonomy_key'], d['confidence'], d['matches']) for d in index.score(text)]
+    assert [(k, pytest.approx(c), m) for k, c, m in expected] == actual
+
+
+def test_hierarchy_and_parent_context(taxonomy_df):
+    index = TaxonomyIndex(taxonomy_df)
+    assert index.children[0] == [1, 2]
+    assert index.parent[3] == 1
+    context = index.parent_context(1)
+    assert context['parent_path'] == '1'
+    assert [s['taxonomy_key'] for s in context['siblings']] == [2, 3]
+    assert index.parent_context(0) == {'siblings': []}
+
+
+def test_search_weights_fields(taxonomy_df):
+    index = TaxonomyIndex(taxonomy_df)
+    results = index.search('influence')
+    assert [r['taxonomy_key'] for r in results] == [1, 2, 3]
+    assert results[0]['match_score'] == pytest.approx(0.3)
+    assert index.search('paille')[0]['taxonomy_key'] == 2
+
+
+def test_explore_and_node_details(taxonomy_df):
+    index = TaxonomyIndex(taxonomy_df)
+    explored = index.explore(0, max_children=1)
+    assert explored['current_node']['pk'] == 0
+    assert [c['pk'] for c in explored['children']] == [1]
+    assert explored['children'][0]['has_children'] is True
+    assert explored['children_truncated'] is True and explored['total_children'] == 2
+
+    details = index.node_details(3)
+    assert details['Name'] == 'Tu quoque'
+    assert 'nom_vulgarisé' not in details  # valeur manquante omise
+    assert details['parent']['pk'] == 1
+    assert 'children' not in details
+    assert index.explore(99)['error'] == "PK 99 non trouvée dans la taxonomie."
+
+
+def test_find_uses_trigrams_and_keeps_taxonomy_order(taxonomy_df):
+    df = taxonomy_df.rename(columns={'nom_vulgarisé': 'nom_vulgarise'})
+    index = TaxonomyIndex(df)
+    assert index.find('HOMME DE') == 2
+    assert index.find('attaqu') == 1  # PK 1 et PK 2 correspondent, la première l'emporte
+    assert index.find('pe') == 1  # motif court : parcours linéaire
+    assert index.find('introuvable') is None
+    # Les champs ne se chevauchent pas : pas de correspondance à cheval sur deux colonnes
+    assert index.find('paille' + 'déformer') is None
+    assert list(index.categories) == ['Racine', 'Influence']
+    assert index.categories['Influence'] == [1, 2, 3]
+
+
+def test_shared_index_is_reused_until_file_changes(tmp_path, taxonomy_df):
+    from argumentation_analysis.agents.core.informal.taxonomy_index import get_shared_index
+
+    path = tmp_path / "taxonomy.csv"
+    path.write_text("PK\n0\n")
+    calls = []
+
+    def load():
+        calls.append(1)
+        return taxonomy_df
+
+    first = get_shared_index(path, load)
+    assert get_shared_index(str(path), load) is first
+    path.write_text("PK\n0\n1\n")
+    assert get_shared_index(path, load) is not first
+    assert len(calls) == 2
+    # Fichier absent : pas de partage
+    assert get_shared_index(tmp_path / "absent.csv", load) is not get_shared_index(tmp_path / "absent.csv", load)
@@ -95,6 +95,41 @@ class TestQueryCache:
         
         assert len(query_cache._cache) == 0
         assert len(query_cache._access_times) == 0
+    
+    def test_cache_lru_eviction_and_counters(self, query_cache):
+        """Test l'éviction LRU et les compteurs du cache."""
+        result = QueryResult(success=True, data={}, message="Test", query_type=QueryType.CARD_INQUIRY)
+        for card in ["knife", "rope", "pipe"]:
+            query_cache.put("Agent1", QueryType.CARD_INQUIRY, {"card": card}, result)
+        
+        # "knife" devient la plus récemment utilisée : "rope" est évincée
+        assert query_cache.get("Agent1", QueryType.CARD_INQUIRY, {"card": "knife"}) is not None
+        query_cache.put("Agent1", QueryType.CARD_INQUIRY, {"card": "wrench"}, result)
+        assert query_cache.get("Agent1", QueryType.CARD_INQUIRY, {"card": "rope"}) is None
+        assert query_cache.get("Agent1", QueryType.CARD_INQUIRY, {"card": "knife"}) is not None
+        
+        stats = query_cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 1)
+        assert stats["total_entries"] == 3
+    
+    def test_cache_ttl_expiry_and_structural_keys(self, query_cache, monkeypatch):
+        """Test l'expiration paresseuse et l'indépendance de la clé vis-à-vis de l'ordre des paramètres."""
+        from argumentation_analysis.agents.core.oracle import dataset_access_manager
+        
+        clock = [1000.0]
+        monkeypatch.setattr(dataset_access_manager.time, "monotonic", lambda: clock[0])
+        result = QueryResult(success=True, data={"ok": True}, message="Test", query_type=QueryType.SUGGESTION_VALIDATION)
+        params = {"suggestion": {"suspect": "Plum", "arme": "Corde", "lieu": "Salon"}}
+        query_cache.put("Agent1", QueryType.SUGGESTION_VALIDATION, params, result)
+        
+        reordered = {"suggestion": {"lieu": "Salon", "arme": "Corde", "suspect": "Plum"}}
+        assert query_cache.get("Agent1", QueryType.SUGGESTION_VALIDATION, reordered) is not None
+        
+        clock[0] += 3
+        assert query_cache.get_stats()["expired_entries"] == 1
+        assert query_cache.get("Agent1", QueryType.SUGGESTION_VALIDATION, params) is None
+        assert len(query_cache._cache) == 0
+        assert query_cache.get_stats()["expirations"] == 1
 
 
 class TestDatasetAccessManager:
@@ -212,6 +247,38 @@ class TestDatasetAccessManager:
         # Paramètres différents = clés différentes
         assert key1 != key3
     
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_queries_are_coalesced(self, dataset_manager, mock_dataset, mock_permission_manager):
+        """Test que des requêtes identiques concurrentes partagent une seule exécution."""
+        mock_permission_manager.add_permission_rule(PermissionRule("Sherlock", [QueryType.CARD_INQUIRY]))
+        original_process_query = mock_dataset.process_query
+        calls = []
+        
+        async def slow_process_query(*args):
+            calls.append(args)
+            await asyncio.sleep(0.05)
+            return await original_process_query(*args)
+        
+        mock_dataset.process_query = slow_process_query
+        results = await asyncio.gather(*[
+            dataset_manager.execute_query("Sherlock", QueryType.CARD_INQUIRY, {"card": "Revolver"})
+            for _ in range(5)
+        ])
+        
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        manager_stats = dataset_manager.get_access_statistics()["manager_stats"]
+        assert manager_stats["coalesced_queries"] == 4
+        # Les requêtes partagées comptent comme des succès
+        assert manager_stats["successful_queries"] == 5
+        assert manager_stats["success_rate"] == 1.0
+        assert manager_stats["inflight_queries"] == 0
+        
+        # La requête suivante est servie par le cache
+        await dataset_manager.execute_query("Sherlock", QueryType.CARD_INQUIRY, {"card": "Revolver"})
+        assert len(calls) == 1
+        assert dataset_manager.get_access_statistics()["cache_stats"]["hits"] == 1
+    
     def test_apply_permission_filters(self, dataset_manager):
         """Test l'application des filtres de permissions."""
         from argumentation_analysis.agents.core.oracle.permissions import QueryResult, QueryType
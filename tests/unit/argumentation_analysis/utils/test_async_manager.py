@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Tests de l'exécution concurrente de AsyncManager.run_multiple_hybrid."""
+
+import asyncio
+import contextlib
+import operator
+import threading
+import time
+
+import pytest
+
+from argumentation_analysis.utils.async_manager import AsyncManager
+
+
+@pytest.fixture
+def manager():
+    manager = AsyncManager(max_workers=4, default_timeout=5.0)
+    yield manager
+    manager.shutdown()
+
+
+class ConcurrencyProbe:
+    """Compte les tâches en cours d'exécution et retient le pic de concurrence."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def __enter__(self):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+
+    def __exit__(self, *exc):
+        with self.lock:
+            self.running -= 1
+
+
+def slow_double(x, delay=0.1, probe=None):
+    with probe or contextlib.nullcontext():
+        time.sleep(delay)
+    return x * 2
+
+
+async def async_double(x, delay=0.1, probe=None):
+    with probe or contextlib.nullcontext():
+        await asyncio.sleep(delay)
+    return x * 2
+
+
+def test_sync_tasks_run_concurrently_in_order(manager):
+    probe = ConcurrencyProbe()
+    tasks = [{'func': slow_double, 'args': (i, 0.2 - 0.05 * i), 'kwargs': {'probe': probe}} for i in range(4)]
+    results = manager.run_multiple_hybrid(tasks, max_concurrent=4)
+    # Les résultats suivent l'ordre des tâches, pas l'ordre de fin
+    assert results == [0, 2, 4, 6]
+    assert probe.peak > 1
+
+
+def test_coroutines_bounded_by_max_concurrent(manager):
+    probe = ConcurrencyProbe()
+    tasks = [{'func': async_double, 'args': (i,), 'kwargs': {'probe': probe}} for i in range(6)]
+    results = manager.run_multiple_hybrid(tasks, max_concurrent=3)
+    assert results == [0, 2, 4, 6, 8, 10]
+    # Deux vagues de trois tâches
+    assert probe.peak == 3
+    stats = manager.get_performance_stats()
+    assert stats['completed_tasks'] == 6
+    assert stats['max_queue_delay'] >= 0.09
+
+
+def test_timeouts_errors_and_global_deadline_use_fallback(manager):
+    def failing():
+        raise RuntimeError("boom")
+
+    tasks = [
+        {'func': async_double, 'args': (1,)},
+        {'func': async_double, 'args': (2, 1.0), 'timeout': 0.05, 'fallback_result': 'timeout'},
+        {'func': failing, 'fallback_result': 'error'},
+        {'func': async_double, 'args': (3, 5.0), 'fallback_result': 'cancelled'},
+    ]
+    start = time.monotonic()
+    results = manager.run_multiple_hybrid(tasks, max_concurrent=4, global_timeout=0.3)
+    # La tâche de 5 s est annulée à l'échéance globale
+    assert time.monotonic() - start < 4.0
+    assert results == [2, 'timeout', 'error', 'cancelled']
+    stats = manager.get_performance_stats()
+    assert (stats['timeout_tasks'], stats['error_tasks'], stats['cancelled_tasks']) == (1, 1, 1)
+
+
+def test_zero_timeout_is_not_the_default(manager):
+    tasks = [{'func': async_double, 'args': (1,), 'timeout': 0, 'fallback_result': 'timeout'}]
+    assert manager.run_multiple_hybrid(tasks) == ['timeout']
+    assert manager.get_performance_stats()['timeout_tasks'] == 1
+    assert manager.run_hybrid(slow_double, 1, 0.5, timeout=0, fallback_result='timeout') == 'timeout'
+
+
+def test_process_pool(manager):
+    tasks = [{'func': operator.mul, 'args': (i, i)} for i in range(5)]
+    assert manager.run_multiple_hybrid(tasks, executor="process") == [0, 1, 4, 9, 16]
+
+
+@pytest.mark.asyncio
+async def test_callable_from_running_loop(manager):
+    tasks = [{'func': async_double, 'args': (i, 0)} for i in range(3)]
+    assert manager.run_multiple_hybrid(tasks) == [0, 2, 4]
+    assert await manager.run_multiple_async(tasks[:0]) == []
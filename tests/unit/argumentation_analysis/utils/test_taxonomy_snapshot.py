@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Tests de l'instantané binaire de la taxonomie des sophismes."""
+
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from argumentation_analysis.utils import taxonomy_loader, taxonomy_snapshot
+from argumentation_analysis.utils.taxonomy_snapshot import (
+    MANIFEST_NAME, compile_taxonomy_snapshot, load_taxonomy_snapshot
+)
+
+CSV_CONTENT = (
+    "PK,FK_Parent,depth,nom_vulgarisé,text_fr,Famille,actif\n"
+    "1,,0,Ad Hominem,Attaquer la personne ,Pertinence,True\n"
+    "2,1,1,Homme de paille,\"Déformer l'argument, puis l'attaquer\",Pertinence,False\n"
+    "3,1,1,Pente glissante,,Causalité,True\n"
+    "4,,0,Appel à l'autorité,« Un expert l'a dit » 🎓,,False\n"
+)
+
+
+@pytest.fixture
+def taxonomy_csv(tmp_path, monkeypatch):
+    monkeypatch.delenv("TAXONOMY_SNAPSHOT_DISABLED", raising=False)
+    monkeypatch.setenv("TAXONOMY_SNAPSHOT_DIR", str(tmp_path / "cache"))
+    csv_file = tmp_path / "taxonomy.csv"
+    csv_file.write_text(CSV_CONTENT, encoding='utf-8')
+    # Fichier « ancien » : sa taille et sa date peuvent être mémorisées sans risque
+    os.utime(csv_file, (time.time() - 60, time.time() - 60))
+    return csv_file
+
+
+def test_snapshot_matches_read_csv(taxonomy_csv):
+    target = compile_taxonomy_snapshot(taxonomy_csv)
+    assert (target / MANIFEST_NAME).exists()
+
+    df = load_taxonomy_snapshot(taxonomy_csv, compile_if_missing=False)
+    expected = pd.read_csv(taxonomy_csv, encoding='utf-8')
+    pd.testing.assert_frame_equal(df, expected)
+    assert df['text_fr'].str.strip().tolist() == expected['text_fr'].str.strip().tolist()
+    assert df[df['Famille'] == "Pertinence"]['PK'].tolist() == [1, 2]
+    assert df.fillna('').iloc[3]['Famille'] == ''
+
+
+def test_loading_does_not_read_the_csv(taxonomy_csv, monkeypatch):
+    load_taxonomy_snapshot(taxonomy_csv)
+
+    def forbidden(*args, **kwargs):
+        raise AssertionError("le CSV ne doit pas être relu")
+
+    monkeypatch.setattr(taxonomy_snapshot, "file_checksum", forbidden)
+    monkeypatch.setattr(taxonomy_snapshot.pd, "read_csv", forbidden)
+    df = load_taxonomy_snapshot(taxonomy_csv, compile_if_missing=False)
+    assert df is not None
+    assert df['nom_vulgarisé'].iloc[1] == "Homme de paille"
+
+
+def test_snapshot_frame_is_writable(taxonomy_csv):
+    compile_taxonomy_snapshot(taxonomy_csv)
+    df = load_taxonomy_snapshot(taxonomy_csv, compile_if_missing=False)
+    df.loc[0, 'depth'] = 5
+    df.loc[1, 'nom_vulgarisé'] = "Épouvantail"
+    df.fillna({'Famille': '', 'text_fr': ''}, inplace=True)
+    assert df['depth'].tolist() == [5, 1, 1, 0]
+    assert df.loc[3, 'Famille'] == ''
+
+    # Les modifications restent propres au DataFrame : l'instantané est intact
+    reloaded = load_taxonomy_snapshot(taxonomy_csv, compile_if_missing=False)
+    pd.testing.assert_frame_equal(reloaded, pd.read_csv(taxonomy_csv, encoding='utf-8'))
+
+
+def test_snapshot_invalidated_when_csv_changes(taxonomy_csv):
+    compile_taxonomy_snapshot(taxonomy_csv)
+    taxonomy_csv.write_text(CSV_CONTENT + "5,4,1,Nouveau,Texte,Autorité,True\n", encoding='utf-8')
+
+    # Taille et date changées : la somme est recalculée et l'ancien instantané écarté
+    assert load_taxonomy_snapshot(taxonomy_csv, compile_if_missing=False) is None
+    df = load_taxonomy_snapshot(taxonomy_csv)
+    assert len(df) == 5
+    assert df['nom_vulgarisé'].iloc[-1] == "Nouveau"
+
+
+def test_snapshot_disabled_or_missing_file(taxonomy_csv, tmp_path, monkeypatch):
+    assert load_taxonomy_snapshot(tmp_path / "absent.csv") is None
+    monkeypatch.setenv("TAXONOMY_SNAPSHOT_DISABLED", "1")
+    assert load_taxonomy_snapshot(taxonomy_csv) is None
+
+
+def test_taxonomy_loader_entries_match_csv_reader(taxonomy_csv, monkeypatch):
+    monkeypatch.setattr(taxonomy_loader, "USE_MOCK", False)
+    monkeypatch.setattr(taxonomy_loader, "get_taxonomy_path", lambda: taxonomy_csv)
+    loader = taxonomy_loader.TaxonomyLoader()
+
+    monkeypatch.setenv("TAXONOMY_SNAPSHOT_DISABLED", "1")
+    from_csv = loader.load_taxonomy()
+    monkeypatch.delenv("TAXONOMY_SNAPSHOT_DISABLED")
+    from_snapshot = loader.load_taxonomy()
+
+    assert from_snapshot == from_csv
+    assert from_snapshot[0] == {
+        "PK": "1", "depth": "0", "nom_vulgarisé": "Ad Hominem",
+        "text_fr": "Attaquer la personne", "Famille": "Pertinence", "actif": "True",
+    }
+    assert from_snapshot[1]["FK_Parent"] == "1"
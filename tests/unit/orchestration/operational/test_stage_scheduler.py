@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Tests de l'ordonnanceur d'étapes et du pipeline opérationnel concurrent."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from argumentation_analysis.orchestration.operational.direct_executor import DirectOperationalExecutor
+from argumentation_analysis.orchestration.operational.stage_scheduler import Stage, StageScheduler
+
+
+def sleeper(delay, value=None):
+    async def func(inputs):
+        await asyncio.sleep(delay)
+        return value if value is not None else inputs
+    return func
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_overlap():
+    scheduler = StageScheduler([
+        Stage("a", sleeper(0.01, "a")),
+        Stage("b", sleeper(0.2, "b"), depends_on=("a",)),
+        Stage("c", sleeper(0.2, "c"), depends_on=("a",)),
+        Stage("d", sleeper(0.01), depends_on=("b", "c")),
+    ])
+    run = await scheduler.run()
+
+    assert run.results["d"] == {"b": "b", "c": "c"}
+    assert run.total_duration < 0.35
+    assert run.metrics["b"]["start"] < run.metrics["c"]["end"]
+    assert run.metrics["c"]["start"] < run.metrics["b"]["end"]
+    assert all(m["status"] == "completed" for m in run.metrics.values())
+
+
+@pytest.mark.asyncio
+async def test_timeout_uses_fallback_and_dependents_run():
+    scheduler = StageScheduler([
+        Stage("slow", sleeper(1, "late"), timeout=0.05, fallback=lambda status, message: {"status": status}),
+        Stage("next", sleeper(0, "done"), depends_on=("slow",)),
+    ])
+    run = await scheduler.run()
+
+    assert run.results["slow"] == {"status": "timeout"}
+    assert run.metrics["slow"]["status"] == "timeout"
+    assert run.results["next"] == "done"
+
+
+@pytest.mark.asyncio
+async def test_failed_stage_without_fallback_skips_dependents():
+    async def boom(inputs):
+        raise RuntimeError("boom")
+
+    run = await StageScheduler([
+        Stage("a", boom),
+        Stage("b", sleeper(0, "b"), depends_on=("a",)),
+    ]).run()
+
+    assert run.metrics["a"] == {**run.metrics["a"], "status": "error", "message": "boom"}
+    assert run.metrics["b"]["status"] == "skipped"
+    assert run.results == {}
+
+
+@pytest.mark.asyncio
+async def test_global_timeout_cancels_running_stages():
+    scheduler = StageScheduler([Stage("a", sleeper(1))])
+    with pytest.raises(asyncio.TimeoutError):
+        await scheduler.run(timeout=0.05)
+
+
+def test_invalid_graphs_rejected():
+    with pytest.raises(ValueError, match="Cycle"):
+        StageScheduler([Stage("a", sleeper(0), depends_on=("b",)), Stage("b", sleeper(0), depends_on=("a",))])
+    with pytest.raises(ValueError, match="inconnues"):
+        StageScheduler([Stage("a", sleeper(0), depends_on=("missing",))])
+
+
+@pytest.mark.asyncio
+async def test_operational_pipeline_runs_informal_and_logic_concurrently():
+    with patch.object(DirectOperationalExecutor, '__init__', lambda s, kernel: None):
+        executor = DirectOperationalExecutor(kernel=MagicMock())
+    executor.stage_timeouts = {"logic": 0.05}
+
+    async def extract(text, tactical):
+        return {"extracted_data": [], "status": "completed"}
+
+    async def informal(text, extract_results):
+        await asyncio.sleep(0.1)
+        return {"informal_analysis": ["ad hominem"], "status": "completed"}
+
+    async def logic(text, extract_results, chat_history=None):
+        await asyncio.sleep(1)
+
+    async def synthesis(text, extract_results, informal_results, logic_results):
+        return {"synthesis_report": {"informal": informal_results, "logic": logic_results}, "status": "completed"}
+
+    executor._execute_extract_agent = extract
+    executor._execute_informal_agent = informal
+    executor._execute_logic_agent = logic
+    executor._execute_synthesis_agent = synthesis
+
+    result = await executor.execute_operational_pipeline("texte", {"tasks": []})
+
+    assert result["status"] == "success"
+    assert result["results"]["informal"]["informal_analysis"] == ["ad hominem"]
+    assert result["results"]["logic"]["logic_analysis"] is None
+    assert result["results"]["logic"]["status"] == "timeout"
+    stages = result["metrics"]["stages"]
+    assert stages["logic"]["start"] < stages["informal"]["end"]
+    assert result["metrics"]["total_duration"] < 0.5